@@ -0,0 +1,230 @@
+"""
+Benchmarks for ENCORE --- :mod:`MDAnalysis.analysis.encore`
+============================================================
+
+Each stage of the ensemble similarity calculations is timed separately on
+synthetic ensembles, so that regressions can be traced back to the
+conformational distance matrix, the clustering or dimensionality reduction
+C kernels, the kernel density estimation or the harmonic similarity.
+
+Synthetic ensembles are made of `n_frames` conformations of a chain of
+`n_atoms` CA atoms, obtained as small random displacements of a random walk.
+Sizes and numbers of cores are set through the ``params`` of each class.
+"""
+from __future__ import division
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import MDAnalysis.analysis.encore as encore
+from MDAnalysis.analysis.encore.clustering.affinityprop import \
+    AffinityPropagation
+from MDAnalysis.analysis.encore.dimensionality_reduction.stochasticproxembed \
+    import StochasticProximityEmbedding, kNNStochasticProximityEmbedding
+from MDAnalysis.analysis.encore.confdistmatrix import RMSDMatrixGenerator
+from MDAnalysis.analysis.encore.utils import TriangularMatrix
+from MDAnalysis.coordinates.array import ArrayReader
+
+
+def write_topology(dirname, n_atoms):
+    """Write a GRO file for a chain of `n_atoms` CA atoms and return its name"""
+    filename = os.path.join(dirname, "chain{0}.gro".format(n_atoms))
+    with open(filename, "w") as gro:
+        gro.write("Synthetic chain\n{0:5d}\n".format(n_atoms))
+        for i in range(n_atoms):
+            resid = (i + 1) % 100000
+            gro.write("{0:5d}{1:<5s}{2:>5s}{3:5d}{4:8.3f}{5:8.3f}{6:8.3f}\n"
+                      "".format(resid, "ALA", "CA", resid % 100000,
+                                0.0, 0.0, 0.0))
+        gro.write("{0:10.5f}{0:10.5f}{0:10.5f}\n".format(100.0))
+    return filename
+
+
+def synthetic_coordinates(n_frames, n_atoms, seed=0):
+    """Coordinates of a fluctuating random walk chain, in 'fac' order"""
+    random_state = np.random.RandomState(seed)
+    chain = np.cumsum(random_state.normal(scale=2.2, size=(n_atoms, 3)),
+                      axis=0)
+    displacements = np.cumsum(
+        random_state.normal(scale=0.1, size=(n_frames, n_atoms, 3)), axis=0)
+    return (chain[np.newaxis] + displacements).astype(np.float32)
+
+
+def synthetic_ensemble(topology, n_frames, n_atoms, seed=0):
+    """:class:`~MDAnalysis.analysis.encore.Ensemble` of synthetic coordinates"""
+    coordinates = synthetic_coordinates(n_frames, n_atoms, seed=seed)
+    return encore.Ensemble(topology=topology,
+                           trajectory=coordinates.swapaxes(0, 1),
+                           format=ArrayReader)
+
+
+def synthetic_distance_matrix(n_frames, n_atoms, seed=0):
+    """RMSD (without superimposition) matrix between synthetic conformations
+
+    The matrix is calculated with numpy, so that setting up the clustering
+    and dimensionality reduction benchmarks does not depend on the
+    performance of the matrix generators.
+    """
+    x = synthetic_coordinates(n_frames, n_atoms, seed=seed).reshape(
+        n_frames, -1).astype(np.float64)
+    sq = np.sum(x ** 2, axis=1)
+    d2 = sq[:, np.newaxis] + sq[np.newaxis, :] - 2 * np.dot(x, x.T)
+    rmsd = np.sqrt(np.clip(d2, 0, None) / n_atoms)
+    matrix = TriangularMatrix(size=n_frames)
+    # row-major lower triangle, which is the TriangularMatrix layout
+    matrix._elements[:] = rmsd[np.tril_indices(n_frames)]
+    return matrix
+
+
+class RMSDMatrixBench(object):
+    """Conformational distance matrix, with and without pairwise alignment"""
+    params = ([100, 500], [100, 1000], [False, True], [1, 2, 4])
+    param_names = ['n_frames', 'n_atoms', 'pairwise_align', 'ncores']
+    timeout = 1200
+
+    def setup(self, n_frames, n_atoms, pairwise_align, ncores):
+        self.tmpdir = tempfile.mkdtemp()
+        topology = write_topology(self.tmpdir, n_atoms)
+        self.ensemble = synthetic_ensemble(topology, n_frames, n_atoms)
+
+    def teardown(self, n_frames, n_atoms, pairwise_align, ncores):
+        shutil.rmtree(self.tmpdir)
+
+    def time_rmsd_matrix(self, n_frames, n_atoms, pairwise_align, ncores):
+        RMSDMatrixGenerator()(self.ensemble,
+                              selection="name CA",
+                              pairwise_align=pairwise_align,
+                              mass_weighted=True,
+                              ncores=ncores)
+
+    def peakmem_rmsd_matrix(self, n_frames, n_atoms, pairwise_align, ncores):
+        RMSDMatrixGenerator()(self.ensemble,
+                              selection="name CA",
+                              pairwise_align=pairwise_align,
+                              mass_weighted=True,
+                              ncores=ncores)
+
+
+class AffinityPropagationBench(object):
+    """Affinity propagation C kernel on a -RMSD matrix"""
+    params = ([100, 500, 1000], [np.float64, np.float32])
+    param_names = ['n_frames', 'dtype']
+    timeout = 600
+
+    def setup(self, n_frames, dtype):
+        self.matrix = synthetic_distance_matrix(n_frames, 100)
+        self.matrix.change_sign()
+        self.matrix._elements = self.matrix._elements.astype(dtype)
+
+    def time_affinity_propagation(self, n_frames, dtype):
+        AffinityPropagation()(self.matrix, -1.0, 0.9, 500, 50, 1)
+
+    def peakmem_affinity_propagation(self, n_frames, dtype):
+        AffinityPropagation()(self.matrix, -1.0, 0.9, 500, 50, 1)
+
+
+class StochasticProximityEmbeddingBench(object):
+    """Stochastic proximity embedding C kernels on a RMSD matrix"""
+    params = ([100, 500, 1000], ['vanilla', 'knn'])
+    param_names = ['n_frames', 'mode']
+    timeout = 600
+
+    def setup(self, n_frames, mode):
+        self.matrix = synthetic_distance_matrix(n_frames, 100)
+
+    def time_spe(self, n_frames, mode):
+        if mode == 'vanilla':
+            StochasticProximityEmbedding().run(self.matrix, 1.5, 3, 2.0,
+                                               0.1, 100, 10000, -1)
+        else:
+            kNNStochasticProximityEmbedding().run(self.matrix, 10, 3, 2.0,
+                                                  0.1, 100, 10000, -1)
+
+
+class KDEBench(object):
+    """Kernel density estimates and resampling of embedded spaces"""
+    params = ([100, 1000, 5000], [2, 3, 5], [1000, 10000])
+    param_names = ['n_frames', 'dimensions', 'nsamples']
+
+    def setup(self, n_frames, dimensions, nsamples):
+        random_state = np.random.RandomState(0)
+        self.embedded_space = random_state.normal(size=(dimensions,
+                                                        n_frames))
+        self.ensemble_assignment = np.repeat([1, 2], [n_frames // 2,
+                                                      n_frames - n_frames // 2])
+
+    def time_gen_kde_pdfs(self, n_frames, dimensions, nsamples):
+        encore.gen_kde_pdfs(self.embedded_space, self.ensemble_assignment,
+                            2, nsamples=nsamples)
+
+    def time_dimred_ensemble_similarity(self, n_frames, dimensions, nsamples):
+        kdes, resamples, embedded_ensembles = encore.gen_kde_pdfs(
+            self.embedded_space, self.ensemble_assignment, 2,
+            nsamples=nsamples)
+        encore.dimred_ensemble_similarity(kdes[0], resamples[0],
+                                          kdes[1], resamples[1])
+
+
+class HESBench(object):
+    """Harmonic ensemble similarity between two synthetic ensembles"""
+    params = ([100, 250], [50, 200])
+    param_names = ['n_frames', 'n_atoms']
+    timeout = 1200
+
+    def setup(self, n_frames, n_atoms):
+        self.tmpdir = tempfile.mkdtemp()
+        topology = write_topology(self.tmpdir, n_atoms)
+        self.ensembles = [
+            synthetic_ensemble(topology, n_frames, n_atoms, seed=0),
+            synthetic_ensemble(topology, n_frames, n_atoms, seed=1)]
+
+    def teardown(self, n_frames, n_atoms):
+        shutil.rmtree(self.tmpdir)
+
+    def time_hes(self, n_frames, n_atoms):
+        encore.hes(self.ensembles)
+
+    def peakmem_hes(self, n_frames, n_atoms):
+        encore.hes(self.ensembles)
+
+
+class SimilarityBench(object):
+    """Clustering and dimensionality reduction ensemble similarity measures
+
+    The conformational distance matrix is precalculated for CES and DRES, so
+    that the timings reflect the parallel clustering and dimensionality
+    reduction runs and the Jensen-Shannon divergence evaluation.
+    """
+    params = ([100, 250], [50, 200], [1, 2, 4])
+    param_names = ['n_frames', 'n_atoms', 'ncores']
+    timeout = 1200
+
+    def setup(self, n_frames, n_atoms, ncores):
+        self.tmpdir = tempfile.mkdtemp()
+        topology = write_topology(self.tmpdir, n_atoms)
+        self.ensembles = [
+            synthetic_ensemble(topology, n_frames, n_atoms, seed=0),
+            synthetic_ensemble(topology, n_frames, n_atoms, seed=1)]
+        self.distance_matrix = synthetic_distance_matrix(2 * n_frames,
+                                                         n_atoms)
+        self.similarity_matrix = synthetic_distance_matrix(2 * n_frames,
+                                                           n_atoms)
+        self.similarity_matrix.change_sign()
+
+    def teardown(self, n_frames, n_atoms, ncores):
+        shutil.rmtree(self.tmpdir)
+
+    def time_ces(self, n_frames, n_atoms, ncores):
+        encore.ces(self.ensembles,
+                   preference_values=[-1.0, -2.0, -5.0, -10.0],
+                   similarity_matrix=self.similarity_matrix,
+                   np=ncores)
+
+    def time_dres(self, n_frames, n_atoms, ncores):
+        encore.dres(self.ensembles,
+                    dimensions=3,
+                    conf_dist_matrix=self.distance_matrix,
+                    np=ncores)
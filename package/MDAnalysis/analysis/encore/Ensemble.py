@@ -116,9 +116,8 @@ class Ensemble(MDAnalysis.Universe):
         """
 
 
-        # Chained trajectories cannot use TimeSeries functionality
-        # and the analysis is therefore slower - we therefore use a
-        # single trajectory value when possible
+        # A single trajectory is read with its own reader rather than
+        # through the ChainReader
         if len(trajectory) == 1:
             trajectory = trajectory[0]
         MDAnalysis.Universe.__init__(self, topology, trajectory,
@@ -66,7 +66,7 @@ class ConformationalDistanceMatrixGenerator:
     """
 
     def run(self, ensemble, selection="all", superimposition_selection="", ncores = None, pairwise_align = False,
-            mass_weighted = True, metadata = True):
+            mass_weighted = True, metadata = True, dtype = float64):
         """
         Run the conformational distance matrix calculation.
 
@@ -94,6 +94,12 @@ class ConformationalDistanceMatrixGenerator:
         ncores : int
             Number of cores to be used for parallel calculation
 
+        dtype : numpy.dtype
+            Type of the elements of the returned matrix, and precision in
+            which coordinates are handed to the distance calculation
+            (default is float64). float32 halves memory and bandwidth
+            usage and is more than enough for RMSD values.
+
         Returns
 		-------
 
@@ -203,14 +209,16 @@ class ConformationalDistanceMatrixGenerator:
                 masses,
                 subset_masses,
                 distmat,
-                partial_counters[i])) for i in range(ncores)]
+                partial_counters[i],
+                dtype)) for i in range(ncores)]
         else:
             workers = [Process(target=self._simple_worker,
                                args=(tasks_per_worker[i],
                                      ensemble.get_coordinates(selection,
                                      format='fac'),
                                masses, distmat,
-                                     partial_counters[i])) for i in range(ncores)]
+                                     partial_counters[i],
+                                     dtype)) for i in range(ncores)]
 
         workers += [Process(target=self._pbar_updater,
                             args=(pbar, partial_counters, matsize))]
@@ -222,16 +230,17 @@ class ConformationalDistanceMatrixGenerator:
             w.join()
 
         # When the workers have finished, return a TriangularMatrix object
-        return TriangularMatrix(distmat, metadata=metadata)
+        return TriangularMatrix(distmat, metadata=metadata, dtype=dtype)
 
-    def _simple_worker(self, tasks, coords, masses, rmsdmat, pbar_counter):
+    def _simple_worker(self, tasks, coords, masses, rmsdmat, pbar_counter,
+                       dtype=float64):
         '''Simple worker prototype; to be overriden in derived classes
         '''
 	return None
 
     def _fitter_worker(self, tasks, coords, subset_coords, masses,
                        subset_masses, rmsdmat,
-                       pbar_counter):  # Prototype fitter worker: pairwase
+                       pbar_counter, dtype=float64):  # Prototype fitter worker: pairwase
         # align and calculate metric. To be overidden in heir classes
 
 
@@ -280,7 +289,8 @@ class RMSDMatrixGenerator(ConformationalDistanceMatrixGenerator):
         fitter worker does.
     '''
 
-    def _simple_worker(self, tasks, coords, masses, rmsdmat, pbar_counter):
+    def _simple_worker(self, tasks, coords, masses, rmsdmat, pbar_counter,
+                       dtype=float64):
         '''
         Simple RMSD Matrix calculator.
             
@@ -308,18 +318,21 @@ class RMSDMatrixGenerator(ConformationalDistanceMatrixGenerator):
 			pbar_counter : multiprocessing.RawValue
 		            Thread-safe shared value. This counter is updated at every
 		            cycle and used to evaluate the progress of each worker.
+
+			dtype : numpy.dtype
+		            Precision in which the coordinates are compared
             '''
         for i, j in trm_indeces(tasks[0], tasks[1]):
             # masses = asarray(masses)/mean(masses)
             summasses = sum(masses)
-            rmsdmat[(i + 1) * i / 2 + j] = PureRMSD(coords[i].astype(float64),
-                                                    coords[j].astype(float64),
+            rmsdmat[(i + 1) * i / 2 + j] = PureRMSD(coords[i].astype(dtype, copy=False),
+                                                    coords[j].astype(dtype, copy=False),
                                                     coords[j].shape[0], masses,
                                                     summasses)
             pbar_counter.value += 1
 
     def _fitter_worker(self, tasks, coords, subset_coords, masses,
-                       subset_masses, rmsdmat, pbar_counter):
+                       subset_masses, rmsdmat, pbar_counter, dtype=float64):
         '''
             Fitter RMSD Matrix calculator: performs least-square fitting
             between each pair of structures before calculating the RMSD.
@@ -354,6 +367,9 @@ class RMSDMatrixGenerator(ConformationalDistanceMatrixGenerator):
             	pbar_counter : multiprocessing.RawValue
             	    Thread-safe shared value. This counter is updated at every
             	    cycle and used to evaluate the progress of each worker.
+
+            	dtype : numpy.dtype
+            	    Precision in which the coordinates are compared
             '''
 
         for i, j in trm_indeces(tasks[0], tasks[1]):
@@ -371,7 +387,7 @@ class RMSDMatrixGenerator(ConformationalDistanceMatrixGenerator):
                                       subset_weights)[0]
             rotated_i = transpose(dot(rotamat, transpose(translated_i)))
             rmsdmat[(i + 1) * i / 2 + j] = PureRMSD(
-                rotated_i.astype(float64), translated_j.astype(float64),
+                rotated_i.astype(dtype, copy=False), translated_j.astype(dtype, copy=False),
                 coords[j].shape[0], masses, summasses)
             pbar_counter.value += 1
 
@@ -382,7 +398,8 @@ class MinusRMSDMatrixGenerator(ConformationalDistanceMatrixGenerator):
         for details.
     '''
 
-    def _simple_worker(self, tasks, coords, masses, rmsdmat, pbar_counter):
+    def _simple_worker(self, tasks, coords, masses, rmsdmat, pbar_counter,
+                       dtype=float64):
         '''
             Simple RMSD Matrix calculator. See
             encore.confdistmatrix.RMSDMatrixGenerator._simple_worker for
@@ -391,14 +408,14 @@ class MinusRMSDMatrixGenerator(ConformationalDistanceMatrixGenerator):
         for i, j in trm_indeces(tasks[0], tasks[1]):
             # masses = asarray(masses)/mean(masses)
             summasses = sum(masses)
-            rmsdmat[(i + 1) * i / 2 + j] = MinusRMSD(coords[i].astype(float64),
-                                                     coords[j].astype(float64),
+            rmsdmat[(i + 1) * i / 2 + j] = MinusRMSD(coords[i].astype(dtype, copy=False),
+                                                     coords[j].astype(dtype, copy=False),
                                                      coords[j].shape[0],
                                                      masses, summasses)
             pbar_counter.value += 1
 
     def _fitter_worker(self, tasks, coords, subset_coords, masses,
-                       subset_masses, rmsdmat, pbar_counter):
+                       subset_masses, rmsdmat, pbar_counter, dtype=float64):
         '''
         Fitter RMSD Matrix calculator. See
         encore.confdistmatrix.RMSDMatrixGenerator._fitter_worker for details.
@@ -421,6 +438,6 @@ class MinusRMSDMatrixGenerator(ConformationalDistanceMatrixGenerator):
                     0]
             rotated_i = transpose(dot(rotamat, transpose(translated_i)))
             rmsdmat[(i + 1) * i / 2 + j] = MinusRMSD(
-                rotated_i.astype(float64), translated_j.astype(float64),
+                rotated_i.astype(dtype, copy=False), translated_j.astype(dtype, copy=False),
                 coords[j].shape[0], masses, summasses)
             pbar_counter.value += 1
@@ -196,7 +196,8 @@ def covariance_matrix(ensemble,
                       mass_weighted=True,
                       reference = None,
                       start=0,
-                      end=None):
+                      end=None,
+                      coordinates=None):
 
     """
     Calculates (optionally mass weighted) covariance matrix
@@ -222,6 +223,11 @@ def covariance_matrix(ensemble,
         Use the distances to a specific reference structure rather than the 
         distance to the mean.
 
+    coordinates : numpy.array or None
+        Coordinates of the selection in 'fac' format, if they have already
+        been extracted from the ensemble. If None (default), they are
+        extracted from the ensemble.
+
     Returns
 	-------
 
@@ -232,7 +238,8 @@ def covariance_matrix(ensemble,
 
     # Extract coordinates from ensemble
     # coordinates = ensemble.get_coordinates(start=start, end=end)
-    coordinates = ensemble.get_coordinates(selection, format='fac')
+    if coordinates is None:
+        coordinates = ensemble.get_coordinates(selection, format='fac')
 
 
     # Flatten coordinate matrix into n_frame x n_coordinates
@@ -44,6 +44,10 @@ handle the ensembles:
     + **Dimensional Reduction Ensemble Similarity** : :func:`dres`
     + **Ensemble class** : :class:`Ensemble`
 
+All three measures can also be calculated at once with :func:`hes_ces_dres`,
+which shares the extracted coordinates and the conformational distance
+matrix between them.
+
 When using this module in published work please cite [Tiberti2015]_.
 
 References
@@ -129,6 +133,24 @@ relative sense respect to HES, i.e. they can be used to understand whether
 ensemble A is closer to ensemble B respect to C, but absolute 
 values are less meaningful as they also depend on the chosen parameters.
 
+For large ensembles, the conformational distance matrix can be calculated
+and stored in single precision by passing ``dtype=numpy.float32`` to
+:func:`ces`, :func:`dres` or :func:`get_similarity_matrix`. The single
+precision matrix is then used as such by the clustering and dimensionality
+reduction algorithms, halving memory usage with no appreciable loss of
+accuracy for RMSD values.
+
+The time and memory spent in each stage of a calculation (coordinate
+extraction, matrix calculation, clustering, dimensionality reduction,
+evaluation of the similarity) can be monitored by passing an
+:class:`~MDAnalysis.analysis.encore.utils.StageProfiler` as the `profiler`
+argument. The clustering stage also records the number of iterations and
+the convergence of each affinity propagation run: ::
+
+    >>> profiler = encore.utils.StageProfiler()
+    >>> ces, details = encore.ces([ens1, ens2], profiler=profiler)
+    >>> print profiler["clustering"]["iterations"]
+
 
 Functions
 ---------
@@ -139,10 +161,13 @@ Functions
 
 .. autofunction:: dres
 
+.. autofunction:: hes_ces_dres
+
 
 
 """
 import numpy
+import copy
 import warnings
 import logging
 from time import sleep
@@ -319,13 +344,15 @@ def clustering_ensemble_similarity(cc, ens1, ens1_id, ens2, ens2_id,
             Jensen-Shannon divergence between the two ensembles, as calculated by
             the clustering ensemble similarity method
     """
-    ens1_coordinates = ens1.get_coordinates(selection, format='fac')
-    ens2_coordinates = ens2.get_coordinates(selection, format='fac')
+    # Only the number of frames is needed here, so avoid extracting the
+    # coordinates of the selection from each ensemble
+    ens1_size = float(ens1.trajectory.n_frames)
+    ens2_size = float(ens2.trajectory.n_frames)
     tmpA = numpy.array([numpy.where(c.metadata['ensemble'] == ens1_id)[
-                            0].shape[0] / float(ens1_coordinates.shape[0]) for
+                            0].shape[0] / ens1_size for
                         c in cc])
     tmpB = numpy.array([numpy.where(c.metadata['ensemble'] == ens2_id)[
-                            0].shape[0] / float(ens2_coordinates.shape[0]) for
+                            0].shape[0] / ens2_size for
                         c in cc])
 
     # Exclude clusters which have 0 elements in both ensembles    
@@ -718,7 +745,7 @@ def bootstrapped_matrix(matrix, ensemble_assignment):
             bootstrapped similarity/dissimilarity matrix
     """
     ensemble_identifiers = numpy.unique(ensemble_assignment)
-    this_m = TriangularMatrix(size=matrix.size)
+    this_m = TriangularMatrix(size=matrix.size, dtype=matrix.dtype)
     indexes = []
     for ens in ensemble_identifiers:
         old_indexes = numpy.where(ensemble_assignment == ens)[0]
@@ -746,7 +773,9 @@ def get_similarity_matrix(ensembles,
                           mass_weighted=True,
                           bootstrap_matrix=False,
                           bootstrapping_samples=100,
-                          np=1):
+                          np=1,
+                          dtype=numpy.float64,
+                          profiler=None):
     """
     Retrieves or calculates the similarity or conformational distance (RMSD)
     matrix. The similarity matrix is calculated between all the frames of all
@@ -813,6 +842,18 @@ def get_similarity_matrix(ensembles,
         np : int, optional
             Maximum number of cores to be used (default is 1)
 
+        dtype : numpy.dtype, optional
+            Type of the elements of the calculated matrix (default is
+            numpy.float64). Using numpy.float32 halves the memory needed
+            by the matrix and by the clustering and dimensionality reduction
+            algorithms that use it. A loaded matrix keeps the type it was
+            saved with.
+
+        profiler : encore.utils.StageProfiler, optional
+            If given, the time and memory spent extracting the coordinates,
+            calculating or loading the matrix and bootstrapping it are
+            recorded in it (default is None).
+
     Returns
     -------
         confdistmatrix : encore.utils.TriangularMatrix or list of encore.utils.TriangularMatrix
@@ -821,23 +862,27 @@ def get_similarity_matrix(ensembles,
             original one and they are returned as a list.
     """
 
+    if profiler is None:
+        profiler = StageProfiler()
+
     trajlist = []
     ensemble_assignment = []
 
     nensembles = len(ensembles)
 
-    # Define ensemble assignments as required on the joined ensemble
-    for i in range(1, nensembles + 1):
-        ensemble_assignment += [i for j in ensembles[i - 1]
-            .get_coordinates(selection, format='fac')]
-    ensemble_assignment = numpy.array(ensemble_assignment)
+    with profiler.stage("matrix_coordinates"):
+        # Define ensemble assignments as required on the joined ensemble
+        for i in range(1, nensembles + 1):
+            ensemble_assignment += [i for j in ensembles[i - 1]
+                .get_coordinates(selection, format='fac')]
+        ensemble_assignment = numpy.array(ensemble_assignment)
 
-    # Joined ensemble
-    joined_ensemble = Ensemble(topology=ensembles[0].topology_filename,
-                               trajectory=numpy.concatenate(
-                               tuple([e.trajectory.timeseries(e.atoms)
-                                      for e in ensembles]), axis=1),
-                               format=ArrayReader)
+        # Joined ensemble
+        joined_ensemble = Ensemble(topology=ensembles[0].topology_filename,
+                                   trajectory=numpy.concatenate(
+                                   tuple([e.trajectory.timeseries(e.atoms)
+                                          for e in ensembles]), axis=1),
+                                   format=ArrayReader)
 
     # Define metadata dictionary
     metadata = {'ensemble': ensemble_assignment}
@@ -856,73 +901,81 @@ def get_similarity_matrix(ensembles,
 
     # Load the matrix if required
     if load_matrix:
-        logging.info("        Loading similarity matrix from: %s" % load_matrix)
-        confdistmatrix = \
-            TriangularMatrix(
-                size=joined_ensemble.get_coordinates(selection,
-                                                     format='fac')
-                                                     .shape[0],
-                loadfile=load_matrix)
-        logging.info("        Done!")
-        for key in confdistmatrix.metadata.dtype.names:
-            logging.info("        %s : %s" % (
-                key, str(confdistmatrix.metadata[key][0])))
-
-        # Change matrix sign if required. Useful to switch between
-        # similarity/distance matrix.
-        if change_sign:
-            logging.info("        The matrix sign will be changed.")
-            confdistmatrix.change_sign()
-
-        # Check matrix size for consistency
-        if not confdistmatrix.size == \
-                joined_ensemble.get_coordinates(selection,
-                                                format='fac').shape[0]:
-            logging.error(
-                "ERROR: The size of the loaded matrix and of the ensemble"
-                " do not match")
-            return None
+        with profiler.stage("matrix_loading"):
+            logging.info("        Loading similarity matrix from: %s" % load_matrix)
+            confdistmatrix = \
+                TriangularMatrix(
+                    size=joined_ensemble.get_coordinates(selection,
+                                                         format='fac')
+                                                         .shape[0],
+                    loadfile=load_matrix)
+            logging.info("        Done!")
+            for key in confdistmatrix.metadata.dtype.names:
+                logging.info("        %s : %s" % (
+                    key, str(confdistmatrix.metadata[key][0])))
+
+            # Change matrix sign if required. Useful to switch between
+            # similarity/distance matrix.
+            if change_sign:
+                logging.info("        The matrix sign will be changed.")
+                confdistmatrix.change_sign()
+
+            # Check matrix size for consistency
+            if not confdistmatrix.size == \
+                    joined_ensemble.get_coordinates(selection,
+                                                    format='fac').shape[0]:
+                logging.error(
+                    "ERROR: The size of the loaded matrix and of the ensemble"
+                    " do not match")
+                return None
 
     # Calculate the matrix  
     else:
-        logging.info(
-            "        Perform pairwise alignment: %s" % str(superimpose))
-        logging.info("        Mass-weighted alignment and RMSD: %s" % str(
-            mass_weighted))
-        if superimpose:
+        with profiler.stage("matrix_calculation") as record:
             logging.info(
-                "        Atoms subset for alignment: %s"%superimposition_subset)
-        logging.info("    Calculating similarity matrix . . .")
-
-        # Use superimposition subset, if necessary. If the pairwise alignment is not required, it will not be performed anyway.
-        if superimposition_subset:
-            confdistmatrix = matrix_builder(
-                joined_ensemble,
-                selection = selection,
-                pairwise_align=superimpose,
-                mass_weighted=mass_weighted,
-                ncores=np)
+                "        Perform pairwise alignment: %s" % str(superimpose))
+            logging.info("        Mass-weighted alignment and RMSD: %s" % str(
+                mass_weighted))
+            if superimpose:
+                logging.info(
+                    "        Atoms subset for alignment: %s"%superimposition_subset)
+            logging.info("    Calculating similarity matrix . . .")
+
+            # Use superimposition subset, if necessary. If the pairwise alignment is not required, it will not be performed anyway.
+            if superimposition_subset:
+                confdistmatrix = matrix_builder(
+                    joined_ensemble,
+                    selection = selection,
+                    pairwise_align=superimpose,
+                    mass_weighted=mass_weighted,
+                    ncores=np,
+                    dtype=dtype)
 
-        else:
-            confdistmatrix = matrix_builder(joined_ensemble,
-                                            pairwise_align=superimpose,
-                                            mass_weighted=mass_weighted,
-                                            ncores=np)
+            else:
+                confdistmatrix = matrix_builder(joined_ensemble,
+                                                pairwise_align=superimpose,
+                                                mass_weighted=mass_weighted,
+                                                ncores=np,
+                                                dtype=dtype)
 
-        logging.info("    Done!")
+            logging.info("    Done!")
+            record['size'] = confdistmatrix.size
+            record['ncores'] = np
 
-        if save_matrix:
-            confdistmatrix.savez(save_matrix)
+            if save_matrix:
+                confdistmatrix.savez(save_matrix)
 
     if bootstrap_matrix:
-        bs_args = [tuple([confdistmatrix, ensemble_assignment]) for i in
-                   range(bootstrapping_samples)]
+        with profiler.stage("matrix_bootstrap") as record:
+            bs_args = [tuple([confdistmatrix, ensemble_assignment]) for i in
+                       range(bootstrapping_samples)]
 
-        pc = ParallelCalculation(np, bootstrapped_matrix, bs_args)
+            pc = ParallelCalculation(np, bootstrapped_matrix, bs_args)
 
-        pc_results = pc.run()
+            pc_results = pc.run()
 
-        bootstrap_matrices = zip(*pc_results)[1]
+            bootstrap_matrices = zip(*pc_results)[1]
+            record['samples'] = bootstrapping_samples
 
         return bootstrap_matrices
 
@@ -993,7 +1046,8 @@ def hes(ensembles,
         details=False,
         estimate_error=False,
         bootstrapping_samples=100,
-        calc_diagonal=False):
+        calc_diagonal=False,
+        profiler=None):
     """
 
     Calculates the Harmonic Ensemble Similarity (HES) between ensembles using
@@ -1020,7 +1074,8 @@ def hes(ensembles,
 
         details : bool, optional 
             Save the mean and covariance matrix for each
-            ensemble in a numpy array (default is False).
+            ensemble in a numpy array (default is False). The timings of
+            the calculation stages are saved as well, see `profiler`.
 
         estimate_error : bool, optional
             Whether to perform error estimation (default is False).
@@ -1029,6 +1084,12 @@ def hes(ensembles,
             Number of times the similarity matrix will be bootstrapped (default
             is 100).
 
+        profiler : encore.utils.StageProfiler, optional
+            Records wall time, CPU time and memory high-water mark of the
+            covariance estimation and of the evaluation of the similarity
+            (default is None). The list of stages is also saved in details,
+            as 'stages'.
+
 
     Returns
     -------
@@ -1081,6 +1142,9 @@ def hes(ensembles,
     Here None is returned in the array as no details has been requested. 
     """
 
+    if profiler is None:
+        profiler = StageProfiler()
+
     logging.info("Chosen metric: Harmonic similarity")
     if cov_estimator == "shrinkage":
         covariance_estimator = EstimatorShrinkage()
@@ -1105,28 +1169,30 @@ def hes(ensembles,
 
     if estimate_error:
         data = []
-        for t in range(bootstrapping_samples):
-            logging.info("The coordinates will be bootstrapped.")
-            xs = []
-            sigmas = []
-            values = numpy.zeros((out_matrix_eln, out_matrix_eln))
-            for e in ensembles:
-                this_coords = bootstrap_coordinates(
-                    e.get_coordinates(selection, format='fac'),
-                    1)[0]
-                xs.append(numpy.average(this_coords, axis=0).flatten())
-                sigmas.append(covariance_matrix(e,
-                                                mass_weighted=True,
-                                                estimator=covariance_estimator,
-                                                selection=selection))
-            for i, j in pairs_indeces:
-                value = harmonic_ensemble_similarity(x1=xs[i],
-                                                     x2=xs[j],
-                                                     sigma1=sigmas[i],
-                                                     sigma2=sigmas[j])
-                values[i, j] = value
-                values[j, i] = value
-            data.append(values)
+        with profiler.stage("harmonic_similarity_bootstrap") as record:
+            for t in range(bootstrapping_samples):
+                logging.info("The coordinates will be bootstrapped.")
+                xs = []
+                sigmas = []
+                values = numpy.zeros((out_matrix_eln, out_matrix_eln))
+                for e in ensembles:
+                    this_coords = bootstrap_coordinates(
+                        e.get_coordinates(selection, format='fac'),
+                        1)[0]
+                    xs.append(numpy.average(this_coords, axis=0).flatten())
+                    sigmas.append(covariance_matrix(e,
+                                                    mass_weighted=True,
+                                                    estimator=covariance_estimator,
+                                                    selection=selection))
+                for i, j in pairs_indeces:
+                    value = harmonic_ensemble_similarity(x1=xs[i],
+                                                         x2=xs[j],
+                                                         sigma1=sigmas[i],
+                                                         sigma2=sigmas[j])
+                    values[i, j] = value
+                    values[j, i] = value
+                data.append(values)
+            record['samples'] = bootstrapping_samples
         avgs = numpy.average(data, axis=0)
         stds = numpy.std(data, axis=0)
 
@@ -1136,27 +1202,28 @@ def hes(ensembles,
     # of each ensemble
     values = numpy.zeros((out_matrix_eln, out_matrix_eln))
 
-    for e in ensembles:
-        print e
-        # Extract coordinates from each ensemble
-        coordinates_system = e.get_coordinates(selection, format='fac')
+    with profiler.stage("covariance_estimation"):
+        for e in ensembles:
+            # Extract coordinates from each ensemble
+            coordinates_system = e.get_coordinates(selection, format='fac')
 
-        # Average coordinates in each system
-        xs.append(numpy.average(coordinates_system, axis=0).flatten())
+            # Average coordinates in each system
+            xs.append(numpy.average(coordinates_system, axis=0).flatten())
 
-        # Covariance matrices in each system
-        sigmas.append(covariance_matrix(e,
-                                        mass_weighted=mass_weighted,
-                                        estimator=covariance_estimator,
-                                        selection=selection))
-
-    for i, j in pairs_indeces:
-        value = harmonic_ensemble_similarity(x1=xs[i],
-                                             x2=xs[j],
-                                             sigma1=sigmas[i],
-                                             sigma2=sigmas[j])
-        values[i, j] = value
-        values[j, i] = value
+            # Covariance matrices in each system
+            sigmas.append(covariance_matrix(e,
+                                            mass_weighted=mass_weighted,
+                                            estimator=covariance_estimator,
+                                            selection=selection))
+
+    with profiler.stage("harmonic_similarity"):
+        for i, j in pairs_indeces:
+            value = harmonic_ensemble_similarity(x1=xs[i],
+                                                 x2=xs[j],
+                                                 sigma1=sigmas[i],
+                                                 sigma2=sigmas[j])
+            values[i, j] = value
+            values[j, i] = value
 
     # Save details as required
     if details:
@@ -1164,6 +1231,7 @@ def hes(ensembles,
         for i in range(out_matrix_eln):
             kwds['ensemble%d_mean' % (i + 1)] = xs[i]
             kwds['ensemble%d_covariance_matrix' % (i + 1)] = sigmas[i]
+        kwds['stages'] = profiler.stages
         details = numpy.array(kwds)
 
     else:
@@ -1187,6 +1255,7 @@ def ces(ensembles,
         details=False,
         calc_diagonal=False,
         np=1,
+        profiler=None,
         **kwargs):
     """
 
@@ -1259,6 +1328,16 @@ def ces(ensembles,
             (i.e. the simlarities of every ensemble against itself).
             If this is False (default), 0.0 will be used instead.
 
+        profiler : encore.utils.StageProfiler, optional
+            Records wall time, CPU time and memory high-water mark of each
+            stage of the calculation: coordinate extraction, similarity
+            matrix (see get_similarity_matrix), clustering and evaluation of
+            the similarity (default is None). The clustering stage also
+            records, for each affinity propagation run, the preference
+            value, the number of iterations, whether it converged and its
+            wall time. The list of stages is also saved in details,
+            as 'stages'.
+
         kwargs :  
             these arguments will be passed to get_similarity_matrix if the matrix
             is calculated on the fly. 
@@ -1338,12 +1417,16 @@ def ces(ensembles,
         raise TypeError("preferences expects a float or an iterable of numbers, such as a list of floats or a numpy.array")
         
 
+    if profiler is None:
+        profiler = StageProfiler()
+
     ensemble_assignment = []
-    for i in range(1, len(ensembles) + 1):
-        ensemble_assignment += \
-            [i for j in ensembles[i - 1].get_coordinates(selection,
-                                                         format='fac')]
-    ensemble_assignment = numpy.array(ensemble_assignment)
+    with profiler.stage("coordinate_extraction"):
+        for i in range(1, len(ensembles) + 1):
+            ensemble_assignment += \
+                [i for j in ensembles[i - 1].get_coordinates(selection,
+                                                             format='fac')]
+        ensemble_assignment = numpy.array(ensemble_assignment)
 
     metadata = {'ensemble': ensemble_assignment}
 
@@ -1361,6 +1444,7 @@ def ces(ensembles,
         if not estimate_error:
             confdistmatrix = get_similarity_matrix(ensembles,
                                                    selection=selection,
+                                                   profiler=profiler,
                                                    **kwargs)
         else:
             confdistmatrix = get_similarity_matrix(
@@ -1368,6 +1452,7 @@ def ces(ensembles,
                 selection=selection,
                 bootstrapping_samples=bootstrapping_samples,
                 bootstrap_matrix=True,
+                profiler=profiler,
                 **kwargs)
 
     if clustering_mode == "ap":
@@ -1416,13 +1501,18 @@ def ces(ensembles,
         logging.info("    Starting affinity propagation runs . . .")
 
         # Do it
-        pc = ParallelCalculation(np, clustalgo, args)
+        with profiler.stage("clustering") as record:
+            pc = ParallelCalculation(np, clustalgo, args,
+                                     [{'details': True} for a in args])
 
-        results = pc.run()
+            results = pc.run()
+            _record_clustering_runs(record, preferences,
+                                    [r[1][1] for r in results])
+            record['ncores'] = np
 
         # Create clusters collections from clustering results,
         # one for each cluster. None if clustering didn't work.
-        ccs = [ClustersCollection(clusters[1],
+        ccs = [ClustersCollection(clusters[1][0],
                                   metadata=metadata) for clusters in results]
 
         if estimate_error:
@@ -1431,34 +1521,35 @@ def ces(ensembles,
             values = {}
             avgs = []
             stds = []
-            for i, p in enumerate(preferences):
-                failed_runs = 0
-                values[p] = []
-                for j in range(len(bootstrap_matrices)):
-                    if ccs[k].clusters == None:
-                        failed_runs += 1
+            with profiler.stage("clustering_similarity"):
+                for i, p in enumerate(preferences):
+                    failed_runs = 0
+                    values[p] = []
+                    for j in range(len(bootstrap_matrices)):
+                        if ccs[k].clusters == None:
+                            failed_runs += 1
+                            k += 1
+                            continue
+                        values[p].append(numpy.zeros((out_matrix_eln,
+                                                      out_matrix_eln)))
+
+                        for pair in pairs_indeces:
+                            # Calculate dJS
+                            this_djs = \
+                                clustering_ensemble_similarity(ccs[k],
+                                                               ensembles[
+                                                                   pair[0]],
+                                                               pair[0] + 1,
+                                                               ensembles[
+                                                                   pair[1]],
+                                                               pair[1] + 1,
+                                                               selection=selection)
+                            values[p][-1][pair[0], pair[1]] = this_djs
+                            values[p][-1][pair[1], pair[0]] = this_djs
                         k += 1
-                        continue
-                    values[p].append(numpy.zeros((out_matrix_eln,
-                                                  out_matrix_eln)))
-
-                    for pair in pairs_indeces:
-                        # Calculate dJS
-                        this_djs = \
-                            clustering_ensemble_similarity(ccs[k],
-                                                           ensembles[
-                                                               pair[0]],
-                                                           pair[0] + 1,
-                                                           ensembles[
-                                                               pair[1]],
-                                                           pair[1] + 1,
-                                                           selection=selection)
-                        values[p][-1][pair[0], pair[1]] = this_djs
-                        values[p][-1][pair[1], pair[0]] = this_djs
-                    k += 1
-                outs = numpy.array(values[p])
-                avgs.append( numpy.average(outs, axis=0))
-                stds.append( numpy.std(outs, axis=0))
+                    outs = numpy.array(values[p])
+                    avgs.append( numpy.average(outs, axis=0))
+                    stds.append( numpy.std(outs, axis=0))
 
             if full_output:
                 avgs = numpy.array(avgs).swapaxes(0, 2)
@@ -1472,34 +1563,36 @@ def ces(ensembles,
     
         values = []
         kwds = {}
-        for i, p in enumerate(preferences):
-            if ccs[i].clusters == None:
-                print "gigigigi"
-                continue
-            else:
-                values.append(numpy.zeros((out_matrix_eln, out_matrix_eln)))
-
-                for pair in pairs_indeces:
-                    # Calculate dJS
-                    this_val = \
-                        clustering_ensemble_similarity(ccs[i],
-                                                       ensembles[pair[0]],
-                                                       pair[0] + 1,
-                                                       ensembles[pair[1]],
-                                                       pair[1] + 1,
-                                                       selection=selection)
-                    values[-1][pair[0], pair[1]] = this_val
-                    values[-1][pair[1], pair[0]] = this_val
+        with profiler.stage("clustering_similarity"):
+            for i, p in enumerate(preferences):
+                if ccs[i].clusters == None:
+                    logging.debug("No clusters for preference {0}, "
+                                  "skipping it.".format(p))
+                    continue
+                else:
+                    values.append(numpy.zeros((out_matrix_eln, out_matrix_eln)))
 
-            if details:
-                kwds['centroids_pref%.3f' % p] = numpy.array(
-                    [c.centroid for c in ccs[i]])
-                kwds['ensemble_sizes'] = numpy.array(
-                    [e.get_coordinates(selection, format='fac')
-                         .shape[0] for e in ensembles])
-                for cln, cluster in enumerate(ccs[i]):
-                    kwds["cluster%d_pref%.3f" % (cln + 1, p)] = numpy.array(
-                        cluster.elements)
+                    for pair in pairs_indeces:
+                        # Calculate dJS
+                        this_val = \
+                            clustering_ensemble_similarity(ccs[i],
+                                                           ensembles[pair[0]],
+                                                           pair[0] + 1,
+                                                           ensembles[pair[1]],
+                                                           pair[1] + 1,
+                                                           selection=selection)
+                        values[-1][pair[0], pair[1]] = this_val
+                        values[-1][pair[1], pair[0]] = this_val
+
+                if details:
+                    kwds['centroids_pref%.3f' % p] = numpy.array(
+                        [c.centroid for c in ccs[i]])
+                    kwds['ensemble_sizes'] = numpy.array(
+                        [e.get_coordinates(selection, format='fac')
+                             .shape[0] for e in ensembles])
+                    for cln, cluster in enumerate(ccs[i]):
+                        kwds["cluster%d_pref%.3f" % (cln + 1, p)] = numpy.array(
+                            cluster.elements)
 
 
     if full_output:
@@ -1508,6 +1601,7 @@ def ces(ensembles,
         values = values[0]
     
     if details:
+        kwds['stages'] = profiler.stages
         details = numpy.array(kwds)
     else:
         details = None
@@ -1533,6 +1627,7 @@ def dres(ensembles,
          details=False,
          np=1,
          calc_diagonal = False,
+         profiler=None,
          **kwargs):
     """
 
@@ -1603,6 +1698,15 @@ def dres(ensembles,
         np : int, optional
             Maximum number of cores to be used (default is 1).
 
+        profiler : encore.utils.StageProfiler, optional
+            Records wall time, CPU time and memory high-water mark of each
+            stage of the calculation: coordinate extraction, distance
+            matrix (see get_similarity_matrix), dimensionality reduction and
+            evaluation of the similarity (default is None). The
+            dimensionality reduction stage also records the number of
+            dimensions and the residual stress of each run. The list of
+            stages is also saved in details, as 'stages'.
+
         **kwargs :  
             these arguments will be passed to get_similarity_matrix if the matrix
             is calculated on the fly. 
@@ -1695,12 +1799,16 @@ def dres(ensembles,
     else:
         pairs_indeces = list(trm_indeces_nodiag(out_matrix_eln))
 
+    if profiler is None:
+        profiler = StageProfiler()
+
     ensemble_assignment = []
-    for i in range(1, len(ensembles) + 1):
-        ensemble_assignment += \
-            [i for j in ensembles[i - 1].get_coordinates(selection,
-                                                         format='fac')]
-    ensemble_assignment = numpy.array(ensemble_assignment)
+    with profiler.stage("coordinate_extraction"):
+        for i in range(1, len(ensembles) + 1):
+            ensemble_assignment += \
+                [i for j in ensembles[i - 1].get_coordinates(selection,
+                                                             format='fac')]
+        ensemble_assignment = numpy.array(ensemble_assignment)
 
     metadata = {'ensemble': ensemble_assignment}
 
@@ -1711,6 +1819,7 @@ def dres(ensembles,
         if not estimate_error:
             confdistmatrix = get_similarity_matrix(ensembles,
                                                    selection=selection,
+                                                   profiler=profiler,
                                                    **kwargs)
         else:
             confdistmatrix = get_similarity_matrix(
@@ -1718,6 +1827,7 @@ def dres(ensembles,
                 selection=selection,
                 bootstrapping_samples=bootstrapping_samples,
                 bootstrap_matrix=True,
+                profiler=profiler,
                 **kwargs)
 
     dimensions = map(int, dimensions)
@@ -1774,8 +1884,12 @@ def dres(ensembles,
     pc = ParallelCalculation(np, embedder, embedding_options)
 
     # Run parallel calculation
-    results = pc.run()
-    sleep(1)
+    with profiler.stage("dimensionality_reduction") as record:
+        results = pc.run()
+        sleep(1)
+        record['dimensions'] = numpy.array(runs)
+        record['stress'] = numpy.array([r[1][0] for r in results])
+        record['ncores'] = np
 
     embedded_spaces_perdim = {}
     stresses_perdim = {}
@@ -1787,34 +1901,35 @@ def dres(ensembles,
         stds = []
         values = {}
         k = 0
-        for ndim in dimensions:
-            values[ndim] = []
-            for i in range(len(bootstrapped_matrices)):
-
-                values[ndim].append(numpy.zeros((out_matrix_eln,
-                                                 out_matrix_eln)))
-
-                embedded_stress = results[k][1][0]
-                embedded_space = results[k][1][1]
-
-                kdes, resamples, embedded_ensembles = gen_kde_pdfs(
-                    embedded_space,
-                    ensemble_assignment,
-                    out_matrix_eln,
-                    nsamples=nsamples)
-
-                for pair in pairs_indeces:
-                    this_value = dimred_ensemble_similarity(kdes[pair[0]],
-                                                            resamples[pair[0]],
-                                                            kdes[pair[1]],
-                                                            resamples[pair[1]])
-                    values[ndim][-1][pair[0], pair[1]] = this_value
-                    values[ndim][-1][pair[1], pair[0]] = this_value
-
-                k += 1
-            outs = numpy.array(values[ndim])
-            avgs.append( numpy.average(outs, axis=0))
-            stds.append( numpy.std(outs, axis=0))
+        with profiler.stage("dimred_similarity"):
+            for ndim in dimensions:
+                values[ndim] = []
+                for i in range(len(bootstrapped_matrices)):
+
+                    values[ndim].append(numpy.zeros((out_matrix_eln,
+                                                     out_matrix_eln)))
+
+                    embedded_stress = results[k][1][0]
+                    embedded_space = results[k][1][1]
+
+                    kdes, resamples, embedded_ensembles = gen_kde_pdfs(
+                        embedded_space,
+                        ensemble_assignment,
+                        out_matrix_eln,
+                        nsamples=nsamples)
+
+                    for pair in pairs_indeces:
+                        this_value = dimred_ensemble_similarity(kdes[pair[0]],
+                                                                resamples[pair[0]],
+                                                                kdes[pair[1]],
+                                                                resamples[pair[1]])
+                        values[ndim][-1][pair[0], pair[1]] = this_value
+                        values[ndim][-1][pair[1], pair[0]] = this_value
+
+                    k += 1
+                outs = numpy.array(values[ndim])
+                avgs.append( numpy.average(outs, axis=0))
+                stds.append( numpy.std(outs, axis=0))
 
         if full_output:
             avgs = numpy.array(avgs).swapaxes(0, 2)
@@ -1839,40 +1954,42 @@ def dres(ensembles,
 
     kwds = {}
 
-    for ndim in dimensions:
+    with profiler.stage("dimred_similarity"):
+        for ndim in dimensions:
 
-        values.append(numpy.zeros((len(ensembles), len(ensembles))))
+            values.append(numpy.zeros((len(ensembles), len(ensembles))))
 
-        embedded_spaces = embedded_spaces_perdim[ndim]
-        embedded_stresses = stresses_perdim[ndim]
+            embedded_spaces = embedded_spaces_perdim[ndim]
+            embedded_stresses = stresses_perdim[ndim]
 
-        embedded_stress = embedded_stresses[numpy.argmin(embedded_stresses)]
-        embedded_space = embedded_spaces[numpy.argmin(embedded_stresses)]
+            embedded_stress = embedded_stresses[numpy.argmin(embedded_stresses)]
+            embedded_space = embedded_spaces[numpy.argmin(embedded_stresses)]
 
-        kdes, resamples, embedded_ensembles = gen_kde_pdfs(embedded_space,
-                                                           ensemble_assignment,
-                                                           len(ensembles),
-                                                           nsamples=nsamples)
+            kdes, resamples, embedded_ensembles = gen_kde_pdfs(embedded_space,
+                                                               ensemble_assignment,
+                                                               len(ensembles),
+                                                               nsamples=nsamples)
 
-        for pair in pairs_indeces:
-            this_value = dimred_ensemble_similarity(kdes[pair[0]],
-                                                    resamples[pair[0]],
-                                                    kdes[pair[1]],
-                                                    resamples[pair[1]])
-            values[-1][pair[0], pair[1]] = this_value
-            values[-1][pair[1], pair[0]] = this_value
+            for pair in pairs_indeces:
+                this_value = dimred_ensemble_similarity(kdes[pair[0]],
+                                                        resamples[pair[0]],
+                                                        kdes[pair[1]],
+                                                        resamples[pair[1]])
+                values[-1][pair[0], pair[1]] = this_value
+                values[-1][pair[1], pair[0]] = this_value
 
-        if details:
-            kwds["stress_%ddims" % ndim] = numpy.array([embedded_stress])
-            for en, e in enumerate(embedded_ensembles):
-                kwds["ensemble%d_%ddims" % (en, ndim)] = e
+            if details:
+                kwds["stress_%ddims" % ndim] = numpy.array([embedded_stress])
+                for en, e in enumerate(embedded_ensembles):
+                    kwds["ensemble%d_%ddims" % (en, ndim)] = e
 
-        if full_output:
-            values = numpy.array(values).swapaxes(0, 2)
-        else:
-            values = values[0]
+    if full_output:
+        values = numpy.array(values).swapaxes(0, 2)
+    else:
+        values = values[0]
 
     if details:
+        kwds['stages'] = profiler.stages
         details = numpy.array(kwds)
     else:
         details = None
@@ -1880,6 +1997,372 @@ def dres(ensembles,
     return values, details
 
 
+def _run_stage(function, *args, **kwargs):
+    """
+    Run one stage of a combined similarity calculation. This allows a single
+    encore.utils.ParallelCalculation to run different algorithms (e.g.
+    clustering and dimensionality reduction) in the same pool of workers.
+    """
+    return function(*args, **kwargs)
+
+
+def _record_clustering_runs(record, preferences, run_details):
+    """
+    Add the preference value, number of iterations, convergence status and
+    wall time of each affinity propagation run to a StageProfiler record.
+    """
+    record['preferences'] = numpy.array(preferences)
+    record['iterations'] = numpy.array([d['iterations'] for d in run_details])
+    record['converged'] = numpy.array([d['converged'] for d in run_details])
+    record['run_wall_times'] = numpy.array([d['wall_time']
+                                            for d in run_details])
+
+
+def hes_ces_dres(ensembles,
+                 selection="name CA",
+                 cov_estimator="shrinkage",
+                 mass_weighted=True,
+                 preference_values=-1.0,
+                 max_iterations=500,
+                 convergence=50,
+                 damping=0.9,
+                 noise=True,
+                 mode='vanilla',
+                 dimensions=3,
+                 maxlam=2.0,
+                 minlam=0.1,
+                 ncycle=100,
+                 nstep=10000,
+                 neighborhood_cutoff=1.5,
+                 kn=100,
+                 nsamples=1000,
+                 details=False,
+                 calc_diagonal=False,
+                 np=1,
+                 profiler=None,
+                 **kwargs):
+    """
+
+    Calculates the Harmonic, Clustering and Dimensional Reduction Ensemble
+    Similarities (see :func:`hes`, :func:`ces` and :func:`dres`) between
+    ensembles in a single pass.
+
+    Calling the three functions separately extracts the coordinates and
+    calculates the conformational distance matrix once for each of them.
+    Here, the coordinates of the selection are extracted from each ensemble
+    only once and the RMSD matrix is calculated only once; the -RMSD
+    similarity matrix needed for clustering is derived from it by changing
+    its sign. Affinity propagation and stochastic proximity embedding runs
+    are then distributed together over the same pool of `np` workers.
+
+
+    Parameters
+    ----------
+
+        ensembles : list
+            List of ensemble objects for similarity measurements
+
+        selection : str
+            Atom selection string in the MDAnalysis format. Default is "name CA"
+            (see http://mdanalysis.googlecode.com/git/package/doc/html/documentation_pages/selections.html)
+
+        cov_estimator : str, optional
+            Covariance matrix estimator method for HES, either shrinkage,
+            `shrinkage`, or Maximum Likelyhood, `ml`. Default is shrinkage.
+
+        mass_weighted : bool, optional
+            Whether to perform mass-weighted covariance matrix estimation
+            (default is True).
+
+        preference_values : float or iterable of floats, optional
+            Preference parameter used in the Affinity Propagation algorithm
+            for CES (default -1.0). See :func:`ces`.
+
+        max_iterations : int, optional
+            Maximum number of iterations for affinity propagation (default is
+            500).
+
+        convergence : int, optional
+            Minimum number of unchanging iterations to achieve convergence
+            (default is 50).
+
+        damping : float, optional
+            Damping factor (default is 0.9).
+
+        noise : bool, optional
+            Apply noise to similarity matrix before running clustering
+            (default is True)
+
+        mode : str, optional
+            Which algorithm to use for dimensional reduction in DRES, either
+            Stochastic Proximity Embedding (`vanilla`, default) or k-Nearest
+            Neighbor Stochastic Proximity Embedding (`knn`).
+
+        dimensions : int or iterable of ints
+            Number of dimensions to which the conformational space will be
+            reduced to for DRES (default is 3). See :func:`dres`.
+
+        maxlam : float, optional
+            Starting lambda learning rate parameter (default is 2.0).
+
+        minlam : float, optional
+            Final lambda learning rate (default is 0.1).
+
+        ncycle : int, optional
+            Number of cycles per run (default is 100).
+
+        nstep : int, optional
+            Number of steps per cycle (default is 10000)
+
+        neighborhood_cutoff : float, optional
+            Neighborhood cutoff (default is 1.5).
+
+        kn : int, optional
+            Number of neighbours to be considered (default is 100)
+
+        nsamples : int, optional
+            Number of samples to be drawn from the ensembles (default is 1000).
+
+        details : bool, optional
+            Whether to provide the details of the HES, CES and DRES
+            calculations (default is False).
+
+        calc_diagonal : bool
+            Whether to calculate the diagonal of the similarity scores
+            (i.e. the simlarities of every ensemble against itself).
+            If this is False (default), 0.0 will be used instead.
+
+        np : int, optional
+            Maximum number of cores to be used (default is 1).
+
+        profiler : encore.utils.StageProfiler, optional
+            Records wall time, CPU time and memory high-water mark of each
+            stage of the calculation (default is None). The combined
+            clustering and embedding stage also records the metrics of
+            each run, as in :func:`ces` and :func:`dres`. The list of
+            stages is also saved in details, as 'stages'.
+
+        **kwargs :
+            these arguments will be passed to get_similarity_matrix when
+            calculating the conformational distance matrix.
+
+    Returns
+    -------
+
+        (hes, ces, dres), details : (numpy.array, numpy.array, numpy.array), numpy.array
+            The similarity values for each measure, arranged as they are
+            returned by :func:`hes`, :func:`ces` and :func:`dres`
+            respectively. Clustering runs that do not converge give
+            numpy.nan values. details is None unless details is True.
+
+
+    Example
+    -------
+
+        >>> ens1 = encore.Ensemble(topology=PDB_small, trajectory=DCD)
+        >>> ens2 = encore.Ensemble(topology=PDB_small, trajectory=DCD2)
+        >>> (HES, CES, DRES), details = encore.hes_ces_dres([ens1, ens2])
+
+    """
+
+    if not hasattr(preference_values, '__iter__'):
+        preference_values = [preference_values]
+        ces_full_output = False
+    else:
+        ces_full_output = True
+    try:
+        preferences = map(float, preference_values)
+    except:
+        raise TypeError("preferences expects a float or an iterable of numbers, such as a list of floats or a numpy.array")
+
+    if not hasattr(dimensions, '__iter__'):
+        dimensions = [dimensions]
+        dres_full_output = False
+    else:
+        dres_full_output = True
+    try:
+        dimensions = map(int, dimensions)
+    except:
+        raise TypeError("dimensions expects an int or an iterable of ints, such as a list of ints or a numpy.array")
+
+    if cov_estimator == "shrinkage":
+        covariance_estimator = EstimatorShrinkage()
+    elif cov_estimator == "ml":
+        covariance_estimator = EstimatorML()
+    else:
+        logging.error(
+            "Covariance estimator %s is not supported. "
+            "Choose between 'shrinkage' and 'ml'." % cov_estimator)
+        return None
+
+    if mode == 'vanilla':
+        embedder = StochasticProximityEmbedding()
+    elif mode == 'knn':
+        embedder = kNNStochasticProximityEmbedding()
+    else:
+        logging.error(
+            "Dimensionality reduction mode %s is not supported. "
+            "Choose between 'vanilla' and 'knn'." % mode)
+        return None
+
+    out_matrix_eln = len(ensembles)
+
+    if calc_diagonal:
+        pairs_indeces = list(trm_indeces_diag(out_matrix_eln))
+    else:
+        pairs_indeces = list(trm_indeces_nodiag(out_matrix_eln))
+
+    if profiler is None:
+        profiler = StageProfiler()
+
+    # Extract coordinates once for all the measures
+    with profiler.stage("coordinate_extraction"):
+        coordinates = [e.get_coordinates(selection, format='fac')
+                       for e in ensembles]
+    ensemble_sizes = numpy.array([c.shape[0] for c in coordinates])
+    ensemble_assignment = numpy.repeat(numpy.arange(1, out_matrix_eln + 1),
+                                       ensemble_sizes)
+    metadata = {'ensemble': ensemble_assignment}
+
+    # HES
+    logging.info("Chosen metric: Harmonic similarity")
+    xs = []
+    sigmas = []
+    with profiler.stage("covariance_estimation"):
+        for e, c in zip(ensembles, coordinates):
+            xs.append(numpy.average(c, axis=0).flatten())
+            sigmas.append(covariance_matrix(e,
+                                            mass_weighted=mass_weighted,
+                                            estimator=covariance_estimator,
+                                            selection=selection,
+                                            coordinates=c))
+
+    hes_values = numpy.zeros((out_matrix_eln, out_matrix_eln))
+    with profiler.stage("harmonic_similarity"):
+        for i, j in pairs_indeces:
+            value = harmonic_ensemble_similarity(x1=xs[i],
+                                                 x2=xs[j],
+                                                 sigma1=sigmas[i],
+                                                 sigma2=sigmas[j])
+            hes_values[i, j] = value
+            hes_values[j, i] = value
+
+    # Conformational distance matrix, calculated once. AP requires the
+    # similarity (-RMSD) matrix, SPE the distance (RMSD) one.
+    kwargs['similarity_mode'] = "rmsd"
+    confdistmatrix = get_similarity_matrix(ensembles,
+                                           selection=selection,
+                                           np=np,
+                                           profiler=profiler,
+                                           **kwargs)
+    similaritymatrix = copy.deepcopy(confdistmatrix)
+    similaritymatrix.change_sign()
+
+    # Run clustering and dimensionality reduction in the same worker pool
+    logging.info("    Starting affinity propagation and stochastic "
+                 "proximity embedding runs . . .")
+    clustalgo = AffinityPropagation()
+    stressfreq = -1
+    args = []
+    run_kwargs = []
+    for p in preferences:
+        args.append((clustalgo, similaritymatrix, p, damping,
+                     max_iterations, convergence, int(noise)))
+        run_kwargs.append({'details': True})
+    for ndim in dimensions:
+        if mode == 'vanilla':
+            args.append((embedder, confdistmatrix, neighborhood_cutoff, ndim,
+                         maxlam, minlam, ncycle, nstep, stressfreq))
+        else:
+            args.append((embedder, confdistmatrix, kn, ndim,
+                         maxlam, minlam, ncycle, nstep, stressfreq))
+        run_kwargs.append({})
+
+    with profiler.stage("clustering_and_embedding") as record:
+        pc = ParallelCalculation(np, _run_stage, args, run_kwargs)
+        results = pc.run()
+        _record_clustering_runs(record, preferences,
+                                [r[1][1] for r in results[:len(preferences)]])
+        record['dimensions'] = numpy.array(dimensions)
+        record['stress'] = numpy.array([r[1][0] for r in
+                                        results[len(preferences):]])
+        record['ncores'] = np
+
+    clustering_results = [(k, r[0]) for k, r in results[:len(preferences)]]
+    embedding_results = results[len(preferences):]
+
+    # CES
+    kwds = {}
+    ces_values = []
+    with profiler.stage("clustering_similarity"):
+        for (k, clusters), p in zip(clustering_results, preferences):
+            cc = ClustersCollection(clusters, metadata=metadata)
+            ces_values.append(numpy.zeros((out_matrix_eln, out_matrix_eln)))
+            if cc.clusters is None:
+                logging.warning("Preference %3.2f: clustering failed, CES "
+                                "values will be set to nan" % p)
+                ces_values[-1][:] = numpy.nan
+                continue
+            for i, j in pairs_indeces:
+                value = clustering_ensemble_similarity(cc,
+                                                       ensembles[i], i + 1,
+                                                       ensembles[j], j + 1,
+                                                       selection=selection)
+                ces_values[-1][i, j] = value
+                ces_values[-1][j, i] = value
+            if details:
+                kwds['centroids_pref%.3f' % p] = numpy.array(
+                    [c.centroid for c in cc])
+                for cln, cluster in enumerate(cc):
+                    kwds["cluster%d_pref%.3f" % (cln + 1, p)] = numpy.array(
+                        cluster.elements)
+
+    # DRES
+    dres_values = []
+    with profiler.stage("dimred_similarity"):
+        for (k, (stress, embedded_space)), ndim in zip(embedding_results,
+                                                       dimensions):
+            dres_values.append(numpy.zeros((out_matrix_eln, out_matrix_eln)))
+            kdes, resamples, embedded_ensembles = gen_kde_pdfs(
+                embedded_space,
+                ensemble_assignment,
+                out_matrix_eln,
+                nsamples=nsamples)
+            for i, j in pairs_indeces:
+                value = dimred_ensemble_similarity(kdes[i],
+                                                   resamples[i],
+                                                   kdes[j],
+                                                   resamples[j])
+                dres_values[-1][i, j] = value
+                dres_values[-1][j, i] = value
+            if details:
+                kwds["stress_%ddims" % ndim] = numpy.array([stress])
+                for en, e in enumerate(embedded_ensembles):
+                    kwds["ensemble%d_%ddims" % (en, ndim)] = e
+
+    if ces_full_output:
+        ces_values = numpy.array(ces_values).swapaxes(0, 2)
+    else:
+        ces_values = ces_values[0]
+
+    if dres_full_output:
+        dres_values = numpy.array(dres_values).swapaxes(0, 2)
+    else:
+        dres_values = dres_values[0]
+
+    if details:
+        kwds['ensemble_sizes'] = ensemble_sizes
+        for i in range(out_matrix_eln):
+            kwds['ensemble%d_mean' % (i + 1)] = xs[i]
+            kwds['ensemble%d_covariance_matrix' % (i + 1)] = sigmas[i]
+        kwds['stages'] = profiler.stages
+        details = numpy.array(kwds)
+    else:
+        details = None
+
+    return (hes_values, ces_values, dres_values), details
+
+
 def ces_convergence(original_ensemble,
                     window_size,
                     selection="name CA",
@@ -29,6 +29,10 @@ except ImportError:
 import time
 import optparse
 import copy
+import os
+import logging
+import resource
+from contextlib import contextmanager
 
 
 class TriangularMatrix:
@@ -47,9 +51,12 @@ class TriangularMatrix:
 		
 		`metadata` : dict
 			Metadata for the matrix (date of creation, name of author ...)
+
+		`dtype` : numpy.dtype
+			Type of the matrix elements
 	"""
 
-    def __init__(self, size, metadata=None, loadfile=None):
+    def __init__(self, size, metadata=None, loadfile=None, dtype=float64):
         """Class constructor.
         
 		Attributes
@@ -68,6 +75,13 @@ class TriangularMatrix:
     	    Load the matrix from this file. All the attributes and data will
     	    be determined by the matrix file itself (i.e. metadata will be
     	    ignored); size has to be provided though.
+
+    	    `dtype` : numpy.dtype
+    	    Type of the matrix elements (default is float64). Using float32
+    	    halves the memory footprint of the matrix, and is carried through
+    	    the clustering and dimensionality reduction algorithms. Ignored if
+    	    the matrix is loaded from file, in which case the saved type is
+    	    used.
         """
         self.metadata = metadata
         self.size = size
@@ -76,15 +90,20 @@ class TriangularMatrix:
             return
         if type(size) == int:
             self.size = size
-            self._elements = zeros((size + 1) * size / 2, dtype=float64)
+            self._elements = zeros((size + 1) * size / 2, dtype=dtype)
             return
         if type(size) == SynchronizedArray:
-            self._elements = array(size.get_obj(), dtype=float64)
+            self._elements = array(size.get_obj(), dtype=dtype)
             self.size = int((sqrt(1 + 8 * len(size)) - 1) / 2)
             return
         else:
             raise TypeError
 
+    @property
+    def dtype(self):
+        """Type of the matrix elements"""
+        return self._elements.dtype
+
     def __getitem__(self, args):
         x, y = args
         if x < y:
@@ -99,7 +118,8 @@ class TriangularMatrix:
 
     def savez(self, fname):
         """Save matrix in the npz compressed numpy format. Save metadata and
-        data as well.
+        data as well. The elements are saved in their own type, so that
+        single precision matrices stay single precision when loaded back.
 
 		Parameters
 		----------
@@ -134,8 +154,7 @@ class TriangularMatrix:
         """
         Change sign of each element of the matrix
         """
-        for k, v in enumerate(self._elements):
-            self._elements[k] = -v
+        self._elements *= -1
 
 
 class ParallelCalculation:
@@ -264,6 +283,89 @@ class ParallelCalculation:
         return tuple(sorted(results_list, key=lambda x: x[0]))
 
 
+class StageProfiler(object):
+    """
+    Collect timings and metrics of the stages of an ENCORE calculation.
+    A StageProfiler can be passed as the `profiler` argument of hes, ces,
+    dres and get_similarity_matrix; each of them records its own stages
+    (e.g. coordinate extraction, matrix calculation, clustering, Jensen-Shannon
+    divergence evaluation) in it. The stages are also included in the details
+    returned by hes, ces and dres.
+
+	Attributes
+	----------
+
+		`stages` : list of dicts
+			One dictionary per completed stage, in order of completion. Each
+			dictionary contains the stage 'name', its 'wall_time' and
+			'cpu_time' (seconds, the latter including the child processes
+			that finished during the stage) and the memory high-water marks
+			'max_rss' and 'max_rss_children' (kilobytes) at the end of the
+			stage. Stages can add further metrics, such as the number of
+			iterations of each clustering run.
+
+		`callback` : callable or None
+			Called with the dictionary of each stage when the stage ends.
+    """
+
+    def __init__(self, callback=None):
+        """ Class constructor.
+
+	Parameters
+	----------
+
+		`callback` : callable or None
+			Function to be called with the dictionary of each stage when the
+			stage ends, e.g. to monitor long calculations.
+	"""
+        self.stages = []
+        self.callback = callback
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Context manager recording a stage. It yields the dictionary of the
+        stage, to which metrics can be added within the context.
+
+		Parameters
+		----------
+
+			`name` : str
+				Name of the stage
+        """
+        record = {'name': name}
+        start_wall = time.time()
+        start_times = os.times()
+        try:
+            yield record
+        finally:
+            end_times = os.times()
+            record['wall_time'] = time.time() - start_wall
+            record['cpu_time'] = (end_times[0] - start_times[0] +
+                                  end_times[1] - start_times[1] +
+                                  end_times[2] - start_times[2] +
+                                  end_times[3] - start_times[3])
+            record['max_rss'] = \
+                resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            record['max_rss_children'] = \
+                resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+            self.stages.append(record)
+            logging.info("    Stage %s: %.3f s wall time, %.3f s CPU time" %
+                         (name, record['wall_time'], record['cpu_time']))
+            if self.callback is not None:
+                self.callback(record)
+
+    def __getitem__(self, name):
+        """Return the dictionary of the last stage called `name`"""
+        for record in reversed(self.stages):
+            if record['name'] == name:
+                return record
+        raise KeyError(name)
+
+    def __contains__(self, name):
+        return any(record['name'] == name for record in self.stages)
+
+
 class ProgressBar(object):
     """Handle and draw a progress barr.
     From https://github.com/ikame/progressbar
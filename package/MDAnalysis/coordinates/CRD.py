@@ -48,7 +48,7 @@ class CRDReader(base.SingleFrameReader):
         #      (i5) natoms
         #      (2I5,1X,A4,1X,A4,3F10.5,1X,A4,1X,A4,F10.5)
         #      iatom,ires,resn,typr,x,y,z,segid,orig_resid,wmain
-        coords_list = []
+        atomlines = []
         with util.openany(self.filename, 'r') as crdfile:
             extended = False
             natoms = 0
@@ -61,19 +61,32 @@ class CRDReader(base.SingleFrameReader):
                     natoms = int(fields[0])
                     extended = (fields[-1] == 'EXT')
                     continue
-                # process coordinates
+                atomlines.append((linenum, line))
+
+        # process coordinates (3F20.10 or 3F10.5)
+        if extended:
+            columns = [(40, 60), (60, 80), (80, 100)]
+        else:
+            columns = [(20, 30), (30, 40), (40, 50)]
+        try:
+            coordinates = util.read_fixed_columns(
+                [line for linenum, line in atomlines], columns)
+        except ValueError:
+            # not aligned to the columns, find the line with the error
+            start, stop = columns[0][0], columns[-1][1]
+            for linenum, line in atomlines:
                 try:
-                    if extended:
-                        coords_list.append(np.array(line[45:100].split()[0:3], dtype=float))
-                    else:
-                        coords_list.append(np.array(line[20:50].split()[0:3], dtype=float))
-                except:
+                    np.array(line[start:stop].split()[0:3], dtype=float)
+                except ValueError:
                     raise ValueError("Check CRD format at line {0}: {1}"
                                      "".format(linenum, line.rstrip()))
+            coordinates = np.array([line[start:stop].split()[0:3]
+                                    for linenum, line in atomlines],
+                                   dtype=np.float32)
 
-        self.n_atoms = len(coords_list)
+        self.n_atoms = len(coordinates)
 
-        self.ts = self._Timestep.from_coordinates(np.array(coords_list),
+        self.ts = self._Timestep.from_coordinates(coordinates,
                                                   **self._ts_kwargs)
         self.ts.frame = 0  # 0-based frame number
         # if self.convert_units:
@@ -72,7 +72,9 @@ import os
 import errno
 import numpy as np
 import struct
+import sys
 import types
+import warnings
 
 from ..core import flags
 from .. import units as mdaunits  # use mdaunits instead of units to avoid a clash
@@ -84,6 +86,11 @@ from . import _dcdmodule
 # dcdtimeseries is implemented with Pyrex - hopefully all dcd reading functionality can move to pyrex
 from . import dcdtimeseries
 
+# flags describing the DCD flavor, see include/readdcd.h
+DCD_IS_CHARMM = 0x01
+DCD_HAS_4DIMS = 0x02
+DCD_HAS_EXTRA_BLOCK = 0x04
+
 
 class Timestep(base.Timestep):
     #: Indices into :attr:`Timestep._unitcell` (``[A, gamma, B, beta, alpha,
@@ -399,17 +406,58 @@ class DCDReader(base.Reader):
        Frames now 0-based instead of 1-based
        Native frame number read into ts._frame
        Removed skip keyword and functionality
+    .. versionchanged:: 0.15.0
+       Added *follow*, *follow_timeout* and *follow_interval* keywords to
+       follow a DCD file that is still being written.
+       Added *mmap* keyword to memory map the frames of the DCD file.
+       Added *atom_indices* keyword to read only a subset of the atoms.
     """
     format = 'DCD'
     flavor = 'CHARMM'
     units = {'time': 'AKMA', 'length': 'Angstrom'}
     _Timestep = Timestep
+    _reads_atom_indices = True
+
+    def __init__(self, dcdfilename, follow=False, follow_timeout=None,
+                 follow_interval=1.0, mmap=False, atom_indices=None,
+                 **kwargs):
+        """Open a DCD file and read its header
 
-    def __init__(self, dcdfilename, **kwargs):
+        :Arguments:
+           *dcdfilename*
+              name of the DCD file
+        :Keywords:
+           *follow*
+              when iterating reaches the last frame, wait for frames to be
+              appended to the file (e.g. by a running simulation), see
+              :meth:`update_n_frames` [``False``]
+           *follow_timeout*
+              stop iterating if no new frame was appended within this number
+              of seconds; ``None`` waits forever [``None``]
+           *follow_interval*
+              seconds between two checks for new frames [1.0]
+           *mmap*
+              memory map the frames instead of reading them from the file.
+              Each frame is a record of fixed size, so that frames are
+              accessed directly in the page cache of the operating system,
+              which is shared between all processes reading the same file,
+              and :meth:`timeseries` only touches the pages of the selected
+              atoms. Files with fixed atoms are read normally. [``False``]
+           *atom_indices*
+              0-based indices of the atoms that are read; the Timestep only
+              holds these atoms. Memory mapped frames only touch the pages
+              of these atoms, otherwise every frame is decoded into a buffer
+              and the atoms are copied from it. [``None``]
+        """
         super(DCDReader, self).__init__(dcdfilename, **kwargs)
+        self._follow = follow
+        self._follow_timeout = follow_timeout
+        self._follow_interval = follow_interval
 
         self.dcdfilename = self.filename # dcdfilename is legacy
         self.dcdfile = None  # set right away because __del__ checks
+        self._mmap = None
+        self._mmap_next = 0
 
         # Issue #32: segfault if dcd is 0-size
         # Hack : test here... (but should be fixed in dcd.c)
@@ -425,6 +473,15 @@ class DCDReader(base.Reader):
 
         # This reads skip_timestep and delta from header
         self._read_dcd_header()
+        # the C code reads and skips frames of all atoms in the file
+        self._n_file_atoms = self.n_atoms
+        self.n_atoms = self._init_atom_indices(atom_indices,
+                                               self._n_file_atoms)
+        if self._atom_indices is not None:
+            self._buffer = np.zeros((self._n_file_atoms, 3), dtype=np.float32,
+                                    order=self._Timestep.order)
+        if mmap:
+            self._map_frames()
 
         # Convert delta to ps
         delta = mdaunits.convert(self.delta, self.units['time'], 'ps')
@@ -470,8 +527,86 @@ class DCDReader(base.Reader):
             'charmm', 'first', 'with_unitcell']
         return dict(zip(desc, struct.unpack("LLiiiiidiPPiiii", self._dcd_C_str)))
 
+    def _frame_dtype(self):
+        """numpy dtype of the record of a frame in the DCD file
+
+        Every block of the record is framed by two integers holding its size
+        in bytes (Fortran unformatted records).
+        """
+        byteorder = '<' if sys.byteorder == 'little' else '>'
+        if self._reverse_endian:
+            byteorder = '>' if byteorder == '<' else '<'
+        i4, f4, f8 = (byteorder + t for t in ('i4', 'f4', 'f8'))
+        fields = []
+        charmm = self._charmm & DCD_IS_CHARMM
+        if charmm and self._charmm & DCD_HAS_EXTRA_BLOCK:
+            fields += [('_unitcell_size', i4), ('unitcell', f8, (6,)),
+                       ('_unitcell_end', i4)]
+        blocks = 'xyzw' if charmm and self._charmm & DCD_HAS_4DIMS else 'xyz'
+        for block in blocks:
+            fields += [('_{0}_size'.format(block), i4),
+                       (block, f4, (self._n_file_atoms,)),
+                       ('_{0}_end'.format(block), i4)]
+        # numpy does not accept unicode field names under Python 2
+        return np.dtype([tuple(str(item) if isinstance(item, type(u'')) else
+                               item for item in field) for field in fields])
+
+    def _map_frames(self):
+        """memory map the frames of the DCD file
+
+        The first frame of files with fixed atoms is larger than the others,
+        such files are not mapped.
+        """
+        if self.fixed:
+            warnings.warn("Can not memory map DCD file {0} with fixed atoms; "
+                          "reading it normally".format(self.filename))
+            return
+        dtype = self._frame_dtype()
+        mmap = np.memmap(self.filename, dtype=dtype, mode='r',
+                         offset=self._header_size, shape=(self.n_frames,))
+        if mmap['_x_size'][0] != 4 * self._n_file_atoms:
+            warnings.warn("Unexpected layout of the frames in DCD file {0}; "
+                          "reading it normally".format(self.filename))
+            return
+        self._mmap = mmap
+
+    def _mapped_frame_to_ts(self, frame, ts):
+        """copy a frame from the memory mapped file into ts"""
+        record = self._mmap[frame]
+        for i, block in enumerate('xyz'):
+            ts._pos[:, i] = self._select_atoms(record[block])
+        unitcell = ts._unitcell
+        if 'unitcell' in record.dtype.names:
+            unitcell[:] = record['unitcell']
+            angles = unitcell[[1, 3, 4]]
+            if np.all((angles >= -1.0) & (angles <= 1.0)):
+                # angle cosines written by CHARMM or NAMD > 2.5, see
+                # __read_next_frame in src/dcd.c
+                unitcell[[1, 3, 4]] = 90.0 - np.degrees(
+                    np.arcsin(angles.astype(np.float64)))
+        else:
+            unitcell[[0, 2, 5]] = 0.0
+            unitcell[[1, 3, 4]] = 90.0
+        ts._frame = frame + 1
+        return ts
+
+    def _read_dcd_frame(self, ts):
+        """read the next frame from the file into ts, return its native number
+
+        With :attr:`atom_indices` the C code decodes the complete frame into
+        a buffer from which the selected atoms are copied.
+        """
+        if self._atom_indices is None:
+            return self._read_next_frame(ts._x, ts._y, ts._z, ts._unitcell, 1)
+        buf = self._buffer
+        frame = self._read_next_frame(buf[:, 0], buf[:, 1], buf[:, 2],
+                                      ts._unitcell, 1)
+        ts._pos[:] = buf[self._atom_indices]
+        return frame
+
     def _reopen(self):
         self.ts.frame = -1
+        self._mmap_next = 0
         self._reset_dcd_read()
 
     def _read_next_timestep(self, ts=None):
@@ -482,7 +617,13 @@ class DCDReader(base.Reader):
         """
         if ts is None:
             ts = self.ts
-        ts._frame = self._read_next_frame(ts._x, ts._y, ts._z, ts._unitcell, 1)
+        if self._mmap is not None:
+            if self._mmap_next >= self.n_frames:
+                raise IOError(errno.EIO, "End of file reached for dcd file")
+            self._mapped_frame_to_ts(self._mmap_next, ts)
+            self._mmap_next += 1
+        else:
+            ts._frame = self._read_dcd_frame(ts)
         ts.frame += 1
         return ts
 
@@ -492,12 +633,33 @@ class DCDReader(base.Reader):
         .. versionchanged:: 0.11.0
            Native frame read into ts._frame, ts.frame naively set to frame
         """
-        self._jump_to_frame(frame)
         ts = self.ts
-        ts._frame = self._read_next_frame(ts._x, ts._y, ts._z, ts._unitcell, 1)
+        if self._mmap is not None:
+            self._mapped_frame_to_ts(frame, ts)
+            self._mmap_next = frame + 1
+        else:
+            self._jump_to_frame(frame)
+            ts._frame = self._read_dcd_frame(ts)
         ts.frame = frame
         return ts
 
+    def update_n_frames(self):
+        """Look for frames appended to the DCD file since it was opened.
+
+        The number of frames is recalculated from the file size; frames which
+        are not completely written yet are not counted.
+
+        :Returns: number of new frames
+
+        .. versionadded:: 0.15.0
+        """
+        n_frames = self._update_dcd_nsets()
+        n_new = n_frames - self.n_frames
+        self.n_frames = n_frames
+        if n_new > 0 and self._mmap is not None:
+            self._map_frames()
+        return n_new
+
     def timeseries(self, asel, start=0, stop=-1, skip=1, format='afc'):
         """Return a subset of coordinate data for an AtomGroup
 
@@ -518,12 +680,29 @@ class DCDReader(base.Reader):
             raise NoDataError("Timeseries requires at least one atom to analyze")
         if len(format) != 3 and format not in ['afc', 'acf', 'caf', 'cfa', 'fac', 'fca']:
             raise ValueError("Invalid timeseries format")
-        atom_numbers = list(asel.indices)
-        # Check if the atom numbers can be grouped for efficiency, then we can read partial buffers
-        # from trajectory file instead of an entire timestep
-        # XXX needs to be implemented
+        indices = self._file_atom_indices(asel.indices)
+        if self._mmap is not None:
+            return self._mapped_timeseries(indices, start, stop, skip, format)
+        atom_numbers = list(indices)
+        # Only runs of consecutive atom numbers (joined across small gaps)
+        # are read from each timestep, see group_dcdsubset_runs() in
+        # readdcd.h
         return self._read_timeseries(atom_numbers, start, stop, skip, format)
 
+    def _mapped_timeseries(self, indices, start, stop, skip, format):
+        """timeseries from the memory mapped frames, by fancy indexing"""
+        # stop is inclusive
+        stop += 1 if skip > 0 else -1
+        if stop < 0:
+            stop = None
+        frames = slice(start, stop, skip)
+        n_frames = len(self._mmap[frames])
+        coordinates = np.empty((n_frames, len(indices), 3), dtype=np.float64)
+        for i, block in enumerate('xyz'):
+            coordinates[:, :, i] = self._mmap[block][frames][:, indices]
+        return np.ascontiguousarray(
+            coordinates.transpose(['fac'.index(c) for c in format]))
+
     def correl(self, timeseries, start=0, stop=-1, skip=1):
         """Populate a TimeseriesCollection object with timeseries computed from the trajectory
 
@@ -537,6 +716,9 @@ class DCDReader(base.Reader):
         atomlist = timeseries._getAtomList()
         format = timeseries._getFormat()
         lowerb, upperb = timeseries._getBounds()
+        if self._atom_indices is not None and atomlist:
+            atomlist = self._file_atom_indices(np.asarray(atomlist)).tolist()
+            lowerb, upperb = min(atomlist), max(atomlist)
         sizedata = timeseries._getDataSize()
         atomcounts = timeseries._getAtomCounts()
         auxdata = timeseries._getAuxData()
@@ -544,6 +726,7 @@ class DCDReader(base.Reader):
                                      sizedata, lowerb, upperb, start, stop, skip)
 
     def close(self):
+        self._mmap = None
         if self.dcdfile is not None:
             self._finish_dcd_read()
             self.dcdfile.close()
@@ -602,6 +785,7 @@ DCDReader._read_next_frame = types.MethodType(_dcdmodule.__read_next_frame, None
 DCDReader._jump_to_frame = types.MethodType(_dcdmodule.__jump_to_frame, None, DCDReader)
 DCDReader._reset_dcd_read = types.MethodType(_dcdmodule.__reset_dcd_read, None, DCDReader)
 DCDReader._finish_dcd_read = types.MethodType(_dcdmodule.__finish_dcd_read, None, DCDReader)
+DCDReader._update_dcd_nsets = types.MethodType(_dcdmodule.__update_dcd_nsets, None, DCDReader)
 DCDReader._read_timeseries = types.MethodType(_dcdmodule.__read_timeseries, None, DCDReader)
 
 DCDWriter._write_dcd_header = types.MethodType(_dcdmodule.__write_dcd_header, None, DCDWriter)
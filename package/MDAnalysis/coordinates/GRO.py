@@ -126,31 +126,28 @@ class GROReader(base.SingleFrameReader):
             # Read first two lines to get number of atoms
             grofile.readline()
             self.n_atoms = n_atoms = int(grofile.readline())
-            # and the third line to get the spacing between coords (cs)
-            # (dependent upon the GRO file precision)
-            first_atomline = grofile.readline()
-            cs = first_atomline[25:].find('.') + 1
-            has_velocities = first_atomline[20:].count('.') > 3
-
-            self.ts = ts = self._Timestep(n_atoms,
-                                          velocities=has_velocities,
-                                          **self._ts_kwargs)
-
-            grofile.seek(0)
-            for pos, line in enumerate(grofile, start=-2):
-                # 2 header lines, 1 box line at end
-                if pos == n_atoms:
-                    unitcell = np.array(list(map(float, line.split())))
-                    continue
-                if pos < 0:
-                    continue
-                for i in range(3):
-                    ts._pos[pos, i] = float(line[20 + cs*i: 20 + cs*(i+1)])
-
-                if not has_velocities:
-                    continue
-                for i, j in enumerate(range(3, 6)):
-                    ts._velocities[pos, i] = float(line[20+cs*j:20+cs*(j+1)])
+            atomlines = [grofile.readline() for _ in range(n_atoms)]
+            if atomlines:
+                # the first atom line gives the spacing between coords (cs)
+                # (dependent upon the GRO file precision)
+                cs = atomlines[0][25:].find('.') + 1
+                has_velocities = atomlines[0][20:].count('.') > 3
+            else:
+                has_velocities = False
+            # the box line follows the atom lines
+            unitcell = np.array(list(map(float, grofile.readline().split())))
+
+        self.ts = ts = self._Timestep(n_atoms,
+                                      velocities=has_velocities,
+                                      **self._ts_kwargs)
+        if atomlines:
+            # fixed width columns of cs characters, starting after column 20
+            n_columns = 6 if has_velocities else 3
+            columns = [(20 + cs*i, 20 + cs*(i+1)) for i in range(n_columns)]
+            values = util.read_fixed_columns(atomlines, columns)
+            ts._pos[:] = values[:, :3]
+            if has_velocities:
+                ts._velocities[:] = values[:, 3:]
 
         self.ts.frame = 0  # 0-based frame number
 
@@ -199,6 +196,9 @@ class GROWriter(base.Writer):
        Removed the `convert_dimensions_to_unitcell` method,
        use `Timestep.triclinic_dimensions` instead
        Now now writes velocities where possible
+    .. versionchanged:: 0.15.0
+       The atom lines are formatted from a template that is kept while the
+       same atoms are written and written in one go
     """
 
     format = 'GRO'
@@ -229,6 +229,35 @@ class GROWriter(base.Writer):
         if convert_units is None:
             convert_units = flags['convert_lengths']
         self.convert_units = convert_units  # convert length and time to base units
+        # atom lines without coordinates, see _atoms_template()
+        self._template = None
+        self._template_atoms = None
+        self._template_key = None
+
+    def _atoms_template(self, atoms, record):
+        """Return the template of the atom lines of *atoms*.
+
+        *record* is the key of the line format in :attr:`fmt`. The template
+        is kept for the next frame of the same *atoms*; see
+        :meth:`~MDAnalysis.coordinates.base.Writer._records_template`.
+        """
+        key = (len(atoms), record)
+        if self._template_atoms is not atoms or self._template_key != key:
+            records = []
+            for atom_index, atom in enumerate(atoms):
+                truncated_atom_index = int(str(atom_index + 1)[-5:])
+                records.append(self.fmt[record].format(
+                    resid=atom.resid,
+                    resname=atom.resname,
+                    index=truncated_atom_index,
+                    name=atom.name,
+                    pos=self._frame_field,
+                    vel=self._frame_field,
+                ))
+            self._template = self._records_template(records)
+            self._template_atoms = atoms
+            self._template_key = key
+        return self._template
 
     def write(self, selection, frame=None):
         """Write selection at current trajectory frame to file.
@@ -286,25 +315,13 @@ class GROWriter(base.Writer):
             output_gro.write('Written by MDAnalysis\n')
             output_gro.write(self.fmt['n_atoms'].format(len(atoms)))
             # Atom descriptions and coords
-            for atom_index, atom in enumerate(atoms):
-                truncated_atom_index = int(str(atom_index + 1)[-5:])
-                if has_velocities:
-                    output_gro.write(self.fmt['xyz_v'].format(
-                        resid=atom.resid,
-                        resname=atom.resname,
-                        index=truncated_atom_index,
-                        name=atom.name,
-                        pos=coordinates[atom_index],
-                        vel=velocities[atom_index],
-                    ))
-                else:
-                    output_gro.write(self.fmt['xyz'].format(
-                        resid=atom.resid,
-                        resname=atom.resname,
-                        index=truncated_atom_index,
-                        name=atom.name,
-                        pos=coordinates[atom_index]
-                    ))
+            if has_velocities:
+                template = self._atoms_template(atoms, 'xyz_v')
+                output_gro.write(self._format_records(
+                    template, coordinates, velocities))
+            else:
+                template = self._atoms_template(atoms, 'xyz')
+                output_gro.write(self._format_records(template, coordinates))
 
             # Footer: box dimensions
             if np.all(u.trajectory.ts.dimensions[3:] == [90., 90., 90.]):
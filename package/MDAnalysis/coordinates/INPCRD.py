@@ -27,6 +27,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from six.moves import range
 
+from ..lib import util
 from . import base
 
 class INPReader(base.SingleFrameReader):
@@ -49,14 +50,13 @@ class INPReader(base.SingleFrameReader):
                 self.ts.time = time
             self.ts.frame = 0
 
-            for p in range(self.n_atoms // 2):
-                line = inf.readline()
-                # each float is f12.7, 6 floats a line
-                for i, dest in enumerate([(2*p, 0), (2*p, 1), (2*p, 2),
-                                          (2*p + 1, 0), (2*p + 1, 1), (2*p + 1, 2)]):
-                    self.ts._pos[dest] = float(line[i*12:(i+1)*12])
-            # Read last coordinate if necessary            
+            # each float is f12.7, 6 floats (2 atoms) a line
+            lines = [inf.readline() for _ in range((self.n_atoms + 1) // 2)]
+            columns = [(i*12, (i+1)*12) for i in range(6)]
+            values = util.read_fixed_columns(lines[:self.n_atoms // 2],
+                                             columns)
+            self.ts._pos[:self.n_atoms // 2 * 2] = values.reshape(-1, 3)
+            # Read last coordinate if necessary
             if self.n_atoms % 2:
-                line = inf.readline()
-                for i in range(3):
-                    self.ts._pos[-1, i] = float(line[i*12:(i+1)*12])
+                self.ts._pos[-1] = util.read_fixed_columns(lines[-1:],
+                                                           columns[:3])
@@ -198,6 +198,7 @@ References
 """
 
 from six.moves import range
+import six
 
 try:
     # BioPython is overkill but potentially extensible (altLoc etc)
@@ -219,11 +220,13 @@ import textwrap
 import warnings
 import logging
 import collections
+import re
 import numpy as np
 
 from ..core import flags
 from ..lib import util
 from . import base
+from .XDR import offsets_filename, read_offsets, write_offsets
 from ..topology.core import guess_atom_element
 from ..core.AtomGroup import Universe
 from ..exceptions import NoDataError
@@ -234,6 +237,11 @@ logger = logging.getLogger("MDAnalysis.coordinates.PBD")
 # Pairs of residue name / atom name in use to deduce PDB formatted atom names
 Pair = collections.namedtuple('Atom', 'resname name')
 
+#: MODEL and END records, which are indexed by the PrimitivePDBReader
+_MODEL_END_RECORD = re.compile(br'^[ \t]*(MODEL|END)(?=[ \t\r\n]|$)', re.M)
+#: bytes read at a time when indexing a PDB file
+_INDEX_BLOCKSIZE = 2**22
+
 
 class PDBReader(base.SingleFrameReader):
     """Read a pdb file into a :mod:`BioPython.PDB` structure.
@@ -452,12 +460,18 @@ class PrimitivePDBReader(base.Reader):
     .. versionchanged:: 0.11.0
        * Frames now 0-based instead of 1-based
        * New :attr:`title` (list with all TITLE lines).
+    .. versionchanged:: 0.15.0
+       Frames are found through the byte offsets of the MODEL records,
+       which are stored in a hidden offsets file; HEADER, TITLE, COMPND
+       and REMARK records are only read up to the end of the first frame.
+       A CRYST1 record before the first MODEL record is the unit cell of
+       all frames without a CRYST1 record of their own.
 
     """
     format = 'Permissive_PDB'
     units = {'time': None, 'length': 'Angstrom'}
 
-    def __init__(self, filename, **kwargs):
+    def __init__(self, filename, refresh_offsets=False, **kwargs):
         """Read coordinates from *filename*.
 
         *filename* can be a gzipped or bzip2ed compressed PDB file.
@@ -466,6 +480,10 @@ class PrimitivePDBReader(base.Reader):
         read as a trajectory where the MODEL numbers correspond to
         frame numbers. Therefore, the MODEL numbers must be a sequence
         of integers (typically starting at 1 or 0).
+
+        The byte offsets of the MODEL records of a multi-model file are
+        stored in a hidden file next to the PDB file, as for the XTC and TRR
+        readers; set *refresh_offsets* to ``True`` to index the file again.
         """
         super(PrimitivePDBReader, self).__init__(filename, **kwargs)
 
@@ -476,89 +494,194 @@ class PrimitivePDBReader(base.Reader):
 
         self.model_offset = kwargs.pop("model_offset", 0)
 
-        header = ""
-        title = []
-        compound = []
-        remarks = []
-
-        frames = {}
-
         self.ts = self._Timestep(self._n_atoms, **self._ts_kwargs)
 
-        pos = 0  # atom position for filling coordinates array
-        occupancy = np.ones(self._n_atoms)
-        with util.openany(filename, 'rt') as pdbfile:
-            for i, line in enumerate(pdbfile):
-                line = line.strip()  # Remove extra spaces
-                if len(line) == 0:  # Skip line if empty
-                    continue
-                record = line[:6].strip()
+        self._pdbfile = util.anyopen(filename, 'rb')
+        if refresh_offsets:
+            self._offsets = self._index_models(store=True)
+        else:
+            self._offsets = self._load_offsets()
+        self.n_frames = len(self._offsets) - 1
+
+        # header records are read from the start of the file to the end of
+        # the first frame
+        lines = self._read_lines(0, self._offsets[1])
+        self._parse_header(lines)
+        # unit cell of all frames without a CRYST1 record of their own, as
+        # written before the first MODEL record, e.g. by gromacs trjconv
+        self._header_unitcell = np.zeros(6, dtype=np.float32)
+        for line in self._read_lines(0, self._offsets[0]):
+            if line[:6] == 'CRYST1':
+                self._header_unitcell[:] = self._parse_cryst1(line)
+        if self.n_frames > 1:
+            lines = self._read_lines(self._offsets[0], self._offsets[1])
+        self._parse_frame(lines, strip=True)
+        self.n_atoms = self._n_atoms
+        self.ts.frame = 0  # 0-based frame number as starting frame
 
-                if record == 'END':
-                    break
-                elif record == 'CRYST1':
-                    self.ts._unitcell[:] = [line[6:15], line[15:24],
-                                            line[24:33], line[33:40],
-                                            line[40:47], line[47:54]]
-                    continue
-                elif record == 'HEADER':
-                    # classification = line[10:50]
-                    # date = line[50:59]
-                    # idCode = line[62:66]
-                    header = line[10:66]
-                    continue
-                elif record == 'TITLE':
-                    l = line[8:80].strip()
-                    title.append(l)
-                    continue
-                elif record == 'COMPND':
-                    l = line[7:80].strip()
-                    compound.append(l)
-                    continue
-                elif record == 'REMARK':
-                    content = line[6:].strip()
-                    remarks.append(content)
-                elif record == 'MODEL':
-                    frames[len(frames)] = i  # 0-based indexing
-                elif line[:6] in ('ATOM  ', 'HETATM'):
-                    # skip atom/hetatm for frames other than the first
-                    # they will be read in when next() is called
-                    # on the trajectory reader
-                    if len(frames) > 1:
-                        continue
-                    self.ts._pos[pos] = [line[30:38],
-                                         line[38:46],
-                                         line[46:54]]
-                    try:
-                        occupancy[pos] = line[54:60]
-                    except ValueError:
-                        pass
-                    pos += 1
+    def _index_models(self, store=False):
+        """Find the offsets of the MODEL records
 
+        Returns the offsets of all frames followed by the offset of the END
+        record (or the end of the file). A file without MODEL records is a
+        single frame that starts at offset 0.
+        """
+        models = []
+        end = None
+        data = b''
+        position = 0  # offset of data in the file
+        f = self._pdbfile
+        f.seek(0)
+        while end is None:
+            block = f.read(_INDEX_BLOCKSIZE)
+            if isinstance(block, six.text_type):
+                block = block.encode('latin-1')
+            if not block:
+                break
+            data += block
+            # only complete lines are searched
+            stop = data.rfind(b'\n') + 1
+            if stop == 0:
+                continue
+            for match in _MODEL_END_RECORD.finditer(data, 0, stop):
+                if match.group(1) == b'END':
+                    end = position + match.start()
+                    break
+                models.append(position + match.start())
+            data = data[stop:]
+            position += stop
+        if end is None:
+            # a last line without line ending
+            for match in _MODEL_END_RECORD.finditer(data):
+                if match.group(1) == b'END':
+                    end = position + match.start()
+                    break
+                models.append(position + match.start())
+            else:
+                end = position + len(data)
+        if not models:
+            models = [0]
+        offsets = np.array(models + [end], dtype=np.int64)
+        if store and len(offsets) > 2:
+            self._store_offsets(offsets)
+        return offsets
+
+    def _offsets_filename(self):
+        """name of the offsets file, ``None`` for streams"""
+        if util.isstream(self.filename) or not os.path.isfile(self.filename):
+            return None
+        return offsets_filename(self.filename)
+
+    def _store_offsets(self, offsets):
+        fname = self._offsets_filename()
+        if fname is None:
+            return
+        try:
+            write_offsets(fname, offsets, size=os.path.getsize(self.filename),
+                          ctime=os.path.getctime(self.filename),
+                          n_atoms=self._n_atoms)
+        except Exception as e:
+            warnings.warn("Couldn't save offsets because: {}".format(e))
+
+    def _load_offsets(self):
+        """load the model offsets from the offsets file, index the file if
+        that fails or if the file has changed"""
+        fname = self._offsets_filename()
+        if fname is None or not os.path.isfile(fname):
+            return self._index_models(store=True)
+        try:
+            data = read_offsets(fname)
+        except (IOError, ValueError) as e:
+            warnings.warn("Reload offsets from trajectory\n "
+                          "couldn't read stored offsets: {}".format(e))
+            return self._index_models(store=True)
+        if (data['size'] == os.path.getsize(self.filename) and
+                data['ctime'] == os.path.getctime(self.filename) and
+                data['n_atoms'] == self._n_atoms and
+                len(data['offsets']) > 1):
+            return data['offsets']
+        warnings.warn("Reload offsets from trajectory\n "
+                      "ctime or size or n_atoms did not match")
+        return self._index_models(store=True)
+
+    def _read_lines(self, start, stop):
+        """Return the lines between the offsets *start* and *stop*
+
+        The file is opened again if the reader was closed.
+        """
+        if self._pdbfile is None:
+            self._pdbfile = util.anyopen(self.filename, 'rb')
+        self._pdbfile.seek(int(start))
+        data = self._pdbfile.read(int(stop - start))
+        if not isinstance(data, str):
+            data = data.decode('latin-1')
+        return data.splitlines()
+
+    def _parse_header(self, lines):
+        """Read HEADER, TITLE, COMPND and REMARK records"""
+        header = ""
+        title = []
+        compound = []
+        remarks = []
+        for line in lines:
+            line = line.strip()  # Remove extra spaces
+            record = line[:6].strip()
+            if record == 'HEADER':
+                # classification = line[10:50]
+                # date = line[50:59]
+                # idCode = line[62:66]
+                header = line[10:66]
+            elif record == 'TITLE':
+                title.append(line[8:80].strip())
+            elif record == 'COMPND':
+                compound.append(line[7:80].strip())
+            elif record == 'REMARK':
+                remarks.append(line[6:].strip())
         self.header = header
         self.title = title
         self.compound = compound
         self.remarks = remarks
 
-        if pos != self._n_atoms:
+    @staticmethod
+    def _parse_cryst1(line):
+        """unit cell (in native units) of a CRYST1 record"""
+        return [line[6:15], line[15:24], line[24:33],
+                line[33:40], line[40:47], line[47:54]]
+
+    def _parse_frame(self, lines, strip=False):
+        """Fill the Timestep from the CRYST1 and ATOM/HETATM records of one
+        frame in *lines*"""
+        atomlines = []
+        self.ts._unitcell[:] = self._header_unitcell
+        for line in lines:
+            if strip:
+                line = line.strip()  # Remove extra spaces
+            record = line[:6]
+            if record == 'ENDMDL':
+                break
+            elif record == 'CRYST1':
+                self.ts._unitcell[:] = self._parse_cryst1(line)
+            elif record in ('ATOM  ', 'HETATM'):
+                # we only care about coordinates
+                # TODO import bfactors - might these change?
+                atomlines.append(line)
+
+        # check if atom number changed
+        if len(atomlines) != self._n_atoms:
             raise ValueError("Read an incorrect number of atoms\n"
                              "Expected {expected} got {actual}"
-                             "".format(expected=self._n_atoms, actual=pos))
-        self.n_atoms = pos
-
-        self.ts.frame = 0  # 0-based frame number as starting frame
-        self.ts.data['occupancy'] = occupancy
-
+                             "".format(expected=self._n_atoms,
+                                       actual=len(atomlines)))
+
+        self.ts._pos[:] = util.read_fixed_columns(
+            atomlines, [(30, 38), (38, 46), (46, 54)])
+        # Be tolerant for ill-formated or empty occupancies
+        self.ts.data['occupancy'] = util.read_fixed_columns(
+            atomlines, [(54, 60)], dtype=np.float64, missing=1.0)[:, 0]
         if self.convert_units:
-            self.convert_pos_from_native(self.ts._pos)  # in-place !
-            self.convert_pos_from_native(self.ts._unitcell[:3])  # in-place ! (only lengths)
-
-        # No 'MODEL' entries
-        if len(frames) == 0:
-            frames[0] = 0
-
-        self.frames = frames
-        self.n_frames = len(frames) if frames else 1
+            # both happen inplace
+            self.convert_pos_from_native(self.ts._pos)
+            self.convert_pos_from_native(self.ts._unitcell[:3])
 
     def Writer(self, filename, **kwargs):
         """Returns a permissive (simple) PDBWriter for *filename*.
@@ -594,60 +717,27 @@ class PrimitivePDBReader(base.Reader):
         return self._read_frame(frame)
 
     def _read_frame(self, frame):
-        try:
-            line = self.frames[frame]
-        except KeyError:
+        if not 0 <= frame < self.n_frames:
             raise IOError
-        if line is None:
+        if self.n_frames == 1:
             # single frame file, we already have the timestep
+            self.ts.frame = frame
             return self.ts
 
-        # TODO: only open file once and leave the file open; then seek back and
-        #       forth; should improve performance substantially
-        pos = 0
-        occupancy = np.ones(self._n_atoms)
-        with util.openany(self.filename, 'rt') as f:
-            for i in range(line):
-                next(f)  # forward to frame
-            for line in f:
-                if line[:6] == 'ENDMDL':
-                    break
-                # NOTE - CRYST1 line won't be found if it comes before the
-                # MODEL line, which is sometimes the case, e.g. output from
-                # gromacs trjconv
-                elif line[:6] == 'CRYST1':
-                    self.ts._unitcell[:] = [line[6:15], line[15:24],
-                                            line[24:33], line[33:40],
-                                            line[40:47], line[47:54]]
-                    continue
-                elif line[:6] in ('ATOM  ', 'HETATM'):
-                    # we only care about coordinates
-                    self.ts._pos[pos] = [line[30:38],
-                                         line[38:46],
-                                         line[46:54]]
-                    # TODO import bfactors - might these change?
-                    try:
-                        occupancy[pos] = line[54:60]
-                    except ValueError:
-                        # Be tolerant for ill-formated or empty occupancies
-                        pass
-                    pos += 1
-                    continue
-
-        # check if atom number changed
-        if pos != self._n_atoms:
-            raise ValueError("Read an incorrect number of atoms\n"
-                             "Expected {expected} got {actual}"
-                             "".format(expected=self._n_atoms, actual=pos+1))
-
-        if self.convert_units:
-            # both happen inplace
-            self.convert_pos_from_native(self.ts._pos)
-            self.convert_pos_from_native(self.ts._unitcell[:3])
+        # seek to the MODEL record and read the frame in one go
+        lines = self._read_lines(self._offsets[frame],
+                                 self._offsets[frame + 1])
+        self._parse_frame(lines)
         self.ts.frame = frame
-        self.ts.data['occupancy'] = occupancy
         return self.ts
 
+    def close(self):
+        """Close the PDB file."""
+        pdbfile = getattr(self, '_pdbfile', None)
+        if pdbfile is not None:
+            pdbfile.close()
+            self._pdbfile = None
+
 
 class PrimitivePDBWriter(base.Writer):
     """PDB writer that implements a subset of the `PDB 3.2 standard`_ .
@@ -810,6 +900,14 @@ class PrimitivePDBWriter(base.Writer):
         self.has_END = False
         self.first_frame_done = False
 
+        # ATOM records without the per-frame columns, see _atoms_template()
+        self._atom_template = None
+        self._template_obj = None
+        self._template_n_atoms = None
+        # CONECT records of _conect_obj, see _write_pdb_bonds()
+        self._conect = None
+        self._conect_obj = None
+
     def close(self):
         """Close PDB file and write END record"""
         if hasattr(self, 'pdbfile') and self.pdbfile is not None:
@@ -910,6 +1008,10 @@ class PrimitivePDBWriter(base.Writer):
            Only write CONECT records if :attr:`PrimitivePDBWriter.bonds` ``== True``.
            Raises :exc:`NotImplementedError` if it would produce wrong output.
 
+        .. versionchanged:: 0.15.0
+           The CONECT records are only collected once for the object that is
+           written.
+
         """
         if not self.bonds:
             return
@@ -923,6 +1025,14 @@ class PrimitivePDBWriter(base.Writer):
             #raise NotImplementedError("PDB CONECT records not written because this only works correctly for a whole
             # Universe.")
 
+        if self._conect_obj is not self.obj:
+            self._conect = self._conect_records()
+            self._conect_obj = self.obj
+        for c in self._conect:
+            self.CONECT(c)
+
+    def _conect_records(self):
+        """Return the rows of the CONECT records of :attr:`obj`."""
         bonds = set()
 
         [[bonds.add(b) for b in a.bonds] for a in self.obj.atoms]
@@ -954,10 +1064,7 @@ class PrimitivePDBWriter(base.Writer):
 
         conect = [([a, ] + sorted(con[a])) for a in atoms if a in con]
 
-        conect = [[mapping[e] for e in row] for row in conect]
-
-        for c in conect:
-            self.CONECT(c)
+        return [[mapping[e] for e in row] for row in conect]
 
     def _update_frame(self, obj):
         """Method to initialize important attributes in writer from a AtomGroup or Universe *obj*.
@@ -1126,6 +1233,34 @@ class PrimitivePDBWriter(base.Writer):
             return '{:<4}'.format(atom.name)
         return ' {:<3}'.format(atom.name)
 
+    def _atoms_template(self, atoms):
+        """Return the template of the ATOM_ records of *atoms*.
+
+        All columns except the coordinates, occupancy and tempFactor are
+        filled in; see :meth:`~MDAnalysis.coordinates.base.Writer._records_template`.
+
+        .. _ATOM: http://www.wwpdb.org/documentation/format32/sect9.html
+        """
+        records = []
+        for i, atom in enumerate(atoms):
+            segid = atom.segid if atom.segid is not "SYSTEM" else " "
+
+            vals = {}
+            vals['serial'] = int(str(i + 1)[-5:])  # check for overflow here?
+            vals['name'] = self._deduce_PDB_atom_name(atom)
+            vals['altLoc'] = atom.altLoc[:1] if atom.altLoc is not None else " "
+            vals['resName'] = atom.resname[:4]
+            vals['chainID'] = segid[:1]
+            vals['resSeq'] = int(str(atom.resid)[-4:])
+            vals['iCode'] = " "
+            vals['pos'] = self._frame_field
+            vals['occupancy'] = self._frame_field
+            vals['tempFactor'] = self._frame_field
+            vals['segID'] = segid[:4]
+            vals['element'] = guess_atom_element(atom.name.strip())[:2]
+            records.append(self.fmt['ATOM'].format(**vals))
+        return self._records_template(records)
+
     def _write_timestep(self, ts, multiframe=False):
         """Write a new timestep *ts* to file
 
@@ -1149,6 +1284,12 @@ class PrimitivePDBWriter(base.Writer):
            underlying trajectory and only if ``len(traj) > 1`` would MODEL records
            have been written.)
 
+        .. versionchanged:: 0.15.0
+           The topology columns of the ATOM records are formatted once for the
+           object that is written (see :meth:`_atoms_template`) and each
+           frame is written with a single write. Changes to the topology of
+           the same object between frames are not picked up.
+
         """
         atoms = self.obj.atoms
         pos = atoms.ts.positions
@@ -1158,30 +1299,21 @@ class PrimitivePDBWriter(base.Writer):
         if multiframe:
             self.MODEL(self.frames_written + 1)
 
-        for i, atom in enumerate(atoms):
-            segid = atom.segid if atom.segid is not "SYSTEM" else " "
-
-            vals = {}
-            vals['serial'] = int(str(i + 1)[-5:])  # check for overflow here?
-            vals['name'] = self._deduce_PDB_atom_name(atom)
-            vals['altLoc'] = atom.altLoc[:1] if atom.altLoc is not None else " "
-            vals['resName'] = atom.resname[:4]
-            vals['chainID'] = segid[:1]
-            vals['resSeq'] = int(str(atom.resid)[-4:])
-            vals['iCode'] = " "
-            vals['pos'] = pos[i]  # don't take off atom so conversion works
-            try:
-                occ = atom.occupancy
-            except NoDataError:
-                occ = 1.0
-            vals['occupancy'] = occ if occ is not None else 1.0
-            temp = atom.bfactor
-            vals['tempFactor'] = temp if temp is not None else 0.0
-            vals['segID'] = segid[:4]
-            vals['element'] = guess_atom_element(atom.name.strip())[:2]
-
-            # .. _ATOM: http://www.wwpdb.org/documentation/format32/sect9.html
-            self.pdbfile.write(self.fmt['ATOM'].format(**vals))
+        if (self._atom_template is None or self._template_obj is not self.obj
+                or self._template_n_atoms != len(atoms)):
+            self._atom_template = self._atoms_template(atoms)
+            self._template_obj = self.obj
+            self._template_n_atoms = len(atoms)
+        try:
+            occupancies = atoms.occupancies
+        except NoDataError:
+            occupancies = np.ones(len(atoms))
+        tempfactors = [temp if temp is not None else 0.0
+                       for temp in (atom.bfactor for atom in atoms)]
+
+        # .. _ATOM: http://www.wwpdb.org/documentation/format32/sect9.html
+        self.pdbfile.write(self._format_records(
+            self._atom_template, pos, occupancies, tempfactors))
         if multiframe:
             self.ENDMDL()
         self.frames_written += 1
@@ -140,7 +140,7 @@ class PDBQTReader(base.SingleFrameReader):
         def _c(start, stop, typeclass=float):
             return self._col(line, start, stop, typeclass=typeclass)
 
-        coords = []
+        atomlines = []
         atoms = []
         unitcell = np.zeros(6, dtype=np.float32)
         with util.openany(self.filename, 'r') as pdbfile:
@@ -159,17 +159,19 @@ class PDBQTReader(base.SingleFrameReader):
                     resName = _c(18, 21, str).strip()
                     chainID = _c(22, 22, str)  # empty chainID is a single space ' '!
                     resSeq = _c(23, 26, int)
-                    x, y, z = _c(31, 38), _c(39, 46), _c(47, 54)
                     occupancy = _c(55, 60)
                     tempFactor = _c(61, 66)
                     partialCharge = _c(67, 76, str).strip()  # PDBQT partial charge
                     atomtype = _c(77, 80, str).strip()  # PDBQT atom type
-                    coords.append((x, y, z))
+                    atomlines.append(line)
                     atoms.append(
                         (serial, name, resName, chainID, resSeq, occupancy, tempFactor, partialCharge, atomtype))
+        # x, y, z in columns 31-38, 39-46, 47-54
+        coords = util.read_fixed_columns(atomlines,
+                                         [(30, 38), (38, 46), (46, 54)],
+                                         missing=0.0)
         self.n_atoms = len(coords)
-        self.ts = self._Timestep.from_coordinates(np.array(coords, dtype=np.float32),
-                                                  **self._ts_kwargs)
+        self.ts = self._Timestep.from_coordinates(coords, **self._ts_kwargs)
         self.ts._unitcell[:] = unitcell
         self.ts.frame = 0  # 0-based frame number
         if self.convert_units:
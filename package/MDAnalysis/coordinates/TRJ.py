@@ -128,6 +128,7 @@ those and will raise a :exc:`NotImplementedError` if anything else is detected.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import itertools
 import numpy as np
 import warnings
 import errno
@@ -137,6 +138,7 @@ import MDAnalysis
 from ..core import flags
 from . import base
 from ..lib import util
+from ..exceptions import NoDataError
 
 
 logger = logging.getLogger("MDAnalysis.coordinates.AMBER")
@@ -207,11 +209,13 @@ class TRJReader(base.Reader):
         # FORMAT(10F8.3)  (X(i), Y(i), Z(i), i=1,NATOM)
         self.default_line_parser = util.FORTRANReader("10F8.3")
         self.lines_per_frame = int(np.ceil(3.0 * self.n_atoms / len(self.default_line_parser)))
+        self._columns = [(e.start, e.stop)
+                         for e in self.default_line_parser.entries]
         # The last line per frame might have fewer than 10
-        # We determine right away what parser we need for the last
+        # We determine right away how many values are on the last
         # line because it will be the same for all frames.
-        last_per_line = 3 * self.n_atoms % len(self.default_line_parser)
-        self.last_line_parser = util.FORTRANReader("{0:d}F8.3".format(last_per_line))
+        self._n_last_line = (3 * self.n_atoms -
+                             len(self._columns) * (self.lines_per_frame - 1))
 
         # FORMAT(10F8.3)  BOX(1), BOX(2), BOX(3)
         # is this always on a separate line??
@@ -230,21 +234,16 @@ class TRJReader(base.Reader):
         if self.trjfile is None:
             self.open_trajectory()
 
-        # Read coordinat frame:
-        #coordinates = numpy.zeros(3*self.n_atoms, dtype=np.float32)
-        _coords = []
-        for number, line in enumerate(self.trjfile):
-            try:
-                _coords.extend(self.default_line_parser.read(line))
-            except ValueError:
-                # less than 10 entries on the line:
-                _coords.extend(self.last_line_parser.read(line))
-            if number == self.lines_per_frame - 1:
-                # read all atoms that are there in this frame
-                break
-        if _coords == []:
-            # at the end of the stream (the loop has not been entered)
+        # Read coordinate frame:
+        lines = list(itertools.islice(self.trjfile, self.lines_per_frame))
+        if not lines:
+            # at the end of the stream
             raise EOFError
+        # all values of the frame are converted at once
+        coordinates = np.concatenate([
+            util.read_fixed_columns(lines[:-1], self._columns).ravel(),
+            util.read_fixed_columns(
+                lines[-1:], self._columns[:self._n_last_line]).ravel()])
 
         # Read box information
         if self.periodic:
@@ -253,10 +252,7 @@ class TRJReader(base.Reader):
             ts._unitcell[:3] = np.array(box, dtype=np.float32)
             ts._unitcell[3:] = [90., 90., 90.]  # assumed
 
-        # probably slow ... could be optimized by storing the coordinates in X,Y,Z
-        # lists or directly filling the array; the array/reshape is not good
-        # because it creates an intermediate array
-        ts._pos[:] = np.array(_coords).reshape(self.n_atoms, 3)
+        ts._pos[:] = coordinates.reshape(self.n_atoms, 3)
         ts.frame += 1
         return ts
 
@@ -403,6 +399,10 @@ class NCDFReader(base.Reader):
     .. versionchanged:: 0.11.0
        Frame labels now 0-based instead of 1-based
        kwarg 'delta' renamed to 'dt', for uniformity with other Readers
+    .. versionchanged:: 0.15.0
+       Iterating over the trajectory (or a slice of it) reads *buffer_frames*
+       frames at a time; added :meth:`timeseries`.
+       Added *atom_indices* keyword to read only a subset of the atoms.
     """
 
     format = ['NCDF', 'NC']
@@ -413,8 +413,27 @@ class NCDFReader(base.Reader):
              'velocity': 'Angstrom/ps',
              'force': 'kcal/(mol*Angstrom)'}
     _Timestep = Timestep
+    #: maximum size in bytes of the frames read at a time while iterating
+    buffer_size = 2**25
+    _reads_atom_indices = True
 
-    def __init__(self, filename, n_atoms=None, **kwargs):
+    def __init__(self, filename, n_atoms=None, buffer_frames=16,
+                 atom_indices=None, **kwargs):
+        """
+        Parameters
+        ----------
+        filename : str
+            name of the NCDF file
+        n_atoms : int (optional)
+            number of atoms, must match the number of atoms in the file
+        buffer_frames : int (optional)
+            number of frames that are read at a time when iterating over the
+            trajectory; fewer frames are read if their coordinates, velocities
+            and forces would take up more than :attr:`buffer_size` bytes
+        atom_indices : array_like (optional)
+            0-based indices of the atoms that are read; only the range of
+            atoms spanned by them is read from the file
+        """
         try:
             import netCDF4 as netcdf
         except ImportError:
@@ -477,6 +496,9 @@ class NCDFReader(base.Reader):
                     "Supplied n_atoms ({0}) != natom from ncdf ({1}). "
                     "Note: n_atoms can be None and then the ncdf value is used!"
                     "".format(n_atoms, self.n_atoms))
+        self.n_atoms = self._init_atom_indices(atom_indices, self.n_atoms)
+        self._atoms, self._atoms_index = self._atom_hyperslab(
+            self._atom_indices)
 
         self.has_velocities = 'velocities' in self.trjfile.variables
         self.has_forces = 'forces' in self.trjfile.variables
@@ -484,6 +506,12 @@ class NCDFReader(base.Reader):
         self.periodic = 'cell_lengths' in self.trjfile.variables
         self._current_frame = 0
 
+        # frames read in one go from all variables, see _read_block()
+        n_arrays = 1 + self.has_velocities + self.has_forces
+        self._buffer_frames = max(1, min(
+            buffer_frames, self.buffer_size // (12 * n_arrays * self.n_atoms)))
+        self._block = None
+
         self.ts = self._Timestep(self.n_atoms,
                                  velocities=self.has_velocities,
                                  forces=self.has_forces,
@@ -493,47 +521,189 @@ class NCDFReader(base.Reader):
         # load first data frame
         self._read_frame(0)
 
-    def _read_frame(self, frame):
-        ts = self.ts
+    def _read_block(self, start, n, step):
+        """Read *n* frames from *start* on with stride *step* of all variables
 
+        Each variable is read with a single (strided) hyperslab read and the
+        units of all frames are converted at once.
+        """
         if self.trjfile is None:
             raise IOError("Trajectory is closed")
-        if frame >= self.n_frames or frame < 0:
-            raise IndexError("frame index must be 0 <= frame < {0}"
-                             "".format(self.n_frames))
-        # note: self.trjfile.variables['coordinates'].shape == (frames, n_atoms, 3)
-        ts._pos[:] = self.trjfile.variables['coordinates'][frame]
-        ts.time = self.trjfile.variables['time'][frame]
+        variables = self.trjfile.variables
+        names = ['coordinates', 'time']
         if self.has_velocities:
-            ts._velocities[:] = self.trjfile.variables['velocities'][frame]
+            names.append('velocities')
         if self.has_forces:
-            ts._forces[:] = self.trjfile.variables['forces'][frame]
+            names.append('forces')
         if self.periodic:
-            ts._unitcell[:3] = self.trjfile.variables['cell_lengths'][frame]
-            ts._unitcell[3:] = self.trjfile.variables['cell_angles'][frame]
+            names.extend(['cell_lengths', 'cell_angles'])
+        frames, order = self._hyperslab(start, n, step)
+        block = {}
+        for name in names:
+            if name in ('coordinates', 'velocities', 'forces'):
+                data = np.asarray(variables[name][frames, self._atoms])
+                data = data[order, self._atoms_index]
+            else:
+                data = np.asarray(variables[name][frames])[order]
+            block[name] = data
         if self.convert_units:
-            self.convert_pos_from_native(ts._pos)  # in-place !
-            self.convert_time_from_native(ts.time)  # in-place ! (hope this works...)
+            block['coordinates'] = block['coordinates'].astype(np.float32)
+            self.convert_pos_from_native(block['coordinates'])
+            block['time'] = self.convert_time_from_native(block['time'])
             if self.has_velocities:
-                self.convert_velocities_from_native(ts._velocities, inplace=True)
+                self.convert_velocities_from_native(block['velocities'],
+                                                    inplace=True)
             if self.has_forces:
-                self.convert_forces_from_native(ts._forces, inplace=True)
+                self.convert_forces_from_native(block['forces'],
+                                                inplace=True)
             if self.periodic:
-                self.convert_pos_from_native(ts._unitcell[:3])  # in-place ! (only lengths)
-        ts.frame = frame # frame labels are 0-based
+                self.convert_pos_from_native(block['cell_lengths'])
+        return block
+
+    @staticmethod
+    def _hyperslab(start, n, step):
+        """Slice of the *n* frames from *start* on with stride *step*
+
+        Returns the slice with a positive stride and the slice that puts the
+        frames that were read into the requested order.
+        """
+        last = start + (n - 1) * step
+        if step < 0:
+            # read forward and reverse the frames
+            return slice(last, start + 1, -step), slice(None, None, -1)
+        return slice(start, last + 1, step), slice(None)
+
+    @staticmethod
+    def _atom_hyperslab(indices):
+        """Slice of the range of atoms spanned by *indices*
+
+        Returns the slice that is read from the file and the index into the
+        atoms that were read that selects *indices*.
+        """
+        if indices is None:
+            return slice(None), slice(None)
+        first = indices.min()
+        return slice(first, indices.max() + 1), indices - first
+
+    def _load_block(self, start, n, step=1):
+        """Read *n* frames from *start* on with stride *step* into the
+        buffer"""
+        self._block = (start, n, step, self._read_block(start, n, step))
+
+    def _block_index(self, frame):
+        """Index of *frame* in the buffer or ``None``"""
+        if self._block is None:
+            return None
+        start, n, step = self._block[:3]
+        i, remainder = divmod(frame - start, step)
+        if remainder or not 0 <= i < n:
+            return None
+        return i
+
+    def _frame_to_ts(self, frame, ts):
+        """Copy *frame* from the buffer into *ts*"""
+        i = self._block_index(frame)
+        block = self._block[3]
+        ts._pos[:] = block['coordinates'][i]
+        ts.time = block['time'][i]
+        if self.has_velocities:
+            ts._velocities[:] = block['velocities'][i]
+        if self.has_forces:
+            ts._forces[:] = block['forces'][i]
+        if self.periodic:
+            ts._unitcell[:3] = block['cell_lengths'][i]
+            ts._unitcell[3:] = block['cell_angles'][i]
+        ts.frame = frame  # frame labels are 0-based
         self._current_frame = frame
         return ts
 
-    def _reopen(self):
-        self._current_frame = -1
+    def _read_frame(self, frame):
+        if self.trjfile is None:
+            raise IOError("Trajectory is closed")
+        if frame >= self.n_frames or frame < 0:
+            raise IndexError("frame index must be 0 <= frame < {0}"
+                             "".format(self.n_frames))
+        if self._block_index(frame) is None:
+            # random access only reads the requested frame
+            self._load_block(frame, 1)
+        return self._frame_to_ts(frame, self.ts)
 
     def _read_next_timestep(self, ts=None):
         if ts is None:
             ts = self.ts
-        try:
-            return self._read_frame(self._current_frame + 1)
-        except IndexError:
+        frame = self._current_frame + 1
+        if frame >= self.n_frames:
             raise IOError
+        if self._block_index(frame) is None:
+            self._load_block(frame, min(self._buffer_frames,
+                                        self.n_frames - frame))
+        return self._frame_to_ts(frame, ts)
+
+    def _reopen(self):
+        self._current_frame = -1
+
+    def _sliced_iter(self, start, stop, step):
+        frames = np.arange(start, stop, step)
+        for i in range(0, len(frames), self._buffer_frames):
+            block = frames[i:i + self._buffer_frames]
+            self._load_block(int(block[0]), len(block), step)
+            for frame in block:
+                yield self._frame_to_ts(int(frame), self.ts)
+
+    def timeseries(self, asel=None, start=0, stop=-1, skip=1, format='afc'):
+        """Return a subset of coordinate data for an AtomGroup
+
+        The coordinates of all frames are read with a single hyperslab read
+        of the range of atoms spanned by *asel*.
+
+        Parameters
+        ----------
+        asel : :class:`~MDAnalysis.core.AtomGroup.AtomGroup` (optional)
+            atoms to read. All atoms are read if ``None``.
+        start, stop, skip : int (optional)
+            range of trajectory to access, start and stop are inclusive
+        format : str (optional)
+            the order/shape of the return data array, corresponding
+            to (a)tom, (f)rame, (c)oordinates all six combinations
+            of 'a', 'f', 'c' are allowed ie "fac" - return array
+            where the shape is (frame, number of atoms,
+            coordinates)
+
+        Returns
+        -------
+        coordinates : ndarray, dtype=float32
+            coordinates in MDAnalysis units
+
+        See Also
+        --------
+        MDAnalysis.coordinates.DCD.DCDReader.timeseries
+
+        .. versionadded:: 0.15.0
+        """
+        if self.trjfile is None:
+            raise IOError("Trajectory is closed")
+        start, stop, skip = self.check_slice_indices(start, stop, skip)
+        if format not in ('afc', 'acf', 'caf', 'cfa', 'fac', 'fca'):
+            raise ValueError("Invalid timeseries format")
+        if asel is None:
+            atoms, indices = self._atoms, self._atoms_index
+        else:
+            if len(asel) == 0:
+                raise NoDataError("Timeseries requires at least one atom "
+                                  "to analyze")
+            atoms, indices = self._atom_hyperslab(
+                self._file_atom_indices(asel.indices))
+
+        # stop is inclusive here
+        n = len(range(start, stop + (1 if skip > 0 else -1), skip))
+        frames, order = self._hyperslab(start, n, skip)
+        coordinates = np.asarray(
+            self.trjfile.variables['coordinates'][frames, atoms],
+            dtype=np.float32)[order, indices]
+        if self.convert_units:
+            self.convert_pos_from_native(coordinates)
+        return np.ascontiguousarray(
+            coordinates.transpose(['fac'.index(c) for c in format]))
 
     def _get_dt(self):
         t1 = self.trjfile.variables['time'][1]
@@ -545,6 +715,7 @@ class NCDFReader(base.Reader):
         if self.trjfile is not None:
             self.trjfile.close()
             self.trjfile = None
+        self._block = None
 
     def Writer(self, filename, **kwargs):
         """Returns a NCDFWriter for *filename* with the same parameters as this NCDF.
@@ -593,15 +764,26 @@ class NCDFWriter(base.Writer):
        Added ability to write velocities and forces
     .. versionchanged:: 0.11.0
        kwarg 'delta' renamed to 'dt', for uniformity with other Readers
+    .. versionchanged:: 0.15.0
+       Added *chunks*, *shuffle*, *buffer_frames* and *netcdf_format*
+       keywords; compressed or chunked trajectories are written in the
+       NETCDF4 (HDF5) format.
     """
 
     format = 'NCDF'
     version = "1.0"
     units = {'time': 'ps', 'length': 'Angstrom', 'velocity': 'Angstrom/ps',
              'force': 'kcal/(mol*Angstrom)'}
+    #: size in bytes of the default chunks of the per-atom variables
+    chunk_size = 2**20
+    #: maximum number of atoms in the default chunks
+    chunk_atoms = 4096
+    #: maximum number of frames in the default chunks
+    chunk_frames = 1024
 
     def __init__(self, filename, n_atoms, start=0, step=1, dt=1.0, remarks=None,
-                 convert_units=None, zlib=False, cmplevel=1, **kwargs):
+                 convert_units=None, zlib=False, cmplevel=1, shuffle=True,
+                 chunks=None, buffer_frames=1, netcdf_format=None, **kwargs):
         """Create a new NCDFWriter
 
         :Arguments:
@@ -625,6 +807,26 @@ class NCDFWriter(base.Writer):
             compress data [``False``]
           *cmplevel*
             compression level (1-9) [1]
+          *shuffle*
+            apply the HDF5 shuffle filter before compressing, which usually
+            improves the compression of floating point data; only used
+            with *zlib* [``True``]
+          *chunks*
+            chunk shape ``(frames, atoms)`` of the coordinates, velocities
+            and forces. By default, chunks of about :attr:`chunk_size` bytes
+            with at most :attr:`chunk_atoms` atoms are used, so that reading
+            blocks of frames and reading all frames of a few atoms (e.g.
+            with :meth:`NCDFReader.timeseries`) both only read little
+            data that is not needed. [``None``]
+          *buffer_frames*
+            number of frames that are collected in memory and written to the
+            file at once [1]
+          *netcdf_format*
+            file format of the netCDF library; by default
+            ``'NETCDF3_64BIT'`` as required by the AMBER convention unless
+            *zlib* or *chunks* are set, which need the
+            ``'NETCDF4'`` (HDF5) format. Not all AMBER tools can read
+            NETCDF4 trajectories. [``None``]
           *velocities*
             Write velocities into the trajectory [``False``]
           *forces*
@@ -645,6 +847,18 @@ class NCDFWriter(base.Writer):
 
         self.zlib = zlib
         self.cmplevel = cmplevel
+        self.shuffle = shuffle
+        self.chunks = chunks
+        if buffer_frames < 1:
+            raise ValueError("buffer_frames must be at least 1, got {0}"
+                             "".format(buffer_frames))
+        self.buffer_frames = buffer_frames
+        if netcdf_format is None:
+            if zlib or chunks is not None:
+                netcdf_format = 'NETCDF4'
+            else:
+                netcdf_format = 'NETCDF3_64BIT'
+        self.netcdf_format = netcdf_format
 
         self.ts = None  # when/why would this be assigned??
         self._first_frame = True  # signals to open trajectory
@@ -653,6 +867,8 @@ class NCDFWriter(base.Writer):
         self.has_velocities = kwargs.get('velocities', False)
         self.has_forces = kwargs.get('forces', False)
         self.curr_frame = 0
+        self._buffer = None  # frames that are not written yet
+        self._n_buffered = 0
 
     def _init_netcdf(self, periodic=True):
         """Initialize netcdf AMBER 1.0 trajectory.
@@ -683,7 +899,8 @@ class NCDFWriter(base.Writer):
         if not self._first_frame:
             raise IOError(errno.EIO, "Attempt to write to closed file {0}".format(self.filename))
 
-        ncfile = netcdf.Dataset(self.filename, clobber=True, mode='w', format='NETCDF3_64BIT')
+        ncfile = netcdf.Dataset(self.filename, clobber=True, mode='w',
+                                format=self.netcdf_format)
 
         # Set global attributes.
         setattr(ncfile, 'program', 'MDAnalysis.coordinates.TRJ.NCDFWriter')
@@ -701,29 +918,28 @@ class NCDFWriter(base.Writer):
         ncfile.createDimension('label', 5)  # needed for cell_angular
 
         # Create variables.
-        coords = ncfile.createVariable('coordinates', 'f4', ('frame', 'atom', 'spatial'),
-                                       zlib=self.zlib, complevel=self.cmplevel)
+        coords = self._create_variable(ncfile, 'coordinates', 'f4',
+                                       ('frame', 'atom', 'spatial'))
         setattr(coords, 'units', 'angstrom')
 
         spatial = ncfile.createVariable('spatial', 'c', ('spatial',))
         spatial[:] = np.asarray(list('xyz'))
 
-        time = ncfile.createVariable('time', 'f4', ('frame',),
-                                     zlib=self.zlib, complevel=self.cmplevel)
+        time = self._create_variable(ncfile, 'time', 'f4', ('frame',))
         setattr(time, 'units', 'picosecond')
 
         self.periodic = periodic
         if self.periodic:
-            cell_lengths = ncfile.createVariable('cell_lengths', 'f8', ('frame', 'cell_spatial'),
-                                                 zlib=self.zlib, complevel=self.cmplevel)
+            cell_lengths = self._create_variable(ncfile, 'cell_lengths', 'f8',
+                                                 ('frame', 'cell_spatial'))
             setattr(cell_lengths, 'units', 'angstrom')
 
             cell_spatial = ncfile.createVariable('cell_spatial', 'c',
                                                  ('cell_spatial',))
             cell_spatial[:] = np.asarray(list('abc'))
 
-            cell_angles = ncfile.createVariable('cell_angles', 'f8', ('frame', 'cell_angular'),
-                                                zlib=self.zlib, complevel=self.cmplevel)
+            cell_angles = self._create_variable(ncfile, 'cell_angles', 'f8',
+                                                ('frame', 'cell_angular'))
             setattr(cell_angles, 'units', 'degrees')
 
             cell_angular = ncfile.createVariable('cell_angular', 'c',
@@ -733,18 +949,52 @@ class NCDFWriter(base.Writer):
 
         # These properties are optional, and are specified on Writer creation
         if self.has_velocities:
-            velocs = ncfile.createVariable('velocities', 'f8', ('frame', 'atom', 'spatial'),
-                                           zlib=self.zlib, complevel=self.cmplevel)
+            velocs = self._create_variable(ncfile, 'velocities', 'f8',
+                                           ('frame', 'atom', 'spatial'))
             setattr(velocs, 'units', 'angstrom/picosecond')
         if self.has_forces:
-            forces = ncfile.createVariable('forces', 'f8', ('frame', 'atom', 'spatial'),
-                                           zlib=self.zlib, complevel=self.cmplevel)
+            forces = self._create_variable(ncfile, 'forces', 'f8',
+                                           ('frame', 'atom', 'spatial'))
             setattr(forces, 'units', 'kilocalorie/mole/angstrom')
 
         ncfile.sync()
         self._first_frame = False
         self.trjfile = ncfile
 
+        # frames are collected in these arrays before they are written
+        self._buffer = {}
+        for name, variable in ncfile.variables.items():
+            if variable.dimensions[0] == 'frame':
+                self._buffer[name] = np.empty(
+                    (self.buffer_frames,) + variable.shape[1:],
+                    dtype=variable.dtype)
+        self._n_buffered = 0
+
+    def _chunksizes(self, dimensions, itemsize):
+        """Chunk shape of a variable with *dimensions*"""
+        if self.netcdf_format.startswith('NETCDF3'):
+            # no chunking in the classic format
+            return None
+        if 'atom' in dimensions:
+            if self.chunks is not None:
+                frames, atoms = self.chunks
+            else:
+                atoms = min(self.n_atoms, self.chunk_atoms)
+                frames = min(self.chunk_frames, max(
+                    1, self.chunk_size // (atoms * 3 * itemsize)))
+            return (frames, min(atoms, self.n_atoms), 3)
+        # per frame data: a chunk of many frames
+        return (self.chunk_frames,) + (3,) * (len(dimensions) - 1)
+
+    def _create_variable(self, ncfile, name, datatype, dimensions):
+        """Create a per-frame variable with the compression and chunking
+        settings of the writer"""
+        return ncfile.createVariable(
+            name, datatype, dimensions, zlib=self.zlib,
+            complevel=self.cmplevel, shuffle=self.shuffle,
+            chunksizes=self._chunksizes(dimensions,
+                                        np.dtype(datatype).itemsize))
+
     def is_periodic(self, ts=None):
         """Return ``True`` if :class:`Timestep` *ts* contains a valid simulation box"""
         ts = ts if ts is not None else self.ts
@@ -805,28 +1055,44 @@ class NCDFWriter(base.Writer):
 
             unitcell = ts.dimensions
 
-        # write step
-        self.trjfile.variables['coordinates'][self.curr_frame, :, :] = pos
-        self.trjfile.variables['time'][self.curr_frame] = time
+        # collect the frame, the frames are written in blocks
+        buf = self._buffer
+        i = self._n_buffered
+        buf['coordinates'][i] = pos
+        buf['time'][i] = time
         if self.periodic:
-            self.trjfile.variables['cell_lengths'][self.curr_frame, :] = unitcell[:3]
-            self.trjfile.variables['cell_angles'][self.curr_frame, :] = unitcell[3:]
+            buf['cell_lengths'][i] = unitcell[:3]
+            buf['cell_angles'][i] = unitcell[3:]
         if self.has_velocities:
             if self.convert_units:
                 velocities = self.convert_velocities_to_native(ts._velocities, inplace=False)
             else:
                 velocities = ts._velocities
-            self.trjfile.variables['velocities'][self.curr_frame, :, :] = velocities
+            buf['velocities'][i] = velocities
         if self.has_forces:
             if self.convert_units:
                 forces = self.convert_forces_to_native(ts._forces, inplace=False)
             else:
-                forces = ts._velocities
-            self.trjfile.variables['forces'][self.curr_frame, :, :] = forces
-        self.trjfile.sync()
+                forces = ts._forces
+            buf['forces'][i] = forces
+        self._n_buffered += 1
         self.curr_frame += 1
+        if self._n_buffered == self.buffer_frames:
+            self.flush()
+
+    def flush(self):
+        """Write the frames that are collected in memory to the file"""
+        n = self._n_buffered
+        if self.trjfile is None or n == 0:
+            return
+        first = self.curr_frame - n
+        for name, data in self._buffer.items():
+            self.trjfile.variables[name][first:first + n] = data[:n]
+        self.trjfile.sync()
+        self._n_buffered = 0
 
     def close(self):
         if self.trjfile is not None:
+            self.flush()
             self.trjfile.close()
             self.trjfile = None
@@ -32,8 +32,10 @@ class TRRWriter(XDRBaseWriter):
         number of atoms to write
     convert_units : bool (optional)
         convert into MDAnalysis units
-    precision : float (optional)
-        set precision of saved trjactory to this number of decimal places.
+    pipeline : bool (optional)
+        write frames in a background thread
+    queue_size : int (optional)
+        number of frames that can wait to be written with *pipeline*
     """
 
     format = 'TRR'
@@ -79,7 +81,11 @@ class TRRWriter(XDRBaseWriter):
 
         box = triclinic_vectors(dimensions)
 
-        self._xdr.write(xyz, velo, forces, box, step, time, 1, self.n_atoms)
+        self._add_frame((xyz, velo, forces, box, step, time, 1, self.n_atoms))
+
+    def _write_frames(self, frames):
+        for frame in frames:
+            self._xdr.write(*frame)
 
 
 class TRRReader(XDRBaseReader):
@@ -94,17 +100,31 @@ class TRRReader(XDRBaseReader):
         filename of the trajectory
     convert_units : bool (optional)
         convert into MDAnalysis units
-    sub : atomgroup (optional)
-        Yeah what is that exactly
+    sub : array_like (optional)
+        old name of *atom_indices*
+    atom_indices : array_like (optional)
+        0-based indices of the atoms that are read; the Timestep only holds
+        these atoms
     refresh_offsets : bool (optional)
         Recalculate offsets for random access from file. If ``False`` try to
         retrieve offsets from hidden offsets file.
+    follow : bool (optional)
+        follow a trajectory that is still being written: when iterating
+        reaches the last frame, wait for new frames to be appended, see
+        :meth:`update_n_frames`
+    follow_timeout : float (optional)
+        stop iterating if no new frame was appended within this number of
+        seconds; ``None`` waits forever
+    follow_interval : float (optional)
+        seconds between two checks for new frames
     """
     format = 'TRR'
     units = {'time': 'ps', 'length': 'nm', 'velocity': 'nm/ps',
              'force': 'kJ/(mol*nm)'}
     _writer = TRRWriter
     _file = TRRFile
+    # magic number at the start of every frame
+    _magic = 1993
 
     def _frame_to_ts(self, frame, ts):
         """convert a trr-frame to a mda TimeStep"""
@@ -121,26 +141,17 @@ class TRRReader(XDRBaseReader):
             self.convert_pos_from_native(ts.dimensions[:3])
 
         if ts.has_positions:
-            if self._sub is not None:
-                ts.positions = frame.x[self._sub]
-            else:
-                ts.positions = frame.x
+            ts.positions = self._select_atoms(frame.x)
             if self.convert_units:
                 self.convert_pos_from_native(ts.positions)
 
         if ts.has_velocities:
-            if self._sub is not None:
-                ts.velocities = frame.v[self._sub]
-            else:
-                ts.velocities = frame.v
+            ts.velocities = self._select_atoms(frame.v)
             if self.convert_units:
                 self.convert_velocities_from_native(ts.velocities)
 
         if ts.has_forces:
-            if self._sub is not None:
-                ts.forces = frame.f[self._sub]
-            else:
-                ts.forces = frame.f
+            ts.forces = self._select_atoms(frame.f)
             if self.convert_units:
                 self.convert_forces_from_native(ts.forces)
 
@@ -71,10 +71,6 @@ Reads coordinates, velocities and more (see attributes of the
 .. autoclass:: TRZWriter
    :members:
 """
-import six
-from six.moves import range
-
-import sys
 import warnings
 import numpy as np
 import os
@@ -82,6 +78,7 @@ import errno
 
 from . import base
 from ..core import flags
+from ..exceptions import NoDataError
 from ..lib import util
 from ..lib.util import cached
 from .core import triclinic_box, triclinic_vectors
@@ -135,13 +132,21 @@ class TRZReader(base.Reader):
        Extra data (Temperature, Energies, Pressures, etc) now read
        into ts.data dictionary
        Now passes a weakref of self to ts (ts._reader)
+    .. versionchanged:: 0.15.0
+       Frames are read from a memory map of the file (random access does not
+       need to seek) and :meth:`timeseries` was added. The frame number is
+       the index of the frame in the file instead of the frame number
+       stored in the frame.
+       Added *atom_indices* keyword to read only a subset of the atoms.
     """
 
     format = "TRZ"
+    _reads_atom_indices = True
 
     units = {'time': 'ps', 'length': 'nm', 'velocity': 'nm/ps'}
 
-    def __init__(self, trzfilename, n_atoms=None, **kwargs):
+    def __init__(self, trzfilename, n_atoms=None, atom_indices=None,
+                 **kwargs):
         """Creates a TRZ Reader
 
         :Arguments:
@@ -149,6 +154,9 @@ class TRZReader(base.Reader):
             name of input file
           *n_atoms*
             number of atoms in trajectory, must taken from topology file!
+          *atom_indices*
+            0-based indices of the atoms that are read; only these atoms
+            are copied out of the memory map of each frame
           *convert_units*
             converts units to MDAnalysis defaults
         """
@@ -159,7 +167,11 @@ class TRZReader(base.Reader):
 
         self.trzfile = util.anyopen(self.filename, 'rb')
         self._cache = dict()
-        self._n_atoms = n_atoms
+        self._n_atoms = self._init_atom_indices(atom_indices, n_atoms)
+        # frames of the file as a memory-mapped array, see _frames
+        self._mmap = None
+        # index of the frame that was read last
+        self._current_frame = -1
 
         self._read_trz_header()
         self.ts = Timestep(self.n_atoms,
@@ -230,33 +242,59 @@ class TRZReader(base.Reader):
         else:
             raise IOError
 
+    @property
+    def _frames(self):
+        """All complete frames of the trajectory as a memory-mapped array
+        with the structured dtype of a frame.
+
+        .. versionadded:: 0.15.0
+        """
+        if self._mmap is None:
+            offset = self._headerdtype.itemsize
+            n_frames = ((os.path.getsize(self.filename) - offset) //
+                        self._dtype.itemsize)
+            if n_frames > 0:
+                self._mmap = np.memmap(self.filename, dtype=self._dtype,
+                                       mode='r', offset=offset,
+                                       shape=(n_frames,))
+            else:
+                self._mmap = np.empty(0, dtype=self._dtype)
+        return self._mmap
+
     def _read_next_timestep(self, ts=None):
         if ts is None:
             ts = self.ts
 
+        frame = self._current_frame + 1
         try:
-            data = np.fromfile(self.trzfile, dtype=self._dtype, count=1)
-            ts.frame = data['nframe'][0] - 1  # 0 based for MDA
+            if frame >= len(self._frames):
+                raise IndexError
+            # a view into the memory map, only the atoms that are read are
+            # copied out of it
+            data = self._frames[frame:frame + 1]
+            self._current_frame = frame
+            ts.frame = frame
             ts._frame = data['ntrj'][0]
             ts.time = data['treal'][0]
             ts._unitcell[:] = data['box']
-            ts.data['pressure'] = data['pressure']
-            ts.data['pressure_tensor'] = data['ptensor']
-            ts.data['total_energy'] = data['etot']
-            ts.data['potential_energy'] = data['ptot']
-            ts.data['kinetic_energy'] = data['ek']
-            ts.data['temperature'] = data['T']
-            ts._x[:] = data['rx']
-            ts._y[:] = data['ry']
-            ts._z[:] = data['rz']
-            ts._velocities[:, 0] = data['vx']
-            ts._velocities[:, 1] = data['vy']
-            ts._velocities[:, 2] = data['vz']
+            ts.data['pressure'] = np.array(data['pressure'])
+            ts.data['pressure_tensor'] = np.array(data['ptensor'])
+            ts.data['total_energy'] = np.array(data['etot'])
+            ts.data['potential_energy'] = np.array(data['ptot'])
+            ts.data['kinetic_energy'] = np.array(data['ek'])
+            ts.data['temperature'] = np.array(data['T'])
+            select = self._select_atoms
+            ts._x[:] = select(data['rx'][0])
+            ts._y[:] = select(data['ry'][0])
+            ts._z[:] = select(data['rz'][0])
+            ts._velocities[:, 0] = select(data['vx'][0])
+            ts._velocities[:, 1] = select(data['vy'][0])
+            ts._velocities[:, 2] = select(data['vz'][0])
             if self.has_force:
-                ts._forces[:, 0] = data['fx']
-                ts._forces[:, 1] = data['fy']
-                ts._forces[:, 2] = data['fz']
-        except IndexError: # Raises indexerror if data has no data (EOF)
+                ts._forces[:, 0] = select(data['fx'][0])
+                ts._forces[:, 1] = select(data['fy'][0])
+                ts._forces[:, 2] = select(data['fz'][0])
+        except IndexError:  # EOF
             raise IOError
         else:
             # Convert things read into MDAnalysis' native formats (nm -> angstroms)
@@ -269,7 +307,7 @@ class TRZReader(base.Reader):
 
     @property
     def n_atoms(self):
-        """Number of atoms in a frame"""
+        """Number of atoms that are read from a frame"""
         return self._n_atoms
 
     @property
@@ -344,48 +382,70 @@ class TRZReader(base.Reader):
 
         .. versionchanged:: 0.11.0
            Frames now 0-based instead of 1-based
+        .. versionchanged:: 0.15.0
+           Frames are read from the memory-mapped file
         """
-        move = frame - self.ts.frame
-
-        self._seek(move - 1)
+        self._current_frame = frame - 1
         self._read_next_timestep()
         return self.ts
 
-    def _seek(self, nframes):
-        """Move *nframes* in the trajectory
-
-        Note that this doens't read the trajectory (ts remains unchanged)
-
-        .. versionadded:: 0.9.0
+    def timeseries(self, asel=None, start=0, stop=-1, skip=1, format='afc'):
+        """Return a subset of coordinate data for an AtomGroup
+
+        The coordinates are sliced directly out of the memory-mapped file
+        without reading frame by frame.
+
+        Parameters
+        ----------
+        asel : :class:`~MDAnalysis.core.AtomGroup.AtomGroup` (optional)
+            atoms to read. All atoms are read if ``None``.
+        start, stop, skip : int (optional)
+            range of trajectory to access, start and stop are inclusive
+        format : str (optional)
+            the order/shape of the return data array, corresponding
+            to (a)tom, (f)rame, (c)oordinates all six combinations
+            of 'a', 'f', 'c' are allowed ie "fac" - return array
+            where the shape is (frame, number of atoms,
+            coordinates)
+
+        Returns
+        -------
+        coordinates : ndarray, dtype=float32
+            coordinates in MDAnalysis units
+
+        See Also
+        --------
+        MDAnalysis.coordinates.DCD.DCDReader.timeseries
+
+        .. versionadded:: 0.15.0
         """
-        # On python 2, seek has issues with long int. This is solve in python 3
-        # where there is no longer a distinction between int and long int.
-        if six.PY2:
-            framesize = long(self._dtype.itemsize)
-            seeksize = framesize * nframes
-            maxi_l = long(sys.maxint)
-        else:
-            framesize = self._dtype.itemsize
-            seeksize = framesize * nframes
-            maxi_l = seeksize + 1
-
-        if seeksize > maxi_l:
-            # Workaround for seek not liking long ints
-            # On python 3 this branch will never be used as we defined maxi_l
-            # greater than seeksize.
-            framesize = long(framesize)
-            seeksize = framesize * nframes
-
-            nreps = int(seeksize / maxi_l)  # number of max seeks we'll have to do
-            rem = int(seeksize % maxi_l)  # amount leftover to do once max seeks done
-
-            for _ in range(nreps):
-                self.trzfile.seek(maxint, 1)
-            self.trzfile.seek(rem, 1)
+        if self.trzfile is None:
+            raise IOError("Trajectory is closed")
+        start, stop, skip = self.check_slice_indices(start, stop, skip)
+        if format not in ('afc', 'acf', 'caf', 'cfa', 'fac', 'fca'):
+            raise ValueError("Invalid timeseries format")
+        # stop is inclusive here
+        frames = np.arange(start, stop + (1 if skip > 0 else -1), skip)
+        if asel is None:
+            if self._atom_indices is None:
+                index = frames
+            else:
+                index = np.ix_(frames, self._atom_indices)
+            n_atoms = self.n_atoms
         else:
-            seeksize = int(seeksize)
-
-            self.trzfile.seek(seeksize, 1)
+            if len(asel) == 0:
+                raise NoDataError("Timeseries requires at least one atom "
+                                  "to analyze")
+            index = np.ix_(frames, self._file_atom_indices(asel.indices))
+            n_atoms = len(asel)
+
+        coordinates = np.empty((len(frames), n_atoms, 3), dtype=np.float32)
+        for i, field in enumerate(('rx', 'ry', 'rz')):
+            coordinates[:, :, i] = self._frames[field][index]
+        if self.convert_units:
+            self.convert_pos_from_native(coordinates)
+        return np.ascontiguousarray(
+            coordinates.transpose(['fac'.index(c) for c in format]))
 
     def _reopen(self):
         self.close()
@@ -404,6 +464,7 @@ class TRZReader(base.Reader):
         #Reset ts
         ts = self.ts
         ts.frame = -1
+        self._current_frame = -1
 
         return self.trzfile
 
@@ -418,6 +479,7 @@ class TRZReader(base.Reader):
         if self.trzfile is not None:
             self.trzfile.close()
             self.trzfile = None
+        self._mmap = None
 
 
 class TRZWriter(base.Writer):
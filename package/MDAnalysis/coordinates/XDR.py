@@ -18,15 +18,28 @@
 import six
 
 import errno
+import os
 import numpy as np
 from os.path import getctime, getsize, isfile, split, join
+import struct
+import tempfile
 import warnings
 
 from . import base
+from ..exceptions import NoDataError
 from ..lib.mdamath import triclinic_box
 
 
-def offsets_filename(filename, ending='npz'):
+#: header of the binary offsets files, followed by `n_frames` little endian
+#: 64 bit integer offsets
+OFFSETS_HEADER = np.dtype([('magic', 'S8'), ('version', '<i8'),
+                           ('n_atoms', '<i8'), ('size', '<i8'),
+                           ('ctime', '<f8'), ('n_frames', '<i8')])
+OFFSETS_MAGIC = b'MDAXDROF'
+OFFSETS_VERSION = 1
+
+
+def offsets_filename(filename, ending='bin'):
     """Return offset filename
 
     Parameters
@@ -61,20 +74,113 @@ def read_numpy_offsets(filename):
     return {k: v for k, v in six.iteritems(np.load(filename))}
 
 
+def read_offsets(filename):
+    """read offsets from a binary offsets file
+
+    The offsets are memory mapped read-only and not loaded into memory.
+
+    Parameters
+    ----------
+    filename : str
+        filename of offsets
+
+    Returns
+    -------
+    offsets : dict
+        dictionary of offsets information
+
+    Raises
+    ------
+    ValueError
+        if the file is not a valid offsets file
+
+    See Also
+    --------
+    write_offsets
+
+    .. versionadded:: 0.15.0
+    """
+    header = np.fromfile(filename, dtype=OFFSETS_HEADER, count=1)
+    if (len(header) != 1 or header['magic'][0] != OFFSETS_MAGIC or
+            header['version'][0] != OFFSETS_VERSION):
+        raise ValueError("{} is not an offsets file".format(filename))
+    header = header[0]
+    n_frames = int(header['n_frames'])
+    if getsize(filename) != OFFSETS_HEADER.itemsize + 8 * n_frames:
+        raise ValueError("{} is truncated".format(filename))
+    if n_frames > 0:
+        offsets = np.memmap(filename, dtype='<i8', mode='r',
+                            offset=OFFSETS_HEADER.itemsize, shape=(n_frames,))
+    else:
+        offsets = np.array([], dtype=np.int64)
+    return {'offsets': offsets, 'size': int(header['size']),
+            'ctime': float(header['ctime']),
+            'n_atoms': int(header['n_atoms'])}
+
+
+def write_offsets(filename, offsets, size, ctime, n_atoms):
+    """write offsets into a binary offsets file
+
+    The file is a fixed size header followed by the raw offsets, so that they
+    can be memory mapped by :func:`read_offsets`. It is written to a
+    temporary file first and then moved in place, so that offsets which are
+    already mapped by other readers stay valid.
+
+    Parameters
+    ----------
+    filename : str
+        filename of offsets
+    offsets : array_like
+        byte offsets of the frames
+    size : int
+        size of the trajectory
+    ctime : float
+        ctime of the trajectory
+    n_atoms : int
+        number of atoms in the trajectory
+
+    .. versionadded:: 0.15.0
+    """
+    offsets = np.asarray(offsets, dtype='<i8')
+    header = np.array([(OFFSETS_MAGIC, OFFSETS_VERSION, n_atoms, size, ctime,
+                        len(offsets))], dtype=OFFSETS_HEADER)
+    head, tail = split(filename)
+    fd, tmpname = tempfile.mkstemp(prefix=tail, dir=head or '.')
+    try:
+        # mkstemp only gives access to the owner
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmpname, 0o666 & ~umask)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header.tostring())
+            f.write(offsets.tostring())
+        os.rename(tmpname, filename)
+    except Exception:
+        os.remove(tmpname)
+        raise
+
+
 class XDRBaseReader(base.Reader):
     """Base class for libmdaxdr file formats xtc and trr"""
+    # frames are decoded completely and then sliced to atom_indices
+    _reads_atom_indices = True
+
     def __init__(self, filename, convert_units=True, sub=None,
-                 refresh_offsets=False, **kwargs):
+                 refresh_offsets=False, follow=False, follow_timeout=None,
+                 follow_interval=1.0, atom_indices=None, **kwargs):
         super(XDRBaseReader, self).__init__(filename,
                                             convert_units=convert_units,
                                             **kwargs)
         self._xdr = self._file(self.filename)
+        self._follow = follow
+        self._follow_timeout = follow_timeout
+        self._follow_interval = follow_interval
 
-        self._sub = sub
-        if self._sub is not None:
-            self.n_atoms = len(self._sub)
-        else:
-            self.n_atoms = self._xdr.n_atoms
+        # sub is the old name of atom_indices
+        if atom_indices is None:
+            atom_indices = sub
+        self.n_atoms = self._init_atom_indices(atom_indices,
+                                               self._xdr.n_atoms)
 
         if not refresh_offsets:
             self._load_offsets()
@@ -104,30 +210,74 @@ class XDRBaseReader(base.Reader):
 
     def _load_offsets(self):
         """load frame offsets from file, reread them from the trajectory if that
-        fails"""
+        fails
+
+        When the trajectory has grown since the offsets were stored, the stored
+        offsets are spot-checked and only the new part of the trajectory is
+        indexed.
+        """
         fname = offsets_filename(self.filename)
+        legacy_fname = offsets_filename(self.filename, ending='npz')
 
-        if not isfile(fname):
+        try:
+            if isfile(fname):
+                data = read_offsets(fname)
+            elif isfile(legacy_fname):
+                data = read_numpy_offsets(legacy_fname)
+            else:
+                self._read_offsets(store=True)
+                return
+        except (IOError, ValueError) as e:
+            warnings.warn("Reload offsets from trajectory\n "
+                          "couldn't read stored offsets: {}".format(e))
             self._read_offsets(store=True)
             return
-
-        data = read_numpy_offsets(fname)
-        ctime_ok = size_ok = n_atoms_ok = False
+        ctime_ok = size_ok = n_atoms_ok = grown = False
 
         try:
+            size = getsize(self.filename)
             ctime_ok = getctime(self.filename) == data['ctime']
-            size_ok = getsize(self.filename) == data['size']
+            size_ok = size == data['size']
             n_atoms_ok = self._xdr.n_atoms == data['n_atoms']
+            grown = size > data['size']
         except KeyError:
             # we tripped over some old offset formated file
             pass
 
-        if not (ctime_ok and size_ok and n_atoms_ok):
+        if ctime_ok and size_ok and n_atoms_ok:
+            self._xdr.set_offsets(data['offsets'])
+        elif (grown and n_atoms_ok and len(data['offsets']) > 0 and
+              self._check_offsets(data['offsets'])):
+            # only index what has been appended, starting at the last known
+            # frame, which might not have been complete
+            offsets = data['offsets']
+            new_offsets = self._xdr.calc_offsets(start=int(offsets[-1]))
+            self._xdr.set_offsets(np.concatenate([offsets[:-1],
+                                                  new_offsets]))
+            self._read_offsets(store=True)
+        else:
             warnings.warn("Reload offsets from trajectory\n "
                           "ctime or size or n_atoms did not match")
             self._read_offsets(store=True)
-        else:
-            self._xdr.set_offsets(data['offsets'])
+
+    def _check_offsets(self, offsets, n_checks=8):
+        """spot-check that frames start at some of the `offsets`
+
+        The first, the last and up to `n_checks` offsets in between are checked
+        for the magic number of the file format.
+        """
+        idx = np.unique(np.linspace(0, len(offsets) - 1,
+                                    min(len(offsets), n_checks + 2)).astype(int))
+        size = getsize(self.filename)
+        with open(self.filename, 'rb') as f:
+            for offset in offsets[idx]:
+                if not 0 <= offset <= size - 4:
+                    return False
+                f.seek(int(offset))
+                magic, = struct.unpack('>i', f.read(4))
+                if magic != self._magic:
+                    return False
+        return True
 
     def _read_offsets(self, store=False):
         """read frame offsets from trajectory"""
@@ -136,12 +286,35 @@ class XDRBaseReader(base.Reader):
             ctime = getctime(self.filename)
             size = getsize(self.filename)
             try:
-                np.savez(offsets_filename(self.filename),
-                         offsets=offsets, size=size, ctime=ctime,
-                         n_atoms=self._xdr.n_atoms)
+                write_offsets(offsets_filename(self.filename), offsets,
+                              size=size, ctime=ctime,
+                              n_atoms=self._xdr.n_atoms)
             except Exception as e:
                 warnings.warn("Couldn't save offsets because: {}".format(e))
 
+    def update_n_frames(self):
+        """Look for frames appended to the trajectory since it was opened.
+
+        Only the trajectory after the last known frame is indexed.
+
+        Returns
+        -------
+        n_new : int
+            number of new frames
+
+        .. versionadded:: 0.15.0
+        """
+        offsets = self._xdr.offsets
+        new_offsets = self._xdr.calc_offsets(start=int(offsets[-1]))
+        n_new = len(new_offsets) - 1
+        if n_new > 0:
+            self._xdr.set_offsets(np.concatenate([offsets, new_offsets[1:]]))
+            # reposition the file, the read buffer might hold a frame that
+            # was incomplete when it was read
+            if self._frame + 1 < self.n_frames:
+                self._xdr.seek(self._frame + 1)
+        return n_new
+
     def rewind(self):
         """Read the first frame again"""
         self._read_frame(0)
@@ -184,6 +357,69 @@ class XDRBaseReader(base.Reader):
         self._frame_to_ts(frame, ts)
         return ts
 
+    def timeseries(self, asel=None, start=0, stop=-1, skip=1, format='afc',
+                   n_threads=1):
+        """Return a subset of coordinate data for an AtomGroup
+
+        The frames are decoded directly into a single array, which is much
+        faster than iterating over the trajectory.
+
+        Parameters
+        ----------
+        asel : :class:`~MDAnalysis.core.AtomGroup.AtomGroup` (optional)
+            atoms to read. All atoms are read if ``None``.
+        start, stop, skip : int (optional)
+            range of trajectory to access, start and stop are inclusive
+        format : str (optional)
+            the order/shape of the return data array, corresponding
+            to (a)tom, (f)rame, (c)oordinates all six combinations
+            of 'a', 'f', 'c' are allowed ie "fac" - return array
+            where the shape is (frame, number of atoms,
+            coordinates)
+        n_threads : int (optional)
+            number of threads decompressing frames in parallel, see
+            :meth:`~MDAnalysis.lib.formats.libmdaxdr.XTCFile.read_frames`
+
+        Returns
+        -------
+        coordinates : ndarray, dtype=float32
+            coordinates in MDAnalysis units. Frames without positions
+            (possible in TRR files) are filled with ``nan``.
+
+        See Also
+        --------
+        MDAnalysis.coordinates.DCD.DCDReader.timeseries
+
+        .. versionadded:: 0.15.0
+        """
+        start, stop, skip = self.check_slice_indices(start, stop, skip)
+        if format not in ('afc', 'acf', 'caf', 'cfa', 'fac', 'fca'):
+            raise ValueError("Invalid timeseries format")
+        atom_indices = None
+        if asel is not None:
+            if len(asel) == 0:
+                raise NoDataError("Timeseries requires at least one atom "
+                                  "to analyze")
+            atom_indices = self._file_atom_indices(asel.indices)
+        elif self._atom_indices is not None:
+            atom_indices = self._atom_indices
+
+        # stop is inclusive here and exclusive in read_frames
+        stop += 1 if skip > 0 else -1
+        if stop < 0:
+            stop = None
+        coordinates = self._xdr.read_frames(start, stop, skip, atom_indices,
+                                            n_threads=n_threads)
+
+        # read_frames moved the file, go back to where the reader was
+        if self._frame + 1 < self.n_frames:
+            self._xdr.seek(self._frame + 1)
+
+        if self.convert_units:
+            self.convert_pos_from_native(coordinates)
+        return np.ascontiguousarray(
+            coordinates.transpose(['fac'.index(c) for c in format]))
+
     def Writer(self, filename, n_atoms=None, **kwargs):
         """Return writer for trajectory format"""
         if n_atoms is None:
@@ -192,17 +428,46 @@ class XDRBaseReader(base.Reader):
 
 
 class XDRBaseWriter(base.Writer):
-    """Base class for libmdaxdr file formats xtc and trr"""
+    """Base class for libmdaxdr file formats xtc and trr
+
+    With ``pipeline=True`` the frames are written to the file in a background
+    thread, while the next frames are read and processed; the writer must
+    then be closed to make sure that all frames are written.
 
-    def __init__(self, filename, n_atoms, convert_units=True, **kwargs):
+    .. versionchanged:: 0.15.0
+       added *pipeline* and *queue_size* keywords
+    """
+    #: number of frames that are written together
+    _batch_size = 1
+
+    def __init__(self, filename, n_atoms, convert_units=True, pipeline=False,
+                 queue_size=8, **kwargs):
         self.filename = filename
         self._convert_units = convert_units
         self.n_atoms = n_atoms
+        self._batch = []
         self._xdr = self._file(self.filename, 'w')
+        if pipeline:
+            self._start_pipeline(queue_size)
+
+    def _add_frame(self, frame):
+        """Write a frame prepared by write_next_timestep() in the next batch"""
+        self._batch.append(frame)
+        if len(self._batch) >= self._batch_size:
+            self._flush_batch()
+
+    def _flush_batch(self):
+        if self._batch:
+            batch, self._batch = self._batch, []
+            self._submit(batch)
 
     def close(self):
         """close trajectory"""
-        self._xdr.close()
+        try:
+            self._flush_batch()
+            self._stop_pipeline()
+        finally:
+            self._xdr.close()
 
     def __del__(self):
         self.close()
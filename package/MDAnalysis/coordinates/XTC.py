@@ -36,16 +36,33 @@ class XTCWriter(XDRBaseWriter):
         convert into MDAnalysis units
     precision : float (optional)
         set precision of saved trjactory to this number of decimal places.
+    pipeline : bool (optional)
+        write frames in a background thread
+    queue_size : int (optional)
+        number of frames (or batches of frames, with *n_threads*) that can
+        wait to be written with *pipeline*
+    n_threads : int (optional)
+        compress batches of ``4 * n_threads`` frames in parallel threads;
+        the frames are written in order
+
+    Note
+    ----
+    With *pipeline* or *n_threads* frames are only written completely when
+    the writer is closed.
+
     """
     format = 'XTC'
     units = {'time': 'ps', 'length': 'nm'}
     _file = XTCFile
 
     def __init__(self, filename, n_atoms, convert_units=True,
-                 precision=3, **kwargs):
+                 precision=3, n_threads=1, **kwargs):
         super(XTCWriter, self).__init__(filename, n_atoms, convert_units,
                                         **kwargs)
         self.precision = precision
+        self.n_threads = n_threads
+        if n_threads > 1:
+            self._batch_size = 4 * n_threads
 
     def write_next_timestep(self, ts):
         """Write timestep object into trajectory.
@@ -73,7 +90,15 @@ class XTCWriter(XDRBaseWriter):
         # a precision of 3 decimal places we need to pass 1000.0 to the xdr
         # library.
         precision = 10.0 ** self.precision
-        self._xdr.write(xyz, box, step, time, precision)
+        self._add_frame((xyz, box, step, time, precision))
+
+    def _write_frames(self, frames):
+        if len(frames) == 1:
+            self._xdr.write(*frames[0])
+        else:
+            xyz, box, step, time, precision = zip(*frames)
+            self._xdr.write_frames(xyz, box, step, time, precision[0],
+                                   n_threads=self.n_threads)
 
 
 class XTCReader(XDRBaseReader):
@@ -89,17 +114,31 @@ class XTCReader(XDRBaseReader):
         filename of the trajectory
     convert_units : bool (optional)
         convert into MDAnalysis units
-    sub : atomgroup (optional)
-        Yeah what is that exactly
+    sub : array_like (optional)
+        old name of *atom_indices*
+    atom_indices : array_like (optional)
+        0-based indices of the atoms that are read; the Timestep only holds
+        these atoms
     refresh_offsets : bool (optional)
         Recalculate offsets for random access from file. If ``False`` try to
         retrieve offsets from hidden offsets file.
+    follow : bool (optional)
+        follow a trajectory that is still being written: when iterating
+        reaches the last frame, wait for new frames to be appended, see
+        :meth:`update_n_frames`
+    follow_timeout : float (optional)
+        stop iterating if no new frame was appended within this number of
+        seconds; ``None`` waits forever
+    follow_interval : float (optional)
+        seconds between two checks for new frames
 
     """
     format = 'XTC'
     units = {'time': 'ps', 'length': 'nm'}
     _writer = XTCWriter
     _file = XTCFile
+    # magic number at the start of every frame
+    _magic = 1995
 
     def _frame_to_ts(self, frame, ts):
         """convert a xtc-frame to a mda TimeStep"""
@@ -108,10 +147,7 @@ class XTCReader(XDRBaseReader):
         ts.data['step'] = frame.step
         ts.dimensions = triclinic_box(*frame.box)
 
-        if self._sub is not None:
-            ts.positions = frame.x[self._sub]
-        else:
-            ts.positions = frame.x
+        ts.positions = self._select_atoms(frame.x)
         if self.convert_units:
             self.convert_pos_from_native(ts.positions)
             self.convert_pos_from_native(ts.dimensions[:3])
@@ -32,6 +32,9 @@ Note the following:
 * All fields to the right of the z-coordinate are ignored.
 * The unitcell information is all zeros since this is not recorded in
   the XYZ format.
+* The byte offsets of the frames are stored in a hidden file next to
+  the XYZ file (as for the XTC and TRR readers) so that the file only
+  has to be scanned once.
 
 .. rubric:: Units
 
@@ -71,19 +74,24 @@ the `VMD xyzplugin`_ from whence the definition was taken)::
 """
 
 from six.moves import range, zip
+import six
 import os
 import errno
+import warnings
 import numpy as np
 import logging
 logger = logging.getLogger('MDAnalysis.analysis.psa')
 
 from . import base
+from .XDR import offsets_filename, read_offsets, write_offsets
 from ..core import flags
 from ..lib import util
-from ..lib.util import cached
 from ..exceptions import NoDataError
 from ..version import __version__
 
+#: bytes read at a time when indexing an XYZ file
+_INDEX_BLOCKSIZE = 2**22
+
 
 class XYZWriter(base.Writer):
     """Writes an XYZ file
@@ -140,6 +148,10 @@ class XYZWriter(base.Writer):
         self.remark = default_remark if remark == 'default' else remark
         # can also be gz, bz2
         self._xyz = util.anyopen(self.filename, 'wt')
+        # atom lines without coordinates for the atom names in
+        # _template_names, see write_next_timestep()
+        self._template = None
+        self._template_names = None
 
     def _get_atomnames(self, atoms):
         """Return a list of atom names"""
@@ -215,7 +227,12 @@ class XYZWriter(base.Writer):
         self.write_next_timestep(ts)
 
     def write_next_timestep(self, ts=None):
-        """Write coordinate information in *ts* to the trajectory"""
+        """Write coordinate information in *ts* to the trajectory
+
+        .. versionchanged:: 0.15.0
+           The atom lines are formatted from a template that is kept while
+           the atom names do not change and a frame is written in one go.
+        """
         if ts is None:
             if not hasattr(self, 'ts'):
                 raise NoDataError('XYZWriter: no coordinate data to write to '
@@ -244,11 +261,17 @@ class XYZWriter(base.Writer):
         else:
             coordinates = ts.positions
 
-        self._xyz.write("{0:d}\n".format(ts.n_atoms))
-        self._xyz.write("frame {0}\n".format(ts.frame))
-        for atom, (x, y, z) in zip(self.atomnames, coordinates):
-            self._xyz.write("{0!s:>8}  {1:10.5f} {2:10.5f} {3:10.5f}\n"
-                            "".format(atom, x, y, z))
+        if (self._template_names is None or
+                not np.array_equal(self._template_names, self.atomnames)):
+            line = "{0!s:>8}  {1:10.5f} {1:10.5f} {1:10.5f}\n"
+            self._template = self._records_template(
+                line.format(atom, self._frame_field)
+                for atom in self.atomnames)
+            self._template_names = np.array(self.atomnames, copy=True)
+
+        self._xyz.write("{0:d}\nframe {1}\n{2}".format(
+            ts.n_atoms, ts.frame,
+            self._format_records(self._template, coordinates)))
 
 
 class XYZReader(base.Reader):
@@ -275,6 +298,10 @@ class XYZReader(base.Reader):
     .. versionchanged:: 0.11.0
        Frames now 0-based instead of 1-based. Added *dt* and
        *time_offset* keywords (passed to :class:`Timestep`)
+    .. versionchanged:: 0.15.0
+       Frames are found through byte offsets, which are stored in a hidden
+       offsets file (*refresh_offsets* keyword), and the coordinates of a
+       frame are converted in one go.
     """
 
     # Phil Fowler:
@@ -288,83 +315,154 @@ class XYZReader(base.Reader):
     units = {'time': 'ps', 'length': 'Angstrom'}
     _Timestep = base.Timestep
 
-    def __init__(self, filename, **kwargs):
+    def __init__(self, filename, refresh_offsets=False, **kwargs):
+        """
+        Parameters
+        ----------
+        filename : str
+            filename of the XYZ file, which can be gzip or bzip2 compressed
+        refresh_offsets : bool (optional)
+            index the frames of the file again instead of using the offsets
+            stored in the hidden offsets file next to it
+        """
         super(XYZReader, self).__init__(filename, **kwargs)
 
         # the filename has been parsed to be either be foo.xyz or foo.xyz.bz2 by
         # coordinates::core.py so the last file extension will tell us if it is
         # bzipped or not
         root, ext = os.path.splitext(self.filename)
-        self.xyzfile = util.anyopen(self.filename, "r")
+        self.xyzfile = util.anyopen(self.filename, "rb")
         self.compression = ext[1:] if ext[1:] != "xyz" else None
-        self._cache = dict()
+
+        self.n_atoms = int(self.xyzfile.readline())
+        if refresh_offsets:
+            self._offsets = self._index_frames(store=True)
+        else:
+            self._offsets = self._load_offsets()
+        self.n_frames = len(self._offsets) - 1
 
         self.ts = self._Timestep(self.n_atoms, **self._ts_kwargs)
-        # Haven't quite figured out where to start with all the self._reopen()
-        # etc.
-        # (Also cannot just use seek() or reset() because that would break
-        # with urllib2.urlopen() streams)
         self._read_next_timestep()
 
-    @property
-    @cached('n_atoms')
-    def n_atoms(self):
-        """number of atoms in a frame"""
-        with util.anyopen(self.filename, 'r') as f:
-            n = f.readline()
-        # need to check type of n
-        return int(n)
-
-    @property
-    @cached('n_frames')
-    def n_frames(self):
+    def _index_frames(self, store=False):
+        """Find the byte offsets of the frames
+
+        The line endings are located in large blocks of the file at a time.
+        Returns the offsets of all complete frames followed by the offset
+        after the last frame.
+        """
+        lines_per_frame = self.n_atoms + 2
+        starts = [np.zeros(1, dtype=np.int64)]
+        n_lines = 0  # number of lines before position
+        position = 0  # offset of the block in the file
+        last = b'\n'
+        f = self.xyzfile
+        f.seek(0)
+        while True:
+            block = f.read(_INDEX_BLOCKSIZE)
+            if isinstance(block, six.text_type):
+                block = block.encode('latin-1')
+            if not block:
+                break
+            newlines = np.flatnonzero(
+                np.frombuffer(block, dtype=np.uint8) == ord(b'\n'))
+            # the line after the k-th newline is line n_lines + k + 1
+            first = -(n_lines + 1) % lines_per_frame
+            starts.append(position + newlines[first::lines_per_frame] + 1)
+            n_lines += len(newlines)
+            position += len(block)
+            last = block[-1:]
+        if last != b'\n':
+            # a last line without line ending
+            n_lines += 1
+        n_frames = n_lines // lines_per_frame
+        offsets = np.concatenate(starts)[:n_frames + 1]
+        if len(offsets) < n_frames + 1:
+            offsets = np.append(offsets, position)
+        if store:
+            self._store_offsets(offsets)
+        return offsets
+
+    def _offsets_filename(self):
+        """name of the offsets file, ``None`` for streams"""
+        if util.isstream(self.filename) or not os.path.isfile(self.filename):
+            return None
+        return offsets_filename(self.filename)
+
+    def _store_offsets(self, offsets):
+        fname = self._offsets_filename()
+        if fname is None:
+            return
+        try:
+            write_offsets(fname, offsets, size=os.path.getsize(self.filename),
+                          ctime=os.path.getctime(self.filename),
+                          n_atoms=self.n_atoms)
+        except Exception as e:
+            warnings.warn("Couldn't save offsets because: {}".format(e))
+
+    def _load_offsets(self):
+        """load the frame offsets from the offsets file, index the file if
+        that fails or if the file has changed"""
+        fname = self._offsets_filename()
+        if fname is None or not os.path.isfile(fname):
+            return self._index_frames(store=True)
         try:
-            return self._read_xyz_n_frames()
-        except IOError:
-            return 0
-
-    def _read_xyz_n_frames(self):
-        # the number of lines in the XYZ file will be 2 greater than the
-        # number of atoms
-        linesPerFrame = self.n_atoms + 2
-        counter = 0
-        offsets = []
-
-        with util.anyopen(self.filename, 'r') as f:
-            line = True
-            while line:
-                if not counter % linesPerFrame:
-                    offsets.append(f.tell())
-                line = f.readline()
-                counter += 1
-
-        # need to check this is an integer!
-        n_frames = int(counter / linesPerFrame)
-        self._offsets = offsets
-        return n_frames
+            data = read_offsets(fname)
+        except (IOError, ValueError) as e:
+            warnings.warn("Reload offsets from trajectory\n "
+                          "couldn't read stored offsets: {}".format(e))
+            return self._index_frames(store=True)
+        if (data['size'] == os.path.getsize(self.filename) and
+                data['ctime'] == os.path.getctime(self.filename) and
+                data['n_atoms'] == self.n_atoms):
+            return data['offsets']
+        warnings.warn("Reload offsets from trajectory\n "
+                      "ctime or size or n_atoms did not match")
+        return self._index_frames(store=True)
 
     def _read_frame(self, frame):
-        self.xyzfile.seek(self._offsets[frame])
-        self.ts.frame = frame - 1  # gets +1'd in next
-        return self._read_next_timestep()
+        return self._read_frame_into(frame, self.ts)
 
     def _read_next_timestep(self, ts=None):
         # check that the timestep object exists
         if ts is None:
             ts = self.ts
+        return self._read_frame_into(self.ts.frame + 1, ts)
 
+    def _read_frame_into(self, frame, ts):
+        """Read *frame* into the Timestep *ts*"""
+        if not 0 <= frame < self.n_frames:
+            raise EOFError("frame {0} is not in the trajectory".format(frame))
+        start, stop = self._offsets[frame], self._offsets[frame + 1]
         f = self.xyzfile
-
+        f.seek(int(start))
+        data = f.read(int(stop - start))
+        if not isinstance(data, str):
+            data = data.decode('latin-1')
+
+        # we assume that there are only two header lines per frame
+        atomlines = data.split('\n', 2)[2]
+        lines = atomlines.splitlines()
         try:
-            # we assume that there are only two header lines per frame
-            f.readline()
-            f.readline()
-            for i in range(self.n_atoms):
-                self.ts._pos[i] = list(map(float, f.readline().split()[1:4]))
-            ts.frame += 1
-            return ts
+            if len(lines) != self.n_atoms:
+                raise ValueError("expected {0} atoms, found {1} lines"
+                                 "".format(self.n_atoms, len(lines)))
+            rows = [line.split() for line in lines]
+            n_columns = len(rows[0])
+            if n_columns >= 4 and all(len(row) == n_columns for row in rows):
+                # same number of columns on all lines: convert the x, y and z
+                # columns of all atoms at once
+                table = np.array(rows, dtype=object)
+                ts._pos[:] = np.fromstring(
+                    ' '.join(table[:, 1:4].ravel()),
+                    sep=' ').reshape(self.n_atoms, 3)
+            else:
+                for i, row in enumerate(rows):
+                    ts._pos[i] = list(map(float, row[1:4]))
         except (ValueError, IndexError) as err:
             raise EOFError(err)
+        ts.frame = frame
+        return ts
 
     def rewind(self):
         """reposition on first frame"""
@@ -373,15 +471,19 @@ class XYZReader(base.Reader):
         self.next()
 
     def _reopen(self):
-        self.close()
-        self.open_trajectory()
+        if self.xyzfile is None:
+            self.open_trajectory()
+        else:
+            # frames are read by offset, keeping the file open retains the
+            # seek points of a compressed file
+            self.ts.frame = -1
 
     def open_trajectory(self):
         if self.xyzfile is not None:
             raise IOError(
                 errno.EALREADY, 'XYZ file already opened', self.filename)
 
-        self.xyzfile = util.anyopen(self.filename, "r")
+        self.xyzfile = util.anyopen(self.filename, "rb")
 
         # reset ts
         ts = self.ts
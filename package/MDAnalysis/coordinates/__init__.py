@@ -221,6 +221,14 @@ also recognized when they are compressed with :program:`gzip` or
    | DL_Poly [#a]_ | history   |  r    | DL_Poly ascii history file                           |
    |               |           |       | :mod:`MDAnalysis.coordinates.DLPOLY`                 |
    +---------------+-----------+-------+------------------------------------------------------+
+   | MEMORY        | *numpy*   |  r    | Trajectory held in memory, created from a numpy array|
+   |               | *array*   |       | or with :meth:`Universe.transfer_to_memory`. Module  |
+   |               |           |       | :mod:`MDAnalysis.coordinates.memory`                 |
+   +---------------+-----------+-------+------------------------------------------------------+
+   | MDACACHE      | *cache*   |  r    | Binary cache of a trajectory, written with           |
+   |               |           |       | ``Universe(..., cache="auto")``. Module              |
+   |               |           |       | :mod:`MDAnalysis.coordinates.cache`                  |
+   +---------------+-----------+-------+------------------------------------------------------+
 
 .. [#a] This format can also be used to provide basic *topology*
    information (i.e. the list of atoms); it is possible to create a
@@ -698,6 +706,8 @@ from . import TRZ
 from . import XTC
 from . import XYZ
 from . import array
+from . import memory
+from . import cache
 
 try:
     from . import DCD
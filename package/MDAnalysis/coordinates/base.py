@@ -110,18 +110,23 @@ module. The derived classes must follow the Trajectory API in
 .. autoclass:: ChainReader
    :members:
 
+.. autoclass:: ReaderWrapper
+   :members:
+
 .. autoclass:: Writer
    :members:
 
 """
 
-from six.moves import range
+from six.moves import range, queue
 import six
 
-import itertools
 import os.path
+import sys
+import threading
+import time
 import warnings
-import bisect
+from collections import OrderedDict
 import numpy as np
 import copy
 import weakref
@@ -1032,6 +1037,19 @@ class _Readermeta(type):
             for f in fmt:
                 _READERS[f] = cls
 
+    def __call__(cls, *args, **kwargs):
+        # Readers that do not read a subset of atoms themselves (see
+        # ProtoReader._init_atom_indices) are wrapped in an AtomSubsetReader
+        atom_indices = kwargs.pop('atom_indices', None)
+        if atom_indices is None:
+            return super(_Readermeta, cls).__call__(*args, **kwargs)
+        if cls._reads_atom_indices:
+            return super(_Readermeta, cls).__call__(
+                *args, atom_indices=atom_indices, **kwargs)
+        from .subset import AtomSubsetReader
+        reader = super(_Readermeta, cls).__call__(*args, **kwargs)
+        return AtomSubsetReader(reader, atom_indices)
+
 
 class ProtoReader(six.with_metaclass(_Readermeta, IObase)):
     """Base class for Readers, without a :meth:`__del__` method.
@@ -1047,17 +1065,95 @@ class ProtoReader(six.with_metaclass(_Readermeta, IObase)):
 
     .. SeeAlso:: :class:`Reader`
 
+    All Readers accept the keyword *atom_indices*, an array of 0-based
+    indices of the atoms that are read from the trajectory; the
+    :class:`Timestep` of the Reader then only holds these atoms, in the
+    given order. Readers that can read a subset of the atoms of a frame set
+    :attr:`_reads_atom_indices` and call :meth:`_init_atom_indices`; all
+    other Readers are wrapped in a
+    :class:`~MDAnalysis.coordinates.subset.AtomSubsetReader` when
+    *atom_indices* is given.
+
     .. versionchanged:: 0.11.0
        Frames now 0-based instead of 1-based
+    .. versionchanged:: 0.15.0
+       Added the *atom_indices* keyword.
     """
 
     #: The appropriate Timestep class, e.g.
     #: :class:`MDAnalysis.coordinates.xdrfile.XTC.Timestep` for XTC.
     _Timestep = Timestep
 
+    #: ``True`` if the Reader reads only the atoms in *atom_indices* itself.
+    _reads_atom_indices = False
+    #: indices of the atoms that are read, ``None`` if all atoms are read
+    _atom_indices = None
+
+    #: Wait for frames appended to the trajectory when iterating, see
+    #: :meth:`update_n_frames`. Set by readers that support it.
+    _follow = False
+    #: Maximum time in seconds to wait for new frames, ``None`` waits forever.
+    _follow_timeout = None
+    #: Time in seconds between two checks for new frames.
+    _follow_interval = 1.0
+
     def __len__(self):
         return self.n_frames
 
+    @property
+    def atom_indices(self):
+        """Indices of the atoms in the trajectory file that are read, or
+        ``None`` if all atoms are read.
+
+        .. versionadded:: 0.15.0
+        """
+        return self._atom_indices
+
+    def _init_atom_indices(self, atom_indices, n_atoms):
+        """Set the indices of the atoms that are read from a trajectory with
+        *n_atoms* atoms.
+
+        Returns the number of atoms that are read. Raises
+        :exc:`ValueError` if *atom_indices* is not a 1-dimensional,
+        non-empty array of indices of the atoms in the trajectory.
+
+        .. versionadded:: 0.15.0
+        """
+        if atom_indices is None:
+            self._atom_indices = None
+            return n_atoms
+        indices = np.asarray(atom_indices)
+        if (indices.ndim != 1 or len(indices) == 0 or
+                not np.issubdtype(indices.dtype, np.integer)):
+            raise ValueError("atom_indices must be a non-empty sequence of "
+                             "atom indices")
+        if indices.min() < 0 or indices.max() >= n_atoms:
+            raise ValueError("atom_indices must be between 0 and {0}, the "
+                             "number of atoms in the trajectory minus 1"
+                             "".format(n_atoms - 1))
+        self._atom_indices = indices.astype(np.intp)
+        return len(indices)
+
+    def _select_atoms(self, array):
+        """The rows of the per-atom *array* that belong to the atoms in
+        :attr:`atom_indices`.
+
+        .. versionadded:: 0.15.0
+        """
+        if self._atom_indices is None:
+            return array
+        return array[self._atom_indices]
+
+    def _file_atom_indices(self, indices):
+        """Indices in the trajectory file of the atoms with *indices* in the
+        Reader, e.g. of an AtomGroup passed to ``timeseries()``.
+
+        .. versionadded:: 0.15.0
+        """
+        if self._atom_indices is None:
+            return indices
+        return self._atom_indices[indices]
+
     def next(self):
         """Forward one step to next frame."""
         return self._read_next_timestep()
@@ -1136,9 +1232,47 @@ class ProtoReader(six.with_metaclass(_Readermeta, IObase)):
             try:
                 yield self._read_next_timestep()
             except (EOFError, IOError):
+                if self._follow and self._wait_for_frames():
+                    continue
                 self.rewind()
                 raise StopIteration
 
+    def update_n_frames(self):
+        """Look for frames appended to the trajectory since it was opened.
+
+        Only the appended part of the trajectory is indexed, so that a
+        trajectory that is still being written can be followed. Frames which
+        are not completely written yet are not counted.
+
+        Returns
+        -------
+        n_new : int
+            number of new frames, :attr:`n_frames` is updated accordingly
+
+        .. versionadded:: 0.15.0
+        """
+        raise NotImplementedError(
+            "{0} can not look for new frames".format(self.__class__.__name__))
+
+    def _wait_for_frames(self):
+        """Poll for new frames every :attr:`_follow_interval` seconds
+
+        Returns ``True`` as soon as new frames are found and ``False`` if there
+        were none within :attr:`_follow_timeout` seconds.
+        """
+        timeout = self._follow_timeout
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            if self.update_n_frames() > 0:
+                return True
+            if deadline is None:
+                time.sleep(self._follow_interval)
+            else:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(self._follow_interval, remaining))
+
     def _reopen(self):
         """Should position Reader to just before first frame
 
@@ -1330,6 +1464,13 @@ class Reader(ProtoReader):
 class ChainReader(ProtoReader):
     """Reader that concatenates multiple trajectories on the fly.
 
+    The number of frames of all trajectories is determined when the
+    ChainReader is set up; afterwards, the individual trajectory readers are
+    only opened when frames are read from them and at most *max_open* of them
+    are kept open at the same time (the least recently used reader is closed
+    first). Chained frames are translated into trajectory and local frame
+    with a binary search.
+
     **Known issues**
 
     - Trajectory API attributes exist but most of them only reflect
@@ -1337,17 +1478,20 @@ class ChainReader(ProtoReader):
       :attr:`ChainReader.n_atoms`, and :attr:`ChainReader.fixed` are
       properly set, though
 
-    - slicing not implemented
-
     .. versionchanged:: 0.11.0
        Frames now 0-based instead of 1-based
     .. versionchanged:: 0.13.0
        :attr:`time` now reports the time summed over each trajectory's
        frames and individual :attr:`dt`. 
+    .. versionchanged:: 0.15.0
+       Trajectory readers are opened lazily and at most *max_open* are kept
+       open; added :meth:`timeseries`.
     """
     format = 'CHAIN'
+    # atom_indices are passed on to the individual trajectory readers
+    _reads_atom_indices = True
 
-    def __init__(self, filenames, **kwargs):
+    def __init__(self, filenames, max_open=32, **kwargs):
         """Set up the chain reader.
 
         :Arguments:
@@ -1362,6 +1506,10 @@ class ChainReader(ProtoReader):
                Extension: filenames are either single filename or list of file names in either plain file names
                format or (filename,format) tuple combination
 
+           *max_open*
+               maximum number of trajectory files that are kept open at the
+               same time [32]
+
            *skip*
                skip step (also passed on to the individual trajectory
                readers); must be same for all trajectories
@@ -1382,6 +1530,8 @@ class ChainReader(ProtoReader):
            The *delta* keyword was added.
         .. versionchanged:: 0.13
            The *delta* keyword was deprecated in favor of using *dt*.
+        .. versionchanged:: 0.15.0
+           The *max_open* keyword was added.
         """
         if 'delta' in kwargs:
             warnings.warn("Keyword 'delta' is now deprecated "
@@ -1392,14 +1542,26 @@ class ChainReader(ProtoReader):
                 kwargs['dt'] = delta
 
         self.filenames = asiterable(filenames)
-        self.readers = [core.reader(filename, **kwargs)
-                        for filename in self.filenames]
-        # pointer to "active" trajectory index into self.readers
+        self._reader_kwargs = kwargs
+        # open readers, least recently used first
+        self._open_readers = OrderedDict()
+        self._max_open = max(1, max_open)
+        # pointer to "active" trajectory index into self.filenames
         self.__active_reader_index = 0
 
         self.skip = kwargs.get('skip', 1)
-        self.n_atoms = self._get_same('n_atoms')
-        #self.fixed = self._get_same('fixed')
+
+        # Number of frames, atoms and dt of each trajectory. Readers are
+        # opened one after the other for this; formats that index their
+        # frames (XTC, TRR) read the offsets stored next to the trajectory.
+        n_frames, n_atoms, dts = [], [], []
+        for i in range(len(self.filenames)):
+            reader = self._get_reader(i)
+            n_frames.append(reader.n_frames)
+            n_atoms.append(reader.n_atoms)
+            dts.append(reader.dt)
+        self.n_atoms = self._same_value('n_atoms', n_atoms)
+        self._atom_indices = reader.atom_indices
 
         # Translation between virtual frames and frames in individual
         # trajectories.
@@ -1408,21 +1570,21 @@ class ChainReader(ProtoReader):
 
         # Build a map of frames: ordered list of starting virtual
         # frames; the index i into this list corresponds to the index
-        # into self.readers
+        # into self.filenames
         #
-        # For virtual frame k (1...sum(n_frames)) find corresponding
+        # For virtual frame k (0...sum(n_frames)-1) find corresponding
         # trajectory i and local frame f (i.e. readers[i][f] will
         # correspond to ChainReader[k]).
 
         # build map 'start_frames', which is used by _get_local_frame()
-        n_frames = self._get('n_frames')
         # [0]: frames are 0-indexed internally
         # (see Timestep.check_slice_indices())
-        self.__start_frames = np.cumsum([0] + n_frames)
+        self._start_frames = np.cumsum([0] + n_frames)
 
-        self.n_frames = np.sum(n_frames)
-        self.dts = np.array(self._get('dt'))
+        self.n_frames = int(self._start_frames[-1])
+        self.dts = np.array(dts)
         self.total_times = self.dts * n_frames
+        self._start_times = np.cumsum(np.concatenate([[0], self.total_times]))
 
         #: source for trajectories frame (fakes trajectory)
         self.__chained_trajectories_iter = None
@@ -1432,6 +1594,34 @@ class ChainReader(ProtoReader):
         self.ts = None
         self.rewind()
 
+    def _get_reader(self, i):
+        """Return the reader of trajectory *i*, opening it if necessary.
+
+        The least recently used reader is closed if more than *max_open*
+        readers would be open.
+        """
+        try:
+            reader = self._open_readers.pop(i)
+        except KeyError:
+            while len(self._open_readers) >= self._max_open:
+                self._open_readers.popitem(last=False)[1].close()
+            reader = core.reader(self.filenames[i], **self._reader_kwargs)
+        self._open_readers[i] = reader
+        return reader
+
+    @property
+    def readers(self):
+        """List of the readers of all trajectories.
+
+        Accessing :attr:`readers` opens all trajectories that are not open
+        yet and keeps them open from then on, regardless of *max_open*.
+
+        .. versionchanged:: 0.15.0
+           Now a property that opens the readers on first access.
+        """
+        self._max_open = max(self._max_open, len(self.filenames))
+        return [self._get_reader(i) for i in range(len(self.filenames))]
+
     def _get_local_frame(self, k):
         """Find trajectory index and trajectory frame for chained frame k.
 
@@ -1454,12 +1644,12 @@ class ChainReader(ProtoReader):
         if k < 0:
             raise IndexError("Virtual (chained) frames must be >= 0")
         # trajectory index i
-        i = bisect.bisect_right(self.__start_frames, k) - 1
+        i = np.searchsorted(self._start_frames, k, side='right') - 1
         if i < 0:
             raise IndexError("Cannot find trajectory for virtual frame {0:d}".format(k))
         # local frame index f in trajectory i (frame indices are 0-based)
-        f = k - self.__start_frames[i]
-        return i, f
+        f = k - self._start_frames[i]
+        return int(i), int(f)
 
     # methods that can change with the current reader
     def convert_time_from_native(self, t):
@@ -1515,24 +1705,21 @@ class ChainReader(ProtoReader):
         # Now each reader is either already instantiated with a common dt, or
         #  left at its default dt. In any case, we sum over individual times.
         trajindex, subframe = self._get_local_frame(self.frame)
-        return self.total_times[:trajindex].sum() + subframe * self.dts[trajindex]
+        return self._start_times[trajindex] + subframe * self.dts[trajindex]
 
     def _apply(self, method, **kwargs):
-        """Execute *method* with *kwargs* for all readers."""
-        return [reader.__getattribute__(method)(**kwargs) for reader in self.readers]
+        """Execute *method* with *kwargs* for all open readers."""
+        return [reader.__getattribute__(method)(**kwargs)
+                for reader in self._open_readers.values()]
 
-    def _get(self, attr):
-        """Get value of *attr* for all readers."""
-        return [reader.__getattribute__(attr) for reader in self.readers]
-
-    def _get_same(self, attr):
+    def _same_value(self, attr, values):
         """Verify that *attr* has the same value for all readers and return value.
 
-        :Arguments: *attr* attribute name
+        :Arguments: *attr* attribute name, *values* values of all readers
         :Returns: common value of the attribute
         :Raises: :Exc:`ValueError` if not all readers have the same value
         """
-        values = np.array(self._get(attr))
+        values = np.array(values)
         value = values[0]
         if not np.all(values == value):
             bad_traj = np.array([self.get_flname(fn) for fn in self.filenames])[values != value]
@@ -1543,14 +1730,14 @@ class ChainReader(ProtoReader):
     def __activate_reader(self, i):
         """Make reader *i* the active reader."""
         # private method, not to be used by user to avoid a total mess
-        if i < 0 or i >= len(self.readers):
-            raise IndexError("Reader index must be 0 <= i < {0:d}".format(len(self.readers)))
+        if i < 0 or i >= len(self.filenames):
+            raise IndexError("Reader index must be 0 <= i < {0:d}".format(len(self.filenames)))
         self.__active_reader_index = i
 
     @property
     def active_reader(self):
         """Reader instance from which frames are being read."""
-        return self.readers[self.__active_reader_index]
+        return self._get_reader(self.__active_reader_index)
 
     def _read_frame(self, frame):
         """Position trajectory at frame index *frame* and return :class:`Timestep`.
@@ -1575,17 +1762,69 @@ class ChainReader(ProtoReader):
         self.ts.frame = frame  # continuous frames, 0-based
         return self.ts
 
+    def timeseries(self, asel, start=0, stop=-1, skip=1, format='afc'):
+        """Return a subset of coordinate data for an AtomGroup
+
+        The coordinates are collected from all chained trajectories into a
+        single array; trajectories with a :meth:`timeseries` method of their
+        own read their part of the frames with it.
+
+        :Arguments:
+            *asel*
+               :class:`~MDAnalysis.core.AtomGroup.AtomGroup` object
+            *start, stop, skip*
+               range of trajectory to access, start and stop are inclusive
+            *format*
+               the order/shape of the return data array, corresponding
+               to (a)tom, (f)rame, (c)oordinates all six combinations
+               of 'a', 'f', 'c' are allowed ie "fac" - return array
+               where the shape is (frame, number of atoms,
+               coordinates)
+
+        .. versionadded:: 0.15.0
+        """
+        if format not in ('afc', 'acf', 'caf', 'cfa', 'fac', 'fca'):
+            raise ValueError("Invalid timeseries format")
+        if len(asel) == 0:
+            raise NoDataError("Timeseries requires at least one atom to analyze")
+        if stop < 0:
+            stop += self.n_frames
+        frames = np.arange(start, stop + 1, skip)
+        if len(frames) == 0 or frames[0] < 0 or frames[-1] >= self.n_frames:
+            raise IndexError("Frame start/stop outside of the range of the "
+                             "trajectory.")
+        indices = asel.indices
+        coordinates = np.empty((len(frames), len(indices), 3),
+                               dtype=np.float32)
+        traj = np.searchsorted(self._start_frames, frames, side='right') - 1
+        # frames of a trajectory are consecutive entries of frames
+        bounds = np.concatenate(
+            [[0], np.flatnonzero(np.diff(traj)) + 1, [len(frames)]])
+        for lower, upper in zip(bounds[:-1], bounds[1:]):
+            i = traj[lower]
+            first = frames[lower] - self._start_frames[i]
+            last = frames[upper - 1] - self._start_frames[i]
+            reader = self._get_reader(i)
+            if skip == 1 and hasattr(reader, 'timeseries'):
+                coordinates[lower:upper] = reader.timeseries(
+                    asel, start=first, stop=last, skip=1, format='fac')
+            else:
+                for j, ts in enumerate(reader[first:last + 1:skip]):
+                    coordinates[lower + j] = ts.positions[indices]
+        return np.transpose(coordinates, ['fac'.index(c) for c in format])
+
     def _chained_iterator(self):
         """Iterator that presents itself as a chained trajectory."""
         self._rewind()  # must rewind all readers
-        readers = itertools.chain(*self.readers)
-        for frame, ts in enumerate(readers):
-            ts.frame = frame  # fake continuous frames, 0-based
-            self.ts = ts
+        frame = 0
+        for i in range(len(self.filenames)):
             # make sure that the active reader is in sync
-            i, f = self._get_local_frame(frame)  # uses 0-based frames!
             self.__activate_reader(i)
-            yield ts
+            for ts in self.active_reader:
+                ts.frame = frame  # fake continuous frames, 0-based
+                self.ts = ts
+                frame += 1
+                yield ts
 
     def _read_next_timestep(self, ts=None):
         self.ts = next(self.__chained_trajectories_iter)
@@ -1604,6 +1843,7 @@ class ChainReader(ProtoReader):
 
     def close(self):
         self._apply('close')
+        self._open_readers.clear()
 
     def __iter__(self):
         """Generator for all frames, starting at frame 1."""
@@ -1625,6 +1865,116 @@ class ChainReader(ProtoReader):
                     natoms=self.n_atoms))
 
 
+def _copy_frame(src, dst, atom_indices=None):
+    """Copy the frame in Timestep *src* into the arrays of Timestep *dst*
+
+    Only the atoms with *atom_indices* are copied if they are given.
+    """
+    dst.frame = src.frame
+    try:
+        dst._frame = src._frame
+    except AttributeError:
+        pass
+    dst.data = src.data.copy()
+    dst._unitcell[...] = src._unitcell
+    for flag, attr in (('has_positions', '_pos'),
+                       ('has_velocities', '_velocities'),
+                       ('has_forces', '_forces')):
+        has_data = getattr(src, flag)
+        setattr(dst, flag, has_data)
+        if has_data:
+            values = getattr(src, attr)
+            if atom_indices is not None:
+                values = values[atom_indices]
+            getattr(dst, attr)[...] = values
+    return dst
+
+
+class ReaderWrapper(ProtoReader):
+    """Base class for Readers that read the frames of another Reader.
+
+    The frames of the wrapped Reader are copied into :attr:`ts` with
+    :meth:`_copy_frame`. All attributes and methods that the
+    :class:`ReaderWrapper` does not define are looked up in the wrapped
+    Reader (see :meth:`_reader_attribute`). The wrapped Reader must not be
+    used directly while the :class:`ReaderWrapper` is in use.
+
+    .. versionadded:: 0.15.0
+    """
+
+    def __init__(self, reader):
+        self._reader = reader
+
+    def __getattr__(self, name):
+        # only called for attributes that the wrapper does not have
+        if '_reader' not in self.__dict__ or name.startswith('__'):
+            raise AttributeError(name)
+        return self._reader_attribute(name)
+
+    def _reader_attribute(self, name):
+        """Return the attribute *name* of the wrapped Reader."""
+        return getattr(self._reader, name)
+
+    def _copy_frame(self, src, dst):
+        """Copy the Timestep *src* of the wrapped Reader into *dst*."""
+        return _copy_frame(src, dst)
+
+    @property
+    def reader(self):
+        """The wrapped Reader."""
+        return self._reader
+
+    @property
+    def n_frames(self):
+        return self._reader.n_frames
+
+    @property
+    def filename(self):
+        return self._reader.filename
+
+    @property
+    def units(self):
+        return self._reader.units
+
+    def __iter__(self):
+        for ts in self._reader:
+            yield self._copy_frame(ts, self.ts)
+        # the wrapped reader has been rewound at the end of the iteration
+        self._copy_frame(self._reader.ts, self.ts)
+
+    def _reader_slice(self, start, stop, step):
+        """Iterator over the frames *start*, *stop*, *step* (as returned by
+        :meth:`check_slice_indices`) of the wrapped Reader."""
+        if stop < 0:
+            # a reverse slice that includes the first frame; slicing the
+            # wrapped reader with -1 would stop at its last frame
+            stop = None
+        return self._reader[start:stop:step]
+
+    def _sliced_iter(self, start, stop, step):
+        for ts in self._reader_slice(start, stop, step):
+            yield self._copy_frame(ts, self.ts)
+
+    def _read_frame(self, frame):
+        return self._copy_frame(self._reader._read_frame(frame), self.ts)
+
+    def _read_next_timestep(self, ts=None):
+        if ts is None:
+            ts = self.ts
+        return self._copy_frame(self._reader._read_next_timestep(), ts)
+
+    def _reopen(self):
+        self._reader._reopen()
+        self.ts.frame = -1
+
+    def close(self):
+        self._reader.close()
+
+    def __repr__(self):
+        return "<{cls} of {reader}>".format(cls=self.__class__.__name__,
+                                           reader=repr(self._reader))
+
+
 class _Writermeta(type):
     # Auto register upon class creation
     def __init__(cls, name, bases, classdict):
@@ -1644,12 +1994,149 @@ class _Writermeta(type):
                 pass
 
 
+class _WriterPipeline(object):
+    """Write frames with *write* in a background thread.
+
+    Frames are handed over through a queue that holds at most *queue_size*
+    items, so that the thread producing frames (e.g. reading and fitting a
+    trajectory) goes on while earlier frames are written; it only waits when
+    the writing thread falls behind. An exception raised by *write* is raised
+    again in the producing thread by the next :meth:`put` or by
+    :meth:`close`.
+    """
+    _STOP = object()
+
+    def __init__(self, write, queue_size=8):
+        self._write = write
+        self._queue = queue.Queue(max(1, queue_size))
+        self._error = None
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            if self._error is None:
+                try:
+                    self._write(item)
+                except Exception:
+                    self._error = sys.exc_info()
+
+    def _raise_error(self):
+        if self._error is not None:
+            six.reraise(*self._error)
+
+    def put(self, item):
+        self._raise_error()
+        self._queue.put(item)
+
+    def close(self):
+        """Wait until all items are written and stop the thread."""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        self._raise_error()
+
+
+class _FrameField(object):
+    """Stand-in for a value of a text record that changes between frames.
+
+    Formatting a record with :meth:`str.format` and a :class:`_FrameField`
+    in place of such a value leaves a marker with the format specification
+    of the field, which :meth:`Writer._records_template` turns into the
+    equivalent printf-style conversion. Indexing returns the field itself so
+    that replacement fields like ``{pos[0]:8.3f}`` work.
+    """
+    marker = '\0'
+
+    def __getitem__(self, key):
+        return self
+
+    def __format__(self, spec):
+        return self.marker + spec
+
+
 class Writer(six.with_metaclass(_Writermeta, IObase)):
     """Base class for trajectory writers.
 
     See Trajectory API definition in :mod:`MDAnalysis.coordinates.__init__` for
     the required attributes and methods.
+
+    Writers can write frames in a background thread: a writer that copies
+    everything it needs out of the :class:`Timestep` in
+    :meth:`write_next_timestep`, hands the copy to :meth:`_submit` and
+    implements :meth:`_write_frames` is pipelined after calling
+    :meth:`_start_pipeline`. Such a writer must be closed (or used as a
+    context manager) so that all frames are written.
+
+    Text writers that write the same atoms in every frame can format the
+    static columns of the atom records once: records formatted with
+    :attr:`_frame_field` in place of the per-frame values are joined into a
+    template with :meth:`_records_template`, and :meth:`_format_records`
+    fills in the values of a frame in a single operation.
+
+    .. versionchanged:: 0.15.0
+       Added the background writing (pipeline) infrastructure and the
+       record templates.
     """
+    #: background writing thread, see :meth:`_start_pipeline`
+    _pipeline = None
+    #: stand-in for per-frame values in records, see :meth:`_records_template`
+    _frame_field = _FrameField()
+
+    @staticmethod
+    def _records_template(records):
+        """Join the formatted *records* into one printf-style template.
+
+        The per-frame fields of *records* must have been formatted from
+        :attr:`_frame_field`; all other ``%`` characters are escaped.
+        """
+        return "".join(records).replace('%', '%%').replace(
+            _FrameField.marker, '%')
+
+    @staticmethod
+    def _format_records(template, *columns):
+        """Fill the per-frame fields of *template* with *columns*.
+
+        Each of *columns* is an array with one row (or value) per record,
+        in the order in which the fields appear in a record.
+        """
+        values = np.column_stack([np.asarray(c, dtype=np.float64)
+                                  for c in columns])
+        return template % tuple(values.ravel().tolist())
+
+    def _start_pipeline(self, queue_size=8):
+        """Write frames in a background thread from now on.
+
+        At most *queue_size* items submitted with :meth:`_submit` wait to be
+        written before :meth:`_submit` blocks.
+        """
+        if self._pipeline is None:
+            self._pipeline = _WriterPipeline(self._write_frames, queue_size)
+
+    def _stop_pipeline(self):
+        """Wait until all submitted frames are written and stop the thread."""
+        pipeline, self._pipeline = self._pipeline, None
+        if pipeline is not None:
+            pipeline.close()
+
+    def _submit(self, frames):
+        """Write *frames* with :meth:`_write_frames`, in the background if a
+        pipeline was started."""
+        if self._pipeline is not None:
+            self._pipeline.put(frames)
+        else:
+            self._write_frames(frames)
+
+    def _write_frames(self, frames):  # pragma: no cover
+        """Write *frames* that were prepared by write_next_timestep()"""
+        raise NotImplementedError(
+            "{0} does not support pipelined writing"
+            "".format(self.__class__.__name__))
+
     def convert_dimensions_to_unitcell(self, ts, inplace=True):
         """Read dimensions from timestep *ts* and return appropriate unitcell.
 
@@ -0,0 +1,318 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- http://www.MDAnalysis.org
+# Copyright (c) 2006-2015 Naveen Michaud-Agrawal, Elizabeth J. Denning, Oliver Beckstein
+# and contributors (see AUTHORS for the full list)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+"""
+Binary trajectory cache --- :mod:`MDAnalysis.coordinates.cache`
+===============================================================
+
+Reading compressed (XTC) or text trajectories decompresses or parses every
+frame again whenever the trajectory is read. A trajectory that is analysed
+many times can instead be read once and written into a cache file, which
+holds the positions of all frames as raw float32 numbers together with the
+time and unit cell of each frame. The :class:`CacheReader` memory maps the
+cache file, so that frames are read straight from the page cache of the
+operating system without decoding anything.
+
+By default the cache of a trajectory is stored as a hidden file next to it
+(see :func:`cache_filename`), in the same way as the frame offsets of XTC and
+TRR files. The cache is only used as long as the size and the modification
+time of the trajectory and the atoms and Reader keywords it was written for
+(see :func:`topology_hash`) match; otherwise it is written again. Velocities
+and forces are not cached: trajectories that contain them are read directly
+instead.
+
+The cache is used by :class:`~MDAnalysis.core.AtomGroup.Universe` and
+:meth:`~MDAnalysis.core.AtomGroup.Universe.load_new` with the *cache*
+keyword::
+
+    u = Universe(GRO, XTC, cache="auto")
+
+The first time the trajectory is read completely and the cache is written,
+afterwards the cache is read instead of the XTC file.
+
+.. versionadded:: 0.15.0
+
+
+Cache file format
+-----------------
+
+A cache file starts with a header of the numpy dtype :data:`CACHE_HEADER`,
+followed by the positions of all frames as little endian float32 array of
+shape ``(n_frames, n_atoms, 3)`` (in MDAnalysis units), the times of all
+frames as float64 array and the unit cells of all frames as float32 array of
+shape ``(n_frames, 6)``.
+
+.. autodata:: CACHE_HEADER
+
+
+Functions and classes
+---------------------
+
+.. autofunction:: cache_filename
+.. autofunction:: topology_hash
+.. autofunction:: write_cache
+.. autofunction:: read_cache_header
+.. autofunction:: cached_reader
+
+.. autoclass:: CacheReader
+   :members:
+
+"""
+from __future__ import absolute_import
+
+import hashlib
+import os
+from os.path import getmtime, getsize, isfile, split, join
+import tempfile
+import warnings
+
+import numpy as np
+
+from .memory import MemoryReader
+
+
+#: header of the cache files
+CACHE_HEADER = np.dtype([('magic', 'S8'), ('version', '<i8'),
+                         ('n_atoms', '<i8'), ('n_frames', '<i8'),
+                         ('size', '<i8'), ('mtime', '<f8'),
+                         ('topology', 'S40')])
+CACHE_MAGIC = b'MDACACHE'
+CACHE_VERSION = 1
+
+
+def cache_filename(filename):
+    """Return the filename of the cache of the trajectory *filename*
+
+    The cache is a hidden file in the directory of the trajectory.
+    """
+    head, tail = split(filename)
+    return join(head, '.{tail}_cache.bin'.format(tail=tail))
+
+
+def topology_hash(atoms, *extra):
+    """Hash of the names, residues and segments of *atoms*
+
+    Any *extra* values or arrays (e.g. the indices of the atoms that are read
+    from the trajectory or the keyword arguments of the Reader that change
+    the frames) are included in the hash; ``None`` is a value of its own.
+
+    Returns
+    -------
+    hash : bytes
+        hexadecimal SHA1 digest
+    """
+    sha = hashlib.sha1()
+    sha.update(str(len(atoms)).encode())
+    for values in (atoms.names, atoms.resnames, atoms.segids):
+        sha.update(' '.join(values).encode())
+    sha.update(np.asarray(atoms.resids, dtype='<i8').tostring())
+    for values in extra:
+        if values is None:
+            sha.update(b'N')
+            continue
+        values = np.asarray(values)
+        if values.dtype.kind in 'biu':
+            sha.update(b'I' + values.astype('<i8').tostring())
+        else:
+            sha.update(b'F' + values.astype('<f8').tostring())
+    return sha.hexdigest().encode()
+
+
+def _layout(n_frames, n_atoms):
+    """offsets and shapes of the arrays following the header"""
+    offset = CACHE_HEADER.itemsize
+    layout = []
+    for name, dtype, shape in (('positions', '<f4', (n_frames, n_atoms, 3)),
+                               ('times', '<f8', (n_frames,)),
+                               ('dimensions', '<f4', (n_frames, 6))):
+        layout.append((name, dtype, shape, offset))
+        offset += np.dtype(dtype).itemsize * int(np.prod(shape))
+    return layout, offset
+
+
+def write_cache(filename, reader, trajectory, topology=b''):
+    """Write all frames of *reader* into the cache file *filename*
+
+    The cache is written to a temporary file first and then moved in place,
+    so that caches which are already mapped by other readers stay valid.
+
+    Parameters
+    ----------
+    filename : str
+        filename of the cache
+    reader : :class:`~MDAnalysis.coordinates.base.ProtoReader`
+        Reader of the trajectory
+    trajectory : str
+        filename of the trajectory; its size and modification time are
+        stored in the cache
+    topology : bytes (optional)
+        hash of the atoms of the trajectory, see :func:`topology_hash`
+
+    Raises
+    ------
+    ValueError
+        if a frame of *reader* has velocities or forces, which can not be
+        stored in the cache
+    """
+    n_frames, n_atoms = reader.n_frames, reader.n_atoms
+    header = np.array([(CACHE_MAGIC, CACHE_VERSION, n_atoms, n_frames,
+                        getsize(trajectory), getmtime(trajectory),
+                        topology)], dtype=CACHE_HEADER)
+    layout, size = _layout(n_frames, n_atoms)
+    head, tail = split(filename)
+    fd, tmpname = tempfile.mkstemp(prefix=tail, dir=head or '.')
+    try:
+        # mkstemp only gives access to the owner
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmpname, 0o666 & ~umask)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header.tostring())
+            f.truncate(size)
+        arrays = {name: np.memmap(tmpname, dtype=dtype, mode='r+',
+                                  offset=offset, shape=shape)
+                  for name, dtype, shape, offset in layout}
+        for i, ts in enumerate(reader):
+            if ts.has_velocities or ts.has_forces:
+                raise ValueError("frame {0} of {1} has velocities or forces, "
+                                 "which are not cached".format(ts.frame,
+                                                               trajectory))
+            arrays['positions'][i] = ts.positions
+            arrays['times'][i] = ts.time
+            arrays['dimensions'][i] = ts.dimensions
+        for array in arrays.values():
+            array.flush()
+        del arrays
+        os.rename(tmpname, filename)
+    except Exception:
+        os.remove(tmpname)
+        raise
+
+
+def read_cache_header(filename):
+    """Read the header of the cache file *filename*
+
+    Returns
+    -------
+    header : dict
+        the fields of :data:`CACHE_HEADER`
+
+    Raises
+    ------
+    ValueError
+        if the file is not a valid cache file
+    """
+    header = np.fromfile(filename, dtype=CACHE_HEADER, count=1)
+    if (len(header) != 1 or header['magic'][0] != CACHE_MAGIC or
+            header['version'][0] != CACHE_VERSION):
+        raise ValueError("{0} is not a trajectory cache".format(filename))
+    header = {name: header[name][0] for name in CACHE_HEADER.names}
+    size = _layout(int(header['n_frames']), int(header['n_atoms']))[1]
+    if getsize(filename) != size:
+        raise ValueError("{0} is truncated".format(filename))
+    return header
+
+
+class CacheReader(MemoryReader):
+    """Read the frames of a trajectory from its cache file.
+
+    The positions, times and unit cells are memory mapped copy-on-write:
+    changing the positions of atoms only changes the trajectory in memory,
+    not the cache file.
+
+    .. versionadded:: 0.15.0
+    """
+    format = 'MDACACHE'
+
+    def __init__(self, filename, trajectory=None, topology=None, **kwargs):
+        """
+        Parameters
+        ----------
+        filename : str
+            filename of the cache
+        trajectory : str (optional)
+            filename of the trajectory that was cached; it is used as the
+            :attr:`filename` of the Reader
+        topology : bytes (optional)
+            the hash of the atoms of the trajectory, see
+            :func:`topology_hash`
+
+        Raises
+        ------
+        ValueError
+            if the cache is not valid or if the size or the modification time
+            of *trajectory* or *topology* do not match the cache
+        """
+        header = read_cache_header(filename)
+        if trajectory is not None and (
+                header['size'] != getsize(trajectory) or
+                header['mtime'] != getmtime(trajectory)):
+            raise ValueError("{0} is not the cache of the current {1}: size "
+                             "or mtime did not match".format(filename,
+                                                             trajectory))
+        if topology is not None and header['topology'] != topology:
+            raise ValueError("{0} was written for different atoms"
+                             "".format(filename))
+        layout = _layout(int(header['n_frames']), int(header['n_atoms']))[0]
+        arrays = {name: np.memmap(filename, dtype=dtype, mode='c',
+                                  offset=offset, shape=shape)
+                  for name, dtype, shape, offset in layout}
+        self.cache = filename
+        super(CacheReader, self).__init__(
+            arrays['positions'], dimensions=arrays['dimensions'],
+            time=arrays['times'], filename=trajectory or filename, **kwargs)
+
+
+def cached_reader(trajectory, open_reader, topology=b'', cache='auto'):
+    """Return a :class:`CacheReader` for the cache of *trajectory*
+
+    If there is no valid cache, the trajectory is read with the Reader
+    returned by ``open_reader()`` and the cache is written. The Reader of
+    the trajectory is returned if the cache can not be written or if the
+    trajectory has velocities or forces.
+
+    Parameters
+    ----------
+    trajectory : str
+        filename of the trajectory
+    open_reader : callable
+        returns a Reader of the trajectory
+    topology : bytes (optional)
+        hash of the atoms of the trajectory, see :func:`topology_hash`
+    cache : str (optional)
+        filename of the cache; ``'auto'`` stores the cache next to the
+        trajectory, see :func:`cache_filename` [``'auto'``]
+    """
+    if cache == 'auto':
+        cache = cache_filename(trajectory)
+    if isfile(cache):
+        try:
+            return CacheReader(cache, trajectory=trajectory, topology=topology)
+        except (IOError, ValueError) as err:
+            warnings.warn("Rewriting trajectory cache: {0}".format(err))
+    reader = open_reader()
+    try:
+        write_cache(cache, reader, trajectory, topology)
+    except (IOError, OSError) as err:
+        warnings.warn("Couldn't write trajectory cache because: {0}"
+                      "".format(err))
+    except ValueError as err:
+        warnings.warn("Not caching the trajectory: {0}".format(err))
+    else:
+        reader.close()
+        return CacheReader(cache, trajectory=trajectory, topology=topology)
+    # writing stopped at some frame of the trajectory
+    reader.rewind()
+    return reader
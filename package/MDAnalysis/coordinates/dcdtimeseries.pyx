@@ -17,6 +17,7 @@
 
 import numpy
 cimport numpy
+from libc.stdlib cimport free
 
 ctypedef int size_t
 
@@ -35,6 +36,11 @@ cdef extern from "readdcd.h":
                        float *unitcell, int nfixed, int first, int *freeind,
                        float *fixedcoords, int reverse, int charmm)
     int skip_dcdstep(fio_fd fd, int natoms, int nfixed, int charmm, int numstep)
+    int group_dcdsubset_runs(int *atoms, int n, int maxgap, int **runstart, int **runlen)
+    int read_dcdsubset_runs(fio_fd fd, int natoms, int lowerb, int nruns,
+                            int *runstart, int *runlen, float *x, float *y, float *z,
+                            int nfixed, int first, int reverse, int charmm)
+    int DCD_SUBSET_MAXGAP
     int jump_to_dcdstep(fio_fd fd, int natoms, int nsets, int nfixed, int charmm, int header_size, int step)
 
 ctypedef struct dcdhandle:
@@ -85,6 +91,14 @@ def __read_timecorrel(object self, object atoms, object atomcounts, object forma
     #print "formatcode", fmtstr
     cdef int range
     range = upperb - lowerb + 1
+    # Only read the runs of atoms that are needed
+    cdef int *runstart = NULL
+    cdef int *runlen = NULL
+    cdef int nruns
+    nruns = group_dcdsubset_runs(<int*>atomlist.data, len(atomlist),
+                                 DCD_SUBSET_MAXGAP, &runstart, &runlen)
+    if nruns < 0:
+        raise MemoryError("Can't allocate space for atom runs")
     # Create data list
     #data = np.zeros((n_frames, sizedata), np.float64)
     data = np.zeros((sizedata, n_frames), np.float64)
@@ -108,24 +122,27 @@ def __read_timecorrel(object self, object atoms, object atomcounts, object forma
 
     cdef int index, numskip
     cdef int i, j
-    cdef float unitcell[6]
-    for i from 0 <= i < n_frames:
-        if (skip > 1):
-            # Check if we have fixed atoms
-            # XXX not done
-            numskip = skip - (dcd.setsread % skip) - 1
-            rc = skip_dcdstep(dcd.fd, dcd.natoms, dcd.nfixed, dcd.charmm, numskip)
+    try:
+        for i from 0 <= i < n_frames:
+            if (skip > 1):
+                # Check if we have fixed atoms
+                # XXX not done
+                numskip = skip - (dcd.setsread % skip) - 1
+                rc = skip_dcdstep(dcd.fd, dcd.natoms, dcd.nfixed, dcd.charmm, numskip)
+                if (rc < 0):
+                    raise IOError("Error skipping frame from DCD file")
+                dcd.setsread = dcd.setsread + numskip
+            rc = read_dcdsubset_runs(dcd.fd, dcd.natoms, lowerb, nruns, runstart, runlen, tempX, tempY, tempZ, dcd.nfixed, dcd.first, dcd.reverse, dcd.charmm)
+            dcd.first=0
+            dcd.setsread = dcd.setsread + 1
             if (rc < 0):
-                raise IOError("Error skipping frame from DCD file")
-            dcd.setsread = dcd.setsread + numskip
-        rc = read_dcdsubset(dcd.fd, dcd.natoms, lowerb, upperb, tempX, tempY, tempZ, unitcell, dcd.nfixed, dcd.first, dcd.freeind, dcd.fixedcoords, dcd.reverse, dcd.charmm)
-        dcd.first=0
-        dcd.setsread = dcd.setsread + 1
-        if (rc < 0):
-            raise IOError("Error reading frame from DCD file")
-        # Copy into data array based on format
-        copyseries(i, <char*>data.data, data.strides, tempX, tempY, tempZ, fmtstr, numdata, <int*>atomlist.data, <int*>atomcountslist.data, lowerb, <double*>auxlist.data);
-        PyErr_CheckSignals()
+                raise IOError("Error reading frame from DCD file")
+            # Copy into data array based on format
+            copyseries(i, <char*>data.data, data.strides, tempX, tempY, tempZ, fmtstr, numdata, <int*>atomlist.data, <int*>atomcountslist.data, lowerb, <double*>auxlist.data);
+            PyErr_CheckSignals()
+    finally:
+        free(runstart)
+        free(runlen)
 
     # Reset trajectory
     rc = fio_fseek(dcd.fd, dcd.header_size, 0) #FIO_SEEK_SET
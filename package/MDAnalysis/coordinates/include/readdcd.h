@@ -92,6 +92,42 @@ static int read_dcdsubset(fio_fd fd, int natoms, int lowerb, int upperb, float *
 			  float *unitcell, int nfixed, int first, int *freeind, 
 			  float *fixedcoords, int reverse, int charmm);
 
+/*
+ * Group atom indices into runs of atoms that are read in one go by
+ * read_dcdsubset_runs. Indices do not have to be sorted or unique. Runs
+ * separated by at most maxgap atoms are merged, since reading a few
+ * unneeded atoms is cheaper than an additional seek.
+ * Input: atoms - n atom indices
+ *        maxgap - largest number of unneeded atoms read between two runs
+ * Output: number of runs, or negative error code on failure.
+ * Side effects: *runstart and *runlen are allocated and hold the first atom
+ *               and the number of atoms of each run, in increasing order.
+ */
+static int group_dcdsubset_runs(const int *atoms, int n, int maxgap,
+                                int **runstart, int **runlen);
+
+/* Default largest gap between runs of atoms, 4 kB of coordinates */
+#define DCD_SUBSET_MAXGAP 1024
+
+/*
+ * Read the coordinates of runs of atoms from a timestep, seeking over the
+ * atoms in between. Only the bytes of the runs are read.
+ * Input: fd - a file struct positioned at the start of a timestep
+ *        natoms, nfixed, first, reverse, charmm - the corresponding items as
+ *        set by read_dcdheader
+ *        lowerb - first atom of the first run
+ *        nruns, runstart, runlen - runs as returned by group_dcdsubset_runs
+ *        x, y, z: space for (last atom of the last run)-lowerb+1 floats each
+ * Output: 0 on success, negative error code on failure.
+ * Side effects: the coordinates of atom i of a run are stored in
+ *               x[i-lowerb], y[i-lowerb], z[i-lowerb]; the other elements are
+ *               not touched. fd is positioned at the next timestep.
+ */
+static int read_dcdsubset_runs(fio_fd fd, int natoms, int lowerb, int nruns,
+                               const int *runstart, const int *runlen,
+                               float *x, float *y, float *z, int nfixed,
+                               int first, int reverse, int charmm);
+
 /* 
  * Skip past a timestep.  If there are fixed atoms, this cannot be used with
  * the first timestep.  
@@ -499,6 +535,96 @@ static int read_dcdsubset(fio_fd fd, int N, int lowerb, int upperb, float *X, fl
   return DCD_SUCCESS;
 }
 
+static int compare_ints(const void *a, const void *b) {
+  int ia = *(const int *)a, ib = *(const int *)b;
+  return (ia > ib) - (ia < ib);
+}
+
+static int group_dcdsubset_runs(const int *atoms, int n, int maxgap,
+                                int **runstart, int **runlen) {
+  int *sorted;
+  int i, nruns;
+
+  *runstart = *runlen = NULL;
+  if (n <= 0) return 0;
+  if ((sorted = (int *)malloc(sizeof(int) * n)) == NULL) return DCD_BADMALLOC;
+  memcpy(sorted, atoms, sizeof(int) * n);
+  qsort(sorted, n, sizeof(int), compare_ints);
+
+  *runstart = (int *)malloc(sizeof(int) * n);
+  *runlen = (int *)malloc(sizeof(int) * n);
+  if (*runstart == NULL || *runlen == NULL) {
+    free(sorted);
+    free(*runstart);
+    free(*runlen);
+    *runstart = *runlen = NULL;
+    return DCD_BADMALLOC;
+  }
+
+  nruns = 0;
+  (*runstart)[0] = sorted[0];
+  (*runlen)[0] = 1;
+  for (i = 1; i < n; i++) {
+    int end = (*runstart)[nruns] + (*runlen)[nruns]; /* one past the run */
+    if (sorted[i] < end) continue; /* duplicate */
+    if (sorted[i] - end <= maxgap) {
+      (*runlen)[nruns] = sorted[i] - (*runstart)[nruns] + 1;
+    } else {
+      nruns++;
+      (*runstart)[nruns] = sorted[i];
+      (*runlen)[nruns] = 1;
+    }
+  }
+  free(sorted);
+  return nruns + 1;
+}
+
+static int read_dcdsubset_runs(fio_fd fd, int N, int lowerb, int nruns,
+                               const int *runstart, const int *runlen,
+                               float *X, float *Y, float *Z, int num_fixed,
+                               int first, int reverseEndian, int charmm) {
+  fio_size_t blockpos;
+  int input_integer;
+  int i, k;
+  float *xyz[3];
+
+  if (!((num_fixed==0) || first)) return DCD_BADFORMAT;
+
+  xyz[0] = X; xyz[1] = Y; xyz[2] = Z;
+  /* position of the format integer in front of the X coordinates */
+  blockpos = fio_ftell(fd);
+  if ((charmm & DCD_IS_CHARMM) && (charmm & DCD_HAS_EXTRA_BLOCK)) {
+    /* skip the charmm extra block */
+    if (fio_fread(&input_integer, sizeof(int), 1, fd) != 1)
+      return DCD_BADREAD;
+    if (reverseEndian) swap4_aligned(&input_integer, 1);
+    blockpos += 2*sizeof(int) + input_integer;
+  }
+
+  /* each coordinate block is framed by two format integers */
+  for (k = 0; k < 3; k++) {
+    for (i = 0; i < nruns; i++) {
+      float *dest = xyz[k] + runstart[i] - lowerb;
+      if (fio_fseek(fd, blockpos + sizeof(int) + sizeof(float)*runstart[i],
+                    FIO_SEEK_SET) == -1)
+        return DCD_BADREAD;
+      if (fio_fread(dest, sizeof(float)*runlen[i], 1, fd) != 1)
+        return DCD_BADREAD;
+      if (reverseEndian) swap4_aligned(dest, runlen[i]);
+    }
+    blockpos += 2*sizeof(int) + sizeof(float)*N;
+  }
+  if (fio_fseek(fd, blockpos, FIO_SEEK_SET) == -1) return DCD_BADREAD;
+
+  /* skip the optional charmm 4th array */
+  if ((charmm & DCD_IS_CHARMM) && (charmm & DCD_HAS_4DIMS)) {
+    if (fio_fread(&input_integer, sizeof(int), 1, fd) != 1) return DCD_BADREAD;
+    if (reverseEndian) swap4_aligned(&input_integer, 1);
+    if (fio_fseek(fd, input_integer+sizeof(int), FIO_SEEK_CUR)) return DCD_BADREAD;
+  }
+  return DCD_SUCCESS;
+}
+
 static int read_dcdstep(fio_fd fd, int N, float *X, float *Y, float *Z, 
                         float *unitcell, int num_fixed,
                         int first, int *indexes, float *fixedcoords, 
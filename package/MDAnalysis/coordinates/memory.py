@@ -0,0 +1,327 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- http://www.MDAnalysis.org
+# Copyright (c) 2006-2015 Naveen Michaud-Agrawal, Elizabeth J. Denning, Oliver Beckstein
+# and contributors (see AUTHORS for the full list)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+"""
+Trajectories held in memory --- :mod:`MDAnalysis.coordinates.memory`
+====================================================================
+
+The :class:`MemoryReader` keeps a complete trajectory in memory as a single
+C-contiguous array of shape ``(n_frames, n_atoms, 3)``, together with the
+unit cell and the time of each frame (and velocities and forces, if
+available). The positions of the current :class:`~base.Timestep` are a view
+of the current frame of this array, so that moving to another frame does not
+copy any coordinates, and changing the positions of atoms changes the
+trajectory in memory.
+
+A :class:`MemoryReader` can be built from a numpy array or from any other
+Reader with :meth:`MemoryReader.from_reader`. The trajectory of a
+:class:`~MDAnalysis.core.AtomGroup.Universe` is transferred into memory with
+:meth:`~MDAnalysis.core.AtomGroup.Universe.transfer_to_memory`.
+
+.. versionadded:: 0.15.0
+
+
+Examples
+--------
+
+Loading a trajectory into memory makes repeated passes over the trajectory
+and random access to frames cheap::
+
+    from MDAnalysis import Universe
+    from MDAnalysisTests.datafiles import PSF, DCD
+
+    u = Universe(PSF, DCD)
+    u.transfer_to_memory()
+
+Only every 10th frame of the C-alpha atoms is read into a standalone
+reader with::
+
+    from MDAnalysis.coordinates.memory import MemoryReader
+
+    ca = u.select_atoms("name CA")
+    reader = MemoryReader.from_reader(u.trajectory, atoms=ca, step=10)
+
+A Universe can also be created directly from an array of coordinates with
+shape ``(n_frames, n_atoms, 3)``::
+
+    u2 = Universe(PSF, u.trajectory.get_array())
+
+
+Classes
+-------
+
+.. autoclass:: MemoryReader
+   :members:
+
+"""
+from __future__ import absolute_import
+
+import errno
+import numpy as np
+
+from . import base
+
+
+class MemoryReader(base.ProtoReader):
+    """Reader for a trajectory held in memory.
+
+    All frames are stored in :attr:`coordinate_array`, a C-contiguous array
+    of shape ``(n_frames, n_atoms, 3)``; the unit cells and times of the
+    frames are stored in :attr:`dimensions_array` (shape ``(n_frames, 6)``)
+    and :attr:`times`. Coordinates are in MDAnalysis units.
+
+    .. versionadded:: 0.15.0
+    """
+
+    format = 'MEMORY'
+    units = {'time': 'ps', 'length': 'Angstrom'}
+    _reads_atom_indices = True
+
+    def __init__(self, coordinate_array, order='fac', dimensions=None,
+                 time=None, dt=1.0, velocities=None, forces=None,
+                 filename=None, atom_indices=None, **kwargs):
+        """
+        Parameters
+        ----------
+        coordinate_array : numpy.ndarray
+            coordinates of all frames, in the order given by `order`
+        order : str (optional)
+            order of the axes of `coordinate_array`; any permutation of
+            (f)rame, (a)tom and (c)oordinate, e.g. ``'afc'`` for the arrays
+            returned by :meth:`DCDReader.timeseries`. The array is copied
+            into ``'fac'`` order unless it is already C-contiguous in that
+            order. [``'fac'``]
+        dimensions : array_like (optional)
+            unit cell (*A*, *B*, *C*, *alpha*, *beta*, *gamma*), either one
+            for all frames or one per frame, shape ``(n_frames, 6)``
+        time : array_like (optional)
+            time of each frame in ps; calculated from `dt` if not given
+        dt : float (optional)
+            time between two frames in ps, only used if `time` is not given
+            [1.0]
+        velocities, forces : numpy.ndarray (optional)
+            velocities and forces of all frames, with the same shape and
+            `order` as `coordinate_array`
+        filename : str (optional)
+            name of the file the trajectory was read from
+        atom_indices : array_like (optional)
+            0-based indices of the atoms that are kept; the arrays are
+            copied with only these atoms
+        """
+        self.filename = filename
+        self.coordinate_array = self._fac_array(coordinate_array, order)
+        self.n_frames, self.n_atoms = self.coordinate_array.shape[:2]
+
+        if dimensions is None:
+            self.dimensions_array = np.zeros((self.n_frames, 6),
+                                             dtype=np.float32)
+        else:
+            dimensions = np.asarray(dimensions, dtype=np.float32)
+            if dimensions.shape == (6,):
+                dimensions = np.tile(dimensions, (self.n_frames, 1))
+            if dimensions.shape != (self.n_frames, 6):
+                raise ValueError("dimensions must have shape (6,) or "
+                                 "({0}, 6)".format(self.n_frames))
+            self.dimensions_array = np.ascontiguousarray(dimensions)
+
+        if time is None:
+            self.times = dt * np.arange(self.n_frames, dtype=np.float64)
+        else:
+            self.times = np.asarray(time, dtype=np.float64)
+            if self.times.shape != (self.n_frames,):
+                raise ValueError("time must have one value per frame")
+            if self.n_frames > 1:
+                dt = self.times[1] - self.times[0]
+
+        self.velocity_array = None
+        if velocities is not None:
+            self.velocity_array = self._fac_array(velocities, order)
+        self.force_array = None
+        if forces is not None:
+            self.force_array = self._fac_array(forces, order)
+        if atom_indices is not None:
+            self.n_atoms = self._init_atom_indices(atom_indices, self.n_atoms)
+            self.coordinate_array = self._select_atoms_fac(
+                self.coordinate_array)
+            self.velocity_array = self._select_atoms_fac(self.velocity_array)
+            self.force_array = self._select_atoms_fac(self.force_array)
+
+        kwargs.pop("n_atoms", None)
+        kwargs.setdefault('dt', dt)
+        self.ts = self._Timestep(self.n_atoms,
+                                 velocities=self.velocity_array is not None,
+                                 forces=self.force_array is not None,
+                                 reader=self,
+                                 **kwargs)
+        self._read_next_timestep()
+
+    def _fac_array(self, array, order):
+        """Return `array` as C-contiguous array in 'fac' order"""
+        array = np.asarray(array)
+        if array.ndim != 3 or sorted(order) != ['a', 'c', 'f']:
+            raise ValueError("Need a 3-dimensional array and an order made "
+                             "of 'f', 'a' and 'c', got shape {0} and order "
+                             "'{1}'".format(array.shape, order))
+        array = np.transpose(array, [order.index(c) for c in 'fac'])
+        if array.shape[2] != 3:
+            raise ValueError("Coordinates must have 3 components, got "
+                             "{0}".format(array.shape[2]))
+        if hasattr(self, 'coordinate_array') and \
+                array.shape != self.coordinate_array.shape:
+            raise ValueError("Array of shape {0} does not match the "
+                             "coordinates {1}".format(
+                                 array.shape, self.coordinate_array.shape))
+        return np.ascontiguousarray(array)
+
+    def _select_atoms_fac(self, array):
+        """Copy of the atoms in :attr:`atom_indices` of a 'fac' `array`"""
+        if array is None:
+            return None
+        return array.take(self._atom_indices, axis=1)
+
+    @classmethod
+    def from_reader(cls, reader, atoms=None, start=None, stop=None, step=None,
+                    dtype=np.float32):
+        """Read (part of) the trajectory of `reader` into memory.
+
+        Parameters
+        ----------
+        reader : :class:`~MDAnalysis.coordinates.base.ProtoReader`
+            Reader of the trajectory
+        atoms : AtomGroup or array_like (optional)
+            only keep these atoms, given as an
+            :class:`~MDAnalysis.core.AtomGroup.AtomGroup` or as 0-based atom
+            indices; all atoms are kept if ``None``
+        start, stop, step : int (optional)
+            read the frames ``reader[start:stop:step]``
+        dtype : numpy.dtype (optional)
+            data type of the coordinates in memory [numpy.float32]
+
+        Returns
+        -------
+        :class:`MemoryReader` with the selected frames and atoms; velocities
+        and forces are kept if `reader` provides them.
+        """
+        start, stop, step = reader.check_slice_indices(start, stop, step)
+        n_frames = len(range(start, stop, step))
+        if atoms is None:
+            indices = slice(None)
+            n_atoms = reader.n_atoms
+        else:
+            indices = np.asarray(getattr(atoms, 'indices', atoms),
+                                 dtype=np.int64)
+            n_atoms = len(indices)
+
+        ts = reader.ts
+        coordinates = np.empty((n_frames, n_atoms, 3), dtype=dtype)
+        dimensions = np.empty((n_frames, 6), dtype=np.float32)
+        times = np.empty(n_frames, dtype=np.float64)
+        velocities = forces = None
+        if ts.has_velocities:
+            velocities = np.empty_like(coordinates)
+        if ts.has_forces:
+            forces = np.empty_like(coordinates)
+
+        for i, ts in enumerate(reader[start:stop:step]):
+            coordinates[i] = ts.positions[indices]
+            dimensions[i] = ts.dimensions
+            times[i] = ts.time
+            if velocities is not None:
+                velocities[i] = ts.velocities[indices]
+            if forces is not None:
+                forces[i] = ts.forces[indices]
+
+        return cls(coordinates, order='fac', dimensions=dimensions,
+                   time=times, velocities=velocities, forces=forces,
+                   filename=getattr(reader, 'filename', None))
+
+    def get_array(self, format='fac'):
+        """Return the coordinates of all frames.
+
+        The array is a view of :attr:`coordinate_array`, and is only
+        C-contiguous in the default ``'fac'`` order.
+
+        Parameters
+        ----------
+        format : str (optional)
+            order of the axes, any permutation of (f)rame, (a)tom and
+            (c)oordinate [``'fac'``]
+        """
+        return np.transpose(self.coordinate_array,
+                            ['fac'.index(c) for c in format])
+
+    def timeseries(self, asel=None, start=0, stop=-1, skip=1, format='afc'):
+        """Return a copy of the coordinates of `asel` in frames `start` to
+        `stop` (inclusive) with step `skip`.
+
+        Parameters
+        ----------
+        asel : :class:`~MDAnalysis.core.AtomGroup.AtomGroup` (optional)
+            atoms to return; all atoms if ``None``
+        start, stop, skip : int (optional)
+            range of frames, `start` and `stop` are inclusive
+        format : str (optional)
+            order of the axes of the returned array, any permutation of
+            (f)rame, (a)tom and (c)oordinate [``'afc'``]
+        """
+        start, stop, skip = self.check_slice_indices(start, stop, skip)
+        if format not in ('afc', 'acf', 'caf', 'cfa', 'fac', 'fca'):
+            raise ValueError("Invalid timeseries format")
+        # stop is inclusive here
+        # fancy indexing copies the frames
+        array = self.coordinate_array[
+            np.arange(start, stop + (1 if skip > 0 else -1), skip)]
+        if asel is not None:
+            array = array.take(asel.indices, axis=1)
+        return np.transpose(array, ['fac'.index(c) for c in format])
+
+    def _reopen(self):
+        """Reset iteration to first frame"""
+        self.ts.frame = -1
+
+    def _read_next_timestep(self, ts=None):
+        """Point the timestep to the next frame"""
+        if ts is None:
+            ts = self.ts
+        if ts.frame + 1 >= self.n_frames:
+            raise IOError(errno.EIO, 'trying to go over trajectory limit')
+        return self._frame_to_ts(ts.frame + 1, ts)
+
+    def _read_frame(self, frame):
+        """Point the timestep to *frame*"""
+        return self._frame_to_ts(frame, self.ts)
+
+    def _frame_to_ts(self, frame, ts):
+        # views of the arrays in memory, no coordinates are copied
+        ts.frame = frame
+        ts._pos = self.coordinate_array[frame]
+        ts._unitcell = self.dimensions_array[frame]
+        ts.time = self.times[frame]
+        if self.velocity_array is not None:
+            ts._velocities = self.velocity_array[frame]
+        if self.force_array is not None:
+            ts._forces = self.force_array[frame]
+        return ts
+
+    def close(self):
+        pass
+
+    def __repr__(self):
+        return ("<{cls} with {nframes} frames of {natoms} atoms>"
+                "".format(
+                    cls=self.__class__.__name__,
+                    nframes=self.n_frames,
+                    natoms=self.n_atoms
+                ))
@@ -0,0 +1,272 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- http://www.MDAnalysis.org
+# Copyright (c) 2006-2015 Naveen Michaud-Agrawal, Elizabeth J. Denning, Oliver Beckstein
+# and contributors (see AUTHORS for the full list)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+"""
+Read-ahead of trajectory frames --- :mod:`MDAnalysis.coordinates.prefetch`
+==========================================================================
+
+The :class:`PrefetchReader` wraps any other Reader. While the trajectory (or
+a slice of it) is iterated over, a background thread reads the next frames
+with the wrapped Reader, so that reading and decompressing frames overlaps
+with the analysis of the current frame. This pays off when reading is slow,
+e.g. for compressed trajectories or trajectories on network file systems,
+and the file format library releases the GIL while reading (as the XTC and
+TRR readers and plain file reads do).
+
+Frames are read into a fixed number of preallocated
+:class:`~MDAnalysis.coordinates.base.Timestep` instances, so that at most
+*n_frames* frames are read ahead and no memory is allocated while iterating.
+On each step of the iteration, :attr:`PrefetchReader.ts` is replaced by the
+:class:`~MDAnalysis.coordinates.base.Timestep` that holds the new frame;
+code should therefore always access the current frame through
+:attr:`PrefetchReader.ts` (or through the atoms of the
+:class:`~MDAnalysis.core.AtomGroup.Universe`) instead of keeping a reference
+to an old :class:`~MDAnalysis.coordinates.base.Timestep`.
+
+Jumping to a frame (``trajectory[i]``) stops reading ahead and reads the frame
+directly.
+
+.. versionadded:: 0.15.0
+
+
+Examples
+--------
+
+Read up to 8 frames ahead when iterating over the trajectory of a Universe::
+
+    u = Universe(GRO, XTC, prefetch=8)
+    for ts in u.trajectory[::10]:
+        ...
+
+An existing Universe is switched to read-ahead by wrapping its trajectory::
+
+    from MDAnalysis.coordinates.prefetch import PrefetchReader
+
+    u.trajectory = PrefetchReader(u.trajectory, n_frames=8)
+
+
+Classes
+-------
+
+.. autoclass:: PrefetchReader
+   :members:
+
+"""
+from __future__ import absolute_import
+
+import errno
+import sys
+import threading
+import weakref
+
+import six
+from six.moves import queue
+
+from . import base
+
+
+class _Prefetcher(object):
+    """Read the frames of *frames* (an iterator over a Reader) in a thread.
+
+    The frames are copied into the Timesteps of the queue *free* and handed
+    over in the queue *filled*, followed by :attr:`END`. An exception in the
+    thread is handed over as a tuple ``(ERROR, exc_info)``.
+    """
+    END = object()
+    ERROR = object()
+
+    def __init__(self, frames, free, filled):
+        self._frames = frames
+        self._free = free
+        self._filled = filled
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        try:
+            for ts in self._frames:
+                if self._stop.is_set():
+                    return
+                buf = self._free.get()
+                if self._stop.is_set():
+                    if buf is not None:
+                        self._free.put(buf)
+                    return
+                base._copy_frame(ts, buf)
+                self._filled.put(buf)
+            self._filled.put(self.END)
+        except Exception:
+            self._filled.put((self.ERROR, sys.exc_info()))
+
+    def stop(self):
+        """Stop reading and return all Timesteps to the queue *free*."""
+        self._stop.set()
+        while True:
+            # unblock the thread if it waits for a free or filled slot
+            self._drain()
+            self._free.put(None)
+            self._thread.join(0.01)
+            if not self._thread.is_alive():
+                break
+        self._drain()
+        self._frames = None
+
+    def _drain(self):
+        while True:
+            try:
+                item = self._filled.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, base.Timestep):
+                self._free.put(item)
+        # remove the Nones that were only used to wake the thread up
+        items = []
+        while True:
+            try:
+                item = self._free.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                items.append(item)
+        for item in items:
+            self._free.put(item)
+
+
+class PrefetchReader(base.ReaderWrapper):
+    """Read ahead up to *n_frames* frames of *reader* in a background thread.
+
+    Iterating over the :class:`PrefetchReader` or over a slice of it reads
+    the frames of the wrapped *reader* in a background thread, at most
+    *n_frames* ahead of the current frame. All other attributes and methods
+    are those of *reader*; calling a method of *reader* through the
+    :class:`PrefetchReader` (e.g. ``timeseries()``) stops reading ahead so
+    that only one thread uses the file at a time. The wrapped *reader* must
+    not be used directly while the :class:`PrefetchReader` is in use.
+
+    .. versionadded:: 0.15.0
+    """
+
+    def __init__(self, reader, n_frames=4):
+        """
+        Parameters
+        ----------
+        reader : :class:`~MDAnalysis.coordinates.base.ProtoReader`
+            the Reader of the trajectory
+        n_frames : int (optional)
+            maximum number of frames that are read ahead [4]
+        """
+        if n_frames < 1:
+            raise ValueError("n_frames must be at least 1, got {0}"
+                             "".format(n_frames))
+        super(PrefetchReader, self).__init__(reader)
+        self._prefetcher = None
+        self.prefetch_frames = n_frames
+
+        # one Timestep for the current frame, n_frames read ahead and one
+        # being filled by the thread
+        self._free = queue.Queue()
+        self._buffers = []
+        for _ in range(n_frames + 2):
+            ts = reader.ts.copy()
+            ts._reader = weakref.ref(reader)
+            self._buffers.append(ts)
+        self.ts = self._buffers[0]
+        for ts in self._buffers[1:]:
+            self._free.put(ts)
+        self._filled = queue.Queue(n_frames)
+        self._copy_frame(reader.ts, self.ts)
+
+    def _reader_attribute(self, name):
+        value = getattr(self._reader, name)
+        if callable(value):
+            self._stop_prefetch()
+        return value
+
+    @property
+    def n_atoms(self):
+        return self._reader.n_atoms
+
+    def update_n_frames(self):
+        self._stop_prefetch()
+        return self._reader.update_n_frames()
+
+    def _start_prefetch(self, frames):
+        self._stop_prefetch()
+        # the Timestep of the current frame stays with the caller
+        self._prefetcher = _Prefetcher(frames, self._free, self._filled)
+        return self._prefetcher
+
+    def _stop_prefetch(self):
+        prefetcher, self._prefetcher = self._prefetcher, None
+        if prefetcher is not None:
+            prefetcher.stop()
+
+    def _prefetched(self, frames):
+        """Generator over the frames of the iterator *frames* of the wrapped
+        reader, which is read in the background."""
+        prefetcher = self._start_prefetch(frames)
+        try:
+            while self._prefetcher is prefetcher:
+                item = self._filled.get()
+                if item is _Prefetcher.END:
+                    self._prefetcher = None
+                    return
+                if isinstance(item, tuple) and item[0] is _Prefetcher.ERROR:
+                    self._prefetcher = None
+                    six.reraise(*item[1])
+                self._free.put(self.ts)
+                self.ts = item
+                yield self.ts
+        finally:
+            # iteration was left early
+            if self._prefetcher is prefetcher:
+                self._stop_prefetch()
+
+    def __iter__(self):
+        for ts in self._prefetched(iter(self._reader)):
+            yield ts
+        # the wrapped reader has been rewound at the end of the iteration
+        self._copy_frame(self._reader.ts, self.ts)
+
+    def _sliced_iter(self, start, stop, step):
+        return self._prefetched(self._reader_slice(start, stop, step))
+
+    def _read_frame(self, frame):
+        self._stop_prefetch()
+        return super(PrefetchReader, self)._read_frame(frame)
+
+    def _read_next_timestep(self, ts=None):
+        self._stop_prefetch()
+        if ts is None:
+            ts = self.ts
+        frame = ts.frame + 1
+        if self._reader.ts.frame == ts.frame:
+            next_ts = self._reader._read_next_timestep()
+        elif frame < self.n_frames:
+            # the thread has read ahead of the current frame
+            next_ts = self._reader._read_frame(frame)
+        else:
+            raise IOError(errno.EIO, 'trying to go over trajectory limit')
+        return self._copy_frame(next_ts, ts)
+
+    def _reopen(self):
+        self._stop_prefetch()
+        super(PrefetchReader, self)._reopen()
+
+    def close(self):
+        self._stop_prefetch()
+        super(PrefetchReader, self).close()
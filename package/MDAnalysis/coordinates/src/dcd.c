@@ -384,6 +384,28 @@ __read_dcd_header(PyObject *self, PyObject *args)
     goto error;
   }
   Py_DECREF(temp);
+  // Layout of the frames, for memory mapping the file
+  temp = Py_BuildValue("L", (long long)dcd->header_size);
+  if (temp == NULL) goto error;
+  if (PyObject_SetAttrString(self, "_header_size", temp) == -1) {
+    PyErr_SetString(PyExc_AttributeError, "Could not create attribute _header_size");
+    goto error;
+  }
+  Py_DECREF(temp);
+  temp = Py_BuildValue("i", dcd->charmm);
+  if (temp == NULL) goto error;
+  if (PyObject_SetAttrString(self, "_charmm", temp) == -1) {
+    PyErr_SetString(PyExc_AttributeError, "Could not create attribute _charmm");
+    goto error;
+  }
+  Py_DECREF(temp);
+  temp = Py_BuildValue("i", dcd->reverse);
+  if (temp == NULL) goto error;
+  if (PyObject_SetAttrString(self, "_reverse_endian", temp) == -1) {
+    PyErr_SetString(PyExc_AttributeError, "Could not create attribute _reverse_endian");
+    goto error;
+  }
+  Py_DECREF(temp);
 	
   temp = PyCObject_FromVoidPtr(dcd, NULL);
   if (temp == NULL) goto error;
@@ -438,8 +460,9 @@ __read_timeseries(PyObject *self, PyObject *args)
   int start = 0, stop = -1, skip = 1, numskip = 0;
   dcdhandle *dcd = NULL;
   int *atomlist = NULL;
+  int *runstart = NULL, *runlen = NULL;
+  int nruns = 0;
   npy_intp dimensions[3];
-  float unitcell[6];
   const char* format = "afc";
 	
   if (!self) {
@@ -491,7 +514,15 @@ __read_timeseries(PyObject *self, PyObject *args)
     atomlist[i] = PyInt_AsLong(temp);
   }
 
-  lowerb = atomlist[0]; upperb = atomlist[n_atoms-1];
+  // Only read the runs of atoms that are needed
+  nruns = group_dcdsubset_runs(atomlist, n_atoms, DCD_SUBSET_MAXGAP,
+                               &runstart, &runlen);
+  if (nruns < 0) {
+    PyErr_SetString(PyExc_MemoryError, "Can't allocate space for atom runs");
+    goto error;
+  }
+  lowerb = runstart[0];
+  upperb = runstart[nruns-1] + runlen[nruns-1] - 1;
   range = upperb-lowerb+1;
 	
   // Figure out the format string
@@ -561,9 +592,9 @@ __read_timeseries(PyObject *self, PyObject *args)
     	}
     	dcd->setsread+=numskip;                                                                              
       }
-      rc = read_dcdsubset(dcd->fd, dcd->natoms, lowerb, upperb, tempX, tempY, tempZ,
-			  unitcell, dcd->nfixed, dcd->first, dcd->freeind, dcd->fixedcoords,
-			  dcd->reverse, dcd->charmm);
+      rc = read_dcdsubset_runs(dcd->fd, dcd->natoms, lowerb, nruns, runstart, runlen,
+			       tempX, tempY, tempZ, dcd->nfixed, dcd->first,
+			       dcd->reverse, dcd->charmm);
       dcd->first = 0;
       dcd->setsread++;
       if (rc < 0) {
@@ -617,6 +648,8 @@ __read_timeseries(PyObject *self, PyObject *args)
   dcd->setsread = 0;
   dcd->first = 1;	
   free(atomlist);
+  free(runstart);
+  free(runlen);
   free(tempX);
   free(tempY);
   free(tempZ);
@@ -629,6 +662,8 @@ __read_timeseries(PyObject *self, PyObject *args)
   dcd->first = 1;	
   Py_XDECREF(coord);
   if (atomlist != NULL) free(atomlist);
+  if (runstart != NULL) free(runstart);
+  if (runlen != NULL) free(runlen);
   if (tempX != NULL) free(tempX);
   if (tempY != NULL) free(tempY);
   if (tempZ != NULL) free(tempZ);
@@ -924,6 +959,62 @@ __reset_dcd_read(PyObject *self, PyObject *args)
   return Py_None;
 }
 
+static PyObject *
+__update_dcd_nsets(PyObject *self, PyObject *args)
+{
+  /* Recount the frames from the file size, so that frames appended to the
+   * file since the header was read can be accessed. The number of frames
+   * never decreases. */
+  PyObject* temp;
+  dcdhandle *dcd;
+  off_t ndims, firstframesize, framesize, extrablocksize;
+  off_t filesize;
+  struct stat stbuf;
+  int nsets;
+
+  if (! self) {
+    /* we were in fact called as a module function, try to retrieve 
+       a matching object from args */
+    if( !PyArg_ParseTuple(args, "O", &self) )
+      return NULL;
+  } else {
+    /* we were obviously called as an object method so args should 
+       only have the int value. */
+    if( !PyArg_ParseTuple(args, "") )
+      return NULL;
+  }
+
+  if ((temp = PyObject_GetAttrString(self, "_dcd_C_ptr")) == NULL) { // This gives me a New Reference
+    // Raise exception
+    PyErr_SetString(PyExc_AttributeError, "_dcd_C_ptr is not an attribute");
+    return NULL;
+  }
+  dcd = (dcdhandle*)PyCObject_AsVoidPtr(temp);
+  Py_DECREF(temp);
+
+  extrablocksize = dcd->charmm & DCD_HAS_EXTRA_BLOCK ? 48 + 8 : 0;
+  ndims = dcd->charmm & DCD_HAS_4DIMS ? 4 : 3;
+  firstframesize = (dcd->natoms+2) * ndims * sizeof(float) + extrablocksize;
+  framesize = (dcd->natoms-dcd->nfixed+2) * ndims * sizeof(float)
+    + extrablocksize;
+
+  memset(&stbuf, 0, sizeof(struct stat));
+  if (fstat(dcd->fd, &stbuf)) {
+    PyErr_SetString(PyExc_IOError, "Could not stat file");
+    return NULL;
+  }
+  filesize = stbuf.st_size - dcd->header_size - firstframesize;
+  if (filesize >= 0) {
+    // partially written frames are not counted
+    nsets = filesize / framesize + 1;
+    if (nsets > dcd->nsets)
+      dcd->nsets = nsets;
+  }
+
+  temp = Py_BuildValue("i", dcd->nsets);
+  return temp;
+}
+
 static PyMethodDef DCDMethods[] = {
   {"__write_dcd_header", __write_dcd_header, METH_VARARGS, "Write a DCD header."},
   {"__write_next_frame", __write_next_frame, METH_VARARGS, "Write the next timestep."},
@@ -933,6 +1024,7 @@ static PyMethodDef DCDMethods[] = {
   {"__jump_to_frame", __jump_to_frame, METH_VARARGS, "Jump to specified timestep."},
   {"__reset_dcd_read", __reset_dcd_read, METH_VARARGS, "Reset dcd file reading."},
   {"__finish_dcd_read", __finish_dcd_read, METH_VARARGS, "Clean up any data for handling dcd file."},
+  {"__update_dcd_nsets", __update_dcd_nsets, METH_VARARGS, "Recount the frames of a growing dcd file."},
   {"__read_timeseries", __read_timeseries, METH_VARARGS, "Return a Numpy array of the coordinates for a set of atoms for the whole trajectory."},
   {NULL, NULL, 0, NULL}	/* Sentinel */
 };
@@ -0,0 +1,116 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- http://www.MDAnalysis.org
+# Copyright (c) 2006-2015 Naveen Michaud-Agrawal, Elizabeth J. Denning, Oliver Beckstein
+# and contributors (see AUTHORS for the full list)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+"""
+Reading a subset of the atoms --- :mod:`MDAnalysis.coordinates.subset`
+======================================================================
+
+All Readers accept the keyword *atom_indices*, the 0-based indices of the
+atoms that are read from the trajectory. The
+:class:`~MDAnalysis.coordinates.base.Timestep` of the Reader then only holds
+these atoms (in the given order), which saves memory and time when only a
+small part of a large system is analysed.
+
+The DCD, XTC, TRR, TRZ, NCDF and in-memory Readers read the subset
+themselves: memory mapped DCD and TRZ frames only touch the selected atoms,
+NCDF files are read as hyperslabs of the range of selected atoms, and XTC,
+TRR and (not memory mapped) DCD frames are decoded completely and then
+sliced. All other Readers are wrapped in an :class:`AtomSubsetReader`
+automatically, which reads complete frames and copies the selected atoms
+into a smaller :class:`~MDAnalysis.coordinates.base.Timestep`.
+
+A :class:`~MDAnalysis.core.AtomGroup.Universe` that only contains a
+selection of the atoms of the topology is created with the *select*
+keyword; the trajectory is then read with the indices of the selected
+atoms.
+
+.. versionadded:: 0.15.0
+
+
+Examples
+--------
+
+Only keep the protein of a solvated system::
+
+    u = Universe(PSF, DCD, select="protein")
+
+Read the first 100 atoms of a trajectory::
+
+    reader = MDAnalysis.coordinates.PDB.PDBReader(PDB, atom_indices=range(100))
+
+
+Classes
+-------
+
+.. autoclass:: AtomSubsetReader
+   :members:
+
+"""
+from __future__ import absolute_import
+
+import weakref
+
+from . import base
+
+
+class AtomSubsetReader(base.ReaderWrapper):
+    """Read only the atoms with *atom_indices* from the frames of *reader*.
+
+    The frames are read with the wrapped *reader* and the selected atoms are
+    copied into :attr:`ts`. All other attributes and methods are those of
+    *reader*, except for methods that take atoms of the trajectory (such as
+    ``timeseries()``), which are not available. The wrapped *reader* must
+    not be used directly while the :class:`AtomSubsetReader` is in use.
+
+    .. versionadded:: 0.15.0
+    """
+    # do not wrap the AtomSubsetReader itself
+    _reads_atom_indices = True
+
+    #: methods of the wrapped Reader that take atoms of the trajectory
+    _atom_methods = ('timeseries', 'correl')
+
+    def __init__(self, reader, atom_indices):
+        """
+        Parameters
+        ----------
+        reader : :class:`~MDAnalysis.coordinates.base.ProtoReader`
+            the Reader of the trajectory
+        atom_indices : array_like
+            0-based indices of the atoms in the trajectory that are read
+        """
+        super(AtomSubsetReader, self).__init__(reader)
+        self.n_atoms = self._init_atom_indices(atom_indices, reader.n_atoms)
+        self.ts = reader.ts.copy_slice(self._atom_indices)
+        self.ts._reader = weakref.ref(reader)
+
+    def _reader_attribute(self, name):
+        if name in self._atom_methods:
+            raise AttributeError(name)
+        return getattr(self._reader, name)
+
+    def _copy_frame(self, src, dst):
+        return base._copy_frame(src, dst, self._atom_indices)
+
+    def Writer(self, filename, **kwargs):
+        """A trajectory writer for the atoms that are read, see the
+        ``Writer()`` of the wrapped Reader."""
+        kwargs.setdefault('n_atoms', self.n_atoms)
+        return self._reader.Writer(filename, **kwargs)
+
+    def __repr__(self):
+        return "<{cls} of {n_atoms} atoms of {reader}>".format(
+            cls=self.__class__.__name__, n_atoms=self.n_atoms,
+            reader=repr(self._reader))
@@ -422,6 +422,7 @@ import os.path
 import weakref
 import gc
 import functools
+import operator
 
 # Local imports
 import MDAnalysis
@@ -489,34 +490,73 @@ class Atom(object):
        Renamed atom.torsions to atom.dihedrals
     .. versionchanged:: 0.11.1
        Added occupancy property. Can get and set.
+    .. versionchanged:: 0.15.0
+       Topology attributes are properties; changing them invalidates the
+       topology columns of the :class:`Universe` that are used by
+       :class:`AtomGroup`.
     """
 
     __slots__ = (
-        "index", "id", "name", "type", "resname", "resid", "segid",
-        "mass", "charge", "residue", "segment",
+        "index", "id", "_name", "_type", "_resname", "_resid", "_segid",
+        "_mass", "_charge", "_residue", "_segment",
         "_universe",
-        "radius", "bfactor", "resnum", "serial", "altLoc")
+        "_radius", "_bfactor", "_resnum", "_serial", "_altLoc")
 
     def __init__(self, index, name, type, resname, resid, segid, mass, charge,
                  residue=None, segment=None, radius=None, bfactor=None,
                  resnum=None, serial=None, altLoc=None, universe=None):
+        # set the slots directly: the Atom is not part of any topology
+        # column of the Universe yet
         self.index = index
-        self.name = name
-        self.altLoc = altLoc
-        self.type = str(type)  # always a string (needed for selections)
-        self.resname = resname
-        self.resid = resid
-        self.resnum = resnum
-        self.residue = residue  # typically patched in later
-        self.segid = segid
-        self.segment = segment  # typically patched in later
-        self.mass = mass
-        self.charge = charge
-        self.radius = radius
-        self.bfactor = bfactor
-        self.serial = serial
+        self._name = name
+        self._altLoc = altLoc
+        self._type = str(type)  # always a string (needed for selections)
+        self._resname = resname
+        self._resid = resid
+        self._resnum = resnum
+        self._residue = residue  # typically patched in later
+        self._segid = segid
+        self._segment = segment  # typically patched in later
+        self._mass = mass
+        self._charge = charge
+        self._radius = radius
+        self._bfactor = bfactor
+        self._serial = serial
         self._universe = universe
 
+    def _column_attribute(name, columns=None):
+        """Attribute *name* of the atom, stored in the slot ``_name``.
+
+        Setting the attribute removes the topology *columns* of the
+        :class:`Universe` that contain it (see
+        :meth:`Universe._topology_column`).
+        """
+        slot = "_" + name
+        columns = columns or (name,)
+
+        def setter(self, value):
+            setattr(self, slot, value)
+            if self._universe is not None:
+                self._universe._clear_columns(*columns)
+
+        return property(operator.attrgetter(slot), setter)
+
+    name = _column_attribute("name")
+    type = _column_attribute("type")
+    resname = _column_attribute("resname")
+    resid = _column_attribute("resid")
+    resnum = _column_attribute("resnum")
+    segid = _column_attribute("segid")
+    mass = _column_attribute("mass")
+    charge = _column_attribute("charge")
+    radius = _column_attribute("radius")
+    bfactor = _column_attribute("bfactor")
+    serial = _column_attribute("serial")
+    altLoc = _column_attribute("altLoc")
+    residue = _column_attribute("residue", ("resindex",))
+    segment = _column_attribute("segment", ("segindex",))
+    del _column_attribute
+
     def __repr__(self):
         return ("<Atom {idx}: {name} of type {t} of resname {rname}, "
                 "resid {rid} and segid {sid}{altloc}>".format(
@@ -896,6 +936,8 @@ class AtomGroup(object):
         * atoms (for "in" lookup); cache is only built for large systems with
           > 10,000 atoms
         * indices (:meth:`AtomGroup.indices`)
+        * column_universe (the :class:`Universe` of all atoms, see
+          :meth:`AtomGroup._get_column`)
         * masses (:meth:`AtomGroup.masses`)
         * residues (:attr:`AtomGroup.residues`)
         * segments (:attr:`AtomGroup.segments`)
@@ -916,8 +958,8 @@ class AtomGroup(object):
             self._cache['atoms'] = dict(((x, None) for x in self.__atoms))
 
         # Delete preexisting cache if exists
-        for att in ['indices', 'residues', 'segments', 'masses',
-                    'bonds', 'angles', 'dihedrals', 'impropers']:
+        for att in ['indices', 'column_universe', 'residues', 'segments',
+                    'masses', 'bonds', 'angles', 'dihedrals', 'impropers']:
             try:
                 del self._cache[att]
             except KeyError:
@@ -925,6 +967,8 @@ class AtomGroup(object):
         # Call each in turn to force them to build into cache
         # indices
         self._cache['indices'] = self.indices
+        # Universe of the topology columns
+        self._cache['column_universe'] = self._column_universe
         # residue instances
         self._cache['residues'] = self.residues
         # segment instances
@@ -1013,6 +1057,9 @@ class AtomGroup(object):
            :attr:`_cls` to define the returned class.
         .. versionchanged:: 0.10.0
            Now supports indexing via boolean numpy arrays
+        .. versionchanged:: 0.15.0
+           Groups of atoms take the :attr:`indices` of their atoms from this
+           group instead of collecting them again.
         """
         container = self._container
         cls = self._cls
@@ -1026,7 +1073,7 @@ class AtomGroup(object):
                     "Index {} is out of bounds for AtomGroup with size {}"
                     "".format(item, len(self)))
         elif isinstance(item, slice):
-            return cls(container[item])
+            group = cls(container[item])
         elif isinstance(item, (np.ndarray, list)):
             # advanced slicing, requires array or list
             try:
@@ -1035,11 +1082,23 @@ class AtomGroup(object):
                     item = np.arange(len(self))[item]
             except IndexError:  # zero length item
                 pass
-            return cls([container[i] for i in item])
+            if isinstance(item, np.ndarray):
+                # indexing the list with Python ints is much faster
+                item = item.tolist()
+            group = cls([container[i] for i in item])
         elif isinstance(item, str):
             return self._get_named_atom(item)
         else:
             raise TypeError("Cannot slice with type: {0}".format(type(item)))
+        if self._containername == "_atoms" and 'indices' in self._cache:
+            # the group holds the same atoms as the indices
+            group._fill_cache('indices', self._cache['indices'][item])
+        if (self._containername == "_atoms" and
+                self._cache.get('column_universe') is not None):
+            # atoms taken from a single Universe
+            group._fill_cache('column_universe',
+                              self._cache['column_universe'])
+        return group
 
     def __getattr__(self, name):
         try:
@@ -1159,6 +1218,60 @@ class AtomGroup(object):
         """
         return np.array([atom.index for atom in self._atoms])
 
+    def _get_column(self, name):
+        """Array of the :class:`Atom` attribute *name* of all atoms.
+
+        The values are taken from the topology column of the
+        :class:`Universe` (see :meth:`Universe._topology_column`) instead of
+        being collected from each :class:`Atom`, as long as all atoms belong
+        to the same :class:`Universe`.
+
+        .. versionadded:: 0.15.0
+        """
+        universe = self._column_universe
+        if universe is not None:
+            column = universe._topology_column(name)
+            if column is not None:
+                return column[self.indices]
+        if self._atoms and name in ('resindex', 'segindex'):
+            raise NoDataError("The {0} of atoms is only defined for the atoms "
+                              "of a single Universe".format(name))
+        return np.array([getattr(atom, name) for atom in self._atoms])
+
+    @property
+    @cached('column_universe')
+    def _column_universe(self):
+        """The :class:`Universe` of all atoms, or ``None`` if the atoms do not
+        all belong to the same :class:`Universe`.
+
+        .. versionadded:: 0.15.0
+        """
+        atoms = self._atoms
+        universe = atoms[0]._universe if atoms else None
+        if all(atom._universe is universe for atom in atoms):
+            return universe
+        return None
+
+    @property
+    def resindices(self):
+        """Array of the index of the :class:`Residue` of each atom.
+
+        The index refers to :attr:`Universe.residues`.
+
+        .. versionadded:: 0.15.0
+        """
+        return self._get_column("resindex")
+
+    @property
+    def segindices(self):
+        """Array of the index of the :class:`Segment` of each atom.
+
+        The index refers to :attr:`Universe.segments`.
+
+        .. versionadded:: 0.15.0
+        """
+        return self._get_column("segindex")
+
     @property
     @cached('masses')
     def masses(self):
@@ -1167,7 +1280,7 @@ class AtomGroup(object):
         .. versionchanged:: 0.11.0
            Now a property
         """
-        return np.array([atom.mass for atom in self._atoms])
+        return self._get_column("mass")
 
     @masses.setter
     def masses(self, new):
@@ -1217,7 +1330,7 @@ class AtomGroup(object):
         .. versionchanged:: 0.11.0
            Now a property
         """
-        return np.array([atom.charge for atom in self._atoms])
+        return self._get_column("charge")
 
     @charges.setter
     def charges(self, new):
@@ -1241,7 +1354,7 @@ class AtomGroup(object):
         .. versionchanged:: 0.11.0
            Now a property
         """
-        return np.array([a.name for a in self._atoms])
+        return self._get_column("name")
 
     @names.setter
     def names(self, new):
@@ -1255,7 +1368,7 @@ class AtomGroup(object):
         .. versionchanged:: 0.11.0
            Now a property
         """
-        return np.array([a.type for a in self._atoms])
+        return self._get_column("type")
 
     @types.setter
     def types(self, new):
@@ -1268,7 +1381,7 @@ class AtomGroup(object):
         .. versionchanged:: 0.11.0
            Now a property
         """
-        return np.array([atom.radius for atom in self._atoms])
+        return self._get_column("radius")
 
     @radii.setter
     def radii(self, new):
@@ -1278,7 +1391,7 @@ class AtomGroup(object):
     def bfactors(self):
         """Crystallographic B-factors (from PDB) in A**2.
         """
-        return np.array([atom.bfactor for atom in self._atoms])
+        return self._get_column("bfactor")
 
     @bfactors.setter
     def bfactors(self, new):
@@ -1290,7 +1403,7 @@ class AtomGroup(object):
 
         .. versionadded:: 0.11.0
         """
-        return np.array([atom.altLoc for atom in self._atoms])
+        return self._get_column("altLoc")
 
     @altLocs.setter
     def altLocs(self, new):
@@ -1302,7 +1415,7 @@ class AtomGroup(object):
 
         .. versionadded:: 0.11.0
         """
-        return np.array([atom.serial for atom in self._atoms])
+        return self._get_column("serial")
 
     @serials.setter
     def serials(self, new):
@@ -1361,7 +1474,7 @@ class AtomGroup(object):
         .. versionchanged:: 0.11.0
            Now a property and returns array of length `len(self)`
         """
-        return np.array([a.resid for a in self._atoms])
+        return self._get_column("resid")
 
     @resids.setter
     def resids(self, new):
@@ -1376,7 +1489,7 @@ class AtomGroup(object):
         .. versionchanged:: 0.11.0
            Now a property and returns array of length `len(self)`
         """
-        return np.array([a.resname for a in self._atoms])
+        return self._get_column("resname")
 
     @resnames.setter
     def resnames(self, new):
@@ -1392,7 +1505,7 @@ class AtomGroup(object):
         .. versionchanged:: 0.11.0
            Now a property and returns array of length `len(self)`
         """
-        return np.array([a.resnum for a in self._atoms])
+        return self._get_column("resnum")
 
     @resnums.setter
     def resnums(self, new):
@@ -1407,7 +1520,7 @@ class AtomGroup(object):
         .. versionchanged:: 0.11.0
            Now a property and returns array of length `len(self)`
         """
-        return np.array([a.segid for a in self._atoms])
+        return self._get_column("segid")
 
     @segids.setter
     def segids(self, new):
@@ -3912,6 +4025,24 @@ class Universe(object):
              individual list member. [``None``]
              Can also pass a subclass of :class:`MDAnalysis.coordinates.base.Reader`
              to define a custom reader to be used on the trajectory file.
+          *prefetch*
+             number of frames to read ahead in a background thread while
+             iterating over the trajectory, see :meth:`Universe.load_new`
+             [``None``]
+          *select*
+             only keep the atoms of this selection (see
+             :meth:`Universe.select_atoms`, evaluated for the first frame)
+             in the Universe; the atoms are renumbered and only the bonds,
+             angles, dihedrals and impropers between selected atoms are
+             kept. The trajectory is read with the indices of the selected
+             atoms (see
+             :mod:`~MDAnalysis.coordinates.subset`), so that its
+             :class:`~MDAnalysis.coordinates.base.Timestep` only holds the
+             selected atoms. [``None``]
+          *cache*
+             read the trajectory from a binary cache, which is written the
+             first time the trajectory is read, see :meth:`Universe.load_new`
+             [``None``]
           *guess_bonds*
               Once Universe has been loaded, attempt to guess the connectivity
               between atoms.  This will populate the .bonds .angles and
@@ -3960,6 +4091,8 @@ class Universe(object):
         .. versionchanged:: 0.11.0
            Added the *is_anchor* and *anchor_name* keywords for finer behavior
            control when unpickling instances of :class:`MDAnalysis.core.AtomGroup.AtomGroup`.
+        .. versionchanged:: 0.15.0
+           Added the *prefetch*, *select* and *cache* keywords.
         """
 
         from ..topology.core import get_parser_for
@@ -3990,6 +4123,8 @@ class Universe(object):
         # old behaviour (explicit coordfile) overrides new behaviour
         coordinatefile = kwargs.pop('coordinatefile', args[1:])
         topology_format = kwargs.pop('topology_format', None)
+        select = kwargs.pop('select', None)
+        cache = kwargs.pop('cache', None)
 
         if len(args) == 1 and not coordinatefile:
             # special hacks to treat a coordinate file as a coordinate AND topology file
@@ -4041,7 +4176,16 @@ class Universe(object):
         self._init_topology()
 
         # Load coordinates
-        self.load_new(coordinatefile, **kwargs)
+        if select is None:
+            self.load_new(coordinatefile, cache=cache, **kwargs)
+        else:
+            self.load_new(coordinatefile, **kwargs)
+            n_atoms = self.atoms.n_atoms
+            atom_indices = self._reduce_to_selection(select)
+            if coordinatefile is not None:
+                # read only the selected atoms of the trajectory
+                self.load_new(coordinatefile, atom_indices=atom_indices,
+                              n_atoms=n_atoms, cache=cache, **kwargs)
 
         if kwargs.get('guess_bonds', False):
             self.atoms.guess_bonds(vdwradii=kwargs.get('vdwradii',None))
@@ -4074,6 +4218,63 @@ class Universe(object):
         """
         self._cache[name] = value
 
+    def _topology_column(self, name):
+        """Array of the attribute *name* of all atoms in the Universe.
+
+        The topology columns are built from the :class:`Atom` instances the
+        first time they are needed and they are cached until the attribute
+        of an atom is changed, so that :class:`AtomGroup` can look up the
+        attribute of its atoms as ``column[indices]``. Besides the topology
+        attributes of :class:`Atom` (*name*, *type*, *mass*, ...) the
+        columns ``"resindex"`` and ``"segindex"`` hold the index of the
+        residue and the segment of each atom in :attr:`residues` and
+        :attr:`segments`.
+
+        Returns ``None`` if the indices of the atoms do not match their
+        position in :attr:`atoms`.
+
+        .. versionadded:: 0.15.0
+        """
+        try:
+            columns = self._cache['columns']
+        except KeyError:
+            if np.array_equal(self.atoms.indices, np.arange(len(self.atoms))):
+                columns = {}
+            else:
+                columns = None
+            self._cache['columns'] = columns
+        if columns is None:
+            return None
+        try:
+            return columns[name]
+        except KeyError:
+            pass
+
+        if name in ('resindex', 'segindex'):
+            groups = self.residues if name == 'resindex' else self.segments
+            # atoms without a residue or segment keep -1
+            column = np.empty(len(self.atoms), dtype=np.intp)
+            column.fill(-1)
+            for i, group in enumerate(groups):
+                column[group.indices] = i
+        else:
+            column = np.array([getattr(a, name) for a in self.atoms._atoms])
+        column.setflags(write=False)
+        columns[name] = column
+        return column
+
+    def _clear_columns(self, *names):
+        """Remove the topology columns *names* from the cache.
+
+        .. SeeAlso:: :meth:`_topology_column`
+
+        .. versionadded:: 0.15.0
+        """
+        columns = self._cache.get('columns')
+        if columns:
+            for name in names:
+                columns.pop(name, None)
+
     def _init_topology(self):
         """Populate Universe attributes from the structure dictionary
         *_topology*.
@@ -4085,6 +4286,54 @@ class Universe(object):
         # segment instant selectors
         self._build_segments()
 
+    def _reduce_to_selection(self, selection):
+        """Only keep the atoms of *selection* in the Universe.
+
+        The atoms are renumbered in the order of the topology and the
+        entries of :attr:`_topology` that refer to atoms which are not
+        selected are removed; the trajectory is closed.
+
+        :Returns: the indices of the selected atoms before renumbering
+        :Raises: :exc:`ValueError` if the selection is empty
+
+        .. versionadded:: 0.15.0
+        """
+        atoms = self.select_atoms(selection)
+        if len(atoms) == 0:
+            raise ValueError("Selection '{0}' does not contain any atoms"
+                             "".format(selection))
+        indices = atoms.indices
+        mapping = {old: new for new, old in enumerate(indices)}
+
+        topology = {'atoms': list(atoms)}
+        for key, entries in self._topology.items():
+            if key == 'atoms' or key.startswith('_'):
+                # private entries of the parsers describe all atoms
+                continue
+            # all other entries are tuples of atom indices, e.g. bonds, or
+            # dicts keyed by them (bondorder)
+            kept = [entry for entry in entries
+                    if all(i in mapping for i in entry)]
+            remapped = [tuple(mapping[i] for i in entry) for entry in kept]
+            if isinstance(entries, dict):
+                topology[key] = dict(zip(remapped,
+                                         (entries[entry] for entry in kept)))
+            else:
+                topology[key] = remapped
+
+        if self._trajectory is not None:
+            self._trajectory.close()
+            self._trajectory = None
+        for i, atom in enumerate(atoms):
+            atom.index = i
+        for name, value in list(self.__dict__.items()):
+            if isinstance(value, Segment):
+                del self.__dict__[name]
+        self._topology = topology
+        self._clear_caches()
+        self._init_topology()
+        return indices
+
     def _build_segments(self):
         """Parse list of atoms into segments.
 
@@ -4519,6 +4768,19 @@ class Universe(object):
                  individual list member [``None``]
                  Can also pass a subclass of :class:`MDAnalysis.coordinates.base.Reader`
                  to define a custom reader to be used on the trajectory file.
+             *prefetch*
+                 read up to *prefetch* frames ahead in a background thread
+                 while iterating over the trajectory, see
+                 :class:`~MDAnalysis.coordinates.prefetch.PrefetchReader`;
+                 ``None`` or 0 reads frames only when they are needed [``None``]
+             *cache*
+                 ``'auto'`` or the filename of a binary cache of the
+                 trajectory, see :mod:`~MDAnalysis.coordinates.cache`; the
+                 cache is written when the trajectory is loaded the first
+                 time (or has changed since) and is read instead of the
+                 trajectory afterwards. ``'auto'`` stores the cache as a
+                 hidden file next to the trajectory. Only single trajectory
+                 files without velocities and forces are cached. [``None``]
              *kwargs*
                  Other kwargs are passed to the trajectory reader (only for advanced use)
 
@@ -4532,6 +4794,10 @@ class Universe(object):
            not read by the :class:`~MDAnalysis.coordinates.base.ChainReader` but directly by
            its specialized file format reader, which typically has more features than the
            :class:`~MDAnalysis.coordinates.base.ChainReader`.
+        .. versionchanged:: 0.15.0
+           A numpy array of coordinates with shape ``(n_frames, n_atoms, 3)``
+           is read with the :class:`~MDAnalysis.coordinates.memory.MemoryReader`.
+           Added the *prefetch* and *cache* keywords.
         """
         if filename is None:
             return
@@ -4540,12 +4806,21 @@ class Universe(object):
         from ..coordinates.core import get_reader_for
         from ..coordinates.base import ProtoReader
 
-        if len(util.asiterable(filename)) == 1:
+        if isinstance(filename, tuple) and len(filename) == 1:
+            # coordinates handed over from Universe.__init__
+            filename = filename[0]
+        if (not isinstance(filename, np.ndarray) and
+                len(util.asiterable(filename)) == 1):
             # make sure a single filename is not handed to the ChainReader
             filename = util.asiterable(filename)[0]
         logger.debug("Universe.load_new(): loading {0}...".format(filename))
 
         reader_format = kwargs.pop('format', None)
+        prefetch = kwargs.pop('prefetch', None)
+        cache = kwargs.pop('cache', None)
+        if isinstance(filename, np.ndarray) and reader_format is None:
+            # an array of coordinates is held in memory
+            reader_format = 'MEMORY'
         perm = kwargs.get('permissive', MDAnalysis.core.flags['permissive_pdb_reader'])
         reader = None
 
@@ -4558,7 +4833,8 @@ class Universe(object):
 
         if not reader:
             # Check if we need to use Chain reader
-            if util.iterable(filename):
+            if (util.iterable(filename) and
+                    not isinstance(filename, np.ndarray)):
                 # Save the format and pass this to ChainReader
                 kwargs.update({'format': reader_format})
                 reader_format='CHAIN'
@@ -4570,10 +4846,27 @@ class Universe(object):
                 raise TypeError(
                     "Cannot find an appropriate coordinate reader for file '{0}'.\n"
                     "           {1}".format(filename, err))
-        # supply number of atoms for readers that cannot do it for themselves
-        kwargs['n_atoms'] = self.atoms.n_atoms
-
-        self.trajectory = reader(filename, **kwargs)    # unified trajectory API
+        # supply number of atoms for readers that cannot do it for themselves;
+        # when only some atoms are read it is the number of atoms in the file
+        if kwargs.get('atom_indices') is None or 'n_atoms' not in kwargs:
+            kwargs['n_atoms'] = self.atoms.n_atoms
+
+        if (cache and reader_format not in ('MEMORY', 'CHAIN') and
+                not util.isstream(filename)):
+            from ..coordinates.cache import cached_reader, topology_hash
+            # the frames in the cache depend on the atoms that are read and
+            # on the keywords that change the times and units of the frames
+            convert_units = kwargs.get('convert_units')
+            if convert_units is None:
+                convert_units = MDAnalysis.core.flags['convert_lengths']
+            topology = topology_hash(
+                self.atoms, kwargs.get('atom_indices'), kwargs.get('dt'),
+                kwargs.get('time_offset'), convert_units)
+            self.trajectory = cached_reader(
+                filename, lambda: reader(filename, **kwargs),
+                topology=topology, cache=cache)
+        else:
+            self.trajectory = reader(filename, **kwargs)    # unified trajectory API
         if self.trajectory.n_atoms != self.atoms.n_atoms:
             raise ValueError("The topology and {form} trajectory files don't"
                              " have the same number of atoms!\n"
@@ -4583,9 +4876,40 @@ class Universe(object):
                                  top_n_atoms=len(self.atoms),
                                  fname=filename,
                                  trj_n_atoms=self.trajectory.n_atoms))
+        if prefetch:
+            from ..coordinates.prefetch import PrefetchReader
+            self.trajectory = PrefetchReader(self.trajectory, n_frames=prefetch)
 
         return filename, self.trajectory.format
 
+    def transfer_to_memory(self, start=None, stop=None, step=None,
+                           dtype=np.float32):
+        """Replace the trajectory by a copy of its frames held in memory.
+
+        The frames ``trajectory[start:stop:step]`` are read into a
+        :class:`~MDAnalysis.coordinates.memory.MemoryReader`, which then
+        becomes :attr:`Universe.trajectory`. Afterwards, iterating over the
+        trajectory and jumping between frames does not access the file
+        anymore, and changes to the positions of atoms are kept when moving
+        to another frame.
+
+        Parameters
+        ----------
+        start, stop, step : int (optional)
+            frames to keep, as in a slice of the trajectory
+        dtype : numpy.dtype (optional)
+            data type of the coordinates in memory [numpy.float32]
+
+        .. versionadded:: 0.15.0
+        """
+        from ..coordinates.memory import MemoryReader
+
+        if (isinstance(self.trajectory, MemoryReader) and
+                (start, stop, step) == (None, None, None)):
+            return
+        self.trajectory = MemoryReader.from_reader(
+            self.trajectory, start=start, stop=stop, step=step, dtype=dtype)
+
     def select_atoms(self, sel, *othersel, **selgroups):
         """Selection of atoms using the MDAnalysis selection syntax.
 
@@ -21,9 +21,10 @@
 """
 
 __all__ = ['log', 'transformations', 'util', 'mdamath', 'distances',
-           'NeighborSearch', 'formats']
+           'NeighborSearch', 'formats', 'compressed']
 
 from . import log
+from . import compressed
 from . import transformations
 from . import util
 from . import mdamath
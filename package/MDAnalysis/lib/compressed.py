@@ -0,0 +1,469 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- http://www.MDAnalysis.org
+# Copyright (c) 2006-2015 Naveen Michaud-Agrawal, Elizabeth J. Denning, Oliver Beckstein
+# and contributors (see AUTHORS for the full list)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+
+"""
+Random access to compressed files --- :mod:`MDAnalysis.lib.compressed`
+======================================================================
+
+Seeking in a gzip or bzip2 compressed file with the :mod:`gzip` or :mod:`bz2`
+modules decompresses the file from its start, so that reading the frames of a
+compressed trajectory in random order costs time proportional to the size of
+the file for every frame. The file objects returned by :func:`open_gzip` and
+:func:`open_bz2` keep *seek points*, positions from which decompression can be
+restarted, so that a seek only decompresses the data between the nearest seek
+point and the new position. :func:`MDAnalysis.lib.util.anyopen` uses them for
+reading compressed files.
+
+gzip
+   Every *spacing* bytes of decompressed data, a copy of the state of the
+   decompressor is kept in memory. Seek points are added while the file is
+   read, so the first access to the end of the file still decompresses
+   everything before it. (The state of the decompressor cannot be stored on
+   disk with the :mod:`zlib` module.)
+
+bzip2
+   A bzip2 file consists of independently compressed blocks of at most
+   900 kB. The bit offsets of all blocks and the positions of their data in
+   the decompressed file are found by scanning the file once and stored in
+   a hidden file next to it (``.<filename>_seekpoints.npz``), so that a
+   seek decompresses at most one block. The index is only built on the
+   first seek backwards (beyond the start of the file) and reused as long
+   as the size and ctime of the file do not change.
+
+.. versionadded:: 0.15.0
+
+.. autofunction:: open_gzip
+.. autofunction:: open_bz2
+
+"""
+from __future__ import absolute_import
+
+import bisect
+import bz2
+import io
+import os
+import warnings
+import zlib
+
+import numpy as np
+import six
+
+#: bytes of compressed data that are read at a time
+READ_SIZE = 2**16
+#: maximum size of the decompressed data that is produced at a time
+CHUNK_SIZE = 2**18
+#: default distance between seek points (in decompressed bytes)
+SPACING = 2**22
+
+_GZIP_MAGIC = b'\x1f\x8b'
+_BZ2_MAGIC = b'BZh'
+#: start of a bzip2 block (BCD of pi)
+_BZ2_BLOCK_MAGIC = 0x314159265359
+#: end of a bzip2 stream (BCD of sqrt(pi))
+_BZ2_EOS_MAGIC = 0x177245385090
+_BZ2_EOS_BITS = np.unpackbits(np.frombuffer(
+    b'\x17\x72\x45\x38\x50\x90', dtype=np.uint8))
+
+
+def _open(raw, mode):
+    """buffered reader (text reader for mode 'rt' in Python 3) of *raw*"""
+    stream = io.BufferedReader(raw, buffer_size=READ_SIZE)
+    if six.PY3 and 't' in mode:
+        stream = io.TextIOWrapper(stream)
+    return stream
+
+
+def open_gzip(filename, mode='rb', spacing=SPACING):
+    """Open the gzip compressed file *filename* for reading with seek points
+
+    Parameters
+    ----------
+    filename : str
+        name of the file
+    mode : str (optional)
+        'r', 'rb' or 'rt' (returns text in Python 3)
+    spacing : int (optional)
+        distance of the seek points in decompressed bytes
+
+    Returns
+    -------
+    stream : :class:`io.BufferedReader`
+
+    Raises
+    ------
+    IOError
+        if the file is not gzip compressed
+    """
+    if not mode.startswith('r'):
+        raise ValueError("mode {0!r} is not supported".format(mode))
+    return _open(_GzipFile(filename, spacing=spacing), mode)
+
+
+def open_bz2(filename, mode='rb', spacing=SPACING):
+    """Open the bzip2 compressed file *filename* for reading with seek points
+
+    Parameters
+    ----------
+    filename : str
+        name of the file
+    mode : str (optional)
+        'r', 'rb' or 'rt' (returns text in Python 3)
+    spacing : int (optional)
+        seeking back to a position that is less than *spacing* bytes into
+        the file decompresses the file from the start instead of building
+        the block index
+
+    Returns
+    -------
+    stream : :class:`io.BufferedReader`
+
+    Raises
+    ------
+    IOError
+        if the file is not bzip2 compressed
+    """
+    if not mode.startswith('r'):
+        raise ValueError("mode {0!r} is not supported".format(mode))
+    return _open(_BZ2File(filename, spacing=spacing), mode)
+
+
+def seekpoints_filename(filename):
+    """name of the file with the bzip2 block index of *filename*"""
+    head, tail = os.path.split(filename)
+    return os.path.join(head, '.{0}_seekpoints.npz'.format(tail))
+
+
+class _CompressedFile(io.RawIOBase):
+    """Decompressed data of a file, read in chunks.
+
+    Subclasses decompress the chunks in :meth:`_decompress_next` and position
+    the decompressor in :meth:`_restart`.
+    """
+
+    def __init__(self, filename, magic, spacing):
+        super(_CompressedFile, self).__init__()
+        self.name = filename
+        self._spacing = spacing
+        self._file = open(filename, 'rb')
+        if self._file.read(len(magic)) != magic:
+            self._file.close()
+            raise IOError("{0} is not a {1} compressed file".format(
+                filename, self._compression))
+        self._file.seek(0)
+        self._pos = 0
+        self._chunk = b''
+        self._chunk_start = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def close(self):
+        if not self.closed:
+            self._file.close()
+        super(_CompressedFile, self).close()
+
+    def _advance(self):
+        """decompress the next chunk, ``False`` at the end of the file"""
+        self._chunk_start += len(self._chunk)
+        self._chunk = self._decompress_next()
+        return len(self._chunk) > 0
+
+    def readinto(self, b):
+        while self._pos >= self._chunk_start + len(self._chunk):
+            if not self._advance():
+                return 0
+        offset = self._pos - self._chunk_start
+        data = self._chunk[offset:offset + len(b)]
+        n = len(data)
+        b[:n] = data
+        self._pos += n
+        return n
+
+    def readall(self):
+        data = []
+        while self._pos >= self._chunk_start + len(self._chunk):
+            if not self._advance():
+                return b''
+        data.append(self._chunk[self._pos - self._chunk_start:])
+        while self._advance():
+            data.append(self._chunk)
+        self._pos = self._chunk_start + len(self._chunk)
+        return b''.join(data)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            # the size is only known after decompressing everything
+            while self._advance():
+                pass
+            offset += self._chunk_start
+        elif whence != io.SEEK_SET:
+            raise ValueError("invalid whence ({0})".format(whence))
+        if offset < 0:
+            raise IOError("negative seek position {0}".format(offset))
+        chunk_stop = self._chunk_start + len(self._chunk)
+        if not self._chunk_start <= offset < chunk_stop:
+            start = self._restart(offset, chunk_stop)
+            if start is not None:
+                self._chunk_start = start
+                self._chunk = b''
+        self._pos = offset
+        return offset
+
+
+class _GzipFile(_CompressedFile):
+    """gzip compressed file with seek points in memory"""
+    _compression = 'gzip'
+
+    def __init__(self, filename, spacing=SPACING):
+        super(_GzipFile, self).__init__(filename, _GZIP_MAGIC, spacing)
+        self._decompressor = self._new_decompressor()
+        self._input = b''
+        self._in_offset = 0  # offset of _input in the file
+        self._out_offset = 0  # offset of the next decompressed data
+        # seek points: decompressed offset, file offset, decompressor
+        self._seekpoints = [(0, 0, self._new_decompressor())]
+        self._seekpoint_offsets = [0]
+
+    @staticmethod
+    def _new_decompressor():
+        # decompress a gzip member including its header
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def _add_seekpoint(self):
+        if self._out_offset >= self._seekpoint_offsets[-1] + self._spacing:
+            self._seekpoints.append((self._out_offset, self._in_offset,
+                                     self._decompressor.copy()))
+            self._seekpoint_offsets.append(self._out_offset)
+
+    def _decompress_next(self):
+        while True:
+            self._add_seekpoint()
+            if not self._input:
+                self._input = self._file.read(READ_SIZE)
+                if not self._input:
+                    return b''
+            try:
+                data = self._decompressor.decompress(
+                    self._input, min(CHUNK_SIZE, self._spacing))
+            except zlib.error as err:
+                raise IOError("error decompressing {0}: {1}".format(
+                    self.name, err))
+            consumed = len(self._input) - len(
+                self._decompressor.unconsumed_tail)
+            self._input = self._decompressor.unconsumed_tail
+            unused = self._decompressor.unused_data
+            if unused:
+                # end of a gzip member, another member may follow
+                consumed -= len(unused)
+                self._input = unused
+                self._decompressor = self._new_decompressor()
+                if not unused.startswith(_GZIP_MAGIC[:len(unused)]):
+                    # trailing garbage (e.g. zero padding)
+                    self._input = b''
+                    self._file.seek(0, io.SEEK_END)
+            self._in_offset += consumed
+            self._out_offset += len(data)
+            if data:
+                return data
+
+    def _restart(self, offset, chunk_stop):
+        i = bisect.bisect_right(self._seekpoint_offsets, offset) - 1
+        out_offset, in_offset, decompressor = self._seekpoints[i]
+        if chunk_stop <= offset and out_offset <= chunk_stop:
+            # decompressing from the current position is as fast
+            return None
+        self._decompressor = decompressor.copy()
+        self._file.seek(in_offset)
+        self._input = b''
+        self._in_offset = in_offset
+        self._out_offset = out_offset
+        return out_offset
+
+
+def _find_bits(data, pattern, n_bits=48):
+    """Bit offsets of all occurrences of the *n_bits* long *pattern* in
+    *data*"""
+    found = []
+    for shift in range(8):
+        n_bytes = (shift + n_bits + 7) // 8
+        tail = 8 * n_bytes - shift - n_bits
+        value = bytearray.fromhex('{0:0{1}x}'.format(pattern << tail,
+                                                     2 * n_bytes))
+        # search for the bytes that are completely covered by the pattern
+        # and compare the partially covered bytes afterwards
+        first = 1 if shift else 0
+        last = n_bytes - 1 if tail else n_bytes
+        needle = bytes(value[first:last])
+        head_mask = 0xff >> shift
+        tail_mask = (0xff << tail) & 0xff
+        i = data.find(needle)
+        while i >= 0:
+            start = i - first
+            if (start >= 0 and start + n_bytes <= len(data) and
+                    (not shift or
+                     bytearray(data[start:start + 1])[0] & head_mask ==
+                     value[0]) and
+                    (not tail or
+                     bytearray(data[start + n_bytes - 1:start + n_bytes])[0] &
+                     tail_mask == value[-1])):
+                found.append(8 * start + shift)
+            i = data.find(needle, i + 1)
+    return found
+
+
+class _BZ2File(_CompressedFile):
+    """bzip2 compressed file with an index of its blocks"""
+    _compression = 'bzip2'
+
+    def __init__(self, filename, spacing=SPACING):
+        super(_BZ2File, self).__init__(filename, _BZ2_MAGIC, spacing)
+        self._decompressor = bz2.BZ2Decompressor()
+        self._index = None
+        self._index_loaded = False
+        self._block = -1  # block of the current chunk if the index is used
+
+    def _decompress_next(self):
+        if self._index is not None:
+            return self._decompress_block(self._block + 1)
+        while True:
+            data = self._file.read(READ_SIZE)
+            if not data:
+                return b''
+            try:
+                data = self._decompressor.decompress(data)
+            except EOFError:
+                # another stream follows the end of the last one
+                self._decompressor = bz2.BZ2Decompressor()
+                data = self._decompressor.decompress(data)
+            except (IOError, ValueError) as err:
+                raise IOError("error decompressing {0}: {1}".format(
+                    self.name, err))
+            unused = self._decompressor.unused_data
+            if unused:
+                self._decompressor = bz2.BZ2Decompressor()
+                if unused.startswith(_BZ2_MAGIC[:len(unused)]):
+                    data += self._decompressor.decompress(unused)
+                else:
+                    self._file.seek(0, io.SEEK_END)
+            if data:
+                return data
+
+    def _decompress_block(self, block):
+        starts, stops, offsets = self._index
+        if block >= len(starts):
+            return b''
+        self._block = block
+        return _decompress_bz2_block(self._file, starts[block], stops[block])
+
+    def _restart(self, offset, chunk_stop):
+        if not self._index_loaded:
+            self._index_loaded = True
+            self._index = self._load_index()
+        if self._index is None:
+            if offset >= chunk_stop:
+                return None
+            if offset >= self._spacing:
+                self._index = self._build_index()
+            else:
+                # close to the start of the file
+                self._file.seek(0)
+                self._decompressor = bz2.BZ2Decompressor()
+                return 0
+        offsets = self._index[2]
+        if not len(offsets):
+            # no data in the file
+            self._block = -1
+            return 0
+        block = max(np.searchsorted(offsets, offset, side='right') - 1, 0)
+        self._block = block - 1
+        return int(offsets[block])
+
+    def _load_index(self):
+        filename = seekpoints_filename(self.name)
+        if not os.path.isfile(filename):
+            return None
+        try:
+            with np.load(filename) as index:
+                if (index['size'] != os.path.getsize(self.name) or
+                        index['ctime'] != os.path.getctime(self.name)):
+                    return None
+                return index['starts'], index['stops'], index['offsets']
+        except Exception:
+            return None
+
+    def _build_index(self):
+        """Find all blocks and the offsets of their decompressed data"""
+        blocks, ends = [], []
+        overlap = 7  # a pattern can start in the last bytes of a read
+        position = 0
+        f = self._file
+        f.seek(0)
+        data = b''
+        while True:
+            block = f.read(2**22)
+            if not block:
+                break
+            data = data[-overlap:] + block
+            offset = 8 * (position - (len(data) - len(block)))
+            blocks.extend(offset + b for b in
+                          _find_bits(data, _BZ2_BLOCK_MAGIC))
+            ends.extend(offset + b for b in _find_bits(data, _BZ2_EOS_MAGIC))
+            position += len(block)
+        blocks = np.unique(blocks).astype(np.int64)
+        ends = np.unique(ends).astype(np.int64)
+        # a block ends where the next block or the end of the stream starts
+        # (or at the end of a truncated file)
+        boundaries = np.append(np.union1d(blocks, ends), 8 * position)
+        stops = boundaries[np.searchsorted(boundaries, blocks) + 1]
+        sizes = [len(_decompress_bz2_block(f, start, stop))
+                 for start, stop in zip(blocks, stops)]
+        offsets = np.zeros(len(blocks), dtype=np.int64)
+        offsets[1:] = np.cumsum(sizes)[:-1]
+        try:
+            np.savez(seekpoints_filename(self.name), starts=blocks,
+                     stops=stops, offsets=offsets,
+                     size=os.path.getsize(self.name),
+                     ctime=os.path.getctime(self.name))
+        except Exception as e:
+            warnings.warn("Couldn't save seek points because: {0}".format(e))
+        return blocks, stops, offsets
+
+
+def _decompress_bz2_block(f, start, stop):
+    """Decompress the block between the bit offsets *start* and *stop*
+
+    The block is shifted to a byte boundary and made a stream of its own,
+    whose CRC is the CRC of the block.
+    """
+    f.seek(start // 8)
+    data = f.read((stop + 7) // 8 - start // 8)
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+    bits = bits[start % 8:start % 8 + stop - start]
+    crc = bits[48:80]
+    stream = np.packbits(np.concatenate([bits, _BZ2_EOS_BITS, crc]))
+    try:
+        return bz2.decompress(b'BZh9' + stream.tobytes())
+    except (IOError, ValueError, EOFError) as err:
+        raise IOError("error decompressing bzip2 block at bit {0}: {1}"
+                      "".format(start, err))
@@ -16,7 +16,8 @@
 import numpy as np
 cimport numpy as np
 
-from libc.stdlib cimport free
+from libc.stdlib cimport free, strtod
+from libc.string cimport memcpy
 from cpython cimport PyObject, Py_INCREF
 
 np.import_array()
@@ -111,3 +112,82 @@ cdef np.ndarray ptr_to_ndarray(void* data_ptr, np.int64_t[:] dim, int data_type)
     Py_INCREF(array_wrapper)
 
     return ndarray
+
+
+# longest field that is converted with strtod(), longer fields use float()
+DEF MAX_FIELD = 63
+
+
+cdef inline bint _is_space(char c) nogil:
+    return c == b' ' or c == b'\t' or c == b'\n' or c == b'\r'
+
+
+cdef inline bint _is_number_char(char c) nogil:
+    # characters that strtod() and float() treat in the same way
+    return (b'0' <= c <= b'9' or c == b'.' or c == b'-' or c == b'+' or
+            c == b'e' or c == b'E' or _is_space(c))
+
+
+cdef bint _parse_field(const char* field, Py_ssize_t length,
+                       double* value) nogil:
+    """Convert *length* characters at *field* with strtod(); return 0 if the
+    field has to be converted by float() instead."""
+    cdef char buf[MAX_FIELD + 1]
+    cdef char* end
+    cdef Py_ssize_t i
+    if length > MAX_FIELD:
+        return 0
+    for i in range(length):
+        if not _is_number_char(field[i]):
+            return 0
+    memcpy(buf, field, length)
+    buf[length] = 0
+    value[0] = strtod(buf, &end)
+    if end == buf:
+        return 0
+    while end[0] != 0:
+        if not _is_space(end[0]):
+            return 0
+        end += 1
+    return 1
+
+
+def parse_fixed_columns(lines, np.intp_t[:] starts, np.intp_t[:] stops,
+                        double[:, :] out, missing=None):
+    """Convert the fields ``line[starts[j]:stops[j]]`` of *lines* to numbers
+    in ``out[i, j]``.
+
+    Fields are converted with C ``strtod()``; fields that ``strtod()`` might
+    read differently from :func:`float` are converted with :func:`float`.
+    Fields that are not numbers are set to *missing*, or raise a
+    :exc:`ValueError` if *missing* is ``None``.
+
+    .. versionadded:: 0.15.0
+    """
+    cdef Py_ssize_t i, j, start, stop, length
+    cdef const char* data
+    cdef bytes line
+    cdef double value
+    cdef Py_ssize_t n_columns = starts.shape[0]
+
+    for i, text in enumerate(lines):
+        if isinstance(text, bytes):
+            line = text
+        else:
+            line = text.encode('ascii', 'replace')
+        data = line
+        length = len(line)
+        for j in range(n_columns):
+            start = min(starts[j], length)
+            stop = min(stops[j], length)
+            if _parse_field(data + start, stop - start, &value):
+                out[i, j] = value
+                continue
+            field = line[start:stop].decode('ascii', 'replace')
+            try:
+                out[i, j] = float(field)
+            except ValueError:
+                if missing is None:
+                    raise ValueError("could not convert {0!r} in line {1:d} "
+                                     "to a number".format(field, i + 1))
+                out[i, j] = missing
@@ -28,6 +28,12 @@ extern "C" {
 extern int read_trr_n_frames(char *fn, int *n_frames, int *est_nframes,
                              int64_t **offsets);
 
+/* Same as read_trr_n_frames, but start indexing at the frame beginning at byte
+ * offset start. The offsets returned start with start. Frames that are not
+ * completely written yet are not counted. */
+extern int read_trr_n_frames_from(char *fn, int64_t start, int *n_frames,
+                                  int *est_nframes, int64_t **offsets);
+
 /* Minimum TRR header size. It can have 8 bytes more if we have double time and
  * lambda. */
 #define TRR_MIN_HEADER_SIZE 54
@@ -631,6 +631,40 @@ extern "C"
     int64_t xdr_tell(XDRFILE *xd);
     int xdr_seek(XDRFILE *xd, int64_t pos, int whence);
 
+	/*! \brief Open an anonymous temporary file for writing
+	 *
+	 *  Frames written to the temporary file are taken out again as raw
+	 *  bytes with xdrfile_tmp_take(), which allows to encode frames in
+	 *  separate threads and write them to the real file in order with
+	 *  xdrfile_write_raw().
+	 *
+	 *  \return Pointer to abstract xdr file datatype, or NULL if an error occurs.
+	 */
+	XDRFILE *
+	xdrfile_open_tmp(void);
+
+	/*! \brief Take the bytes written to a temporary file
+	 *
+	 *  All bytes written since the file was opened or since the last call
+	 *  are copied into a newly allocated buffer (to be freed by the caller)
+	 *  and the file is rewound.
+	 *
+	 *  \param xfp     Handle created with xdrfile_open_tmp()
+	 *  \param buf     Set to the allocated buffer
+	 *  \param nbytes  Set to the number of bytes in the buffer
+	 *
+	 *  \return        exdrOK on success
+	 */
+	int
+	xdrfile_tmp_take(XDRFILE *xfp, char **buf, int64_t *nbytes);
+
+	/*! \brief Write raw (already encoded) bytes
+	 *
+	 *  \return        exdrOK on success
+	 */
+	int
+	xdrfile_write_raw(XDRFILE *xfp, const char *buf, int64_t nbytes);
+
 #ifdef __cplusplus
 }
 #endif
@@ -27,6 +27,12 @@ extern "C" {
 extern int read_xtc_n_frames(char *fn, int *n_frames, int *est_nframes,
                              int64_t **offsets);
 
+/* Same as read_xtc_n_frames, but start indexing at the frame beginning at byte
+ * offset start. The offsets returned start with start. Frames that are not
+ * completely written yet are not counted. */
+extern int read_xtc_n_frames_from(char *fn, int64_t start, int *n_frames,
+                                  int *est_nframes, int64_t **offsets);
+
 /* XTC header fields until coord floats: *** only for trajectories of less than
  * 10 atoms! ***  */
 /* magic natoms step time DIM*DIM_box_vecs natoms */
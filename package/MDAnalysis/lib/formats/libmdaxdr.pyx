@@ -17,11 +17,12 @@ cimport numpy as np
 cimport cython
 from cython_util cimport ptr_to_ndarray
 from libc.stdint cimport int64_t
+from libc.stdlib cimport malloc, free
 
 from libc.stdio cimport SEEK_SET, SEEK_CUR, SEEK_END
 _whence_vals = {"SEEK_SET": SEEK_SET, "SEEK_CUR": SEEK_CUR, "SEEK_END": SEEK_END}
 
-cdef extern from 'include/xdrfile.h':
+cdef extern from 'include/xdrfile.h' nogil:
     ctypedef struct XDRFILE:
         pass
 
@@ -29,11 +30,14 @@ cdef extern from 'include/xdrfile.h':
     int xdrfile_close (XDRFILE * xfp)
     int xdr_seek(XDRFILE *xfp, int64_t pos, int whence)
     int64_t xdr_tell(XDRFILE *xfp)
+    XDRFILE* xdrfile_open_tmp()
+    int xdrfile_tmp_take(XDRFILE *xfp, char **buf, int64_t *nbytes)
+    int xdrfile_write_raw(XDRFILE *xfp, char *buf, int64_t nbytes)
     ctypedef float matrix[3][3]
     ctypedef float rvec[3]
 
 
-cdef extern from 'include/xdrfile_xtc.h':
+cdef extern from 'include/xdrfile_xtc.h' nogil:
     int read_xtc_natoms(char * fname, int * natoms)
     int read_xtc(XDRFILE * xfp, int natoms, int * step, float * time, matrix box,
                  rvec * x, float * prec)
@@ -42,7 +46,7 @@ cdef extern from 'include/xdrfile_xtc.h':
 
 
 
-cdef extern from 'include/xdrfile_trr.h':
+cdef extern from 'include/xdrfile_trr.h' nogil:
     int read_trr_natoms(char *fname, int *natoms)
     int read_trr(XDRFILE *xfp, int natoms, int *step, float *time, float *_lambda,
                  matrix box, rvec *x, rvec *v, rvec *f, int *has_prop)
@@ -52,10 +56,14 @@ cdef extern from 'include/xdrfile_trr.h':
 
 cdef extern from 'include/xtc_seek.h':
     int read_xtc_n_frames(char *fn, int *n_frames, int *est_nframes, int64_t **offsets)
+    int read_xtc_n_frames_from(char *fn, int64_t start, int *n_frames,
+                              int *est_nframes, int64_t **offsets)
 
 
 cdef extern from 'include/trr_seek.h':
     int read_trr_n_frames(char *fn, int *n_frames, int *est_nframes, int64_t **offsets)
+    int read_trr_n_frames_from(char *fn, int64_t start, int *n_frames,
+                              int *est_nframes, int64_t **offsets)
 
 
 cdef enum:
@@ -80,6 +88,7 @@ error_message = ['OK', 'header', 'string', 'double', 'integer',
 
 import cython
 import numpy as np
+import threading
 from os.path import exists
 from collections import namedtuple
 
@@ -342,6 +351,201 @@ cdef class _XDRFile:
         """Low-level call to xdr_tell to get current byte offset."""
         return xdr_tell(self.xfp)
 
+    cdef int _read_xyz(self, XDRFILE* xfp, float* xyz, int* has_x) nogil:
+        """read the coordinates of the next frame in *xfp* into *xyz*
+
+        Implemented by the subclasses. Returns the XDR return code; *has_x* is
+        set to 0 if the frame contains no coordinates.
+        """
+        return EHEADER
+
+    cdef int _read_chunk(self, char* fname, int64_t* offsets, int n_frames,
+                         np.intp_t* indices, int n_selected, float* xyz,
+                         np.uint8_t* has_x) nogil:
+        """decode the frames at *offsets* into consecutive blocks of *xyz*
+
+        A new handle on *fname* is opened, so that several chunks can be
+        decoded at the same time in different threads. If *indices* is not
+        NULL only these atoms are copied into *xyz*. Returns the XDR return
+        code, or -1 if the file could not be opened or seeked.
+        """
+        cdef XDRFILE* xfp = xdrfile_open(fname, 'r')
+        cdef float* buf = NULL
+        cdef float* target
+        cdef int i, j, k, frame_has_x
+        cdef int return_code = EOK
+        if xfp == NULL:
+            return -1
+        if indices != NULL:
+            buf = <float*>malloc(self.n_atoms * DIMS * sizeof(float))
+            if buf == NULL:
+                xdrfile_close(xfp)
+                return EMEMORY
+        for i in range(n_frames):
+            if xdr_seek(xfp, offsets[i], SEEK_SET) != EOK:
+                return_code = -1
+                break
+            target = buf if indices != NULL else xyz + i * n_selected * DIMS
+            return_code = self._read_xyz(xfp, target, &frame_has_x)
+            if return_code != EOK:
+                break
+            has_x[i] = frame_has_x
+            if indices != NULL:
+                for j in range(n_selected):
+                    for k in range(DIMS):
+                        xyz[(i * n_selected + j) * DIMS + k] = \
+                            buf[indices[j] * DIMS + k]
+        free(buf)
+        xdrfile_close(xfp)
+        return return_code
+
+    def read_frames(self, start=None, stop=None, step=None,
+                    atom_indices=None, n_threads=1):
+        """Read the coordinates of several frames at once
+
+        The coordinates are decoded directly into one preallocated array,
+        without creating a frame object for each frame. Frames are selected
+        as with a python slice of the trajectory.
+
+        With more than one thread, the frames are split in contiguous chunks
+        that are decoded at the same time, each thread using its own file
+        handle and the frame offsets to find its frames. Decompressing XTC
+        frames is CPU bound, so this scales with the number of cores as long
+        as the disk keeps up.
+
+        Parameters
+        ----------
+        start, stop, step : int (optional)
+            slice of the frames to read
+        atom_indices : array_like (optional)
+            indices of the atoms to return. All atoms are returned if
+            ``None``.
+        n_threads : int (optional)
+            number of threads decoding frames in parallel
+
+        Returns
+        -------
+        xyz : ndarray, shape=(n_frames, n_atoms, 3), dtype=float32
+            coordinates of the selected atoms in the selected frames. Frames
+            that contain no coordinates (possible in TRR files) are filled
+            with ``nan``.
+
+        Raises
+        ------
+        RuntimeError
+            If the file is not opened for reading
+        IOError
+            Something must have happened reading the file
+        IndexError
+            If an atom index is out of range
+        """
+        if not self.is_open:
+            raise RuntimeError('No file opened')
+        if self.mode != 'r':
+            raise RuntimeError('File opened in mode: {}. Reading only allow '
+                               'in mode "r"'.format(self.mode))
+
+        cdef np.ndarray frames = np.arange(len(self))[start:stop:step]
+        cdef np.ndarray indices = None
+        cdef int n_selected = self.n_atoms
+        if atom_indices is not None:
+            indices = np.array(atom_indices, dtype=np.intp, ndmin=1)
+            if indices.size and (indices.min() < -self.n_atoms or
+                                 indices.max() >= self.n_atoms):
+                raise IndexError('atom indices out of range for {} '
+                                 'atoms'.format(self.n_atoms))
+            indices[indices < 0] += self.n_atoms
+            n_selected = indices.size
+
+        cdef np.ndarray xyz = np.empty((frames.size, n_selected, DIMS),
+                                       dtype=DTYPE)
+        cdef np.ndarray has_x = np.ones(frames.size, dtype=np.uint8)
+        if frames.size == 0:
+            return xyz
+
+        if n_threads > 1 and frames.size > 1:
+            self._read_frames_parallel(frames, indices, xyz, has_x, n_threads)
+        else:
+            self._read_frames_serial(frames, indices, xyz, has_x)
+
+        xyz[has_x == 0] = np.nan
+        return xyz
+
+    def _read_frames_serial(self, np.ndarray frames, np.ndarray indices,
+                            np.ndarray xyz, np.ndarray has_x):
+        """decode frames one after the other with the open file handle"""
+        cdef int n_selected = xyz.shape[1]
+        cdef np.ndarray buf
+        cdef int i, frame, return_code, frame_has_x
+        cdef float* target
+        if indices is not None:
+            # full frames are decoded in here and the selection copied out
+            buf = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
+        for i in range(frames.size):
+            frame = frames[i]
+            if frame != self.current_frame or self.reached_eof:
+                self.seek(frame)
+            if indices is None:
+                target = <float*>xyz.data + i * n_selected * DIMS
+            else:
+                target = <float*>buf.data
+            return_code = self._read_xyz(self.xfp, target, &frame_has_x)
+            if return_code != EOK:
+                raise IOError('XDR read error = {} in frame {}'.format(
+                    error_message[return_code], frame))
+            self.current_frame += 1
+            has_x[i] = frame_has_x
+            if indices is not None and frame_has_x:
+                np.take(buf, indices, axis=0, out=xyz[i])
+
+    def _read_frames_parallel(self, np.ndarray frames, np.ndarray indices,
+                              np.ndarray xyz, np.ndarray has_x, n_threads):
+        """decode contiguous chunks of frames in parallel threads"""
+        cdef np.ndarray offsets = np.ascontiguousarray(self.offsets[frames],
+                                                       dtype=np.int64)
+        chunks = [c for c in np.array_split(np.arange(frames.size), n_threads)
+                  if c.size]
+        return_codes = [EOK] * len(chunks)
+
+        def decode(n, first, count):
+            return_codes[n] = self._decode_chunk(offsets, first, count,
+                                                 indices, xyz, has_x)
+
+        threads = [threading.Thread(target=decode, args=(n, c[0], c.size))
+                   for n, c in enumerate(chunks)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for n, return_code in enumerate(return_codes):
+            if return_code != EOK:
+                if return_code < 0:
+                    message = 'could not open or seek the file'
+                else:
+                    message = error_message[return_code]
+                raise IOError('XDR read error = {} in frames {}-{}'.format(
+                    message, frames[chunks[n][0]], frames[chunks[n][-1]]))
+
+    def _decode_chunk(self, np.ndarray offsets, int first, int count,
+                      np.ndarray indices, np.ndarray xyz, np.ndarray has_x):
+        """decode *count* frames starting at *first* without holding the GIL"""
+        cdef int n_selected = xyz.shape[1]
+        cdef bytes fname = self.fname
+        cdef char* c_fname = fname
+        cdef int64_t* c_offsets = <int64_t*>offsets.data + first
+        cdef np.intp_t* c_indices = NULL
+        cdef float* c_xyz = <float*>xyz.data + first * n_selected * DIMS
+        cdef np.uint8_t* c_has_x = <np.uint8_t*>has_x.data + first
+        cdef int return_code
+        if indices is not None:
+            c_indices = <np.intp_t*>indices.data
+        with nogil:
+            return_code = self._read_chunk(c_fname, c_offsets, count,
+                                           c_indices, n_selected, c_xyz,
+                                           c_has_x)
+        return return_code
+
 
 TRRFrame = namedtuple('TRRFrame', 'x v f box step time lmbda hasx hasv hasf')
 
@@ -374,14 +578,33 @@ cdef class TRRFile(_XDRFile):
         return return_code, n_atoms
 
 
-    def calc_offsets(self):
-        """read byte offsets from TRR file directly"""
+    def calc_offsets(self, start=0):
+        """read byte offsets from TRR file directly
+
+        Parameters
+        ----------
+        start : int (optional)
+            byte offset of a frame in the file. Only the frames from there
+            to the end of the file are indexed, which allows to extend known
+            offsets of a file that is still growing. Frames that are not
+            completely written yet are not counted.
+
+        Returns
+        -------
+        offsets : ndarray
+            byte offsets of the frames, the first one being `start`
+
+        .. versionchanged:: 0.15.0
+           added `start` keyword
+        """
         if not self.is_open:
             return np.array([])
         cdef int n_frames = 0
         cdef int est_nframes = 0
         cdef int64_t* offsets = NULL
-        ok = read_trr_n_frames(self.fname, &n_frames, &est_nframes, &offsets)
+        cdef int64_t c_start = start
+        ok = read_trr_n_frames_from(self.fname, c_start, &n_frames,
+                                  &est_nframes, &offsets)
         if ok != EOK:
             raise RuntimeError("TRR couldn't calculate offsets. "
                                "XDR error = {}".format(error_message[ok]))
@@ -418,7 +641,7 @@ cdef class TRRFile(_XDRFile):
             raise RuntimeError('No file opened')
         if self.mode != 'r':
             raise RuntimeError('File opened in mode: {}. Reading only allow '
-                               'in mode "r"'.format('self.mode'))
+                               'in mode "r"'.format(self.mode))
 
         return_code = 1
         cdef int step = 0
@@ -463,6 +686,18 @@ cdef class TRRFile(_XDRFile):
         return TRRFrame(xyz, velocity, forces, box, step, time, lmbda,
                         has_x, has_v, has_f)
 
+    cdef int _read_xyz(self, XDRFILE* xfp, float* xyz, int* has_x) nogil:
+        cdef int step = 0
+        cdef int has_prop = 0
+        cdef float time = 0
+        cdef float lmbda = 0
+        cdef matrix box
+        cdef int return_code = read_trr(xfp, self.n_atoms, &step, &time,
+                                        &lmbda, box, <rvec*>xyz, NULL, NULL,
+                                        &has_prop)
+        has_x[0] = has_prop & HASX
+        return return_code
+
     def write(self, xyz, velocity, forces, box, int step, float time,
               float _lambda, int natoms):
         """write one frame into TRR file.
@@ -491,7 +726,7 @@ cdef class TRRFile(_XDRFile):
         """
         if self.mode != 'w' :
             raise RuntimeError('File opened in mode: {}. Writing only allow '
-                               'in mode "w"'.format('self.mode'))
+                               'in mode "w"'.format(self.mode))
 
         cdef float* xyz_ptr = NULL
         cdef float* velocity_ptr = NULL
@@ -539,11 +774,14 @@ cdef class TRRFile(_XDRFile):
                                  'are trying to write {} atoms.'.format(
                                      self.n_atoms, forces.shape[0]))
 
-        return_code = write_trr(self.xfp, self.n_atoms, step, time,
-                                       _lambda, <matrix> box_ptr,
-                                       <rvec*> xyz_ptr,
-                                       <rvec*> velocity_ptr,
-                                       <rvec*> forces_ptr)
+        cdef int return_code
+        cdef int n_atoms = self.n_atoms
+        with nogil:
+            return_code = write_trr(self.xfp, n_atoms, step, time,
+                                    _lambda, <matrix> box_ptr,
+                                    <rvec*> xyz_ptr,
+                                    <rvec*> velocity_ptr,
+                                    <rvec*> forces_ptr)
         if return_code != EOK:
             raise IOError('TRR write error = {}'.format(
                 error_message[return_code]))
@@ -583,14 +821,33 @@ cdef class XTCFile(_XDRFile):
         return return_code, n_atoms
 
 
-    def calc_offsets(self):
-        """Calculate offsets from XTC file directly"""
+    def calc_offsets(self, start=0):
+        """Calculate offsets from XTC file directly
+
+        Parameters
+        ----------
+        start : int (optional)
+            byte offset of a frame in the file. Only the frames from there
+            to the end of the file are indexed, which allows to extend known
+            offsets of a file that is still growing. Frames that are not
+            completely written yet are not counted.
+
+        Returns
+        -------
+        offsets : ndarray
+            byte offsets of the frames, the first one being `start`
+
+        .. versionchanged:: 0.15.0
+           added `start` keyword
+        """
         if not self.is_open:
             return np.array([])
         cdef int n_frames = 0
         cdef int est_nframes = 0
         cdef int64_t* offsets = NULL
-        ok = read_xtc_n_frames(self.fname, &n_frames, &est_nframes, &offsets)
+        cdef int64_t c_start = start
+        ok = read_xtc_n_frames_from(self.fname, c_start, &n_frames,
+                                  &est_nframes, &offsets)
         if ok != EOK:
             raise RuntimeError("XTC couldn't calculate offsets. "
                                "XDR error = {}".format(error_message[ok]))
@@ -627,7 +884,7 @@ cdef class XTCFile(_XDRFile):
             raise RuntimeError('No file opened')
         if self.mode != 'r':
             raise RuntimeError('File opened in mode: {}. Reading only allow '
-                               'in mode "r"'.format('self.mode'))
+                               'in mode "r"'.format(self.mode))
 
         return_code = 1
         cdef int step
@@ -651,6 +908,14 @@ cdef class XTCFile(_XDRFile):
             self.current_frame += 1
         return XTCFrame(xyz, box, step, time, prec)
 
+    cdef int _read_xyz(self, XDRFILE* xfp, float* xyz, int* has_x) nogil:
+        cdef int step
+        cdef float time, prec
+        cdef matrix box
+        has_x[0] = 1
+        return read_xtc(xfp, self.n_atoms, &step, &time, box, <rvec*>xyz,
+                        &prec)
+
     def write(self, xyz, box, int step, float time, float precision=1000):
         """write one frame to the XTC file
 
@@ -684,7 +949,7 @@ cdef class XTCFile(_XDRFile):
         """
         if self.mode != 'w':
             raise RuntimeError('File opened in mode: {}. Writing only allow '
-                               'in mode "w"'.format('self.mode'))
+                               'in mode "w"'.format(self.mode))
 
         cdef DTYPE_T[:, ::1] xyz_view = np.ascontiguousarray(xyz, dtype=DTYPE)
         cdef DTYPE_T[:, ::1] box_view = np.ascontiguousarray(box, dtype=DTYPE)
@@ -703,11 +968,150 @@ cdef class XTCFile(_XDRFile):
                                  'are trying to use {}'.format(
                                      self.precision, precision))
 
-        return_code = write_xtc(self.xfp, self.n_atoms, step, time,
-                                       <matrix>&box_view[0, 0],
-                                       <rvec*>&xyz_view[0, 0], precision)
+        cdef int return_code
+        cdef int n_atoms = self.n_atoms
+        # compression does not need the GIL, other threads can go on reading
+        with nogil:
+            return_code = write_xtc(self.xfp, n_atoms, step, time,
+                                    <matrix>&box_view[0, 0],
+                                    <rvec*>&xyz_view[0, 0], precision)
         if return_code != EOK:
             raise IOError('XTC write error = {}'.format(
                 error_message[return_code]))
 
         self.current_frame += 1
+
+    def write_frames(self, xyz, box, step, time, float precision=1000,
+                     n_threads=1):
+        """write several frames to the XTC file
+
+        With more than one thread, the frames are split in contiguous chunks
+        that are compressed at the same time, each thread encoding its frames
+        into its own temporary file. The compressed frames are then written
+        to the XTC file in order. Compressing XTC frames is CPU bound, so
+        this scales with the number of cores.
+
+        Parameters
+        ----------
+        xyz : ndarray, shape=(n_frames, n_atoms, 3)
+            cartesion coordinates
+        box : ndarray, shape=(n_frames, 3, 3)
+            Box vectors of the frames
+        step : array_like, shape=(n_frames,)
+            step numbers of the frames
+        time : array_like, shape=(n_frames,)
+            times of the frames
+        precision : float (optional)
+            precision of saved trajectory, see :meth:`write`
+        n_threads : int (optional)
+            number of threads compressing frames in parallel
+
+        Raises
+        ------
+        RuntimeError
+            Couldn't write the file
+        ValueError
+            The arguments to not match with previous saved frames.
+        """
+        xyz = np.ascontiguousarray(xyz, dtype=DTYPE)
+        box = np.ascontiguousarray(box, dtype=DTYPE)
+        step = np.ascontiguousarray(step, dtype=np.intc)
+        time = np.ascontiguousarray(time, dtype=DTYPE)
+        cdef int i, return_code = EOK
+        cdef int n_frames = len(xyz)
+        if (xyz.ndim != 3 or box.shape != (n_frames, DIMS, DIMS) or
+                step.shape != (n_frames,) or time.shape != (n_frames,)):
+            raise ValueError('xyz, box, step and time must contain the same '
+                             'number of frames')
+        if n_frames == 0:
+            return
+        if n_threads <= 1 or n_frames == 1:
+            for i in range(n_frames):
+                self.write(xyz[i], box[i], step[i], time[i], precision)
+            return
+
+        if self.mode != 'w':
+            raise RuntimeError('File opened in mode: {}. Writing only allow '
+                               'in mode "w"'.format(self.mode))
+        if self.current_frame == 0:
+            self.n_atoms = xyz.shape[1]
+            self.box = box[0]
+            self.precision = precision
+        else:
+            if self.n_atoms != xyz.shape[1]:
+                raise ValueError('Previous frames contained {} atoms. You '
+                                 'are trying to write {} atoms.'.format(
+                                     self.n_atoms, xyz.shape[1]))
+            if self.precision != precision:
+                raise ValueError('Previous frames used precision of {}. You '
+                                 'are trying to use {}'.format(
+                                     self.precision, precision))
+
+        # compressed frames, as malloc'ed buffers and their sizes
+        cdef np.ndarray buffers = np.zeros(n_frames, dtype=np.uintp)
+        cdef np.ndarray sizes = np.zeros(n_frames, dtype=np.int64)
+        chunks = [c for c in np.array_split(np.arange(n_frames), n_threads)
+                  if c.size]
+        return_codes = [EOK] * len(chunks)
+
+        def compress(n, first, count):
+            return_codes[n] = self._compress_chunk(
+                first, count, xyz, box, step, time, precision, buffers,
+                sizes)
+
+        try:
+            threads = [threading.Thread(target=compress,
+                                        args=(n, c[0], c.size))
+                       for n, c in enumerate(chunks)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            for return_code in return_codes:
+                if return_code != EOK:
+                    raise IOError('XTC write error = {}'.format(
+                        error_message[return_code]))
+            for i in range(n_frames):
+                return_code = xdrfile_write_raw(
+                    self.xfp, <char*><size_t>buffers[i], sizes[i])
+                if return_code != EOK:
+                    raise IOError('XTC write error = {}'.format(
+                        error_message[return_code]))
+                self.current_frame += 1
+        finally:
+            for i in range(n_frames):
+                free(<void*><size_t>buffers[i])
+
+    def _compress_chunk(self, int first, int count, np.ndarray xyz,
+                        np.ndarray box, np.ndarray steps, np.ndarray times,
+                        float precision, np.ndarray buffers,
+                        np.ndarray sizes):
+        """compress *count* frames starting at *first* without the GIL"""
+        cdef int n_atoms = self.n_atoms
+        cdef float* c_xyz = <float*>xyz.data + first * n_atoms * DIMS
+        cdef float* c_box = <float*>box.data + first * DIMS * DIMS
+        cdef int* c_steps = <int*>steps.data + first
+        cdef float* c_times = <float*>times.data + first
+        cdef size_t* c_buffers = <size_t*>buffers.data + first
+        cdef int64_t* c_sizes = <int64_t*>sizes.data + first
+        cdef char* buf
+        cdef int i, return_code = EOK
+        cdef XDRFILE* xfp
+        with nogil:
+            xfp = xdrfile_open_tmp()
+            if xfp == NULL:
+                return_code = EMEMORY
+            else:
+                for i in range(count):
+                    return_code = write_xtc(
+                        xfp, n_atoms, c_steps[i], c_times[i],
+                        <matrix>(c_box + i * DIMS * DIMS),
+                        <rvec*>(c_xyz + i * n_atoms * DIMS), precision)
+                    if return_code != EOK:
+                        break
+                    return_code = xdrfile_tmp_take(xfp, &buf, &c_sizes[i])
+                    if return_code != EOK:
+                        break
+                    c_buffers[i] = <size_t>buf
+                xdrfile_close(xfp)
+        return return_code
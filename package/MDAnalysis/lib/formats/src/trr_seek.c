@@ -24,6 +24,11 @@
 
 int read_trr_n_frames(char *fn, int *n_frames, int *est_nframes,
                       int64_t **offsets) {
+  return read_trr_n_frames_from(fn, 0L, n_frames, est_nframes, offsets);
+}
+
+int read_trr_n_frames_from(char *fn, int64_t start, int *n_frames,
+                           int *est_nframes, int64_t **offsets) {
   XDRFILE *xd;
   t_trnheader sh;
   float time, lambda;
@@ -37,7 +42,8 @@ int read_trr_n_frames(char *fn, int *n_frames, int *est_nframes,
     return exdrNR;
   }
   filesize = xdr_tell(xd);
-  if (xdr_seek(xd, 0L, SEEK_SET) != exdrOK) {
+  /* start has to point at a frame header */
+  if (xdr_seek(xd, start, SEEK_SET) != exdrOK) {
     xdrfile_close(xd);
     return exdrNR;
   }
@@ -52,7 +58,8 @@ int read_trr_n_frames(char *fn, int *n_frames, int *est_nframes,
                sh.v_size + sh.f_size;
 
   *est_nframes =
-      (int)(filesize / ((int64_t)(framebytes + TRR_MIN_HEADER_SIZE)) +
+      (int)((filesize - start) /
+                ((int64_t)(framebytes + TRR_MIN_HEADER_SIZE)) +
             1); // add one because it'd be easy to underestimate low
                 // frame numbers.
   *est_nframes += *est_nframes / 5;
@@ -63,7 +70,7 @@ int read_trr_n_frames(char *fn, int *n_frames, int *est_nframes,
     return exdrNOMEM;
   }
 
-  (*offsets)[0] = 0L;
+  (*offsets)[0] = start;
   *n_frames = 1;
   while (1) {
     if (xdr_seek(xd, (int64_t)(framebytes), SEEK_CUR) != exdrOK) {
@@ -74,6 +81,13 @@ int read_trr_n_frames(char *fn, int *n_frames, int *est_nframes,
     frame_offset = xdr_tell(xd); /* Store it now, before we read the header */
     if ((result = do_trnheader(xd, 1, &sh)) != exdrOK) /* Interpreting as EOF */
       break;
+    /* Calculate how much to skip this time */
+    framebytes = sh.ir_size + sh.e_size + sh.box_size + sh.vir_size +
+                 sh.pres_size + sh.top_size + sh.sym_size + sh.x_size +
+                 sh.v_size + sh.f_size;
+    /* A frame that is still being written is not counted */
+    if (xdr_tell(xd) + (int64_t)framebytes > filesize)
+      break;
     /* Read was successful; this is another frame */
     /* Check if we need to enlarge array */
     if (*n_frames == *est_nframes) {
@@ -86,10 +100,6 @@ int read_trr_n_frames(char *fn, int *n_frames, int *est_nframes,
     }
     (*offsets)[*n_frames] = frame_offset;
     (*n_frames)++;
-    /* Calculate how much to skip this time */
-    framebytes = sh.ir_size + sh.e_size + sh.box_size + sh.vir_size +
-                 sh.pres_size + sh.top_size + sh.sym_size + sh.x_size +
-                 sh.v_size + sh.f_size;
   }
   xdrfile_close(xd);
   return exdrOK;
@@ -257,6 +257,67 @@ xdrfile_close(XDRFILE *xfp)
 
 
 
+XDRFILE *
+xdrfile_open_tmp(void)
+{
+	XDRFILE *xfp;
+
+	if((xfp=(XDRFILE *)malloc(sizeof(XDRFILE)))==NULL)
+		return NULL;
+	if((xfp->fp=tmpfile())==NULL)
+    {
+		free(xfp);
+		return NULL;
+	}
+	if((xfp->xdr=(XDR *)malloc(sizeof(XDR)))==NULL)
+    {
+		fclose(xfp->fp);
+		free(xfp);
+		return NULL;
+	}
+	xfp->mode='w';
+	xdrstdio_create((XDR *)(xfp->xdr),xfp->fp,XDR_ENCODE);
+	xfp->buf1 = xfp->buf2 = NULL;
+	xfp->buf1size = xfp->buf2size = 0;
+	return xfp;
+}
+
+
+int
+xdrfile_tmp_take(XDRFILE *xfp, char **buf, int64_t *nbytes)
+{
+	off_t n;
+
+	*buf = NULL;
+	*nbytes = 0;
+	if(fflush(xfp->fp) != 0 || (n=ftello(xfp->fp)) < 0)
+		return exdrCLOSE;
+	if((*buf=(char *)malloc(n > 0 ? n : 1))==NULL)
+		return exdrNOMEM;
+	rewind(xfp->fp);
+	if(n > 0 && fread(*buf, 1, (size_t) n, xfp->fp) != (size_t) n)
+    {
+		free(*buf);
+		*buf = NULL;
+		return exdrENDOFFILE;
+	}
+	/* later frames overwrite this one */
+	rewind(xfp->fp);
+	*nbytes = (int64_t) n;
+	return exdrOK;
+}
+
+
+int
+xdrfile_write_raw(XDRFILE *xfp, const char *buf, int64_t nbytes)
+{
+	if(nbytes > 0 && fwrite(buf, 1, (size_t) nbytes, xfp->fp) != (size_t) nbytes)
+		return exdrCLOSE;
+	return exdrOK;
+}
+
+
+
 int
 xdrfile_read_int(int *ptr, int ndata, XDRFILE* xfp)
 {
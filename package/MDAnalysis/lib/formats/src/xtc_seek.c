@@ -24,14 +24,24 @@ enum { FALSE, TRUE };
 
 int read_xtc_n_frames(char *fn, int *n_frames, int *est_nframes,
                       int64_t **offsets) {
+  return read_xtc_n_frames_from(fn, 0L, n_frames, est_nframes, offsets);
+}
+
+int read_xtc_n_frames_from(char *fn, int64_t start, int *n_frames,
+                           int *est_nframes, int64_t **offsets) {
   XDRFILE *xd;
   int framebytes, natoms, step;
   float time;
-  int64_t filesize;
+  int64_t filesize, frame_end;
 
   if ((xd = xdrfile_open(fn, "r")) == NULL)
     return exdrFILENOTFOUND;
 
+  if (xdr_seek(xd, start, SEEK_SET) != exdrOK) {
+    xdrfile_close(xd);
+    return exdrNR;
+  }
+  /* start has to point at a frame header */
   if (xtc_header(xd, &natoms, &step, &time, TRUE) != exdrOK) {
     xdrfile_close(xd);
     return exdrHEADER;
@@ -48,20 +58,20 @@ int read_xtc_n_frames(char *fn, int *n_frames, int *est_nframes,
     int i;
     xdrfile_close(xd);
     framebytes = XTC_SHORTHEADER_SIZE + XTC_SHORT_BYTESPERATOM * natoms;
-    *n_frames = filesize / framebytes; /* Should we complain if framesize
-                                          doesn't divide filesize? */
+    /* Should we complain if framesize doesn't divide filesize? */
+    *n_frames = (int)((filesize - start) / framebytes);
     /* Allocate memory for the frame index array */
     if ((*offsets = malloc(sizeof(int64_t) * (*n_frames))) == NULL)
       return exdrNOMEM;
     for (i = 0; i < *n_frames; i++) {
-      (*offsets)[i] = i * framebytes;
+      (*offsets)[i] = start + (int64_t)i * framebytes;
     }
     *est_nframes = *n_frames;
     return exdrOK;
   } else /* No easy way out. We must iterate. */
   {
     /* Estimation of number of frames, with 20% allowance for error. */
-    if (xdr_seek(xd, (int64_t)XTC_HEADER_SIZE, SEEK_SET) != exdrOK) {
+    if (xdr_seek(xd, start + (int64_t)XTC_HEADER_SIZE, SEEK_SET) != exdrOK) {
       xdrfile_close(xd);
       return exdrNR;
     }
@@ -72,7 +82,8 @@ int read_xtc_n_frames(char *fn, int *n_frames, int *est_nframes,
     framebytes =
         (framebytes + 3) & ~0x03; // Rounding to the next 32-bit boundary
     *est_nframes =
-        (int)(filesize / ((int64_t)(framebytes + XTC_HEADER_SIZE)) +
+        (int)((filesize - start) /
+                  ((int64_t)(framebytes + XTC_HEADER_SIZE)) +
               1); // add one because it'd be easy to underestimate low
                   // frame numbers.
     *est_nframes += *est_nframes / 5;
@@ -82,7 +93,7 @@ int read_xtc_n_frames(char *fn, int *n_frames, int *est_nframes,
       xdrfile_close(xd);
       return exdrNOMEM;
     }
-    (*offsets)[0] = 0L;
+    (*offsets)[0] = start;
     *n_frames = 1;
     while (1) {
       if (xdr_seek(xd, (int64_t)(framebytes + XTC_HEADER_SIZE), SEEK_CUR) !=
@@ -93,6 +104,10 @@ int read_xtc_n_frames(char *fn, int *n_frames, int *est_nframes,
       }
       if (xdrfile_read_int(&framebytes, 1, xd) == 0)
         break;
+      /* A frame that is still being written is not counted */
+      frame_end = xdr_tell(xd) + (int64_t)((framebytes + 3) & ~0x03);
+      if (frame_end > filesize)
+        break;
       /* Read was successful; this is another frame */
       /* Check if we need to enlarge array */
       if (*n_frames == *est_nframes) {
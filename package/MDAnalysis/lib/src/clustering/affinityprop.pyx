@@ -26,6 +26,7 @@ Cython wrapper for the C implementation of the Affinity Perturbation clustering
 """
 from ..utils import TriangularMatrix
 import logging
+import time
 import numpy
 cimport numpy
 cimport caffinityprop
@@ -44,14 +45,14 @@ cdef class AffinityPropagation:
 
     """
 
-    def run(self, s, preference, double lam, int max_iterations, int convergence, int noise=1):
+    def run(self, s, preference, double lam, int max_iterations, int convergence, int noise=1, details=False):
         """
 	Run the clustering algorithm. 
 
 	**Arguments:**
 	
 	`s` : encore.utils.TriangularMatrix object
-		Triangular matrix containing the similarity values for each pair of clustering elements. Notice that the current implementation does not allow for asymmetric values (i.e. similarity(a,b) is assumed to be equal to similarity(b,a))
+		Triangular matrix containing the similarity values for each pair of clustering elements. Notice that the current implementation does not allow for asymmetric values (i.e. similarity(a,b) is assumed to be equal to similarity(b,a)). If the matrix is stored in single precision (float32), the clustering is performed in single precision as well.
 
 	`preference` : numpy.array of floats or float
 		Preference values, which the determine the number of clusters. If a single value is given, all the preference values are set to that. Otherwise, the list is used to set the preference values (one value per element, so the list must be of the same size as the number of elements)
@@ -66,6 +67,9 @@ cdef class AffinityPropagation:
 
 	`noise` : int
 		Whether to apply noise to the input s matrix, such there are no equal values. 1 is for yes, 0 is for no. 
+
+	`details` : bool
+		Whether to also return the number of iterations, the convergence status and the wall time of the run.
 		
 
 	**Returns:**
@@ -73,6 +77,9 @@ cdef class AffinityPropagation:
 	`elements` : list of int or None
 		List of cluster-assigned elements, which can be used by encore.utils.ClustersCollection to generate Cluster objects. See these classes for more details.
 
+	`run_details` : dict
+		Only returned if details is True. Dictionary with keys 'iterations' (number of iterations performed), 'converged' (whether the clustering converged to well-formed clusters) and 'wall_time' (seconds spent in the C kernel).
+
 	"""
         cdef int cn = s.size
         cdef double cpreference = preference
@@ -93,26 +100,42 @@ cdef class AffinityPropagation:
         logging.info("Preference %3.2f: starting Affinity Propagation" % (preference))
 
         # Prepare input and ouput arrays
-        cdef numpy.ndarray[numpy.float64_t,  ndim=1] matndarray = numpy.ascontiguousarray(s._elements, dtype=numpy.float64)
+        cdef numpy.ndarray[numpy.float64_t,  ndim=1] matndarray
+        cdef numpy.ndarray[numpy.float32_t,  ndim=1] matndarray32
         cdef numpy.ndarray[long,   ndim=1] clusters   = numpy.zeros((s.size),dtype=long)
-        
-        # run C module Affinity Propagation
-        iterations = caffinityprop.CAffinityPropagation( <double*>matndarray.data, cn, lam, max_iterations, convergence, noise, <long*>clusters.data)
+
+        # run C module Affinity Propagation, in the precision of the matrix
+        start = time.time()
+        if s._elements.dtype == numpy.float32:
+            matndarray32 = numpy.ascontiguousarray(s._elements, dtype=numpy.float32)
+            iterations = caffinityprop.CAffinityPropagationFloat( <float*>matndarray32.data, cn, lam, max_iterations, convergence, noise, <long*>clusters.data)
+        else:
+            matndarray = numpy.ascontiguousarray(s._elements, dtype=numpy.float64)
+            iterations = caffinityprop.CAffinityPropagation( <double*>matndarray.data, cn, lam, max_iterations, convergence, noise, <long*>clusters.data)
+        run_details = {'iterations': abs(iterations),
+                       'converged': False,
+                       'wall_time': time.time() - start}
+
         # Check results and return them
+        result = None
         if iterations > 0:
             centroids = numpy.unique(clusters)
             for i in centroids:
                 if clusters[i] != i:
                     logging.info("Preference %3.2f: Clustering converged, but clusters were malformed. Increase the convergence limit." % (preference))
-                    return None
-            
-            logging.info("Preference %3.2f: converged in %d iterations" % (preference, iterations))
-            return clusters
+                    break
+            else:
+                logging.info("Preference %3.2f: converged in %d iterations" % (preference, iterations))
+                run_details['converged'] = True
+                result = clusters
         
         else:
             logging.info("Preference %3.2f: could not converge in %d iterations" % (preference, -iterations))
-            return None
 
-    def __call__(self, *args):
-        results = self.run(*args)
+        if details:
+            return result, run_details
+        return result
+
+    def __call__(self, *args, **kwargs):
+        results = self.run(*args, **kwargs)
         return results
@@ -28,4 +28,5 @@ float min(float*, int);
 
 float max(float*, int);
 
-int CAffinityPropagation(double*, int, double, int, int, int, double*);
+int CAffinityPropagation(double*, int, double, int, int, int, long*);
+int CAffinityPropagationFloat(float*, int, double, int, int, int, long*);
@@ -35,3 +35,4 @@ cdef extern from "ap.h":
     float min(float*, int)
     float max(float*, int)
     int CAffinityPropagation(double*, int, double, int, int, bint, long*)
+    int CAffinityPropagationFloat(float*, int, double, int, int, bint, long*)
@@ -47,3 +47,5 @@ cdef extern from "stochasticproxembed.h":
     double CkNeighboursStochasticProximityEmbedding(double*, double*, double, int, int, int, double, double, int, int)
     double CStochasticProximityEmbedding(double*, double*, double, int, int, double, double, int, int, int)
     double CkNNStochasticProximityEmbedding(double*, double*, int, int, int, double, double, int, int, int)
+    double CStochasticProximityEmbeddingFloat(float*, double*, double, int, int, double, double, int, int, int)
+    double CkNNStochasticProximityEmbeddingFloat(float*, double*, int, int, int, double, double, int, int, int)
@@ -0,0 +1,317 @@
+/*
+spe_kernels.h --- Stochastic Proximity Embedding kernels, templated on the
+type of the input distance matrix
+Copyright (C) 2014 Wouter Boomsma, Matteo Tiberti
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+/* This file is included by spe.c once per floating point type. Before
+   including it, SPE_REAL must be defined as the type of the elements of the
+   distance matrix and SPE_NAME(name) as a macro producing the names of the
+   resulting functions. Embedded coordinates are always double precision. */
+
+double SPE_NAME(stress)(SPE_REAL *s, double *d_coords, int dim, int elemsn) {
+    double denom = 0.0;
+    double numer = 0.0;
+    double dab = 0.0;
+    double delta = 0.0;
+    int k = 0;
+
+    for (int i=0; i<elemsn; i++) {
+        for (int j=0; j<i; j++) {
+            dab = ed(d_coords, i, j, dim);
+            denom += s[k];
+            delta = dab - s[k];
+            numer += delta*delta / s[k];
+            //printf("%d, dab %.3f, denom %.3f, numer %.3f, s[k]: %.3f\n", k, dab, denom, numer,s[k]);
+            k++;
+            //printf("a %d, b %d, dab %.3f, rab %.3f, delta %.3f\n",i,j,dab,s[k],dab-s[k]);
+        }
+        k++;
+    }
+    return( numer/denom );
+}
+
+int SPE_NAME(neighbours)(SPE_REAL *s, int nelem, double cutoff, int* s_indeces, int* ioffsets, int* js) {
+    int idx = 0;
+    int global_counter = 0;
+    int offset_counter = 0;
+    ioffsets[0] = 0;
+    for (int i=0;i<nelem;i++) {
+        offset_counter = 0;
+        for (int j=0;j<nelem;j++) {
+            idx = trmIndex(i,j);
+            if (s[idx] < cutoff) {
+                s_indeces[global_counter] = idx; //XXX: replace numbers with addresses
+                js[global_counter] = j;
+                offset_counter++;
+                global_counter++;
+            }
+        }
+        ioffsets[i+1] = ioffsets[i] + offset_counter;
+    }
+    return global_counter;
+}
+
+int* SPE_NAME(nearest_neighbours)(SPE_REAL *s, int nelem, int kn) {
+    IVWrapper* ivpairs = (IVWrapper*) malloc((nelem-1)*sizeof(IVWrapper));
+    int* neighbours = (int*) malloc(nelem*kn*sizeof(int));
+    int totk = 0;
+    int k = 0;
+    for (int i=0;i<nelem;i++) {
+        k = 0;
+        for (int j=0;j<nelem;j++) {
+            if (i!=j) {
+                ivpairs[k].index = j;
+                ivpairs[k].value = s[trmIndex(i,j)];
+                k++;
+            }
+        }
+        qsort(ivpairs, nelem-1, sizeof(IVWrapper), cmp_ivwrapper);
+        for (int k=0;k<kn;k++) {
+            neighbours[totk] = ivpairs[k].index;
+            totk++;
+        }
+    }
+    free(ivpairs);
+    return neighbours;
+}
+
+double SPE_NAME(neighbours_stress)(SPE_REAL *s, double *d_coords, int dim, int elemsn, double rco) {
+    double denom = 0.0;
+    double numer = 0.0;
+    double dab = 0.0;
+    double delta = 0.0;
+    int k = 0;
+
+    for (int i=0; i<elemsn; i++) {
+        for (int j=0; j<i; j++) {
+            dab = ed(d_coords, i, j, dim);
+	    if (s[k] <= rco || dab < s[k]) {
+	        denom += s[k];
+                delta = dab - s[k];
+                numer += delta*delta / s[k];
+	    }
+            //printf("%d, dab %.3f, denom %.3f, numer %.3f, s[k]: %.3f\n", k, dab, denom, numer,s[k]);
+            k++;
+            //printf("a %d, b %d, dab %.3f, rab %.3f, delta %.3f\n",i,j,dab,s[k],dab-s[k]);
+        }
+        k++;
+    }
+    return( numer/denom );
+}
+
+
+
+
+double SPE_NAME(CkNNStochasticProximityEmbedding)(
+        SPE_REAL* s,
+        double* d_coords,
+        int kn,
+        int nelem,
+        int dim,
+        double maxlam,
+        double minlam,
+        int ncycle,
+        int nstep,
+        int stressfreq) {
+
+    int* tmp;
+    int* neighbours;
+    int a = 0, b = 0, idx = 0, idxa = 0, idxb = 0, idxak = 0, idxbk = 0, idxab = 0;
+    double dab = 0.0, rab = 0.0;
+    double lam = maxlam;
+    double t = 0.0;
+    double finalstress = 0.0;
+
+    srand(time(NULL)+getpid()*getpid());
+    //time_t tempo;
+    //time(&tempo);
+    //printf("%s: Finding neighbours...\n",ctime(&tempo));
+    neighbours = SPE_NAME(nearest_neighbours)(s, nelem, kn);
+    //time(&tempo);
+    //printf("%s: Done!\n", ctime(&tempo));
+    for (int i=0; i<nelem*dim; i++) {
+        d_coords[i] = (double)rand();
+    }
+
+    for (int i=0; i<ncycle; i++) {
+        for (int j=0; j<nstep; j++) {
+            a = rand() % nelem;
+
+            for (int k=kn; k<(a+1)*kn; k++) {
+                b = neighbours[k];
+
+                dab = ed(d_coords, a, b, dim);
+                rab = s[trmIndex(a,b)];
+
+                if (dab > rab) {
+                    idxa = a * dim;
+                    idxb = b * dim;
+                    t = lam * 0.5 * (rab - dab) / (dab + EPSILON);
+
+                    for (int k = 0; k < dim; k++) {
+                        idxak = idxa+k;
+                        idxbk = idxb+k;
+                        d_coords[idxak] = d_coords[idxak] + t*(d_coords[idxak] - d_coords[idxbk]);
+                        d_coords[idxbk] = d_coords[idxbk] + t*(d_coords[idxbk] - d_coords[idxak]);
+                    }
+                }
+            }
+        }
+        if (i % stressfreq == 0 && i != 0 && stressfreq > 0)
+            printf("Cycle %d - Residual stress: %.3f, lambda %.3f\n", i, SPE_NAME(stress)(s, d_coords, dim, nelem),lam);
+        lam = lam - (maxlam - minlam) / (double)(ncycle - 1);
+    }
+    free(neighbours);
+    return(SPE_NAME(stress)(s, d_coords, dim, nelem));
+}
+
+double SPE_NAME(CkNeighboursStochasticProximityEmbedding)(
+        SPE_REAL* s,
+        double* d_coords,
+        double rco,
+        int kn,
+        int nelem,
+        int dim,
+        double maxlam,
+        double minlam,
+        int ncycle,
+        int stressfreq) {
+
+    int* tmp;
+    int a = 0, b = 0, idx = 0, idxa = 0, idxb = 0, idxak = 0, idxbk = 0, idxab = 0;
+    double dab = 0.0, rab = 0.0;
+    double lam = maxlam;
+    double t = 0.0;
+    double finalstress = 0.0;
+    int* s_indeces = (int*) malloc(nelem*nelem*sizeof(int));
+    int* ioffsets  = (int*) malloc(nelem      *sizeof(int));
+    int* js        = (int*) malloc(nelem*nelem*sizeof(int));
+    int nlistlen = 0;
+
+    srand(time(NULL)+getpid()*getpid());
+    nlistlen = SPE_NAME(neighbours)(s, nelem, rco, s_indeces, ioffsets, js);
+
+    s_indeces = (int*) realloc(s_indeces, nlistlen*sizeof(int));
+    ioffsets  = (int*) realloc(ioffsets, nelem*sizeof(int));
+    js        = (int*) realloc(js, nlistlen*sizeof(int));
+
+    for (int i=0; i<nelem*dim; i++) {
+        d_coords[i] = (double) rand() / RAND_MAX;
+    }
+    for (int i=0; i<nelem+1; i++) {
+        //printf("ioff %d\n",ioffsets[i]);
+    }
+
+    /* start self organization */
+    for (int i=0; i<ncycle; i++) {
+        for (int a=0; a<nelem; a++) {
+            for (int k=0; k<kn; k++) {
+
+                int test = ioffsets[1] - ioffsets[0];
+
+                b = rand() % (ioffsets[a+1] - ioffsets[a]);
+                idxab = s_indeces[ioffsets[a]+b];
+                b = js[ioffsets[a]+b];
+
+                dab = ed(d_coords, a, b, dim);
+                rab = s[idxab];
+
+                if (dab < rab) {
+                    idxa = a * dim;
+                    idxb = b * dim;
+                    t = lam * 0.5 * (rab - dab) / (dab + EPSILON);
+
+                    for (int k = 0; k < dim; k++) {
+                        idxak = idxa+k;
+                        idxbk = idxb+k;
+                        d_coords[idxak] = d_coords[idxak] + t*(d_coords[idxak] - d_coords[idxbk]);
+                        d_coords[idxbk] = d_coords[idxbk] + t*(d_coords[idxbk] - d_coords[idxak]);
+                    }
+                }
+            }
+        }
+        lam = lam - (maxlam - minlam) / (double)(ncycle - 1);
+        if (i % stressfreq == 0 && i != 0 && stressfreq > 0)
+            printf("Cycle %d - Residual stress: %.3f, lambda %.3f\n", i, SPE_NAME(stress)(s, d_coords, dim, nelem),lam);
+    }
+    finalstress = SPE_NAME(stress)(s, d_coords, dim, nelem);
+    printf("Calculation finished (%d dimensions). - Residual stress: %.3f\n", dim, finalstress);
+    return(finalstress);
+    /* cleanup */
+}
+
+
+double SPE_NAME(CStochasticProximityEmbedding)(
+        SPE_REAL* s,
+        double* d_coords,
+        double rco,
+        int nelem,
+        int dim,
+        double maxlam,
+        double minlam,
+        int ncycle,
+        int nstep,
+        int stressfreq) {
+
+    int a = 0, b = 0, idx = 0, idxa = 0, idxb = 0, idxak = 0, idxbk = 0;
+    double dab = 0.0, rab = 0.0;
+    double lam = maxlam;
+    double t = 0.0;
+    double finalstress = 0.0;
+
+    srand(time(NULL)+getpid()*getpid());
+    /* random init of d */
+
+
+    for (int i=0; i<nelem*dim; i++) {
+        d_coords[i] = (double) rand() / (double) RAND_MAX;
+    }
+
+    /* start self organization */
+    for (int i=0; i<ncycle; i++) {
+        for (int j=0; j<nstep; j++) {
+
+            a = rand() % nelem;
+            while(1) {
+                b = rand() % nelem;
+                if (b != a) break;
+            }
+
+            dab = ed(d_coords, a, b, dim);
+            rab = s[trmIndex(a, b)];
+
+            if (rab <= rco || (rab > rco && dab < rab)) {
+                idxa = a * dim;
+                idxb = b * dim;
+                t = lam * 0.5 * (rab - dab) / (dab + EPSILON);
+
+                for (int k=0; k<dim; k++) {
+                    idxak = idxa+k;
+                    idxbk = idxb+k;
+                    d_coords[idxak] = d_coords[idxak] + t*(d_coords[idxak] - d_coords[idxbk]);
+                    d_coords[idxbk] = d_coords[idxbk] + t*(d_coords[idxbk] - d_coords[idxak]);
+                }
+            }
+        }
+        lam = lam - (maxlam - minlam) / (double)(ncycle - 1);
+        if (i % stressfreq == 0 && i != 0 && stressfreq > 0)
+	  printf("Cycle %d - Residual stress: %.3f, lambda %.3f\n", i, SPE_NAME(neighbours_stress)(s, d_coords, dim, nelem, rco),lam);
+    }
+    finalstress = SPE_NAME(neighbours_stress)(s, d_coords, dim, nelem, rco);
+    //printf("Calculation finished. - Residual stress: %.3f\n", finalstress);
+    return(finalstress);
+}
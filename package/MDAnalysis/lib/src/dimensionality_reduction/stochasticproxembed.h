@@ -46,6 +46,30 @@ double CStochasticProximityEmbedding(
         int,
         int);
 
+double CkNNStochasticProximityEmbeddingFloat(
+        float*,
+        double*,
+        int,
+        int,
+        int,
+        double,
+        double,
+        int,
+        int,
+        int);
+
+double CStochasticProximityEmbeddingFloat(
+        float*,
+        double*,
+        double,
+        int,
+        int,
+        double,
+        double,
+        int,
+        int,
+        int);
+
 
 
 
@@ -50,7 +50,7 @@ cdef class StochasticProximityEmbedding:
 	**Arguments:**
 	
 	`s` : encore.utils.TriangularMatrix object
-                Triangular matrix containing the distance values for each pair of elements in the original space.	
+                Triangular matrix containing the distance values for each pair of elements in the original space. Single precision (float32) matrices are used without conversion.
 
 	`rco` : float
 		neighborhood distance cut-off
@@ -84,10 +84,17 @@ cdef class StochasticProximityEmbedding:
         
         logging.info("Starting Stochastic Proximity Embedding")
 
-        cdef numpy.ndarray[numpy.float64_t,  ndim=1] matndarray = numpy.ascontiguousarray(s._elements, dtype=numpy.float64)
+        cdef numpy.ndarray[numpy.float64_t,  ndim=1] matndarray
+        cdef numpy.ndarray[numpy.float32_t,  ndim=1] matndarray32
         cdef numpy.ndarray[numpy.float64_t,   ndim=1] d_coords   = numpy.zeros((nelem*dim),dtype=numpy.float64)
-        
-        finalstress = cstochasticproxembed.CStochasticProximityEmbedding( <double*>matndarray.data, <double*>d_coords.data, rco, nelem, dim, maxlam, minlam, ncycle, nstep, stressfreq)
+
+        # Use the kernel matching the precision of the matrix, to avoid copies
+        if s._elements.dtype == numpy.float32:
+            matndarray32 = numpy.ascontiguousarray(s._elements, dtype=numpy.float32)
+            finalstress = cstochasticproxembed.CStochasticProximityEmbeddingFloat( <float*>matndarray32.data, <double*>d_coords.data, rco, nelem, dim, maxlam, minlam, ncycle, nstep, stressfreq)
+        else:
+            matndarray = numpy.ascontiguousarray(s._elements, dtype=numpy.float64)
+            finalstress = cstochasticproxembed.CStochasticProximityEmbedding( <double*>matndarray.data, <double*>d_coords.data, rco, nelem, dim, maxlam, minlam, ncycle, nstep, stressfreq)
         
         logging.info("Stochastic Proximity Embedding finished. Residual stress: %.3f" % finalstress)
           
@@ -143,10 +150,17 @@ cdef class kNNStochasticProximityEmbedding:
         
         logging.info("Starting k-Nearest Neighbours Stochastic Proximity Embedding")
         
-        cdef numpy.ndarray[numpy.float64_t,  ndim=1] matndarray = numpy.ascontiguousarray(s._elements, dtype=numpy.float64)
+        cdef numpy.ndarray[numpy.float64_t,  ndim=1] matndarray
+        cdef numpy.ndarray[numpy.float32_t,  ndim=1] matndarray32
         cdef numpy.ndarray[numpy.float64_t,  ndim=1] d_coords   = numpy.zeros((nelem*dim),dtype=numpy.float64)
-        
-        finalstress = cstochasticproxembed.CkNNStochasticProximityEmbedding(<double*>matndarray.data, <double*>d_coords.data, kn, nelem, dim, maxlam, minlam, ncycle, nstep, stressfreq)
+
+        # Use the kernel matching the precision of the matrix, to avoid copies
+        if s._elements.dtype == numpy.float32:
+            matndarray32 = numpy.ascontiguousarray(s._elements, dtype=numpy.float32)
+            finalstress = cstochasticproxembed.CkNNStochasticProximityEmbeddingFloat(<float*>matndarray32.data, <double*>d_coords.data, kn, nelem, dim, maxlam, minlam, ncycle, nstep, stressfreq)
+        else:
+            matndarray = numpy.ascontiguousarray(s._elements, dtype=numpy.float64)
+            finalstress = cstochasticproxembed.CkNNStochasticProximityEmbedding(<double*>matndarray.data, <double*>d_coords.data, kn, nelem, dim, maxlam, minlam, ncycle, nstep, stressfreq)
         
         logging.info("Stochastic Proximity Embedding finished. Residual stress: %.3f" % finalstress)
           
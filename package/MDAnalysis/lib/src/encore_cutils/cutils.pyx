@@ -27,6 +27,7 @@ Mixed Cython utils for ENCORE
 import numpy as np
 cimport numpy as np
 import cython
+from cython cimport floating
 
 cdef extern from "math.h":
     double sqrt(double x)
@@ -35,8 +36,8 @@ cdef extern from "math.h":
 @cython.boundscheck(False)
 @cython.wraparound(False)
 
-def PureRMSD(np.ndarray[np.float64_t,ndim=2] coordsi,
-             np.ndarray[np.float64_t,ndim=2] coordsj,
+def PureRMSD(np.ndarray[floating,ndim=2] coordsi,
+             np.ndarray[floating,ndim=2] coordsj,
              int atomsn,
              np.ndarray[np.float64_t,ndim=1] masses,
              double summasses):
@@ -50,8 +51,8 @@ def PureRMSD(np.ndarray[np.float64_t,ndim=2] coordsi,
         normsum += masses[k]*((coordsi[k,0]-coordsj[k,0])**2 + (coordsi[k,1]-coordsj[k,1])**2 + (coordsi[k,2]-coordsj[k,2])**2)
     return sqrt(normsum/summasses)
 
-def MinusRMSD(np.ndarray[np.float64_t,ndim=2] coordsi,
-             np.ndarray[np.float64_t,ndim=2] coordsj,
+def MinusRMSD(np.ndarray[floating,ndim=2] coordsi,
+             np.ndarray[floating,ndim=2] coordsj,
              int atomsn,
              np.ndarray[np.float64_t,ndim=1] masses,
              double summasses):
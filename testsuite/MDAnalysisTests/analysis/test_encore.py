@@ -87,6 +87,21 @@ class TestEncore(TestCase):
         assert_equal(triangular_matrix_3[0,1], expected_value, 
                         err_msg="Data error in TriangularMatrix: loaded matrix non symmetrical")
 
+    def test_triangular_matrix_float32(self):
+        filename = tempfile.mktemp()+".npz"
+
+        triangular_matrix = encore.utils.TriangularMatrix(size = 3, dtype = numpy.float32)
+        triangular_matrix[0,1] = 1.984
+        assert_equal(triangular_matrix.dtype, numpy.float32,
+                     err_msg="Unexpected type for TriangularMatrix elements")
+
+        triangular_matrix.savez(filename)
+        triangular_matrix_2 = encore.utils.TriangularMatrix(size = 3, loadfile = filename)
+        assert_equal(triangular_matrix_2.dtype, numpy.float32,
+                     err_msg="TriangularMatrix type not preserved on save/load")
+        assert_almost_equal(triangular_matrix_2[1,0], 1.984, decimal=5,
+                            err_msg="Data error in loaded single precision TriangularMatrix")
+
     def test_parallel_calculation(self):
 
         def function(x):
@@ -103,6 +118,23 @@ class TestEncore(TestCase):
             assert_equal(r[1], arguments[i][0]**2,
                 err_msg="Unexpeted results from ParallelCalculation")
 
+    def test_stage_profiler(self):
+        recorded = []
+        profiler = encore.utils.StageProfiler(callback=recorded.append)
+        with profiler.stage("first") as record:
+            record['metric'] = 1
+        with profiler.stage("second"):
+            pass
+        assert_equal([r['name'] for r in profiler.stages], ["first", "second"],
+                     err_msg="Stages not recorded in order by StageProfiler")
+        assert_equal(recorded, profiler.stages,
+                     err_msg="StageProfiler callback not called for each stage")
+        assert_equal(profiler["first"]['metric'], 1,
+                     err_msg="Stage metric not recorded by StageProfiler")
+        for key in ['wall_time', 'cpu_time', 'max_rss', 'max_rss_children']:
+            assert_equal(key in profiler["second"], True,
+                         err_msg="{0} not recorded by StageProfiler".format(key))
+
 
 
     def test_rmsd_matrix_with_superimposition(self):
@@ -141,6 +173,25 @@ class TestEncore(TestCase):
             assert_almost_equal(rmsd[2], confdist_matrix[0,i], decimal=3,
                                 err_msg = "calculated RMSD values differ from the reference implementation")
 
+    def test_rmsd_matrix_float32(self):
+        generator = encore.confdistmatrix.RMSDMatrixGenerator()
+        confdist_matrix = generator(self.ens1,
+                                    selection = "name CA",
+                                    pairwise_align = True,
+                                    mass_weighted = True,
+                                    ncores = 1)
+        confdist_matrix_32 = generator(self.ens1,
+                                       selection = "name CA",
+                                       pairwise_align = True,
+                                       mass_weighted = True,
+                                       ncores = 1,
+                                       dtype = numpy.float32)
+        assert_equal(confdist_matrix_32.dtype, numpy.float32,
+                     err_msg="Unexpected type for single precision RMSD matrix")
+        for i in range(confdist_matrix.size):
+            assert_almost_equal(confdist_matrix_32[0,i], confdist_matrix[0,i], decimal=3,
+                                err_msg = "single precision RMSD values differ from double precision ones")
+
     def test_minus_rmsd_matrix_with_superimposition(self):
         
         generator = encore.confdistmatrix.MinusRMSDMatrixGenerator()
@@ -469,6 +520,22 @@ class TestEncore(TestCase):
         assert_almost_equal(result_value, expected_value,
                             err_msg="ClusteringEnsemble Similarity to itself not zero: {0:f}".format(result_value))
 
+    @dec.slow
+    def test_ces_float32(self):
+        results, details = encore.ces([self.ens1, self.ens2], dtype=numpy.float32)
+        result_value = results[0,1]
+        expected_value = 0.68070
+        assert_almost_equal(result_value, expected_value, decimal=2,
+                            err_msg="Unexpected value for single precision Cluster Ensemble Similarity: {}. Expected {}.".format(result_value, expected_value))
+
+    @dec.slow
+    def test_dres_float32(self):
+        results, details = encore.dres([self.ens1, self.ens2], dtype=numpy.float32)
+        result_value = results[0,1]
+        expected_value = 0.68
+        assert_almost_equal(result_value, expected_value, decimal=1,
+                            err_msg="Unexpected value for single precision Dim. reduction Ensemble Similarity: {0:f}. Expected {1:f}.".format(result_value, expected_value))
+
     @dec.slow
     def test_ces(self):
         results, details = encore.ces([self.ens1, self.ens2])
@@ -501,6 +568,48 @@ class TestEncore(TestCase):
         assert_almost_equal(result_value, expected_value, decimal=1,
                             err_msg="Unexpected value for Dim. reduction Ensemble Similarity: {0:f}. Expected {1:f}.".format(result_value, expected_value))
         
+    @dec.slow
+    def test_hes_ces_dres(self):
+        (hes, ces, dres), details = encore.hes_ces_dres([self.ens1, self.ens2])
+        assert_almost_equal(hes[0,1], 13946090.576, decimal=2,
+                            err_msg="Unexpected value for Harmonic Ensemble Similarity in combined calculation: {0:f}".format(hes[0,1]))
+        assert_almost_equal(ces[0,1], 0.68070, decimal=2,
+                            err_msg="Unexpected value for Cluster Ensemble Similarity in combined calculation: {0:f}".format(ces[0,1]))
+        assert_almost_equal(dres[0,1], 0.68, decimal=1,
+                            err_msg="Unexpected value for Dim. reduction Ensemble Similarity in combined calculation: {0:f}".format(dres[0,1]))
+
+    @dec.slow
+    def test_ces_profiler(self):
+        profiler = encore.utils.StageProfiler()
+        results, details = encore.ces([self.ens1, self.ens2],
+                                      preference_values=[-1.0, -2.0],
+                                      details=True, profiler=profiler)
+        for stage in ["coordinate_extraction", "matrix_calculation",
+                      "clustering", "clustering_similarity"]:
+            assert_equal(stage in profiler, True,
+                         err_msg="Stage {0} not recorded for CES".format(stage))
+        clustering = profiler["clustering"]
+        assert_equal(clustering['preferences'], [-1.0, -2.0],
+                     err_msg="Preferences not recorded for CES clustering")
+        assert_equal(clustering['converged'], [True, True],
+                     err_msg="Convergence not recorded for CES clustering")
+        assert_equal(numpy.all(clustering['iterations'] > 0), True,
+                     err_msg="Iterations not recorded for CES clustering")
+        assert_equal(details.item()['stages'], profiler.stages,
+                     err_msg="Stages not saved in CES details")
+
+    @dec.slow
+    def test_dres_profiler(self):
+        profiler = encore.utils.StageProfiler()
+        results, details = encore.dres([self.ens1, self.ens2],
+                                       dimensions=[2, 3], profiler=profiler)
+        assert_equal(results.shape, (2, 2, 2),
+                     err_msg="Unexpected shape of DRES results for two dimensions")
+        assert_equal(profiler["dimensionality_reduction"]['dimensions'], [2, 3],
+                     err_msg="Dimensions not recorded for DRES embedding")
+        assert_equal("dimred_similarity" in profiler, True,
+                     err_msg="Stage dimred_similarity not recorded for DRES")
+
     @dec.slow
     def test_ces_convergence(self):
         expected_values = [ 0.48194205,  0.40284672,  0.31699026,  0.25220447,  0.19829817,
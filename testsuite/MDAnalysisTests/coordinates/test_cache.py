@@ -0,0 +1,215 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4 fileencoding=utf-8
+#
+# MDAnalysis --- http://www.MDAnalysis.org
+# Copyright (c) 2006-2015 Naveen Michaud-Agrawal, Elizabeth J. Denning, Oliver
+# Beckstein and contributors (see AUTHORS for the full list)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+from six.moves import zip
+
+import errno
+import os
+import shutil
+import warnings
+
+import numpy as np
+from numpy.testing import (assert_equal, assert_array_equal,
+                           assert_array_almost_equal, assert_raises, assert_)
+import tempdir
+
+import MDAnalysis as mda
+from MDAnalysis.coordinates import cache
+from MDAnalysis.coordinates.cache import CacheReader
+from MDAnalysisTests.datafiles import PSF, DCD, GRO, XTC, GRO_velocity
+
+from unittest import TestCase
+
+
+class _CacheTest(TestCase):
+    topology = None
+    trajectory = None
+
+    def setUp(self):
+        # the cache is written next to the trajectory
+        self.tmpdir = tempdir.TempDir()
+        shutil.copy(self.trajectory, self.tmpdir.name)
+        self.traj = os.path.join(self.tmpdir.name,
+                                 os.path.basename(self.trajectory))
+        self.ref = mda.Universe(self.topology, self.traj)
+        self.universe = mda.Universe(self.topology, self.traj, cache='auto')
+
+    def tearDown(self):
+        del self.ref
+        del self.universe
+        del self.tmpdir
+
+    def test_reader(self):
+        assert_(isinstance(self.universe.trajectory, CacheReader))
+        assert_(os.path.isfile(cache.cache_filename(self.traj)))
+        assert_equal(self.universe.trajectory.filename, self.traj)
+        assert_equal(self.universe.trajectory.n_frames,
+                     self.ref.trajectory.n_frames)
+
+    def test_frames(self):
+        for ts, ref_ts in zip(self.universe.trajectory,
+                                         self.ref.trajectory):
+            assert_array_equal(ts.positions, ref_ts.positions)
+            assert_array_almost_equal(ts.dimensions, ref_ts.dimensions)
+            assert_array_almost_equal(ts.time, ref_ts.time)
+
+    def test_reuse(self):
+        mtime = os.path.getmtime(cache.cache_filename(self.traj))
+        u = mda.Universe(self.topology, self.traj, cache='auto')
+        assert_(isinstance(u.trajectory, CacheReader))
+        assert_equal(os.path.getmtime(cache.cache_filename(self.traj)), mtime)
+
+    def test_positions_not_written(self):
+        self.universe.atoms.translate([1.0, 2.0, 3.0])
+        u = mda.Universe(self.topology, self.traj, cache='auto')
+        assert_array_equal(u.atoms.positions,
+                           self.ref.trajectory[0].positions)
+
+    def test_modified_trajectory(self):
+        os.utime(self.traj, (0, 0))
+        with warnings.catch_warnings(record=True) as warn:
+            warnings.simplefilter('always')
+            u = mda.Universe(self.topology, self.traj, cache='auto')
+        assert_(any('cache' in str(w.message) for w in warn))
+        header = cache.read_cache_header(cache.cache_filename(self.traj))
+        assert_equal(header['mtime'], 0)
+        assert_array_equal(u.trajectory[2].positions,
+                           self.ref.trajectory[2].positions)
+
+    def test_different_atoms(self):
+        u = mda.Universe(self.topology, self.traj, cache='auto',
+                         select="name CA")
+        ca = self.ref.select_atoms("name CA")
+        assert_(isinstance(u.trajectory, CacheReader))
+        assert_equal(u.trajectory.n_atoms, ca.n_atoms)
+        assert_array_equal(u.trajectory[1].positions,
+                           self.ref.trajectory[1].positions[ca.indices])
+
+    def test_time_offset(self):
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('always')
+            u = mda.Universe(self.topology, self.traj, cache='auto',
+                             time_offset=10.0)
+        assert_(isinstance(u.trajectory, CacheReader))
+        assert_array_almost_equal(u.trajectory[2].time,
+                                  self.ref.trajectory[2].time + 10.0)
+
+
+class TestCacheDCD(_CacheTest):
+    topology = PSF
+    trajectory = DCD
+
+
+class TestCacheXTC(_CacheTest):
+    topology = GRO
+    trajectory = XTC
+
+    def test_convert_units(self):
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('always')
+            u = mda.Universe(self.topology, self.traj, cache='auto',
+                             convert_units=False)
+        assert_array_almost_equal(u.trajectory[2].positions,
+                                  self.ref.trajectory[2].positions / 10.0,
+                                  decimal=5)
+
+
+class _DiskFullReader(mda.coordinates.DCD.DCDReader):
+    """DCDReader that fails while the cache is written"""
+    def __iter__(self):
+        for ts in super(_DiskFullReader, self).__iter__():
+            if ts.frame == 5:
+                raise IOError(errno.ENOSPC, "No space left on device")
+            yield ts
+
+
+class TestCache(TestCase):
+    def setUp(self):
+        self.tmpdir = tempdir.TempDir()
+        self.filename = os.path.join(self.tmpdir.name, 'adk.cache')
+        self.universe = mda.Universe(PSF, DCD)
+
+    def tearDown(self):
+        del self.universe
+        del self.tmpdir
+
+    def test_cache_filename(self):
+        assert_equal(cache.cache_filename('/a/b/traj.xtc'),
+                     '/a/b/.traj.xtc_cache.bin')
+
+    def test_write_read(self):
+        cache.write_cache(self.filename, self.universe.trajectory, DCD,
+                          b'abc')
+        header = cache.read_cache_header(self.filename)
+        assert_equal(header['n_frames'], 98)
+        assert_equal(header['n_atoms'], 3341)
+        assert_equal(header['topology'], b'abc')
+        reader = CacheReader(self.filename)
+        assert_array_equal(reader[10].positions,
+                           self.universe.trajectory[10].positions)
+        assert_raises(ValueError, CacheReader, self.filename,
+                      topology=b'abd')
+
+    def test_truncated(self):
+        cache.write_cache(self.filename, self.universe.trajectory, DCD)
+        with open(self.filename, 'r+b') as f:
+            f.truncate(1000)
+        assert_raises(ValueError, cache.read_cache_header, self.filename)
+
+    def test_not_a_cache(self):
+        assert_raises(ValueError, cache.read_cache_header, DCD)
+
+    def test_topology_hash(self):
+        atoms = self.universe.atoms
+        assert_equal(cache.topology_hash(atoms), cache.topology_hash(atoms))
+        assert_(cache.topology_hash(atoms) !=
+                cache.topology_hash(atoms[:10]))
+        assert_(cache.topology_hash(atoms) !=
+                cache.topology_hash(atoms, [1, 2]))
+        assert_(cache.topology_hash(atoms, None, 2.5) !=
+                cache.topology_hash(atoms, None, 2.0))
+        assert_(cache.topology_hash(atoms, None, 1) !=
+                cache.topology_hash(atoms, 1, None))
+
+    def test_velocities(self):
+        shutil.copy(GRO_velocity, self.tmpdir.name)
+        traj = os.path.join(self.tmpdir.name, os.path.basename(GRO_velocity))
+        with warnings.catch_warnings(record=True) as warn:
+            warnings.simplefilter('always')
+            u = mda.Universe(traj, cache='auto')
+        assert_(any('velocities' in str(w.message) for w in warn))
+        assert_(not isinstance(u.trajectory, CacheReader))
+        assert_(not os.path.exists(cache.cache_filename(traj)))
+        assert_array_equal(u.atoms.velocities,
+                           mda.Universe(GRO_velocity).atoms.velocities)
+
+    def test_unwritable(self):
+        filename = os.path.join(self.tmpdir.name, 'missing', 'adk.cache')
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('always')
+            reader = cache.cached_reader(
+                DCD, lambda: mda.coordinates.DCD.DCDReader(DCD),
+                cache=filename)
+        assert_(isinstance(reader, mda.coordinates.DCD.DCDReader))
+
+    def test_write_error(self):
+        with warnings.catch_warnings(record=True) as warn:
+            warnings.simplefilter('always')
+            reader = cache.cached_reader(
+                DCD, lambda: _DiskFullReader(DCD), cache=self.filename)
+        assert_(any('No space' in str(w.message) for w in warn))
+        assert_(isinstance(reader, _DiskFullReader))
+        assert_equal(reader.ts.frame, 0)
+        assert_equal(os.listdir(self.tmpdir.name), [])
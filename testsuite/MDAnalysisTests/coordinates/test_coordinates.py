@@ -21,7 +21,7 @@ from six.moves import zip
 
 from nose.plugins.attrib import attr
 from numpy.testing import (assert_allclose, assert_equal, assert_array_equal,
-                           assert_almost_equal, dec)
+                           assert_almost_equal, assert_, dec)
 import tempdir
 from unittest import TestCase
 
@@ -138,6 +138,52 @@ class TestChainReader(TestCase):
                             5,
                             err_msg="Wrong time of frame")
 
+    def test_time_last_frame(self):
+        self.trajectory[-1]
+        assert_almost_equal(self.trajectory.time,
+                            self.trajectory.n_frames - 1, 3)
+
+    def test_timeseries(self):
+        atoms = self.universe.atoms[[2, 1000, 10]]
+        coordinates = self.trajectory.timeseries(atoms, format='fac')
+        assert_equal(coordinates.shape, (self.trajectory.n_frames, 3, 3))
+        for frame in (0, 97, 98, 99, 196, 297):
+            assert_array_equal(coordinates[frame],
+                               self.trajectory[frame].positions[[2, 1000, 10]])
+
+    def test_timeseries_skip(self):
+        atoms = self.universe.atoms[[2, 1000, 10]]
+        coordinates = self.trajectory.timeseries(atoms, start=90, stop=200,
+                                                 skip=7, format='afc')
+        assert_equal(coordinates.shape, (3, 16, 3))
+        for i, frame in enumerate(range(90, 201, 7)):
+            assert_array_equal(coordinates[:, i],
+                               self.trajectory[frame].positions[[2, 1000, 10]])
+
+    def test_max_open(self):
+        u = mda.Universe(PSF, [DCD, CRD, DCD, CRD, DCD, CRD, CRD], max_open=2)
+        trajectory = u.trajectory
+        assert_equal(trajectory.n_frames, 3 * 98 + 4)
+        assert_(len(trajectory._open_readers) <= 2)
+        frames = [ts.frame for ts in trajectory]
+        assert_equal(frames, np.arange(trajectory.n_frames))
+        assert_(len(trajectory._open_readers) <= 2)
+        assert_array_equal(trajectory[250].positions,
+                           self.trajectory[250].positions)
+        assert_array_equal(trajectory[3].positions,
+                           self.trajectory[3].positions)
+        assert_(len(trajectory._open_readers) <= 2)
+
+    def test_readers(self):
+        u = mda.Universe(PSF, [DCD, CRD, DCD, CRD], max_open=2)
+        readers = u.trajectory.readers
+        assert_equal(len(readers), 4)
+        assert_equal([r.n_frames for r in readers], [98, 1, 98, 1])
+        # all readers stay open and usable
+        assert_equal(len(u.trajectory._open_readers), 4)
+        assert_equal(len([ts for ts in u.trajectory]), 198)
+        assert_equal(readers[0][5].frame, 5)
+
     @dec.slow
     def test_write_dcd(self):
         """test that ChainReader written dcd (containing crds) is correct
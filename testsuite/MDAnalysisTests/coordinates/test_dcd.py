@@ -6,7 +6,7 @@ from six.moves import zip, range
 from nose.plugins.attrib import attr
 from numpy.testing import (assert_equal, assert_array_equal, assert_raises,
                            assert_almost_equal, assert_array_almost_equal,
-                           assert_allclose, dec)
+                           assert_allclose, assert_, dec)
 import tempdir
 from unittest import TestCase
 
@@ -138,6 +138,136 @@ class TestDCDReader(_TestDCD):
                             err_msg="wrong volume for unitcell (no unitcell "
                             "in DCD so this should be 0)")
 
+class TestDCDReaderFollow(TestCase):
+    # the DCD file is written in two parts to simulate a running simulation
+    n_first = 10
+
+    def setUp(self):
+        self.tmpdir = tempdir.TempDir()
+        self.dcd = os.path.join(self.tmpdir.name, 'growing.dcd')
+        with mda.coordinates.DCD.DCDReader(DCD) as ref:
+            n_frames, n_atoms = ref.n_frames, ref.n_atoms
+            extrablock = 48 + 8 if ref.periodic else 0
+        with open(DCD, 'rb') as f:
+            data = f.read()
+        framesize = (n_atoms + 2) * 3 * 4 + extrablock
+        split = len(data) - (n_frames - self.n_first) * framesize
+        with open(self.dcd, 'wb') as f:
+            # include part of the next frame, that is still being written
+            f.write(data[:split + framesize // 2])
+        self.remainder = data[split + framesize // 2:]
+        self.n_frames = n_frames
+
+    def tearDown(self):
+        del self.tmpdir
+
+    def _append(self):
+        with open(self.dcd, 'ab') as f:
+            f.write(self.remainder)
+
+    def test_update_n_frames(self):
+        with mda.coordinates.DCD.DCDReader(self.dcd) as dcd:
+            assert_equal(dcd.n_frames, self.n_first)
+            assert_equal(dcd.update_n_frames(), 0)
+            self._append()
+            assert_equal(dcd.update_n_frames(), self.n_frames - self.n_first)
+            assert_equal(dcd.n_frames, self.n_frames)
+            ref = mda.Universe(PSF, DCD).trajectory
+            assert_array_almost_equal(dcd[-1].positions, ref[-1].positions)
+
+    def test_update_n_frames_mmap(self):
+        with mda.coordinates.DCD.DCDReader(self.dcd, mmap=True) as dcd:
+            self._append()
+            assert_equal(dcd.update_n_frames(), self.n_frames - self.n_first)
+            ref = mda.Universe(PSF, DCD).trajectory
+            assert_array_equal(dcd[-1].positions, ref[-1].positions)
+
+    def test_follow(self):
+        dcd = mda.coordinates.DCD.DCDReader(self.dcd, follow=True,
+                                            follow_timeout=0.5,
+                                            follow_interval=0.01)
+        frames = []
+        for ts in dcd:
+            frames.append(ts.frame)
+            if ts.frame == self.n_first - 1:
+                self._append()
+        assert_equal(frames, list(range(self.n_frames)))
+        dcd.close()
+
+    def test_follow_timeout(self):
+        dcd = mda.coordinates.DCD.DCDReader(self.dcd, follow=True,
+                                            follow_timeout=0.05,
+                                            follow_interval=0.01)
+        assert_equal([ts.frame for ts in dcd], list(range(self.n_first)))
+        dcd.close()
+
+
+class TestDCDTimeseries(_TestDCD):
+    def _reference(self, indices, start=0, stop=None, skip=1):
+        return np.array([ts.positions[indices]
+                         for ts in self.dcd[start:stop:skip]])
+
+    def _check(self, indices, start=0, stop=-1, skip=1, format='fac'):
+        atoms = self.universe.atoms[indices]
+        data = self.dcd.timeseries(atoms, start=start, stop=stop, skip=skip,
+                                   format=format)
+        ref_stop = None if stop == -1 else stop + 1
+        ref = self._reference(indices, start, ref_stop, skip)
+        assert_array_almost_equal(data, ref, decimal=5)
+
+    def test_contiguous(self):
+        self._check(np.arange(100, 300))
+
+    def test_scattered(self):
+        # runs far apart, close together and single atoms
+        self._check(np.r_[0:10, 12:20, 1500, 3000:3010, 3340])
+
+    def test_unsorted(self):
+        self._check([3000, 5, 1700, 6])
+
+    def test_slice(self):
+        self._check(np.r_[0:10, 3000:3010], start=5, stop=50)
+
+    def test_format(self):
+        atoms = self.universe.atoms[[3, 2000, 4]]
+        fac = self.dcd.timeseries(atoms, format='fac')
+        assert_array_almost_equal(self.dcd.timeseries(atoms, format='afc'),
+                                  fac.transpose(1, 0, 2))
+        assert_array_almost_equal(self.dcd.timeseries(atoms, format='cfa'),
+                                  fac.transpose(2, 0, 1))
+
+
+class TestDCDReaderMmap(TestDCDReader):
+    def setUp(self):
+        self.universe = mda.Universe(PSF, DCD, mmap=True)
+        self.dcd = self.universe.trajectory
+        self.ts = self.universe.coord
+
+    def test_mapped(self):
+        assert_(self.dcd._mmap is not None)
+
+    def test_frames(self):
+        ref = mda.Universe(PSF, DCD).trajectory
+        for ts in self.dcd[::10]:
+            ref_ts = ref[ts.frame]
+            assert_equal(ts._frame, ref_ts._frame)
+            assert_array_equal(ts.positions, ref_ts.positions)
+            assert_array_equal(ts._unitcell, ref_ts._unitcell)
+
+
+class TestDCDTimeseriesMmap(TestDCDTimeseries):
+    def setUp(self):
+        self.universe = mda.Universe(PSF, DCD, mmap=True)
+        self.dcd = self.universe.trajectory
+        self.ts = self.universe.coord
+
+    def test_same_as_read(self):
+        atoms = self.universe.atoms[[5, 3000, 4, 1200]]
+        ref = mda.Universe(PSF, DCD).trajectory
+        assert_array_equal(self.dcd.timeseries(atoms, format='fac'),
+                           ref.timeseries(atoms, format='fac'))
+
+
 def test_DCDReader_set_dt(dt=100., frame=3):
     u = mda.Universe(PSF, DCD, dt=dt)
     assert_almost_equal(u.trajectory[frame].time, frame*dt,
@@ -370,6 +500,18 @@ class TestDCDReader_NAMD_Unitcell(_TestDCDReader_TriclinicUnitcell,
     pass
 
 
+class TestDCDReader_CHARMM_Unitcell_Mmap(TestDCDReader_CHARMM_Unitcell):
+    def setUp(self):
+        super(TestDCDReader_CHARMM_Unitcell_Mmap, self).setUp()
+        self.u = mda.Universe(self.topology, self.trajectory, mmap=True)
+
+
+class TestDCDReader_NAMD_Unitcell_Mmap(TestDCDReader_NAMD_Unitcell):
+    def setUp(self):
+        super(TestDCDReader_NAMD_Unitcell_Mmap, self).setUp()
+        self.u = mda.Universe(self.topology, self.trajectory, mmap=True)
+
+
 class TestNCDF2DCD(TestCase):
     @dec.skipif(module_not_found("netCDF4"),
                 "Test skipped because netCDF is not available.")
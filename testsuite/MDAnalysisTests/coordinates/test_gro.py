@@ -159,6 +159,24 @@ class TestGROReaderNoConversion(TestCase, RefAdK):
             err_msg="wrong volume for unitcell (rhombic dodecahedron)")
 
 
+class TestGROReaderNoAtoms(TestCase):
+    def setUp(self):
+        self.tmpdir = tempdir.TempDir()
+        self.filename = self.tmpdir.name + '/empty.gro'
+        with open(self.filename, 'w') as f:
+            f.write("empty system\n    0\n   1.00000   2.00000   3.00000\n")
+
+    def tearDown(self):
+        del self.tmpdir
+
+    def test_read(self):
+        reader = mda.coordinates.GRO.GROReader(self.filename)
+        assert_equal(reader.n_atoms, 0)
+        assert_equal(reader.ts.positions.shape, (0, 3))
+        assert_array_almost_equal(reader.ts.dimensions,
+                                  [10., 20., 30., 90., 90., 90.])
+
+
 class TestGROWriter(TestCase, tempdir.TempDir):
     def setUp(self):
         self.universe = mda.Universe(GRO)
@@ -236,6 +254,19 @@ class TestGROWriter(TestCase, tempdir.TempDir):
         del u
 
 
+    def test_write_frames(self):
+        # the atom lines are reused for the next frame of the same atoms
+        W = mda.coordinates.GRO.GROWriter(self.outfile)
+        ref = []
+        for shift in (0, 10):
+            self.universe.atoms.translate([shift, 0, 0])
+            ref.append(self.universe.atoms.positions)
+            W.write(self.universe)
+            u = mda.Universe(self.outfile)
+            assert_almost_equal(u.atoms.positions, ref[-1], self.prec)
+        assert_equal(u.atoms.names, self.universe.atoms.names)
+
+
 class TestGROWriterLarge(TestCase, tempdir.TempDir):
     def setUp(self):
         self.tmpdir = tempdir.TempDir()
@@ -0,0 +1,201 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4 fileencoding=utf-8
+#
+# MDAnalysis --- http://www.MDAnalysis.org
+# Copyright (c) 2006-2015 Naveen Michaud-Agrawal, Elizabeth J. Denning, Oliver
+# Beckstein and contributors (see AUTHORS for the full list)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+from six.moves import zip
+
+import numpy as np
+from numpy.testing import (assert_equal, assert_array_equal,
+                           assert_array_almost_equal, assert_raises, assert_)
+
+import MDAnalysis as mda
+from MDAnalysis.coordinates.memory import MemoryReader
+from MDAnalysisTests.datafiles import PSF, DCD, GRO_velocity
+
+from unittest import TestCase
+
+
+class TestMemoryReader(TestCase):
+    def setUp(self):
+        self.ref = mda.Universe(PSF, DCD)
+        self.universe = mda.Universe(PSF, DCD)
+        self.universe.transfer_to_memory()
+        self.reader = self.universe.trajectory
+
+    def tearDown(self):
+        del self.ref
+        del self.universe
+        del self.reader
+
+    def test_reader(self):
+        assert_(isinstance(self.reader, MemoryReader))
+
+    def test_n_atoms(self):
+        assert_equal(self.reader.n_atoms, self.ref.trajectory.n_atoms)
+
+    def test_n_frames(self):
+        assert_equal(len(self.reader), self.ref.trajectory.n_frames)
+
+    def test_array(self):
+        array = self.reader.coordinate_array
+        assert_equal(array.shape, (98, 3341, 3))
+        assert_(array.flags['C_CONTIGUOUS'])
+        assert_equal(array.dtype, np.float32)
+
+    def test_iteration(self):
+        for ts, ref_ts in zip(self.reader, self.ref.trajectory):
+            assert_equal(ts.frame, ref_ts.frame)
+            assert_array_equal(ts.positions, ref_ts.positions)
+            assert_array_almost_equal(ts.dimensions, ref_ts.dimensions)
+            assert_array_almost_equal(ts.time, ref_ts.time)
+        assert_equal(self.reader.frame, 0)
+
+    def test_frame_jump(self):
+        ts = self.reader[37]
+        assert_equal(ts.frame, 37)
+        assert_array_equal(ts.positions, self.ref.trajectory[37].positions)
+
+    def test_slice(self):
+        frames = [ts.frame for ts in self.reader[10:40:7]]
+        assert_equal(frames, list(range(10, 40, 7)))
+
+    def test_go_over_last_frame(self):
+        assert_raises(IndexError, self.reader.__getitem__, 98)
+
+    def test_positions_view(self):
+        ts = self.reader[5]
+        assert_(np.may_share_memory(ts.positions,
+                                    self.reader.coordinate_array))
+        assert_(ts._pos.base is not None)
+
+    def test_positions_changed(self):
+        self.reader[5]
+        self.universe.atoms.translate([1, 2, 3])
+        self.reader[6]
+        self.reader[5]
+        assert_array_almost_equal(self.universe.atoms.positions,
+                                  self.ref.trajectory[5].positions + [1, 2, 3],
+                                  decimal=5)
+
+    def test_dt(self):
+        assert_array_almost_equal(self.reader.dt, self.ref.trajectory.dt)
+
+    def test_timeseries(self):
+        atoms = self.universe.atoms[[3, 1000, 2]]
+        assert_array_equal(self.reader.timeseries(atoms, format='afc'),
+                           self.ref.trajectory.timeseries(atoms,
+                                                          format='afc'))
+
+    def test_timeseries_skip(self):
+        atoms = self.universe.atoms[[3, 1000, 2]]
+        ts = self.reader.timeseries(atoms, start=2, stop=20, skip=3,
+                                    format='fac')
+        assert_equal(ts.shape, (7, 3, 3))
+        assert_array_equal(ts[1],
+                           self.ref.trajectory[5].positions[[3, 1000, 2]])
+
+    def test_timeseries_negative_stop(self):
+        atoms = self.universe.atoms[[3, 1000, 2]]
+        assert_array_equal(
+            self.reader.timeseries(atoms, start=90, stop=-2, format='fac'),
+            self.ref.trajectory.timeseries(atoms, start=90, stop=-2,
+                                           format='fac'))
+        ts = self.reader.timeseries(atoms, start=90, stop=-2, format='fac')
+        assert_equal(ts.shape, (7, 3, 3))
+
+    def test_timeseries_invalid(self):
+        assert_raises(ValueError, self.reader.timeseries, format='abc')
+        assert_raises(IndexError, self.reader.timeseries, start=200)
+
+    def test_get_array(self):
+        assert_equal(self.reader.get_array('afc').shape, (3341, 98, 3))
+        assert_equal(self.reader.get_array('cfa').shape, (3, 98, 3341))
+
+    def test_repr(self):
+        assert_equal(repr(self.reader),
+                     "<MemoryReader with 98 frames of 3341 atoms>")
+
+
+class TestMemoryReaderFromArray(TestCase):
+    def setUp(self):
+        self.ref = mda.Universe(PSF, DCD)
+        self.coordinates = self.ref.trajectory.timeseries(self.ref.atoms,
+                                                          format='fac')
+
+    def test_universe(self):
+        u = mda.Universe(PSF, self.coordinates)
+        assert_(isinstance(u.trajectory, MemoryReader))
+        assert_array_equal(u.trajectory[4].positions,
+                           self.coordinates[4])
+
+    def test_universe_order(self):
+        u = mda.Universe(PSF, self.coordinates.swapaxes(0, 1),
+                         format='MEMORY', order='afc')
+        assert_(u.trajectory.coordinate_array.flags['C_CONTIGUOUS'])
+        assert_array_equal(u.trajectory[4].positions,
+                           self.coordinates[4])
+
+    def test_dimensions(self):
+        reader = MemoryReader(self.coordinates,
+                              dimensions=[10, 11, 12, 90, 90, 90])
+        assert_array_equal(reader[7].dimensions, [10, 11, 12, 90, 90, 90])
+
+    def test_time(self):
+        reader = MemoryReader(self.coordinates, dt=2.5)
+        assert_array_almost_equal(reader[4].time, 10.0)
+        assert_array_almost_equal(reader.dt, 2.5)
+
+    def test_wrong_dimensions(self):
+        assert_raises(ValueError, MemoryReader, self.coordinates,
+                      dimensions=np.zeros((5, 6)))
+
+    def test_wrong_order(self):
+        assert_raises(ValueError, MemoryReader, self.coordinates,
+                      order='fab')
+
+
+class TestMemoryReaderFromReader(TestCase):
+    def setUp(self):
+        self.ref = mda.Universe(PSF, DCD)
+
+    def test_selection_step(self):
+        ca = self.ref.select_atoms("name CA")
+        reader = MemoryReader.from_reader(self.ref.trajectory, atoms=ca,
+                                          start=5, step=10)
+        assert_equal(reader.n_atoms, ca.n_atoms)
+        assert_equal(reader.n_frames, 10)
+        assert_array_equal(reader[2].positions,
+                           self.ref.trajectory[25].positions[ca.indices])
+        assert_array_almost_equal(reader[2].time,
+                                  self.ref.trajectory[25].time)
+
+    def test_dtype(self):
+        reader = MemoryReader.from_reader(self.ref.trajectory,
+                                          dtype=np.float64)
+        assert_equal(reader.coordinate_array.dtype, np.float64)
+        assert_equal(reader.ts.positions.dtype, np.float64)
+
+    def test_transfer_to_memory_slice(self):
+        self.ref.transfer_to_memory(stop=20, step=2)
+        assert_equal(self.ref.trajectory.n_frames, 10)
+
+    def test_velocities(self):
+        u = mda.Universe(GRO_velocity)
+        u.transfer_to_memory()
+        ts = u.trajectory.ts
+        assert_(ts.has_velocities)
+        assert_array_equal(ts.velocities,
+                           mda.Universe(GRO_velocity).atoms.velocities)
+        assert_(np.may_share_memory(ts.velocities,
+                                    u.trajectory.velocity_array))
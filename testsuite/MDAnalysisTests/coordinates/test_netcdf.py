@@ -6,7 +6,7 @@ from six.moves import zip
 from nose.plugins.attrib import attr
 from numpy.testing import (assert_equal, assert_array_almost_equal,
                            assert_array_equal,
-                           assert_almost_equal, assert_raises, dec)
+                           assert_almost_equal, assert_raises, assert_, dec)
 import tempdir
 from unittest import TestCase
 from MDAnalysisTests import module_not_found
@@ -113,6 +113,72 @@ class TestNCDFReader2(TestCase):
         assert_almost_equal(ref, self.u.trajectory.ts.dt, self.prec)
 
 
+class TestNCDFReaderBlocks(TestCase):
+    @dec.skipif(module_not_found("netCDF4"), "Test skipped because netCDF is not available.")
+    def setUp(self):
+        self.ref = mda.Universe(PFncdf_Top, PFncdf_Trj, buffer_frames=1)
+        self.u = mda.Universe(PFncdf_Top, PFncdf_Trj, buffer_frames=3)
+        self.n_frames = self.u.trajectory.n_frames
+
+    def tearDown(self):
+        self.u.trajectory.close()
+        self.ref.trajectory.close()
+        del self.u
+        del self.ref
+
+    def _frames(self, trajectory):
+        return [(ts.frame, ts.time, ts.positions.copy(), ts.forces.copy(),
+                 ts.dimensions.copy()) for ts in trajectory]
+
+    def _assert_frames(self, frames, ref):
+        assert_equal(len(frames), len(ref))
+        for frame, ref_frame in zip(frames, ref):
+            assert_equal(frame[0], ref_frame[0])
+            assert_almost_equal(frame[1], ref_frame[1])
+            for value, ref_value in zip(frame[2:], ref_frame[2:]):
+                assert_array_equal(value, ref_value)
+
+    def test_iteration(self):
+        ref = [self._frames([self.ref.trajectory[i]])[0]
+               for i in range(self.n_frames)]
+        self._assert_frames(self._frames(self.u.trajectory), ref)
+
+    def test_slices(self):
+        for sl in (slice(1, None, 2), slice(None, None, -1),
+                   slice(-2, 0, -3)):
+            ref = [self._frames([self.ref.trajectory[i]])[0]
+                   for i in range(self.n_frames)[sl]]
+            self._assert_frames(self._frames(self.u.trajectory[sl]), ref)
+
+    def test_random_access_after_iteration(self):
+        for ts in self.u.trajectory[::2]:
+            pass
+        assert_array_equal(self.u.trajectory[1].positions,
+                           self.ref.trajectory[1].positions)
+
+    def test_timeseries(self):
+        atoms = self.u.atoms[[3, 10, 7]]
+        ref = np.array([atoms.positions for ts in self.u.trajectory])
+        assert_array_equal(self.u.trajectory.timeseries(atoms, format='fac'),
+                           ref)
+        assert_array_equal(self.u.trajectory.timeseries(atoms),
+                           ref.transpose(1, 0, 2))
+        assert_array_equal(
+            self.u.trajectory.timeseries(atoms, start=1, stop=-1, skip=2,
+                                         format='fac'), ref[1::2])
+        assert_array_equal(
+            self.u.trajectory.timeseries(atoms, start=-1, stop=0, skip=-1,
+                                         format='fac'), ref[::-1])
+
+    def test_timeseries_all_atoms(self):
+        ref = np.array([ts.positions.copy() for ts in self.u.trajectory])
+        assert_array_equal(self.u.trajectory.timeseries(format='fac'), ref)
+
+    def test_timeseries_no_atoms(self):
+        assert_raises(mda.NoDataError, self.u.trajectory.timeseries,
+                      self.u.atoms[[]])
+
+
 class _NCDFWriterTest(TestCase):
     @dec.skipif(module_not_found("netCDF4"), "Test skipped because netCDF is not available.")
     def setUp(self):
@@ -357,3 +423,85 @@ class TestNCDFWriterVelsForces(TestCase):
 
     def test_pos_vel_force(self):
         self._write_ts(True, True, True)
+
+
+class TestNCDFWriterStorage(TestCase):
+    """Test compression, chunking and buffered writing"""
+
+    @dec.skipif(module_not_found("netCDF4"), "Test skipped because netCDF is not available.")
+    def setUp(self):
+        self.tmpdir = tempdir.TempDir()
+        self.outfile = os.path.join(self.tmpdir.name, 'ncdf-storage.ncdf')
+        self.universe = mda.Universe(PFncdf_Top, PFncdf_Trj)
+
+    def tearDown(self):
+        self.universe.trajectory.close()
+        del self.universe
+        del self.tmpdir
+
+    def _write(self, **kwargs):
+        with mda.coordinates.TRJ.NCDFWriter(
+                self.outfile, self.universe.atoms.n_atoms, forces=True,
+                **kwargs) as w:
+            for ts in self.universe.trajectory:
+                w.write_next_timestep(ts)
+
+    def _check(self, **kwargs):
+        u = mda.Universe(PFncdf_Top, self.outfile, **kwargs)
+        assert_equal(u.trajectory.n_frames, self.universe.trajectory.n_frames)
+        for ts, ref in zip(u.trajectory, self.universe.trajectory):
+            assert_array_almost_equal(ts.positions, ref.positions, 5)
+            assert_array_almost_equal(ts.forces, ref.forces, 3)
+            assert_almost_equal(ts.time, ref.time, 5)
+        u.trajectory.close()
+
+    def _dataset(self):
+        import netCDF4
+        return netCDF4.Dataset(self.outfile)
+
+    def test_default_format(self):
+        self._write()
+        ncfile = self._dataset()
+        assert_(ncfile.data_model.startswith('NETCDF3_64BIT'))
+        ncfile.close()
+        self._check()
+
+    def test_compression(self):
+        self._write(zlib=True, cmplevel=4)
+        ncfile = self._dataset()
+        assert_equal(ncfile.data_model, 'NETCDF4')
+        filters = ncfile.variables['coordinates'].filters()
+        assert_equal(filters['zlib'], True)
+        assert_equal(filters['complevel'], 4)
+        assert_equal(filters['shuffle'], True)
+        ncfile.close()
+        self._check()
+
+    def test_chunks(self):
+        self._write(chunks=(2, 100))
+        ncfile = self._dataset()
+        assert_equal(ncfile.variables['coordinates'].chunking(), [2, 100, 3])
+        assert_equal(ncfile.variables['forces'].chunking(), [2, 100, 3])
+        ncfile.close()
+        self._check()
+
+    def test_default_chunks(self):
+        self._write(zlib=True)
+        ncfile = self._dataset()
+        n_atoms = self.universe.atoms.n_atoms
+        frames, atoms, spatial = ncfile.variables['coordinates'].chunking()
+        assert_equal(atoms, min(n_atoms, 4096))
+        assert_(frames > 1)
+        ncfile.close()
+
+    def test_buffer_frames(self):
+        self._write(buffer_frames=3)
+        self._check()
+
+    def test_no_conversion(self):
+        self._write(convert_units=False, buffer_frames=2)
+        self._check(convert_units=False)
+
+    def test_buffer_frames_invalid(self):
+        assert_raises(ValueError, mda.coordinates.TRJ.NCDFWriter,
+                      self.outfile, 10, buffer_frames=0)
@@ -4,6 +4,8 @@ from six.moves import zip
 import MDAnalysis as mda
 import numpy as np
 import os
+import shutil
+import warnings
 
 from nose.plugins.attrib import attr
 from numpy.testing import (assert_equal, assert_, dec,
@@ -15,6 +17,7 @@ from unittest import TestCase
 from MDAnalysisTests.coordinates.reference import (RefAdKSmall, Ref4e43,
                                                    RefAdK)
 from MDAnalysisTests.coordinates.base import _SingleFrameReader
+from MDAnalysis.coordinates import XDR
 from MDAnalysisTests.datafiles import (PDB, PDB_small, PDB_multiframe,
                                        XPDB_small, PSF, DCD, CONECT, CRD,
                                        INC_PDB, PDB_xlserial, ALIGN)
@@ -425,6 +428,97 @@ class TestMultiPDBReader(TestCase):
                      "is %d" % (len(u._topology['bonds']), len(desired)))
 
 
+class TestMultiPDBReaderOffsets(TestCase):
+    def setUp(self):
+        self.tmpdir = tempdir.TempDir()
+        self.filename = os.path.join(self.tmpdir.name, 'multi.pdb')
+        shutil.copy(PDB_multiframe, self.filename)
+        self.offsets = os.path.join(self.tmpdir.name,
+                                    '.multi.pdb_offsets.bin')
+
+    def tearDown(self):
+        del self.tmpdir
+
+    def _positions(self, trajectory):
+        return [ts.positions.copy() for ts in trajectory]
+
+    def test_offsets_stored(self):
+        u = mda.Universe(self.filename, permissive=True)
+        assert_(os.path.isfile(self.offsets))
+        offsets = XDR.read_offsets(self.offsets)['offsets']
+        assert_equal(len(offsets), u.trajectory.n_frames + 1)
+        with open(self.filename, 'rb') as f:
+            for offset in offsets[:-1]:
+                f.seek(offset)
+                assert_equal(f.read(5), b'MODEL')
+
+    def test_offsets_reused(self):
+        ref = self._positions(mda.Universe(self.filename,
+                                           permissive=True).trajectory)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            u = mda.Universe(self.filename, permissive=True)
+        assert_equal([str(x.message) for x in w
+                      if 'offsets' in str(x.message)], [])
+        assert_equal(u.trajectory.n_frames, 24)
+        assert_array_almost_equal(self._positions(u.trajectory), ref)
+
+    def test_refresh_offsets(self):
+        mda.Universe(self.filename, permissive=True)
+        XDR.write_offsets(self.offsets, [0, 10], 0, 0, 392)
+        u = mda.Universe(self.filename, permissive=True)
+        assert_equal(u.trajectory.n_frames, 24)
+        u = mda.Universe(self.filename, permissive=True,
+                         refresh_offsets=True)
+        assert_equal(u.trajectory.n_frames, 24)
+
+    def test_random_access(self):
+        u = mda.Universe(self.filename, permissive=True)
+        ref = self._positions(u.trajectory)
+        for frame in [7, 23, 0, 12, 11, 23]:
+            ts = u.trajectory[frame]
+            assert_equal(ts.frame, frame)
+            assert_array_almost_equal(ts.positions, ref[frame])
+
+    def test_dimensions(self):
+        # the CRYST1 record comes before the first MODEL record
+        u = mda.Universe(self.filename, permissive=True)
+        for ts in u.trajectory[::5]:
+            assert_array_almost_equal(ts.dimensions, [1, 1, 1, 90, 90, 90])
+
+    def test_dimensions_in_frame(self):
+        with open(self.filename) as f:
+            lines = f.readlines()
+        models = [i for i, line in enumerate(lines)
+                  if line.startswith('MODEL')]
+        lines.insert(models[2] + 1, "CRYST1   10.000   20.000   30.000  "
+                     "90.00  90.00 120.00 P 1           1\n")
+        with open(self.filename, 'w') as f:
+            f.writelines(lines)
+        u = mda.Universe(self.filename, permissive=True)
+        assert_array_almost_equal(u.trajectory[2].dimensions,
+                                  [10, 20, 30, 90, 90, 120])
+        assert_array_almost_equal(u.trajectory[3].dimensions,
+                                  [1, 1, 1, 90, 90, 90])
+
+    def test_read_after_close(self):
+        u = mda.Universe(self.filename, permissive=True)
+        ref = u.trajectory[5].positions.copy()
+        u.trajectory.close()
+        assert_array_almost_equal(u.trajectory[5].positions, ref)
+        u.trajectory.close()
+        u.trajectory.rewind()
+        assert_equal(u.trajectory.frame, 0)
+
+    def test_single_frame_not_stored(self):
+        filename = os.path.join(self.tmpdir.name, 'single.pdb')
+        shutil.copy(PDB_small, filename)
+        u = mda.Universe(filename, permissive=True)
+        assert_equal(u.trajectory.n_frames, 1)
+        assert_(not os.path.exists(os.path.join(self.tmpdir.name,
+                                                '.single.pdb_offsets.bin')))
+
+
 class TestMultiPDBWriter(TestCase):
     @dec.skipif(parser_not_found('DCD'),
                 'DCD parser not available. Are you using python 3?')
@@ -513,6 +607,33 @@ class TestMultiPDBWriter(TestCase):
                      err_msg="The number of frames should be 3.")
 
 
+    def test_write_frames(self):
+        u = self.universe2
+        with mda.Writer(self.outfile, multiframe=True) as W:
+            for ts in u.trajectory[:3]:
+                u.atoms.bfactors = ts.frame
+                W.write(u.atoms)
+        u0 = mda.Universe(self.outfile)
+        for ts, ref_ts in zip(u0.trajectory, u.trajectory[:3]):
+            assert_array_almost_equal(ts.positions, ref_ts.positions,
+                                      self.prec)
+        # tempFactors are written for every frame
+        with open(self.outfile) as pdb:
+            tempfactors = [float(line[60:66]) for line in pdb
+                           if line.startswith('ATOM')]
+        assert_equal(np.reshape(tempfactors, (3, -1)),
+                     np.repeat([[0], [1], [2]], u.atoms.n_atoms, axis=1))
+
+    def test_write_percent(self):
+        u = self.universe
+        u.atoms[0].name = 'C%'
+        u.atoms[0].resname = '%d'
+        u.atoms.write(self.outfile)
+        with open(self.outfile) as pdb:
+            atom = [line for line in pdb if line.startswith('ATOM')][0]
+        assert_equal(atom[12:21], ' C%  %d  ')
+
+
 class TestPDBReaderBig(TestCase, RefAdK):
     def setUp(self):
         self.universe = mda.Universe(PDB)
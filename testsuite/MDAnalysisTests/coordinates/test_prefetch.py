@@ -0,0 +1,156 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4 fileencoding=utf-8
+#
+# MDAnalysis --- http://www.MDAnalysis.org
+# Copyright (c) 2006-2015 Naveen Michaud-Agrawal, Elizabeth J. Denning, Oliver
+# Beckstein and contributors (see AUTHORS for the full list)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+from six.moves import zip
+
+from numpy.testing import (assert_equal, assert_array_equal,
+                           assert_array_almost_equal, assert_raises, assert_)
+
+import MDAnalysis as mda
+from MDAnalysis.coordinates.prefetch import PrefetchReader
+from MDAnalysisTests.datafiles import PSF, DCD, GRO, XTC
+
+from unittest import TestCase
+
+
+class _PrefetchReaderTest(TestCase):
+    topology = None
+    trajectory = None
+
+    def setUp(self):
+        self.ref = mda.Universe(self.topology, self.trajectory)
+        self.universe = mda.Universe(self.topology, self.trajectory,
+                                     prefetch=3)
+        self.reader = self.universe.trajectory
+
+    def tearDown(self):
+        self.reader.close()
+        del self.ref
+        del self.universe
+        del self.reader
+
+    def test_reader(self):
+        assert_(isinstance(self.reader, PrefetchReader))
+        assert_equal(self.reader.n_frames, self.ref.trajectory.n_frames)
+        assert_equal(self.reader.n_atoms, self.ref.trajectory.n_atoms)
+        assert_equal(self.reader.format, self.ref.trajectory.format)
+
+    def test_iteration(self):
+        for ts, ref_ts in zip(self.reader, self.ref.trajectory):
+            assert_equal(ts.frame, ref_ts.frame)
+            assert_array_equal(ts.positions, ref_ts.positions)
+            assert_array_almost_equal(ts.dimensions, ref_ts.dimensions)
+            assert_array_almost_equal(ts.time, ref_ts.time)
+            assert_array_equal(self.universe.atoms.positions,
+                               ref_ts.positions)
+        assert_equal(self.reader.frame, 0)
+
+    def test_iteration_twice(self):
+        frames = [ts.frame for ts in self.reader]
+        assert_equal([ts.frame for ts in self.reader], frames)
+        assert_equal(len(frames), self.ref.trajectory.n_frames)
+
+    def test_slice(self):
+        ref = [ts.positions.copy() for ts in self.ref.trajectory[1:9:3]]
+        frames = []
+        for ts, pos in zip(self.reader[1:9:3], ref):
+            frames.append(ts.frame)
+            assert_array_equal(self.universe.atoms.positions, pos)
+        assert_equal(frames, [1, 4, 7])
+
+    def test_reverse_slice(self):
+        frames = [ts.frame for ts in self.reader[7:1:-2]]
+        assert_equal(frames, [7, 5, 3])
+        ref = [ts.positions.copy() for ts in self.ref.trajectory[::-1]]
+        frames = []
+        for ts, pos in zip(self.reader[::-1], ref):
+            frames.append(ts.frame)
+            assert_array_equal(self.universe.atoms.positions, pos)
+        n_frames = self.ref.trajectory.n_frames
+        assert_equal(frames, list(range(n_frames - 1, -1, -1)))
+        assert_equal([ts.frame for ts in self.reader[4::-3]], [4, 1])
+
+    def test_seek_during_iteration(self):
+        for ts in self.reader:
+            if ts.frame == 2:
+                break
+        ts = self.reader[5]
+        assert_equal(ts.frame, 5)
+        assert_array_equal(ts.positions, self.ref.trajectory[5].positions)
+
+    def test_next_after_break(self):
+        for ts in self.reader:
+            if ts.frame == 1:
+                break
+        ts = self.reader.next()
+        assert_equal(ts.frame, 2)
+        assert_array_equal(ts.positions, self.ref.trajectory[2].positions)
+
+    def test_bounded_buffers(self):
+        for ts in self.reader:
+            pass
+        assert_equal(len(set(id(ts._pos) for ts in self.reader)), 5)
+
+    def test_timeseries(self):
+        if not hasattr(self.ref.trajectory, 'timeseries'):
+            return
+        atoms = self.universe.atoms[[0, 5, 10]]
+        for ts in self.reader:
+            if ts.frame == 1:
+                break
+        assert_array_equal(self.reader.timeseries(atoms, format='fac'),
+                           self.ref.trajectory.timeseries(atoms, format='fac'))
+
+
+class TestPrefetchReaderDCD(_PrefetchReaderTest):
+    topology = PSF
+    trajectory = DCD
+
+
+class TestPrefetchReaderXTC(_PrefetchReaderTest):
+    topology = GRO
+    trajectory = XTC
+
+
+class TestPrefetchReader(TestCase):
+    def test_wrap(self):
+        u = mda.Universe(PSF, DCD)
+        u.trajectory = PrefetchReader(u.trajectory, n_frames=1)
+        assert_equal(sum(1 for ts in u.trajectory), 98)
+
+    def test_n_frames(self):
+        u = mda.Universe(PSF, DCD)
+        assert_raises(ValueError, PrefetchReader, u.trajectory, n_frames=0)
+
+    def test_transfer_to_memory(self):
+        ref = mda.Universe(PSF, DCD)
+        u = mda.Universe(PSF, DCD, prefetch=2)
+        u.transfer_to_memory(step=10)
+        assert_equal(u.trajectory.n_frames, 10)
+        assert_array_equal(u.trajectory[3].positions,
+                           ref.trajectory[30].positions)
+
+    def test_error_in_thread(self):
+        u = mda.Universe(PSF, DCD)
+        reader = PrefetchReader(u.trajectory)
+
+        def broken(start, stop, step):
+            yield u.trajectory[0]
+            raise RuntimeError("broken")
+
+        reader._reader._sliced_iter = broken
+        frames = iter(reader[1:10:2])
+        assert_equal(next(frames).frame, 0)
+        assert_raises(RuntimeError, next, frames)
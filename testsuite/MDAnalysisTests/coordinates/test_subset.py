@@ -0,0 +1,209 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4 fileencoding=utf-8
+#
+# MDAnalysis --- http://www.MDAnalysis.org
+# Copyright (c) 2006-2015 Naveen Michaud-Agrawal, Elizabeth J. Denning, Oliver
+# Beckstein and contributors (see AUTHORS for the full list)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+from six.moves import zip
+
+import numpy as np
+from numpy.testing import (assert_equal, assert_array_equal,
+                           assert_array_almost_equal, assert_raises, assert_,
+                           dec)
+
+import MDAnalysis as mda
+from MDAnalysis.coordinates.subset import AtomSubsetReader
+from MDAnalysis.coordinates.base import ChainReader
+from MDAnalysis.coordinates.DCD import DCDReader
+from MDAnalysis.coordinates.XYZ import XYZReader
+from MDAnalysisTests.datafiles import (PSF, DCD, GRO, XTC, TRZ_psf, TRZ,
+                                       PRMncdf, NCDF, XYZ_psf, XYZ)
+from MDAnalysisTests import module_not_found
+
+from unittest import TestCase
+
+
+class _AtomIndicesTest(TestCase):
+    topology = None
+    trajectory = None
+    atom_indices = [5, 3, 0, 10]
+    reader_kwargs = {}
+    native = True
+
+    def setUp(self):
+        self.ref = mda.Universe(self.topology, self.trajectory)
+        self.indices = np.array(self.atom_indices)
+        self.reader = self.ref.trajectory.__class__(
+            self.trajectory, atom_indices=self.indices,
+            n_atoms=self.ref.atoms.n_atoms, **self.reader_kwargs)
+
+    def tearDown(self):
+        self.reader.close()
+        del self.ref
+        del self.reader
+
+    def test_reader(self):
+        assert_equal(isinstance(self.reader, AtomSubsetReader),
+                     not self.native)
+        assert_equal(self.reader.n_atoms, len(self.indices))
+        assert_equal(self.reader.ts.n_atoms, len(self.indices))
+        assert_equal(self.reader.n_frames, self.ref.trajectory.n_frames)
+        assert_array_equal(self.reader.atom_indices, self.indices)
+
+    def test_iteration(self):
+        for ts, ref_ts in zip(self.reader, self.ref.trajectory):
+            assert_equal(ts.frame, ref_ts.frame)
+            assert_array_equal(ts.positions, ref_ts.positions[self.indices])
+            assert_array_almost_equal(ts.dimensions, ref_ts.dimensions)
+
+    def test_random_access(self):
+        ref = self.ref.trajectory[3].positions[self.indices]
+        assert_array_equal(self.reader[3].positions, ref)
+        assert_equal(self.reader.ts.frame, 3)
+
+    def test_slice(self):
+        frames = [ts.frame for ts in self.reader[1:5:2]]
+        assert_equal(frames, [1, 3])
+
+    def test_reverse_slice(self):
+        n_frames = self.ref.trajectory.n_frames
+        frames = [ts.frame for ts in self.reader[::-1]]
+        assert_equal(frames, list(range(n_frames - 1, -1, -1)))
+        frames = []
+        for ts in self.reader[3::-2]:
+            ref = self.ref.trajectory[ts.frame].positions[self.indices]
+            assert_array_equal(ts.positions, ref)
+            frames.append(ts.frame)
+        assert_equal(frames, [3, 1])
+
+    def test_timeseries(self):
+        if not hasattr(self.ref.trajectory, 'timeseries'):
+            return
+        atoms = self.ref.atoms[self.indices[[1, 3]]]
+        subset = mda.Universe(self.topology).atoms[[1, 3]]
+        assert_array_equal(self.reader.timeseries(subset, format='fac'),
+                           self.ref.trajectory.timeseries(atoms,
+                                                          format='fac'))
+
+
+class TestAtomIndicesDCD(_AtomIndicesTest):
+    topology = PSF
+    trajectory = DCD
+
+
+class TestAtomIndicesDCDmmap(_AtomIndicesTest):
+    topology = PSF
+    trajectory = DCD
+    reader_kwargs = {'mmap': True}
+
+
+class TestAtomIndicesXTC(_AtomIndicesTest):
+    topology = GRO
+    trajectory = XTC
+
+
+class TestAtomIndicesTRZ(_AtomIndicesTest):
+    topology = TRZ_psf
+    trajectory = TRZ
+
+
+class TestAtomIndicesNCDF(_AtomIndicesTest):
+    topology = PRMncdf
+    trajectory = NCDF
+
+    @dec.skipif(module_not_found("netCDF4"),
+                "Test skipped because netCDF is not available.")
+    def setUp(self):
+        super(TestAtomIndicesNCDF, self).setUp()
+
+
+class TestAtomIndicesXYZ(_AtomIndicesTest):
+    topology = XYZ_psf
+    trajectory = XYZ
+    native = False
+
+    def test_no_timeseries(self):
+        assert_(not hasattr(self.reader, 'timeseries'))
+
+
+class TestAtomIndices(TestCase):
+    def test_invalid(self):
+        for indices in ([], [[1, 2]], [0.5], [-1], [3341]):
+            assert_raises(ValueError, DCDReader, DCD, atom_indices=indices)
+
+    def test_wrap_invalid(self):
+        assert_raises(ValueError, XYZReader, XYZ, atom_indices=[1284])
+
+    def test_chain(self):
+        ref = mda.Universe(PSF, DCD)
+        reader = ChainReader([DCD, DCD], atom_indices=[2, 1])
+        assert_equal(reader.n_atoms, 2)
+        assert_array_equal(reader.atom_indices, [2, 1])
+        assert_array_equal(reader[100].positions,
+                           ref.trajectory[2].positions[[2, 1]])
+
+    def test_memory(self):
+        ref = mda.Universe(PSF, DCD)
+        coordinates = ref.trajectory.timeseries(ref.atoms, format='fac')
+        reader = mda.coordinates.memory.MemoryReader(coordinates,
+                                                     atom_indices=[4, 2])
+        assert_equal(reader.coordinate_array.shape, (98, 2, 3))
+        assert_array_equal(reader[5].positions, coordinates[5, [4, 2]])
+
+
+class TestUniverseSelect(TestCase):
+    def setUp(self):
+        self.ref = mda.Universe(PSF, DCD)
+        self.universe = mda.Universe(PSF, DCD, select="resid 1:3")
+        self.atoms = self.ref.select_atoms("resid 1:3")
+
+    def tearDown(self):
+        del self.ref
+        del self.universe
+        del self.atoms
+
+    def test_atoms(self):
+        assert_equal(self.universe.atoms.n_atoms, self.atoms.n_atoms)
+        assert_array_equal(self.universe.atoms.indices,
+                           np.arange(self.atoms.n_atoms))
+        assert_array_equal(self.universe.atoms.names, self.atoms.names)
+        assert_equal(len(self.universe.residues), 3)
+        assert_equal(self.universe.s4AKE.atoms.n_atoms, self.atoms.n_atoms)
+
+    def test_trajectory(self):
+        assert_equal(self.universe.trajectory.ts.n_atoms, self.atoms.n_atoms)
+        for ts in self.universe.trajectory[::10]:
+            self.ref.trajectory[ts.frame]
+            assert_array_equal(self.universe.atoms.positions,
+                               self.atoms.positions)
+
+    def test_bonds(self):
+        bonds = self.atoms.bonds.atomgroup_intersection(self.atoms,
+                                                        strict=True)
+        assert_equal(len(self.universe.bonds), len(bonds))
+        for bond in self.universe.bonds:
+            assert_(bond[0].index < self.atoms.n_atoms)
+            assert_(bond[1].index < self.atoms.n_atoms)
+
+    def test_empty(self):
+        assert_raises(ValueError, mda.Universe, PSF, DCD, select="name XYZ")
+
+    def test_wrapped_reader(self):
+        u = mda.Universe(GRO, select="resname SOL and name OW")
+        assert_equal(u.atoms.n_atoms, 11084)
+        assert_(isinstance(u.trajectory, AtomSubsetReader))
+        assert_equal(u.trajectory.ts.n_atoms, 11084)
+
+    def test_needs_n_atoms(self):
+        ref = mda.Universe(TRZ_psf, TRZ)
+        u = mda.Universe(TRZ_psf, TRZ, select="bynum 4:10")
+        assert_array_equal(u.atoms.positions, ref.atoms.positions[3:10])
@@ -121,6 +121,34 @@ class TestTRZReader(TestCase, RefTRZ):
             except OSError:
                 pass
 
+    def test_random_access(self):
+        ref = [ts.positions.copy() for ts in self.trz]
+        for i in (4, 1, 5, 0):
+            assert_equal(self.trz[i].frame, i)
+            assert_array_almost_equal(self.ts.positions, ref[i])
+        self.trz.next()
+        assert_equal(self.ts.frame, 1)
+        assert_array_almost_equal(self.ts.positions, ref[1])
+
+    def test_timeseries(self):
+        ref = np.array([ts.positions.copy() for ts in self.trz])
+        assert_array_almost_equal(self.trz.timeseries(format='fac'), ref)
+
+    def test_timeseries_asel(self):
+        ref = np.array([ts.positions.copy() for ts in self.trz])
+        atoms = self.universe.atoms[[42, 7, 8000]]
+        coordinates = self.trz.timeseries(atoms, start=1, stop=5, skip=2)
+        assert_equal(coordinates.shape, (3, 3, 3))
+        assert_array_almost_equal(
+            coordinates, ref[1::2, atoms.indices].transpose(1, 0, 2))
+        coordinates = self.trz.timeseries(atoms, start=4, stop=0, skip=-3,
+                                          format='fac')
+        assert_array_almost_equal(coordinates, ref[[4, 1]][:, atoms.indices])
+
+    def test_timeseries_empty_asel(self):
+        assert_raises(NoDataError, self.trz.timeseries,
+                      self.universe.atoms[[]])
+
 
 class TestTRZWriter(TestCase, RefTRZ):
     def setUp(self):
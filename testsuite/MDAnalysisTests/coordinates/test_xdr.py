@@ -66,6 +66,12 @@ class _XDRReader_Sub(TestCase):
         ts = self.udry.atoms.ts
         assert_timestep_almost_equal(ts, self.ts)
 
+    def test_sub_timeseries(self):
+        self.udry.load_new(self.XDR_SUB_SOL, sub=self.sub)
+        atoms = self.udry.atoms[[0, 10, 20]]
+        coordinates = self.udry.trajectory.timeseries(atoms, format='fac')
+        assert_array_almost_equal(coordinates[0], self.ts.positions[[0, 10, 20]])
+
 
 class TestTRRReader_Sub(_XDRReader_Sub):
     XDR_SUB_SOL = TRR_sub_sol
@@ -247,6 +253,47 @@ class _GromacsReader(TestCase):
             assert_equal(err.errno, errno.EIO,
                          "IOError produces wrong error code")
 
+    def test_timeseries(self):
+        atoms = self.universe.select_atoms('name CA')
+        ref = np.array([atoms.positions for ts in self.trajectory])
+        coordinates = self.trajectory.timeseries(atoms, format='fac')
+        assert_equal(coordinates.shape, (10, len(atoms), 3))
+        assert_array_almost_equal(coordinates, ref, self.prec)
+
+    def test_timeseries_format_and_slice(self):
+        atoms = self.universe.select_atoms('name CA')
+        ref = np.array([atoms.positions for ts in self.trajectory[2:9:3]])
+        coordinates = self.trajectory.timeseries(atoms, start=2, stop=8,
+                                                 skip=3)
+        assert_equal(coordinates.shape, (len(atoms), 3, 3))
+        assert_array_almost_equal(coordinates, ref.swapaxes(0, 1),
+                                  self.prec)
+
+    def test_timeseries_all_atoms(self):
+        coordinates = self.trajectory.timeseries(format='fac')
+        assert_equal(coordinates.shape, (10, self.trajectory.n_atoms, 3))
+        self.trajectory[-1]
+        assert_array_almost_equal(coordinates[-1], self.ts.positions,
+                                  self.prec)
+
+    def test_timeseries_parallel(self):
+        atoms = self.universe.select_atoms('name CA')
+        assert_array_equal(self.trajectory.timeseries(atoms, n_threads=4),
+                           self.trajectory.timeseries(atoms))
+
+    def test_timeseries_keeps_frame(self):
+        self.trajectory[4]
+        self.trajectory.timeseries(self.universe.atoms[:10])
+        assert_equal(self.trajectory.next().frame, 5)
+
+    def test_timeseries_empty_selection(self):
+        assert_raises(mda.NoDataError, self.trajectory.timeseries,
+                      self.universe.atoms[[]])
+
+    def test_timeseries_wrong_format(self):
+        assert_raises(ValueError, self.trajectory.timeseries,
+                      self.universe.atoms, format='xyz')
+
 
 class TestXTCReader(_GromacsReader):
     filename = XTC
@@ -421,6 +468,41 @@ class _GromacsWriter(TestCase):
 class TestXTCWriter(_GromacsWriter):
     infilename = XTC
 
+    def _write(self, outfile, writer, **kwargs):
+        t = self.universe.trajectory
+        with writer(outfile, t.n_atoms, dt=t.dt, **kwargs) as W:
+            for ts in t:
+                W.write_next_timestep(ts)
+        with open(outfile, 'rb') as f:
+            return f.read()
+
+    def test_pipeline(self):
+        ref = self._write(self.tmpdir.name + '/ref.xtc', self.Writer)
+        data = self._write(self.outfile, self.Writer, pipeline=True,
+                           queue_size=2)
+        assert_equal(data, ref)
+
+    def test_n_threads(self):
+        ref = self._write(self.tmpdir.name + '/ref.xtc', self.Writer)
+        data = self._write(self.outfile, self.Writer, n_threads=3)
+        assert_equal(data, ref)
+
+    def test_n_threads_pipeline(self):
+        ref = self._write(self.tmpdir.name + '/ref.xtc', self.Writer)
+        data = self._write(self.outfile, self.Writer, n_threads=2,
+                           pipeline=True)
+        assert_equal(data, ref)
+
+    def test_pipeline_trr(self):
+        outfile = self.tmpdir.name + '/pipeline.trr'
+        self._write(outfile, mda.coordinates.TRR.TRRWriter, pipeline=True)
+        uw = mda.Universe(GRO, outfile)
+        assert_equal(uw.trajectory.n_frames,
+                     self.universe.trajectory.n_frames)
+        for orig_ts, written_ts in zip(self.universe.trajectory,
+                                       uw.trajectory):
+            assert_array_almost_equal(written_ts._pos, orig_ts._pos, 5)
+
 
 class TestTRRWriter(_GromacsWriter):
     infilename = TRR
@@ -733,7 +815,7 @@ class _GromacsReader_offsets(TestCase):
                                   err_msg="wrong frame offsets")
 
         outfile_offsets = XDR.offsets_filename(self.traj)
-        saved_offsets = XDR.read_numpy_offsets(outfile_offsets)
+        saved_offsets = XDR.read_offsets(outfile_offsets)
 
         assert_array_almost_equal(self.trajectory._xdr.offsets,
                                   saved_offsets['offsets'],
@@ -757,10 +839,9 @@ class _GromacsReader_offsets(TestCase):
         # check that stored offsets are not loaded when trajectory
         # size differs from stored size
         fname = XDR.offsets_filename(self.traj)
-        saved_offsets = XDR.read_numpy_offsets(fname)
+        saved_offsets = XDR.read_offsets(fname)
         saved_offsets['size'] += 1
-        with open(fname, 'wb') as f:
-            np.savez(f, **saved_offsets)
+        XDR.write_offsets(fname, **saved_offsets)
 
         with warnings.catch_warnings(record=True) as warn:
             warnings.simplefilter('always')
@@ -773,10 +854,9 @@ class _GromacsReader_offsets(TestCase):
         # check that stored offsets are not loaded when trajectory
         # ctime differs from stored ctime
         fname = XDR.offsets_filename(self.traj)
-        saved_offsets = XDR.read_numpy_offsets(fname)
+        saved_offsets = XDR.read_offsets(fname)
         saved_offsets['ctime'] += 1
-        with open(fname, 'wb') as f:
-            np.savez(f, **saved_offsets)
+        XDR.write_offsets(fname, **saved_offsets)
 
         with warnings.catch_warnings(record=True) as warn:
             warnings.simplefilter('always')
@@ -789,9 +869,9 @@ class _GromacsReader_offsets(TestCase):
         # check that stored offsets are not loaded when trajectory
         # ctime differs from stored ctime
         fname = XDR.offsets_filename(self.traj)
-        saved_offsets = XDR.read_numpy_offsets(fname)
+        saved_offsets = XDR.read_offsets(fname)
         saved_offsets['n_atoms'] += 1
-        np.savez(fname, **saved_offsets)
+        XDR.write_offsets(fname, **saved_offsets)
 
         with warnings.catch_warnings(record=True) as warn:
             warnings.simplefilter('always')
@@ -802,11 +882,12 @@ class _GromacsReader_offsets(TestCase):
     @dec.slow
     def test_persistent_offsets_last_frame_wrong(self):
         fname = XDR.offsets_filename(self.traj)
-        saved_offsets = XDR.read_numpy_offsets(fname)
+        saved_offsets = XDR.read_offsets(fname)
 
         idx_frame = 3
+        saved_offsets['offsets'] = saved_offsets['offsets'].copy()
         saved_offsets['offsets'][idx_frame] += 42
-        np.savez(fname, **saved_offsets)
+        XDR.write_offsets(fname, **saved_offsets)
 
         with warnings.catch_warnings(record=True) as warn:
             warnings.simplefilter('always')
@@ -819,16 +900,127 @@ class _GromacsReader_offsets(TestCase):
     @dec.slow
     def test_unsupported_format(self):
         fname = XDR.offsets_filename(self.traj)
-        saved_offsets = XDR.read_numpy_offsets(fname)
+        saved_offsets = XDR.read_offsets(fname)
+        os.remove(fname)
 
         idx_frame = 3
         saved_offsets.pop('n_atoms')
-        np.savez(fname, **saved_offsets)
+        np.savez(XDR.offsets_filename(self.traj, ending='npz'),
+                 **saved_offsets)
 
         # ok as long as this doesn't throw
         reader = self._reader(self.traj)
         reader[idx_frame]
 
+    @dec.slow
+    def test_legacy_offsets(self):
+        fname = XDR.offsets_filename(self.traj)
+        saved_offsets = XDR.read_offsets(fname)
+        os.remove(fname)
+        np.savez(XDR.offsets_filename(self.traj, ending='npz'),
+                 **saved_offsets)
+
+        with warnings.catch_warnings(record=True) as warn:
+            warnings.simplefilter('always')
+            reader = self._reader(self.traj)
+        assert_equal(len(warn), 0)
+        assert_array_equal(reader._xdr.offsets, self.ref_offsets)
+
+    def test_corrupt_offsets_file(self):
+        fname = XDR.offsets_filename(self.traj)
+        with open(fname, 'wb') as f:
+            f.write(b'garbage')
+
+        with warnings.catch_warnings(record=True) as warn:
+            warnings.simplefilter('always')
+            reader = self._reader(self.traj)
+        assert_equal(len(warn), 1)
+        assert_array_equal(reader._xdr.offsets, self.ref_offsets)
+        assert_array_equal(XDR.read_offsets(fname)['offsets'],
+                           self.ref_offsets)
+
+    def _truncate(self, n_frames):
+        """only keep the first `n_frames` of the trajectory and the beginning
+        of the next one, return the missing data"""
+        with open(self.filename, 'rb') as f:
+            data = f.read()
+        split = self.ref_offsets[n_frames] + 100
+        with open(self.traj, 'wb') as f:
+            f.write(data[:split])
+        return data[split:]
+
+    def _grow(self, n_frames):
+        """write the first `n_frames` of the trajectory, index them and append
+        the remaining frames"""
+        remainder = self._truncate(n_frames)
+        reader = self._reader(self.traj)
+        assert_equal(reader.n_frames, n_frames)
+        reader.close()
+        with open(self.traj, 'ab') as f:
+            f.write(remainder)
+
+    def test_update_n_frames(self):
+        remainder = self._truncate(4)
+        reader = self._reader(self.traj)
+        reader[3]
+        assert_equal(reader.update_n_frames(), 0)
+        with open(self.traj, 'ab') as f:
+            f.write(remainder)
+        assert_equal(reader.update_n_frames(), len(self.ref_offsets) - 4)
+        assert_equal(reader.n_frames, len(self.ref_offsets))
+        assert_array_equal(reader._xdr.offsets, self.ref_offsets)
+        # continue reading where the reader was
+        assert_equal(reader.next().frame, 4)
+        ref = self._reader(self.filename)
+        assert_array_almost_equal(reader.ts.positions, ref[4].positions)
+
+    def test_follow(self):
+        remainder = self._truncate(4)
+        reader = self._reader(self.traj, follow=True, follow_timeout=0.5,
+                              follow_interval=0.01)
+        frames = []
+        for ts in reader:
+            frames.append(ts.frame)
+            if ts.frame == 3:
+                with open(self.traj, 'ab') as f:
+                    f.write(remainder)
+        assert_equal(frames, list(range(len(self.ref_offsets))))
+
+    def test_follow_timeout(self):
+        self._truncate(4)
+        reader = self._reader(self.traj, follow=True, follow_timeout=0.05,
+                              follow_interval=0.01)
+        assert_equal([ts.frame for ts in reader], list(range(4)))
+
+    @dec.slow
+    def test_offsets_growing_file(self):
+        self._grow(4)
+        with warnings.catch_warnings(record=True) as warn:
+            warnings.simplefilter('always')
+            reader = self._reader(self.traj)
+        assert_equal(len(warn), 0)
+        assert_equal(reader.n_frames, len(self.ref_offsets))
+        assert_array_equal(reader._xdr.offsets, self.ref_offsets)
+        saved_offsets = XDR.read_offsets(XDR.offsets_filename(self.traj))
+        assert_array_equal(saved_offsets['offsets'], self.ref_offsets)
+        assert_equal(saved_offsets['size'], os.path.getsize(self.traj))
+
+    @dec.slow
+    def test_offsets_growing_file_wrong_prefix(self):
+        self._grow(4)
+        fname = XDR.offsets_filename(self.traj)
+        saved_offsets = XDR.read_offsets(fname)
+        saved_offsets['offsets'] = saved_offsets['offsets'].copy()
+        saved_offsets['offsets'][2] += 42
+        XDR.write_offsets(fname, **saved_offsets)
+
+        with warnings.catch_warnings(record=True) as warn:
+            warnings.simplefilter('always')
+            reader = self._reader(self.traj)
+        assert_equal(warn[0].message.args,
+                     ('Reload offsets from trajectory\n ctime or size or n_atoms did not match', ))
+        assert_array_equal(reader._xdr.offsets, self.ref_offsets)
+
     @dec.slow
     def test_persistent_offsets_readonly(self):
         os.remove(XDR.offsets_filename(self.traj))
@@ -2,9 +2,16 @@ from six.moves import range
 
 import MDAnalysis as mda
 import numpy as np
+import os
+import shutil
 
-from numpy.testing import assert_array_almost_equal, raises
+from numpy.testing import (assert_array_almost_equal, assert_equal, assert_,
+                           assert_raises, raises)
+import tempdir
+from unittest import TestCase
 
+from MDAnalysis.coordinates import XDR
+from MDAnalysis.lib import util
 from MDAnalysisTests.datafiles import COORDINATES_XYZ, COORDINATES_XYZ_BZ2
 from MDAnalysisTests.coordinates.base import (BaseReaderTest, BaseReference,
                                               BaseWriterTest)
@@ -68,6 +75,22 @@ class TestXYZWriter(BaseWriterTest):
                 err_msg="coordinate mismatch between original and written "
                 "container at frame {} ".format(ts.frame))
 
+    def test_write_renamed_atoms(self):
+        outfile = self.tmp_file('write-renamed')
+        uni = mda.Universe(self.ref.topology)
+        name = uni.atoms[0].name
+        with self.ref.writer(outfile) as w:
+            w.write(uni)
+            uni.atoms[0].name = 'Xe%'
+            w.write(uni)
+        with util.anyopen(outfile) as xyz:
+            names = [line.split()[0] for line in xyz
+                     if len(line.split()) == 4]
+        n_atoms = uni.atoms.n_atoms
+        assert_equal(names[0], name)
+        assert_equal(names[n_atoms], 'Xe%')
+        assert_equal(names[1:n_atoms], names[n_atoms + 1:])
+
     def test_no_conversion(self):
         outfile = self.tmp_file('write-no-conversion')
         with self.ref.writer(outfile, convert_units=False) as w:
@@ -91,3 +114,88 @@ class Test_XYZBZReader(TestXYZReader):
 class Test_XYZBZWriter(TestXYZWriter):
     def __init__(self):
         super(Test_XYZBZWriter, self).__init__(XYZ_BZ_Reference())
+
+
+class TestXYZReaderOffsets(TestCase):
+    def setUp(self):
+        self.tmpdir = tempdir.TempDir()
+        self.filename = os.path.join(self.tmpdir.name, 'test.xyz')
+        shutil.copy(COORDINATES_XYZ, self.filename)
+        self.offsets = os.path.join(self.tmpdir.name, '.test.xyz_offsets.bin')
+        self.ref = XYZReference()
+
+    def tearDown(self):
+        del self.tmpdir
+
+    def _write(self, text):
+        with open(self.filename, 'w') as f:
+            f.write(text)
+        return mda.coordinates.XYZ.XYZReader(self.filename)
+
+    def test_offsets_stored(self):
+        reader = mda.coordinates.XYZ.XYZReader(self.filename)
+        assert_(os.path.isfile(self.offsets))
+        offsets = XDR.read_offsets(self.offsets)['offsets']
+        assert_equal(len(offsets), reader.n_frames + 1)
+        with open(self.filename, 'rb') as f:
+            for offset in offsets[:-1]:
+                f.seek(offset)
+                assert_equal(int(f.readline()), self.ref.n_atoms)
+
+    def test_refresh_offsets(self):
+        mda.coordinates.XYZ.XYZReader(self.filename)
+        XDR.write_offsets(self.offsets, [0, 10], 0, 0, self.ref.n_atoms)
+        reader = mda.coordinates.XYZ.XYZReader(self.filename)
+        assert_equal(reader.n_frames, self.ref.n_frames)
+        reader = mda.coordinates.XYZ.XYZReader(self.filename,
+                                               refresh_offsets=True)
+        assert_equal(reader.n_frames, self.ref.n_frames)
+
+    def test_random_access(self):
+        reader = mda.coordinates.XYZ.XYZReader(self.filename)
+        ref = [ts.positions.copy() for ts in reader]
+        for frame in [3, 1, 4, 0, 4]:
+            ts = reader[frame]
+            assert_equal(ts.frame, frame)
+            assert_array_almost_equal(ts.positions, ref[frame])
+
+    def test_extra_columns(self):
+        reader = self._write("2\nframe 0\n"
+                             "C 1.0 2.0 3.0 0.5\n"
+                             "O 4.0 5.0 6.0\n"
+                             "2\nframe 1\n"
+                             "C 7.0 8.0 9.0\n"
+                             "O 1.5 2.5 3.5")
+        assert_equal(reader.n_frames, 2)
+        assert_array_almost_equal(reader[0].positions,
+                                  [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        assert_array_almost_equal(reader[1].positions,
+                                  [[7.0, 8.0, 9.0], [1.5, 2.5, 3.5]])
+
+    def test_mixed_columns_divisible(self):
+        # 6 + 4 fields could be read as two lines of 5 columns
+        reader = self._write("2\nframe 0\n"
+                             "C 1.0 2.0 3.0 0.5 0.5\n"
+                             "O 4.0 5.0 6.0\n")
+        assert_array_almost_equal(reader[0].positions,
+                                  [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+    def test_malformed_frame(self):
+        # 5 + 3 fields could be read as two lines of 4 columns; the second
+        # atom has no name
+        reader = self._write("2\nframe 0\n"
+                             "C 1.0 2.0 3.0\n"
+                             "O 4.0 5.0 6.0\n"
+                             "2\nframe 1\n"
+                             "C 7.0 8.0 9.0 1.0\n"
+                             "1.5 2.5 3.5\n")
+        assert_raises(EOFError, reader._read_frame_into, 1, reader.ts)
+
+    def test_incomplete_frame(self):
+        reader = self._write("2\nframe 0\n"
+                             "C 1.0 2.0 3.0\n"
+                             "O 4.0 5.0 6.0\n"
+                             "2\nframe 1\n"
+                             "C 7.0 8.0 9.0\n")
+        assert_equal(reader.n_frames, 1)
+        assert_equal(len([ts for ts in reader]), 1)
@@ -57,6 +57,16 @@ class XDRFormatBaseTest(object):
         with self.xdrfile('foo', 'w') as f:
             f.read()
 
+    @run_in_tempdir()
+    def test_read_write_mode_message(self):
+        with self.xdrfile('foo', 'w') as f:
+            try:
+                f.read()
+            except RuntimeError as err:
+                assert_equal('mode: w.' in str(err), True)
+            else:
+                raise AssertionError("reading in mode 'w' did not fail")
+
     @raises(RuntimeError)
     def test_read_closed(self):
         f = self.xdrfile(self.multi_frame)
@@ -83,6 +93,23 @@ class XDRFormatBaseTest(object):
         f = self.xdrfile(self.multi_frame)
         assert_array_equal(f.offsets, self.offsets)
 
+    def test_calc_offsets_start(self):
+        with self.xdrfile(self.multi_frame) as f:
+            assert_array_equal(f.calc_offsets(start=self.offsets[4]),
+                               self.offsets[4:])
+
+    @run_in_tempdir()
+    def test_calc_offsets_incomplete_frame(self):
+        with open(self.multi_frame, 'rb') as f:
+            data = f.read()
+        # the last frame is still being written
+        with open('growing', 'wb') as f:
+            f.write(data[:-4])
+        with self.xdrfile('growing') as f:
+            assert_array_equal(f.calc_offsets(), self.offsets[:-1])
+            assert_array_equal(f.calc_offsets(start=self.offsets[7]),
+                               self.offsets[7:-1])
+
     @raises(IOError)
     def test_set_offsets(self):
         f = self.xdrfile(self.multi_frame)
@@ -108,6 +135,40 @@ class XDRFormatBaseTest(object):
             f._bytes_seek(offset)
             assert_equal(f._bytes_tell(), offset)
 
+    def test_read_frames(self):
+        with self.xdrfile(self.multi_frame) as f:
+            xyz = f.read_frames()
+        assert_equal(xyz.shape, (10, 10, 3))
+        assert_equal(xyz.dtype, np.float32)
+        assert_array_almost_equal(xyz[:, 0, 0], np.arange(10), decimal=3)
+
+    def test_read_frames_slice_and_atoms(self):
+        with self.xdrfile(self.multi_frame) as f:
+            xyz = f.read_frames(1, 8, 3, atom_indices=[0, 9])
+        assert_equal(xyz.shape, (3, 2, 3))
+        assert_array_almost_equal(xyz[:, 1, 2], [1, 4, 7], decimal=3)
+
+    def test_read_frames_continue_reading(self):
+        with self.xdrfile(self.multi_frame) as f:
+            f.read_frames(None, 3)
+            assert_equal(f.tell(), 3)
+            assert_array_almost_equal(f.read()[0], np.ones((10, 3)) * 3,
+                                      decimal=3)
+
+    def test_read_frames_parallel(self):
+        with self.xdrfile(self.multi_frame) as f:
+            for args in [(), (1, 8, 3), (None, None, -1)]:
+                for atom_indices in [None, [0, 5, -1]]:
+                    serial = f.read_frames(*args, atom_indices=atom_indices)
+                    parallel = f.read_frames(*args, atom_indices=atom_indices,
+                                             n_threads=3)
+                    assert_array_equal(parallel, serial)
+
+    @raises(IndexError)
+    def test_read_frames_atoms_out_of_range(self):
+        with self.xdrfile(self.multi_frame) as f:
+            f.read_frames(atom_indices=[10])
+
     def test_seek_tell_largefile(self):
         # Seeking/telling can be done on offsets larger than the file.
         # Filesize won't change unless a write is done at the offset.
@@ -178,6 +239,24 @@ def test_write_xtc():
             assert_equal(prec, 1000.0)
 
 
+@run_in_tempdir()
+def test_write_frames_xtc():
+    with XTCFile(XTC_multi_frame) as f_in:
+        frames = [frame for frame in f_in]
+    with XTCFile('serial.xtc', 'w') as f_out:
+        for frame in frames:
+            f_out.write(*frame)
+    xyz, box, step, time, prec = zip(*frames)
+    with XTCFile('threads.xtc', 'w') as f_out:
+        f_out.write_frames(np.array(xyz), np.array(box), step, time,
+                           precision=1000, n_threads=3)
+        assert_equal(f_out.tell(), 10)
+
+    with open('serial.xtc', 'rb') as serial, \
+            open('threads.xtc', 'rb') as threads:
+        assert_equal(threads.read(), serial.read())
+
+
 @run_in_tempdir()
 def test_different_box_xtc():
     """test if we can write different box-sizes for different frames.
@@ -58,7 +58,7 @@ class Cleanup(Plugin):
                 "{}\n".format(dirname))
         for root, dirs, fnames in walk(dirname):
             for fname in fnames:
-                if fname.endswith('_offsets.npz'):
+                if fname.endswith(('_offsets.npz', '_offsets.bin')):
                     fullname = path.join(root, fname)
                     if self.verbosity > 1:
                         stream.write("Cleanup: deleting offset file "
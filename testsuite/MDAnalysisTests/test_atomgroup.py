@@ -1969,6 +1969,93 @@ class TestUniverseCache(TestCase):
         assert_equal(self.u._cache, dict())
 
 
+class TestTopologyColumns(TestCase):
+    @dec.skipif(parser_not_found('DCD'),
+                'DCD parser not available. Are you using python 3?')
+    def setUp(self):
+        self.u = MDAnalysis.Universe(PSF, DCD)
+        self.ag = self.u.atoms[[30, 2, 17, 4]]
+
+    def tearDown(self):
+        del self.u
+        del self.ag
+
+    def test_columns(self):
+        for attr in ('name', 'type', 'mass', 'charge', 'resid', 'resname',
+                     'resnum', 'segid'):
+            values = getattr(self.ag, _PLURAL_PROPERTIES[attr])
+            assert_equal(list(values),
+                         [getattr(a, attr) for a in self.ag])
+        assert_('columns' in self.u._cache)
+
+    def test_column_readonly(self):
+        column = self.u._topology_column('mass')
+        assert_raises(ValueError, column.__setitem__, 0, 2.0)
+        masses = self.ag.masses
+        masses[0] = 100.
+        assert_(self.u.atoms[30].mass != 100.)
+
+    def test_atom_changes_column(self):
+        self.u.atoms.names
+        self.u.atoms[17].name = 'LONGNAME'
+        assert_equal(self.ag.names[2], 'LONGNAME')
+        assert_equal(self.u.atoms.names[17], 'LONGNAME')
+
+    def test_set_changes_column(self):
+        self.u.atoms.charges
+        self.ag.set_charges(2.5)
+        assert_array_equal(self.u.atoms.charges[[30, 2, 17, 4]], 2.5)
+
+    def test_resindices(self):
+        residues = self.u.residues
+        for atom, resindex in zip(self.ag, self.ag.resindices):
+            assert_(residues[resindex] is atom.residue)
+        assert_equal(self.u.atoms.segindices, 0)
+        assert_equal(self.u.atoms.resindices[-1], 213)
+
+    def test_resindices_set_resids(self):
+        self.u.atoms.resindices
+        self.u.atoms[:5].set_resids(300)
+        residues = self.u.residues
+        for atom, resindex in zip(self.u.atoms, self.u.atoms.resindices):
+            assert_(residues[resindex] is atom.residue)
+
+    def test_column_universe_cached(self):
+        atoms = self.u.atoms
+        atoms.names
+        assert_(atoms._cache['column_universe'] is self.u)
+        assert_('indices' in atoms._cache)
+        ag = atoms[5:20][[4, 2, -1]]
+        assert_(ag._cache['column_universe'] is self.u)
+        assert_array_equal(ag._cache['indices'], [9, 7, 19])
+        assert_array_equal(ag.names, [a.name for a in ag])
+
+    def test_slice_indices(self):
+        ag = self.u.atoms[5:20][[4, 2, -1]]
+        assert_array_equal(ag.indices, [9, 7, 19])
+        ag = self.u.atoms[self.u.atoms.masses > 30.][::2]
+        assert_array_equal(ag.indices,
+                           [a.index for a in ag])
+
+    def test_no_universe(self):
+        ag = AtomGroup([Atom(0, 'a', 't', 'rn', 1, 's', 1., 0.),
+                        Atom(1, 'b', 't', 'rn', 1, 's', 2., 0.)])
+        assert_array_equal(ag.names, ['a', 'b'])
+        assert_array_equal(ag.masses, [1., 2.])
+        assert_raises(NoDataError, getattr, ag, 'resindices')
+        assert_equal(len(AtomGroup([]).resindices), 0)
+
+    def test_mixed_universes(self):
+        other = MDAnalysis.Universe(PSF, DCD)
+        other.atoms[0].name = 'OTHER'
+        ag = AtomGroup([self.u.atoms[5], other.atoms[0], self.u.atoms[1]])
+        self.u.atoms.names
+        other.atoms.names
+        assert_array_equal(ag.names, [a.name for a in ag])
+        assert_array_equal(ag.masses, [a.mass for a in ag])
+        assert_raises(NoDataError, getattr, ag, 'resindices')
+
+
 class TestUnorderedResidues(TestCase):
     """
     This pdb file has resids that are non sequential
@@ -394,10 +394,12 @@ class TestStreamIO(TestCase, RefAdKSmall):
                                 streamData.as_NamedStream('XYZ'))
         assert_equal(len(u.atoms), 8)
         assert_equal(u.trajectory.n_frames, 3)
-        assert_equal(u.trajectory.frame, 0)  # weird, something odd with XYZ reader
-        u.trajectory.next()  # (should really only need one next()... )
-        assert_equal(u.trajectory.frame, 1)  # !!!! ???
-        u.trajectory.next()  # frame 2
-        assert_equal(u.trajectory.frame, 2)
+        assert_equal(u.trajectory.frame, 0)
+        u.trajectory.next()
+        assert_equal(u.trajectory.frame, 1)
         assert_almost_equal(u.atoms[2].position, np.array([0.45600, 18.48700, 16.26500]), 3,
+                            err_msg="wrong coordinates for atom CA at frame 1")
+        u.trajectory.next()
+        assert_equal(u.trajectory.frame, 2)
+        assert_almost_equal(u.atoms[2].position, np.array([0.53300, 18.34800, 16.17400]), 3,
                             err_msg="wrong coordinates for atom CA at frame 2")
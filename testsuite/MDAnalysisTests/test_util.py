@@ -16,6 +16,11 @@
 from six.moves import range, StringIO
 import six
 
+import bz2
+import gzip
+import os
+import zlib
+
 import numpy as np
 from numpy.testing import (assert_raises, assert_equal, assert_almost_equal,
                            assert_array_almost_equal, assert_,
@@ -24,10 +29,13 @@ from numpy.testing import (assert_raises, assert_equal, assert_almost_equal,
 import MDAnalysis as mda
 import MDAnalysis.lib.util as util
 import MDAnalysis.lib.mdamath as mdamath
+from MDAnalysis.lib import compressed
 from MDAnalysis.lib.util import cached
 from MDAnalysis.core.topologyobjects import TopologyGroup, Bond
 from MDAnalysis.exceptions import NoDataError
 
+import tempdir
+
 
 from MDAnalysisTests.datafiles import Make_Whole
 
@@ -550,6 +558,129 @@ class TestFixedwidthBins(object):
         assert_almost_equal(ret['min'], 3.9)
         assert_almost_equal(ret['max'], 5.1)
 
+
+class TestReadFixedColumns(object):
+    columns = [(0, 8), (8, 16), (16, 24)]
+
+    def test_values(self):
+        values = np.random.RandomState(0).uniform(-999, 999, size=(100, 3))
+        lines = ["{0:8.3f}{1:8.3f}{2:8.4f}\n".format(*v) for v in values]
+        ref = [[float(line[start:stop]) for start, stop in self.columns]
+               for line in lines]
+        ret = util.read_fixed_columns(lines, self.columns, dtype=np.float64)
+        assert_equal(ret, ref)
+
+    def test_dtype(self):
+        ret = util.read_fixed_columns(["   1.000   2.000   3.000"],
+                                      self.columns)
+        assert_equal(ret.dtype, np.float32)
+        assert_equal(ret, [[1, 2, 3]])
+
+    def test_formats(self):
+        ret = util.read_fixed_columns(["  1.5e3 -.25    +4.", "   nan"],
+                                      [(0, 7), (7, 13), (13, 19)],
+                                      missing=0.0)
+        assert_equal(ret[0], [1500., -0.25, 4.])
+        assert_(np.isnan(ret[1, 0]))
+        assert_equal(ret[1, 1:], [0., 0.])
+
+    def test_short_line(self):
+        ret = util.read_fixed_columns(["   1.000   2.0"], self.columns,
+                                      missing=-1)
+        assert_equal(ret, [[1, 2, -1]])
+
+    def test_missing(self):
+        assert_raises(ValueError, util.read_fixed_columns,
+                      ["   1.000  *****   3.000"], self.columns)
+        ret = util.read_fixed_columns(["   1.000  *****   3.000"],
+                                      self.columns, missing=99)
+        assert_equal(ret, [[1, 99, 3]])
+
+    def test_empty(self):
+        ret = util.read_fixed_columns([], self.columns)
+        assert_equal(ret.shape, (0, 3))
+
+
+class TestCompressedFiles(TestCase):
+    def setUp(self):
+        self.tmpdir = tempdir.TempDir()
+        values = np.random.RandomState(0).uniform(-99, 99, size=(20000, 3))
+        self.data = b''.join("{0:5d} {1:8.3f} {2:8.3f} {3:8.3f}\n".format(
+            i, *v).encode() for i, v in enumerate(values))
+        self.offsets = np.random.RandomState(1).randint(0, len(self.data), 20)
+
+    def tearDown(self):
+        del self.tmpdir
+
+    def _file(self, name, contents):
+        filename = os.path.join(self.tmpdir.name, name)
+        with open(filename, 'wb') as f:
+            f.write(contents)
+        return filename
+
+    def _gzip(self, data):
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+
+    def _check_seek(self, f):
+        for offset in list(self.offsets) + [0, len(self.data) - 3]:
+            f.seek(offset)
+            assert_equal(f.tell(), offset)
+            assert_equal(f.read(100), self.data[offset:offset + 100])
+        f.seek(10)
+        line = f.readline()
+        assert_equal(line, self.data[10:self.data.index(b'\n', 10) + 1])
+        f.seek(0, os.SEEK_END)
+        assert_equal(f.tell(), len(self.data))
+        assert_equal(f.read(), b'')
+
+    def test_gzip(self):
+        filename = self._file('data.gz', self._gzip(self.data))
+        with compressed.open_gzip(filename, spacing=2**14) as f:
+            assert_equal(f.read(), self.data)
+            self._check_seek(f)
+            assert_(len(f.raw._seekpoints) > 10)
+
+    def test_gzip_members(self):
+        filename = self._file('data.gz', self._gzip(self.data[:1000]) +
+                              self._gzip(self.data[1000:]))
+        with compressed.open_gzip(filename, spacing=2**14) as f:
+            self._check_seek(f)
+
+    def test_bz2(self):
+        filename = self._file('data.bz2', bz2.compress(self.data, 1))
+        with compressed.open_bz2(filename, spacing=2**14) as f:
+            self._check_seek(f)
+        index = np.load(compressed.seekpoints_filename(filename))
+        assert_(len(index['starts']) > 3)
+        assert_equal(index['offsets'][0], 0)
+        # the stored index is used again
+        with compressed.open_bz2(filename) as f:
+            f.seek(len(self.data) - 5)
+            assert_(f.raw._index is not None)
+            assert_equal(f.read(), self.data[-5:])
+
+    def test_bz2_streams(self):
+        filename = self._file('data.bz2', bz2.compress(self.data[:1000]) +
+                              bz2.compress(self.data[1000:], 1))
+        with compressed.open_bz2(filename, spacing=2**14) as f:
+            assert_equal(f.read(), self.data)
+            self._check_seek(f)
+
+    def test_wrong_format(self):
+        filename = self._file('data', self.data)
+        assert_raises(IOError, compressed.open_gzip, filename)
+        assert_raises(IOError, compressed.open_bz2, filename)
+
+    def test_anyopen(self):
+        filename = self._file('data.bz2', bz2.compress(self.data, 1))
+        with util.openany(filename, 'rb') as f:
+            self._check_seek(f)
+        filename = self._file('data.gz', self._gzip(self.data))
+        with util.openany(filename, 'rb') as f:
+            self._check_seek(f)
+
+
 class TestGuessFormat(object):
     """Test guessing of format from filenames
 